@@ -0,0 +1,162 @@
+"""partition data revisions by month
+
+Revision ID: a9c3e7f1b2d5
+Revises: f2a6d9b3c8e4
+Create Date: 2026-10-18
+
+Rebuilds data_revisions as a table range-partitioned by scraped_at, one
+partition per month from the oldest revision up to three months ahead. The
+scraping maintenance task creates later partitions and archives old ones.
+
+A unique constraint on a partitioned table must include the partition key, so
+the primary key becomes (id, scraped_at) and foreign keys that point at
+data_revisions.id (change diffs, scrape jobs, tickets, revision notifications)
+are dropped; the application keeps those references consistent.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e7f1b2d5'
+down_revision: Union[str, Sequence[str], None] = 'f2a6d9b3c8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+# (constraint, table, column, ondelete) of the foreign keys onto data_revisions.id.
+REFERENCES = [
+    ('change_diff_new_revision_id_fkey', 'change_diff', 'new_revision_id', None),
+    ('change_diff_old_revision_id_fkey', 'change_diff', 'old_revision_id', None),
+    ('scrape_jobs_data_revision_id_fkey', 'scrape_jobs', 'data_revision_id', None),
+    ('fk_tickets_data_revision_id', 'tickets', 'data_revision_id', 'SET NULL'),
+    ('revision_notifications_revision_id_fkey', 'revision_notifications', 'revision_id', None),
+]
+
+SEARCH_TRIGGER = """
+CREATE TRIGGER trg_update_data_revisions_search_vector
+    BEFORE INSERT OR UPDATE ON data_revisions
+    FOR EACH ROW EXECUTE FUNCTION update_data_revisions_search_vector()
+"""
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_data_revisions_source_id', 'data_revisions', ['source_id'])
+    op.create_index('ix_data_revisions_content_hash', 'data_revisions', ['content_hash'])
+    op.create_index(
+        'idx_data_revisions_search_vector',
+        'data_revisions',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_data_revisions_source_scraped_at',
+        'data_revisions',
+        ['source_id', sa.text('scraped_at DESC')],
+    )
+    op.create_foreign_key(
+        'data_revisions_source_id_fkey', 'data_revisions', 'sources', ['source_id'], ['id']
+    )
+    op.execute(SEARCH_TRIGGER)
+
+
+def _drop_references() -> None:
+    op.execute(
+        """
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN
+                SELECT conrelid::regclass AS tbl, conname
+                FROM pg_constraint
+                WHERE contype = 'f' AND confrelid = 'data_revisions'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', r.tbl, r.conname);
+            END LOOP;
+        END $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE data_revisions_partitioned (
+            LIKE data_revisions INCLUDING DEFAULTS,
+            PRIMARY KEY (id, scraped_at)
+        ) PARTITION BY RANGE (scraped_at)
+        """
+    )
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            first_month date := date_trunc(
+                'month', coalesce((SELECT min(scraped_at) FROM data_revisions), now())
+            );
+            last_month date := date_trunc('month', now()) + interval '{MONTHS_AHEAD} months';
+            m date;
+        BEGIN
+            m := first_month;
+            WHILE m <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF data_revisions_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'data_revisions_p' || to_char(m, 'YYYYMM'),
+                    m,
+                    (m + interval '1 month')::date
+                );
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute("INSERT INTO data_revisions_partitioned SELECT * FROM data_revisions")
+
+    _drop_references()
+    op.drop_table('data_revisions')
+    op.rename_table('data_revisions_partitioned', 'data_revisions')
+    op.execute(
+        "ALTER TABLE data_revisions "
+        "RENAME CONSTRAINT data_revisions_partitioned_pkey TO data_revisions_pkey"
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE data_revisions_plain (
+            LIKE data_revisions INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO data_revisions_plain SELECT * FROM data_revisions")
+    op.drop_table('data_revisions')
+    op.rename_table('data_revisions_plain', 'data_revisions')
+    op.execute(
+        "ALTER TABLE data_revisions RENAME CONSTRAINT data_revisions_plain_pkey TO data_revisions_pkey"
+    )
+    _create_indexes()
+
+    # Revisions archived by retention no longer exist; clear what still points at them.
+    op.execute(
+        "DELETE FROM change_diff WHERE new_revision_id NOT IN (SELECT id FROM data_revisions) "
+        "OR old_revision_id NOT IN (SELECT id FROM data_revisions)"
+    )
+    op.execute(
+        "DELETE FROM revision_notifications WHERE revision_id NOT IN (SELECT id FROM data_revisions)"
+    )
+    for table in ('scrape_jobs', 'tickets'):
+        op.execute(
+            f"UPDATE {table} SET data_revision_id = NULL "
+            "WHERE data_revision_id NOT IN (SELECT id FROM data_revisions)"
+        )
+    for name, table, column, ondelete in REFERENCES:
+        op.create_foreign_key(
+            name, table, 'data_revisions', [column], ['id'], ondelete=ondelete
+        )
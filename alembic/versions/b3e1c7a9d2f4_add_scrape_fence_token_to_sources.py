@@ -0,0 +1,25 @@
+"""add scrape fence token to sources
+
+Revision ID: b3e1c7a9d2f4
+Revises: 0fcbdabbf412
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1c7a9d2f4'
+down_revision: Union[str, Sequence[str], None] = '0fcbdabbf412'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sources', sa.Column('scrape_fence_token', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sources', 'scrape_fence_token')
@@ -0,0 +1,47 @@
+"""store extracted data as jsonb with a facts index
+
+Revision ID: b6d4f2a8e1c7
+Revises: a9c3e7f1b2d5
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d4f2a8e1c7'
+down_revision: Union[str, Sequence[str], None] = 'a9c3e7f1b2d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'data_revisions',
+        'extracted_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='extracted_data::jsonb',
+    )
+    op.create_index(
+        'idx_data_revisions_facts',
+        'data_revisions',
+        [sa.text("(extracted_data -> 'extracted_data' -> 'key_value_pairs') jsonb_path_ops")],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_data_revisions_facts', table_name='data_revisions')
+    op.alter_column(
+        'data_revisions',
+        'extracted_data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='extracted_data::json',
+    )
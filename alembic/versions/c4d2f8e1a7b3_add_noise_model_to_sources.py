@@ -0,0 +1,25 @@
+"""add noise model to sources
+
+Revision ID: c4d2f8e1a7b3
+Revises: b3e1c7a9d2f4
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2f8e1a7b3'
+down_revision: Union[str, Sequence[str], None] = 'b3e1c7a9d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sources', sa.Column('noise_model', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sources', 'noise_model')
@@ -0,0 +1,51 @@
+"""add default partition to data revisions
+
+Revision ID: c7e2a9d4f1b8
+Revises: f4b9d2a7c1e3
+Create Date: 2026-10-18
+
+Revisions scraped in a month whose partition has not been created yet land in
+data_revisions_default instead of failing the insert. The partition
+maintenance task moves them into monthly partitions on its next run.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9d4f1b8'
+down_revision: Union[str, Sequence[str], None] = 'f4b9d2a7c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE TABLE data_revisions_default PARTITION OF data_revisions DEFAULT')
+
+
+def downgrade() -> None:
+    # Give every month still held by the default partition a partition of its own.
+    op.execute('ALTER TABLE data_revisions DETACH PARTITION data_revisions_default')
+    op.execute(
+        """
+        DO $$
+        DECLARE m date;
+        BEGIN
+            FOR m IN
+                SELECT DISTINCT CAST(date_trunc('month', scraped_at) AS date)
+                FROM data_revisions_default
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF data_revisions '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'data_revisions_p' || to_char(m, 'YYYYMM'),
+                    m,
+                    (m + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute('INSERT INTO data_revisions SELECT * FROM data_revisions_default')
+    op.drop_table('data_revisions_default')
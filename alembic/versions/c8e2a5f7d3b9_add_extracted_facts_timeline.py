@@ -0,0 +1,114 @@
+"""add extracted facts timeline
+
+Revision ID: c8e2a5f7d3b9
+Revises: b6d4f2a8e1c7
+Create Date: 2026-10-18
+
+Adds extracted_facts, one row per value of an extracted key-value fact with
+the period it was valid (valid_to is NULL for the current value), and
+backfills it from the revisions still in data_revisions. Consecutive
+revisions of a source with the same value of a key collapse into one row; a
+value ends at the scrape of the first revision that changed or dropped it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2a5f7d3b9'
+down_revision: Union[str, Sequence[str], None] = 'b6d4f2a8e1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL = r"""
+INSERT INTO extracted_facts
+    (id, source_id, key, value, numeric_value, valid_from, valid_to, revision_id)
+WITH revs AS (
+    SELECT
+        id,
+        source_id,
+        scraped_at,
+        extracted_data -> 'extracted_data' -> 'key_value_pairs' AS pairs,
+        row_number() OVER (PARTITION BY source_id ORDER BY scraped_at, id) AS rn,
+        lead(scraped_at) OVER (PARTITION BY source_id ORDER BY scraped_at, id) AS next_scraped_at
+    FROM data_revisions
+),
+facts AS (
+    SELECT revs.id, revs.source_id, revs.scraped_at, revs.rn, revs.next_scraped_at,
+           kv.key, kv.value
+    FROM revs
+    CROSS JOIN LATERAL jsonb_each_text(
+        CASE WHEN jsonb_typeof(revs.pairs) = 'object' THEN revs.pairs ELSE '{}'::jsonb END
+    ) AS kv
+    WHERE kv.value IS NOT NULL
+),
+marked AS (
+    SELECT facts.*,
+           CASE
+               WHEN lag(rn) OVER w = rn - 1 AND lag(value) OVER w = value THEN 0
+               ELSE 1
+           END AS starts_run
+    FROM facts
+    WINDOW w AS (PARTITION BY source_id, key ORDER BY rn)
+),
+runs AS (
+    SELECT marked.*,
+           sum(starts_run) OVER (PARTITION BY source_id, key ORDER BY rn) AS run
+    FROM marked
+)
+SELECT
+    gen_random_uuid(),
+    source_id,
+    key,
+    min(value),
+    substring(replace(min(value), ',', '') FROM '-?[0-9]+(?:\.[0-9]+)?')::double precision,
+    min(scraped_at),
+    (array_agg(next_scraped_at ORDER BY rn DESC))[1],
+    (array_agg(id ORDER BY rn))[1]
+FROM runs
+GROUP BY source_id, key, run
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'extracted_facts',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('source_id', sa.Uuid(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('value', sa.String(), nullable=False),
+        sa.Column('numeric_value', sa.Float(), nullable=True),
+        sa.Column('valid_from', sa.DateTime(), nullable=False),
+        sa.Column('valid_to', sa.DateTime(), nullable=True),
+        sa.Column('revision_id', sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(['source_id'], ['sources.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(BACKFILL)
+
+    op.create_index('idx_extracted_facts_key_valid_from', 'extracted_facts', ['key', 'valid_from'])
+    op.create_index(
+        'idx_extracted_facts_source_key_valid_from',
+        'extracted_facts',
+        ['source_id', 'key', 'valid_from'],
+    )
+    op.create_index('idx_extracted_facts_valid_from', 'extracted_facts', ['valid_from'])
+    op.create_index('idx_extracted_facts_valid_to', 'extracted_facts', ['valid_to'])
+    op.create_index(
+        'uq_extracted_facts_current',
+        'extracted_facts',
+        ['source_id', 'key'],
+        unique=True,
+        postgresql_where=sa.text('valid_to IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_extracted_facts_current', table_name='extracted_facts')
+    op.drop_index('idx_extracted_facts_valid_to', table_name='extracted_facts')
+    op.drop_index('idx_extracted_facts_valid_from', table_name='extracted_facts')
+    op.drop_index('idx_extracted_facts_source_key_valid_from', table_name='extracted_facts')
+    op.drop_index('idx_extracted_facts_key_valid_from', table_name='extracted_facts')
+    op.drop_table('extracted_facts')
@@ -0,0 +1,98 @@
+"""weight data revisions search vector
+
+Revision ID: d3f7b1e9a6c2
+Revises: c8e2a5f7d3b9
+Create Date: 2026-10-18
+
+Rebuilds search_vector from weighted parts: the AI summary (A), the keys
+and values of the extracted key_value_pairs (B), the markdown summary (C) and
+the object key (D). The expression lives in data_revisions_search_vector() so
+the trigger and the batched backfill task (search.service.tasks.
+backfill_search_vectors) build identical vectors. The trigger now only fires
+when one of its inputs changes, so heartbeat updates skip it.
+
+Existing rows keep their unweighted vectors until the backfill task has run.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f7b1e9a6c2'
+down_revision: Union[str, Sequence[str], None] = 'c8e2a5f7d3b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION data_revisions_search_vector(
+    object_key text, summary text, markdown_summary text, extracted_data jsonb
+) RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector('english', coalesce(summary, '')), 'A')
+        || setweight(
+            CASE
+                WHEN jsonb_typeof(extracted_data -> 'extracted_data' -> 'key_value_pairs') = 'object'
+                THEN jsonb_to_tsvector(
+                    'english',
+                    extracted_data -> 'extracted_data' -> 'key_value_pairs',
+                    '["key", "string", "numeric"]'
+                )
+                ELSE ''::tsvector
+            END,
+            'B'
+        )
+        || setweight(to_tsvector('english', coalesce(markdown_summary, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(object_key, '')), 'D')
+$$ LANGUAGE sql IMMUTABLE;
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_data_revisions_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := data_revisions_search_vector(
+        NEW.minio_object_key, NEW.ai_summary, NEW.ai_markdown_summary, NEW.extracted_data
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER = """
+CREATE TRIGGER trg_update_data_revisions_search_vector
+    BEFORE INSERT OR UPDATE OF minio_object_key, ai_summary, ai_markdown_summary, extracted_data
+    ON data_revisions
+    FOR EACH ROW EXECUTE FUNCTION update_data_revisions_search_vector()
+"""
+
+PREVIOUS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_data_revisions_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector(
+        'english', coalesce(NEW.minio_object_key, '') || ' ' || coalesce(NEW.ai_summary, '')
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_TRIGGER = """
+CREATE TRIGGER trg_update_data_revisions_search_vector
+    BEFORE INSERT OR UPDATE ON data_revisions
+    FOR EACH ROW EXECUTE FUNCTION update_data_revisions_search_vector()
+"""
+
+
+def upgrade() -> None:
+    op.execute(SEARCH_VECTOR_FUNCTION)
+    op.execute(TRIGGER_FUNCTION)
+    op.execute('DROP TRIGGER IF EXISTS trg_update_data_revisions_search_vector ON data_revisions')
+    op.execute(TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS trg_update_data_revisions_search_vector ON data_revisions')
+    op.execute(PREVIOUS_TRIGGER_FUNCTION)
+    op.execute(PREVIOUS_TRIGGER)
+    op.execute('DROP FUNCTION IF EXISTS data_revisions_search_vector(text, text, text, jsonb)')
@@ -0,0 +1,25 @@
+"""add section fingerprint to data revisions
+
+Revision ID: d7a3e9c2b5f1
+Revises: c4d2f8e1a7b3
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3e9c2b5f1'
+down_revision: Union[str, Sequence[str], None] = 'c4d2f8e1a7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('data_revisions', sa.Column('section_fingerprint', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('data_revisions', 'section_fingerprint')
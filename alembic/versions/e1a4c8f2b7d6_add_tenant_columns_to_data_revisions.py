@@ -0,0 +1,66 @@
+"""add tenant columns to data revisions
+
+Revision ID: e1a4c8f2b7d6
+Revises: d3f7b1e9a6c2
+Create Date: 2026-10-18
+
+Copies organization_id, project_id and jurisdiction_id from each revision's
+source onto data_revisions, so tenant-scoped search and exports filter one
+table instead of joining sources, jurisdictions and projects. The scraper
+sets them on insert; this migration backfills existing rows.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a4c8f2b7d6'
+down_revision: Union[str, Sequence[str], None] = 'd3f7b1e9a6c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TENANT_COLUMNS = ('organization_id', 'project_id', 'jurisdiction_id')
+
+
+def upgrade() -> None:
+    for column in TENANT_COLUMNS:
+        op.add_column('data_revisions', sa.Column(column, sa.Uuid(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE data_revisions AS d
+        SET organization_id = p.org_id,
+            project_id = p.id,
+            jurisdiction_id = j.id
+        FROM sources AS s
+        JOIN jurisdictions AS j ON j.id = s.jurisdiction_id
+        JOIN projects AS p ON p.id = j.project_id
+        WHERE s.id = d.source_id
+        """
+    )
+
+    op.create_index(
+        'idx_data_revisions_org_scraped_at',
+        'data_revisions',
+        ['organization_id', sa.text('scraped_at DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'idx_data_revisions_project_scraped_at',
+        'data_revisions',
+        ['project_id', sa.text('scraped_at DESC')],
+    )
+    op.create_index(
+        'idx_data_revisions_jurisdiction_scraped_at',
+        'data_revisions',
+        ['jurisdiction_id', sa.text('scraped_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_data_revisions_jurisdiction_scraped_at', table_name='data_revisions')
+    op.drop_index('idx_data_revisions_project_scraped_at', table_name='data_revisions')
+    op.drop_index('idx_data_revisions_org_scraped_at', table_name='data_revisions')
+    for column in reversed(TENANT_COLUMNS):
+        op.drop_column('data_revisions', column)
@@ -0,0 +1,53 @@
+"""add latest revision pointer to sources
+
+Revision ID: e5b8c1d4f9a2
+Revises: d7a3e9c2b5f1
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c1d4f9a2'
+down_revision: Union[str, Sequence[str], None] = 'd7a3e9c2b5f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sources', sa.Column('latest_revision_id', sa.Uuid(), nullable=True))
+    op.add_column('sources', sa.Column('latest_content_hash', sa.String(), nullable=True))
+    op.add_column('sources', sa.Column('latest_scraped_at', sa.DateTime(), nullable=True))
+    op.add_column('sources', sa.Column('latest_change_detected', sa.Boolean(), nullable=True))
+    op.create_index(
+        'idx_data_revisions_source_scraped_at',
+        'data_revisions',
+        ['source_id', sa.text('scraped_at DESC')],
+    )
+    op.execute(
+        """
+        UPDATE sources AS s
+        SET latest_revision_id = r.id,
+            latest_content_hash = r.content_hash,
+            latest_scraped_at = r.scraped_at,
+            latest_change_detected = r.was_change_detected
+        FROM (
+            SELECT DISTINCT ON (source_id)
+                source_id, id, content_hash, scraped_at, was_change_detected
+            FROM data_revisions
+            ORDER BY source_id, scraped_at DESC
+        ) AS r
+        WHERE r.source_id = s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_data_revisions_source_scraped_at', table_name='data_revisions')
+    op.drop_column('sources', 'latest_change_detected')
+    op.drop_column('sources', 'latest_scraped_at')
+    op.drop_column('sources', 'latest_content_hash')
+    op.drop_column('sources', 'latest_revision_id')
@@ -0,0 +1,101 @@
+"""compact unchanged data revisions into heartbeats
+
+Revision ID: f2a6d9b3c8e4
+Revises: e5b8c1d4f9a2
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6d9b3c8e4'
+down_revision: Union[str, Sequence[str], None] = 'e5b8c1d4f9a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables and columns that reference data_revisions.id.
+REFERENCES = [
+    ('change_diff', 'old_revision_id'),
+    ('change_diff', 'new_revision_id'),
+    ('scrape_jobs', 'data_revision_id'),
+    ('tickets', 'data_revision_id'),
+    ('revision_notifications', 'revision_id'),
+    ('sources', 'latest_revision_id'),
+]
+
+
+def upgrade() -> None:
+    op.add_column('data_revisions', sa.Column('last_confirmed_at', sa.DateTime(), nullable=True))
+    op.add_column(
+        'data_revisions',
+        sa.Column('confirmations', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Consecutive revisions of a source with the same content hash form a run;
+    # the first revision of each run is kept and absorbs the others.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE revision_runs AS
+        WITH ordered AS (
+            SELECT id, source_id, scraped_at, content_hash,
+                   LAG(content_hash) OVER (
+                       PARTITION BY source_id ORDER BY scraped_at, id
+                   ) AS previous_hash
+            FROM data_revisions
+        ),
+        numbered AS (
+            SELECT id, source_id, scraped_at,
+                   SUM(
+                       CASE WHEN content_hash IS NOT NULL AND content_hash = previous_hash
+                            THEN 0 ELSE 1 END
+                   ) OVER (PARTITION BY source_id ORDER BY scraped_at, id) AS run
+            FROM ordered
+        )
+        SELECT id, scraped_at,
+               FIRST_VALUE(id) OVER (
+                   PARTITION BY source_id, run ORDER BY scraped_at, id
+               ) AS keeper_id
+        FROM numbered
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE data_revisions AS d
+        SET last_confirmed_at = runs.last_confirmed_at,
+            confirmations = runs.duplicates
+        FROM (
+            SELECT keeper_id, MAX(scraped_at) AS last_confirmed_at, COUNT(*) - 1 AS duplicates
+            FROM revision_runs
+            GROUP BY keeper_id
+            HAVING COUNT(*) > 1
+        ) AS runs
+        WHERE d.id = runs.keeper_id
+        """
+    )
+    for table, column in REFERENCES:
+        op.execute(
+            f"""
+            UPDATE {table} AS t
+            SET {column} = r.keeper_id
+            FROM revision_runs AS r
+            WHERE t.{column} = r.id AND r.id <> r.keeper_id
+            """
+        )
+    op.execute(
+        """
+        DELETE FROM data_revisions AS d
+        USING revision_runs AS r
+        WHERE d.id = r.id AND r.id <> r.keeper_id
+        """
+    )
+    op.execute("DROP TABLE revision_runs")
+
+
+def downgrade() -> None:
+    # Compacted duplicates cannot be restored; only the columns are dropped.
+    op.drop_column('data_revisions', 'confirmations')
+    op.drop_column('data_revisions', 'last_confirmed_at')
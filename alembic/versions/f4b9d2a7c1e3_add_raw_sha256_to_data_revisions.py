@@ -0,0 +1,30 @@
+"""add raw sha256 to data revisions
+
+Revision ID: f4b9d2a7c1e3
+Revises: e1a4c8f2b7d6
+Create Date: 2026-10-18
+
+Stores the digest of the raw response body computed while it streams. A scrape
+whose raw body matches the latest revision's skips PDF extraction, archiving
+and cleaning and is recorded as a heartbeat. Existing rows stay NULL and are
+filled by their next scrape.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b9d2a7c1e3'
+down_revision: Union[str, Sequence[str], None] = 'e1a4c8f2b7d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('data_revisions', sa.Column('raw_sha256', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('data_revisions', 'raw_sha256')
@@ -102,6 +102,97 @@ class Settings(BaseSettings):
     SCRAPE_DISPATCH_LOCK_TIMEOUT: int = config("SCRAPE_DISPATCH_LOCK_TIMEOUT", default=60, cast=int)
     SCRAPE_BATCH_SIZE: int = config("SCRAPE_BATCH_SIZE", default=1000, cast=int)
 
+    # Scrape queues (fair-share dispatch)
+    SCRAPE_QUEUE_MANUAL: str = config("SCRAPE_QUEUE_MANUAL", default="scraping.manual")
+    SCRAPE_QUEUE_HOURLY: str = config("SCRAPE_QUEUE_HOURLY", default="scraping.hourly")
+    SCRAPE_QUEUE_DEFAULT: str = config("SCRAPE_QUEUE_DEFAULT", default="scraping.default")
+    SCRAPE_QUEUE_MAX_BACKLOG: int = config("SCRAPE_QUEUE_MAX_BACKLOG", default=500, cast=int)
+    SCRAPE_PLAN_WEIGHTS: str = config(
+        "SCRAPE_PLAN_WEIGHTS", default="ESSENTIAL:1,PROFESSIONAL:2,ENTERPRISE:4"
+    )
+    SCRAPE_DEFAULT_TENANT_WEIGHT: int = config("SCRAPE_DEFAULT_TENANT_WEIGHT", default=1, cast=int)
+    SCRAPE_LEASE_TTL_SECONDS: int = config("SCRAPE_LEASE_TTL_SECONDS", default=120, cast=int)
+    SCRAPE_LEASE_WAIT_TIMEOUT: int = config("SCRAPE_LEASE_WAIT_TIMEOUT", default=900, cast=int)
+    SCRAPE_LEASE_RESULT_TTL: int = config("SCRAPE_LEASE_RESULT_TTL", default=600, cast=int)
+    SCRAPE_DLQ_MAXLEN: int = config("SCRAPE_DLQ_MAXLEN", default=10000, cast=int)
+    SCRAPE_DLQ_RETENTION_DAYS: int = config("SCRAPE_DLQ_RETENTION_DAYS", default=14, cast=int)
+    SCRAPE_DLQ_REPLAY_BATCH_SIZE: int = config(
+        "SCRAPE_DLQ_REPLAY_BATCH_SIZE", default=100, cast=int
+    )
+    SCRAPE_HOST_RATE_LIMIT: int = config("SCRAPE_HOST_RATE_LIMIT", default=10, cast=int)
+    SCRAPE_HOST_RATE_WINDOW_SECONDS: int = config(
+        "SCRAPE_HOST_RATE_WINDOW_SECONDS", default=60, cast=int
+    )
+    SCRAPE_BREAKER_WINDOW_SECONDS: int = config(
+        "SCRAPE_BREAKER_WINDOW_SECONDS", default=300, cast=int
+    )
+    SCRAPE_BREAKER_MIN_REQUESTS: int = config("SCRAPE_BREAKER_MIN_REQUESTS", default=5, cast=int)
+    SCRAPE_BREAKER_FAILURE_RATIO: float = config(
+        "SCRAPE_BREAKER_FAILURE_RATIO", default=0.5, cast=float
+    )
+    SCRAPE_BREAKER_OPEN_SECONDS: int = config("SCRAPE_BREAKER_OPEN_SECONDS", default=300, cast=int)
+    SCRAPE_TIME_BUDGET_SECONDS: int = config("SCRAPE_TIME_BUDGET_SECONDS", default=300, cast=int)
+    SCRAPE_MANUAL_COALESCE_SECONDS: int = config(
+        "SCRAPE_MANUAL_COALESCE_SECONDS", default=60, cast=int
+    )
+    SCRAPE_FETCH_CACHE_ENABLED: bool = config("SCRAPE_FETCH_CACHE_ENABLED", default=True, cast=bool)
+    SCRAPE_FETCH_CACHE_TTL_SECONDS: int = config(
+        "SCRAPE_FETCH_CACHE_TTL_SECONDS", default=300, cast=int
+    )
+    SCRAPE_FETCH_CACHE_VALIDATOR_TTL_SECONDS: int = config(
+        "SCRAPE_FETCH_CACHE_VALIDATOR_TTL_SECONDS", default=86400, cast=int
+    )
+    SCRAPE_FETCH_CACHE_LOCK_SECONDS: int = config(
+        "SCRAPE_FETCH_CACHE_LOCK_SECONDS", default=90, cast=int
+    )
+    SCRAPE_FETCH_CACHE_BUCKET: str = config("SCRAPE_FETCH_CACHE_BUCKET", default="fetch-cache")
+    SCRAPE_SESSION_TTL_SECONDS: int = config("SCRAPE_SESSION_TTL_SECONDS", default=86400, cast=int)
+    SCRAPE_RENDER_MAX_BYTES: int = config("SCRAPE_RENDER_MAX_BYTES", default=20_000_000, cast=int)
+    SCRAPE_MAX_DOWNLOAD_BYTES: int = config(
+        "SCRAPE_MAX_DOWNLOAD_BYTES", default=500_000_000, cast=int
+    )
+    SCRAPE_DOWNLOAD_SPOOL_BYTES: int = config(
+        "SCRAPE_DOWNLOAD_SPOOL_BYTES", default=5_000_000, cast=int
+    )
+    SCRAPE_PDF_WORKERS: int = config("SCRAPE_PDF_WORKERS", default=4, cast=int)
+    SCRAPE_PDF_PARALLEL_MIN_PAGES: int = config(
+        "SCRAPE_PDF_PARALLEL_MIN_PAGES", default=16, cast=int
+    )
+    SCRAPE_PDF_PAGE_CACHE_TTL_SECONDS: int = config(
+        "SCRAPE_PDF_PAGE_CACHE_TTL_SECONDS", default=604800, cast=int
+    )
+    SCRAPE_NOISE_WINDOW: int = config("SCRAPE_NOISE_WINDOW", default=3, cast=int)
+    SCRAPE_NOISE_MAX_TRACKED_LINES: int = config(
+        "SCRAPE_NOISE_MAX_TRACKED_LINES", default=500, cast=int
+    )
+    SCRAPE_INCREMENTAL_ENABLED: bool = config("SCRAPE_INCREMENTAL_ENABLED", default=True, cast=bool)
+    SCRAPE_INCREMENTAL_MAX_DIFF_RATIO: float = config(
+        "SCRAPE_INCREMENTAL_MAX_DIFF_RATIO", default=0.25, cast=float
+    )
+    SCRAPE_INCREMENTAL_FULL_EVERY: int = config(
+        "SCRAPE_INCREMENTAL_FULL_EVERY", default=10, cast=int
+    )
+    SCRAPE_FEED_SAFETY_HOURS: int = config("SCRAPE_FEED_SAFETY_HOURS", default=168, cast=int)
+    SCRAPE_FEED_TIMEOUT_SECONDS: int = config("SCRAPE_FEED_TIMEOUT_SECONDS", default=10, cast=int)
+    SCRAPE_FEED_MAX_BYTES: int = config("SCRAPE_FEED_MAX_BYTES", default=20_000_000, cast=int)
+    SCRAPE_REVISION_PARTITIONS_AHEAD: int = config(
+        "SCRAPE_REVISION_PARTITIONS_AHEAD", default=3, cast=int
+    )
+    SCRAPE_REVISION_RETENTION_MONTHS: int = config(
+        "SCRAPE_REVISION_RETENTION_MONTHS", default=24, cast=int
+    )
+    SCRAPE_REVISION_ARCHIVE_BUCKET: str = config(
+        "SCRAPE_REVISION_ARCHIVE_BUCKET", default="revision-archive"
+    )
+
+    # Full-text search
+    SEARCH_BACKFILL_BATCH_SIZE: int = config("SEARCH_BACKFILL_BATCH_SIZE", default=1000, cast=int)
+    SEARCH_BACKFILL_BATCHES_PER_RUN: int = config(
+        "SEARCH_BACKFILL_BATCHES_PER_RUN", default=50, cast=int
+    )
+    SEARCH_CANDIDATE_LIMIT: int = config("SEARCH_CANDIDATE_LIMIT", default=5000, cast=int)
+    SEARCH_CACHE_TTL_SECONDS: int = config("SEARCH_CACHE_TTL_SECONDS", default=300, cast=int)
+
     MINIO_ENDPOINT: str = config("MINIO_ENDPOINT", default="localhost:9000")
     MINIO_ACCESS_KEY: str = config("MINIO_ACCESS_KEY", default="lwd")
     MINIO_SECRET_KEY: str = config("MINIO_SECRET_KEY", default="lwd12345")
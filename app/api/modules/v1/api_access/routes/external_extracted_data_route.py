@@ -403,13 +403,8 @@ async def download_jurisdiction_extracted_data(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient scope")
 
     from app.api.modules.v1.scraping.models.data_revision import DataRevision
-    from app.api.modules.v1.scraping.models.source_model import Source
 
-    stmt = (
-        select(DataRevision)
-        .join(Source, DataRevision.source_id == Source.id)
-        .where(Source.jurisdiction_id == jurisdiction_id)
-    )
+    stmt = select(DataRevision).where(DataRevision.jurisdiction_id == jurisdiction_id)
     if start_date:
         try:
             sd = datetime.fromisoformat(start_date)
@@ -491,16 +486,9 @@ async def download_project_extracted_data(
     if not api_key_has_scope(api_key, required_scope):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient scope")
 
-    from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
     from app.api.modules.v1.scraping.models.data_revision import DataRevision
-    from app.api.modules.v1.scraping.models.source_model import Source
 
-    stmt = (
-        select(DataRevision)
-        .join(Source, DataRevision.source_id == Source.id)
-        .join(Jurisdiction, Source.jurisdiction_id == Jurisdiction.id)
-        .where(Jurisdiction.project_id == project_id)
-    )
+    stmt = select(DataRevision).where(DataRevision.project_id == project_id)
     if start_date:
         try:
             sd = datetime.fromisoformat(start_date)
@@ -587,7 +575,6 @@ async def get_jurisdiction_extracted_data(
     from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
     from app.api.modules.v1.projects.models.project_model import Project
     from app.api.modules.v1.scraping.models.data_revision import DataRevision
-    from app.api.modules.v1.scraping.models.source_model import Source
 
     if getattr(api_key, "organization_id", None):
         stmt_proj = (
@@ -602,11 +589,7 @@ async def get_jurisdiction_extracted_data(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Organization mismatch"
             )
 
-    stmt = (
-        select(DataRevision)
-        .join(Source, DataRevision.source_id == Source.id)
-        .where(Source.jurisdiction_id == jurisdiction_id)
-    )
+    stmt = select(DataRevision).where(DataRevision.jurisdiction_id == jurisdiction_id)
 
     if start_date:
         try:
@@ -691,10 +674,8 @@ async def get_project_extracted_data(
     if not api_key_has_scope(api_key, required_scope):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient scope")
 
-    from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
     from app.api.modules.v1.projects.models.project_model import Project
     from app.api.modules.v1.scraping.models.data_revision import DataRevision
-    from app.api.modules.v1.scraping.models.source_model import Source
 
     if getattr(api_key, "organization_id", None):
         stmt_p = select(Project).where(Project.id == project_id)
@@ -705,12 +686,7 @@ async def get_project_extracted_data(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Organization mismatch"
             )
 
-    stmt = (
-        select(DataRevision)
-        .join(Source, DataRevision.source_id == Source.id)
-        .join(Jurisdiction, Source.jurisdiction_id == Jurisdiction.id)
-        .where(Jurisdiction.project_id == project_id)
-    )
+    stmt = select(DataRevision).where(DataRevision.project_id == project_id)
 
     # apply date filters
     if start_date:
@@ -57,7 +57,6 @@ class Notification(SQLModel, table=True):
     notification_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     revision_id: uuid.UUID = Field(
-        foreign_key="data_revisions.id",
         index=True,
         description="Link to data revision if applicable",
     )
@@ -1,6 +1,7 @@
 """Model exports for scraping module."""
 
+from app.api.modules.v1.scraping.models.extracted_fact import ExtractedFact
 from app.api.modules.v1.scraping.models.scrape_job import ScrapeJob, ScrapeJobStatus
 from app.api.modules.v1.scraping.models.source_model import Source, SourceType
 
-__all__ = ["Source", "SourceType", "ScrapeJob", "ScrapeJobStatus"]
+__all__ = ["Source", "SourceType", "ScrapeJob", "ScrapeJobStatus", "ExtractedFact"]
@@ -1,7 +1,7 @@
 import uuid
 from typing import Dict, Optional
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
@@ -11,13 +11,10 @@ class ChangeDiff(SQLModel, table=True):
 
     diff_id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
 
-    new_revision_id: uuid.UUID = Field(
-        sa_column=Column(ForeignKey("data_revisions.id"), nullable=False)
-    )
+    # No foreign keys: data_revisions is partitioned and has no unique key on id alone.
+    new_revision_id: uuid.UUID = Field(nullable=False)
 
-    old_revision_id: uuid.UUID = Field(
-        sa_column=Column(ForeignKey("data_revisions.id"), nullable=False)
-    )
+    old_revision_id: uuid.UUID = Field(nullable=False)
 
     diff_patch: Optional[Dict] = Field(default=None, sa_column=Column(JSONB))
 
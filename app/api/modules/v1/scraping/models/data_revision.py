@@ -2,8 +2,8 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Dict, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, Index, text
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy import Column, Index, desc, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlmodel import JSON, Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -17,35 +17,73 @@ class DataRevision(SQLModel, table=True):
     DataRevision model
     Represents a specific revision of scraped data,
     including its content, metadata, and AI-generated summaries.
+
+    In Postgres the table is range-partitioned by month on ``scraped_at``
+    (see ``service.revision_partitions``). A partitioned table's primary key
+    must include the partition key, so it is ``(id, scraped_at)`` and tables
+    referencing a revision store its id without a foreign key.
     """
 
     __tablename__ = "data_revisions"
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     source_id: UUID = Field(index=True, foreign_key="sources.id")
+    # Copied from the source's jurisdiction and project at insert time so tenant
+    # filters need no joins. Sources never move between jurisdictions.
+    organization_id: Optional[UUID] = Field(default=None, nullable=True)
+    project_id: Optional[UUID] = Field(default=None, nullable=True)
+    jurisdiction_id: Optional[UUID] = Field(default=None, nullable=True)
     minio_object_key: str = Field(nullable=False)
     content_hash: Optional[str] = Field(default=None, nullable=True, index=True)
+    # SHA-256 of the last raw body that produced or confirmed this revision.
+    raw_sha256: Optional[str] = Field(default=None, nullable=True)
     extracted_data: Optional[Dict] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONB, nullable=True),
     )
     ai_summary: Optional[str] = Field(default=None)
     ai_markdown_summary: Optional[str] = Field(default=None)
     ai_confidence_score: Optional[float] = Field(default=None)
     scraped_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None)
+        default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        primary_key=True,
     )
     was_change_detected: bool = Field(default=False)
     is_baseline: bool = Field(default=False)
+    last_confirmed_at: Optional[datetime] = Field(default=None, nullable=True)
+    confirmations: int = Field(default=0)
+    section_fingerprint: Optional[Dict] = Field(
+        default=None,
+        sa_column=Column(JSON, nullable=True),
+    )
 
     search_vector: Optional[str] = Field(
         default=None, sa_column=Column(TSVECTOR, nullable=True, server_default=text("NULL"))
     )
 
-    tickets: list["Ticket"] = Relationship(back_populates="data_revision")
+    tickets: list["Ticket"] = Relationship(
+        back_populates="data_revision",
+        sa_relationship_kwargs={
+            "primaryjoin": "DataRevision.id == foreign(Ticket.data_revision_id)"
+        },
+    )
 
     __table_args__ = (
         Index("idx_data_revisions_search_vector", "search_vector", postgresql_using="gin"),
+        Index("idx_data_revisions_source_scraped_at", "source_id", desc("scraped_at")),
+        Index(
+            "idx_data_revisions_org_scraped_at",
+            "organization_id",
+            desc("scraped_at"),
+            desc("id"),
+        ),
+        Index("idx_data_revisions_project_scraped_at", "project_id", desc("scraped_at")),
+        Index("idx_data_revisions_jurisdiction_scraped_at", "jurisdiction_id", desc("scraped_at")),
+        Index(
+            "idx_data_revisions_facts",
+            text("(extracted_data -> 'extracted_data' -> 'key_value_pairs') jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     source: Optional["Source"] = Relationship(back_populates="data_revisions")
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import Index, text
+from sqlmodel import Field, SQLModel
+
+
+class ExtractedFact(SQLModel, table=True):
+    """
+    ExtractedFact model
+    One value of one extracted key-value fact of a source, valid from the
+    revision that introduced it until the revision that changed or dropped it
+    (``valid_to`` is NULL while the value is current).
+    """
+
+    __tablename__ = "extracted_facts"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    source_id: UUID = Field(foreign_key="sources.id")
+    key: str = Field(nullable=False)
+    value: str = Field(nullable=False)
+    numeric_value: Optional[float] = Field(default=None)
+    valid_from: datetime = Field(nullable=False)
+    valid_to: Optional[datetime] = Field(default=None, nullable=True)
+    # Revision that introduced the value. Not a foreign key: data_revisions is partitioned.
+    revision_id: UUID = Field(nullable=False)
+
+    __table_args__ = (
+        Index("idx_extracted_facts_key_valid_from", "key", "valid_from"),
+        Index("idx_extracted_facts_source_key_valid_from", "source_id", "key", "valid_from"),
+        Index("idx_extracted_facts_valid_from", "valid_from"),
+        Index("idx_extracted_facts_valid_to", "valid_to"),
+        Index(
+            "uq_extracted_facts_current",
+            "source_id",
+            "key",
+            unique=True,
+            postgresql_where=text("valid_to IS NULL"),
+        ),
+    )
@@ -61,9 +61,7 @@ class ScrapeJob(SQLModel, table=True):
     result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     error_message: Optional[str] = Field(default=None)
 
-    data_revision_id: Optional[uuid.UUID] = Field(
-        default=None, foreign_key="data_revisions.id", index=True
-    )
+    data_revision_id: Optional[uuid.UUID] = Field(default=None, index=True)
     is_baseline: bool = Field(default=False)
 
     created_at: datetime = Field(
@@ -75,4 +73,8 @@ class ScrapeJob(SQLModel, table=True):
     )
 
     source: Optional["Source"] = Relationship()
-    data_revision: Optional["DataRevision"] = Relationship()
+    data_revision: Optional["DataRevision"] = Relationship(
+        sa_relationship_kwargs={
+            "primaryjoin": "foreign(ScrapeJob.data_revision_id) == DataRevision.id"
+        }
+    )
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Dict, List, Optional
 
-from sqlalchemy import DateTime
+from sqlalchemy import BigInteger, DateTime
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -65,11 +65,20 @@ class Source(SQLModel, table=True):
 
     auth_details_encrypted: Optional[str] = Field(default=None)
     scraping_rules: Dict = Field(default={}, sa_column=Column(JSON))
+    noise_model: Optional[Dict] = Field(default=None, sa_column=Column(JSON, nullable=True))
 
     last_scraped_at: Optional[datetime] = Field(
         default=None, sa_column=Column(DateTime(timezone=True))
     )
     last_error: Optional[str] = Field(default=None)
+    scrape_fence_token: Optional[int] = Field(
+        default=None, sa_column=Column(BigInteger, nullable=True)
+    )
+
+    latest_revision_id: Optional[uuid.UUID] = Field(default=None, nullable=True)
+    latest_content_hash: Optional[str] = Field(default=None, nullable=True)
+    latest_scraped_at: Optional[datetime] = Field(default=None, nullable=True)
+    latest_change_detected: Optional[bool] = Field(default=None, nullable=True)
 
     created_at: datetime = Field(
         default_factory=now_utc_aware, sa_column=Column(DateTime(timezone=True))
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from app.api.modules.v1.scraping.routes.admin_routes import router as scraping_admin_router
+from app.api.modules.v1.scraping.routes.fact_routes import router as fact_router
 from app.api.modules.v1.scraping.routes.scrape_routes import router as scrape_router
 from app.api.modules.v1.scraping.routes.source_discovery_route import (
     router as source_discovery_router,
@@ -12,5 +14,7 @@ router = APIRouter()
 router.include_router(source_router)
 router.include_router(source_discovery_router)
 router.include_router(scrape_router)
+router.include_router(scraping_admin_router)
+router.include_router(fact_router)
 
 __all__ = ["router"]
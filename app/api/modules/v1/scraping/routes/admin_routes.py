@@ -0,0 +1,235 @@
+"""
+Operational admin routes for the scraping fleet.
+
+Provides endpoints for:
+- GET /scraping/admin/queue-latency - Per-tenant scrape queue latency
+- GET /scraping/admin/dlq/summary - Dead-letter counts by source, host and error class
+- GET /scraping/admin/dlq - List dead-letter entries
+- POST /scraping/admin/dlq/replay - Replay one throttled batch of dead-letter entries
+- DELETE /scraping/admin/dlq/{entry_id} - Discard a dead-letter entry
+- GET /scraping/admin/breakers - Per-host circuit breaker states
+- POST /scraping/admin/breakers/{host}/reset - Force a host's breaker closed
+"""
+
+import logging
+from typing import Optional
+
+import redis
+from fastapi import APIRouter, Depends, Query, status
+from starlette.concurrency import run_in_threadpool
+
+from app.api.core.config import settings
+from app.api.core.dependencies.admin_check_email import verify_admin_email
+from app.api.core.dependencies.redis_service import get_redis_client
+from app.api.modules.v1.scraping.schemas.dead_letter_schema import DeadLetterReplayRequest
+from app.api.modules.v1.scraping.service.circuit_breaker import HostCircuitBreaker
+from app.api.modules.v1.scraping.service.dead_letter import DeadLetterQueue
+from app.api.modules.v1.scraping.service.fair_queue import (
+    TENANT_LATENCY_KEY,
+    parse_latency_report,
+)
+from app.api.utils.response_payloads import error_response, success_response
+
+router = APIRouter(
+    prefix="/scraping/admin",
+    tags=["Scraping Admin"],
+    dependencies=[Depends(verify_admin_email)],
+)
+logger = logging.getLogger("app")
+
+_sync_redis_pool: Optional[redis.ConnectionPool] = None
+
+
+def _sync_redis() -> redis.Redis:
+    """Return a synchronous Redis client on a shared pool.
+
+    The DLQ and circuit breaker are shared with Celery workers and the CLI,
+    which are synchronous, so the API runs their calls in the threadpool.
+    """
+    global _sync_redis_pool
+    if _sync_redis_pool is None:
+        _sync_redis_pool = redis.ConnectionPool.from_url(settings.REDIS_URL, decode_responses=True)
+    return redis.Redis(connection_pool=_sync_redis_pool)
+
+
+def get_dead_letter_queue() -> DeadLetterQueue:
+    """Build a DeadLetterQueue on the shared synchronous Redis pool."""
+    return DeadLetterQueue(_sync_redis())
+
+
+def get_circuit_breaker() -> HostCircuitBreaker:
+    """Build a HostCircuitBreaker on the shared synchronous Redis pool."""
+    return HostCircuitBreaker(_sync_redis())
+
+
+@router.get("/queue-latency", status_code=status.HTTP_200_OK)
+async def get_queue_latency():
+    """
+    Report how long each tenant's sources wait between becoming due and starting.
+
+    Entries are keyed by organization and queue and sorted by the worst
+    exponentially weighted moving average first.
+
+    Returns:
+        JSONResponse: 200 with the per-tenant latency entries.
+    """
+    redis_client = await get_redis_client()
+    raw = await redis_client.hgetall(TENANT_LATENCY_KEY)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Queue latency retrieved successfully",
+        data={"items": parse_latency_report(raw)},
+    )
+
+
+@router.get("/dlq/summary", status_code=status.HTTP_200_OK)
+async def get_dead_letter_summary(dlq: DeadLetterQueue = Depends(get_dead_letter_queue)):
+    """
+    Count dead-lettered scrapes grouped by source, host and error class.
+
+    Returns:
+        JSONResponse: 200 with the total and the largest groups per dimension.
+    """
+    summary = await run_in_threadpool(dlq.summary)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dead-letter summary retrieved successfully",
+        data=summary,
+    )
+
+
+@router.get("/dlq", status_code=status.HTTP_200_OK)
+async def list_dead_letters(
+    source_id: Optional[str] = Query(default=None),
+    host: Optional[str] = Query(default=None),
+    error_class: Optional[str] = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=1000),
+    dlq: DeadLetterQueue = Depends(get_dead_letter_queue),
+):
+    """
+    List dead-lettered scrapes, newest first.
+
+    Args:
+        source_id (Optional[str]): Only entries for this source.
+        host (Optional[str]): Only entries for this host.
+        error_class (Optional[str]): Only entries that failed with this error class.
+        limit (int): Maximum entries to return.
+
+    Returns:
+        JSONResponse: 200 with the matching entries.
+    """
+    items = await run_in_threadpool(dlq.entries, limit, source_id, host, error_class)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dead-letter entries retrieved successfully",
+        data={"items": items, "count": len(items)},
+    )
+
+
+@router.post("/dlq/replay", status_code=status.HTTP_200_OK)
+async def replay_dead_letters(
+    payload: DeadLetterReplayRequest,
+    dlq: DeadLetterQueue = Depends(get_dead_letter_queue),
+):
+    """
+    Replay one throttled batch of dead-lettered scrapes.
+
+    The batch is capped by the free capacity of the default scrape queue and by
+    the per-host limiter; throttled entries stay queued for the next call.
+
+    Args:
+        payload (DeadLetterReplayRequest): Batch size, filters and dry-run flag.
+
+    Returns:
+        JSONResponse: 200 with replayed and throttled counts.
+    """
+    result = await run_in_threadpool(
+        dlq.replay,
+        payload.batch_size,
+        payload.source_id,
+        payload.host,
+        payload.error_class,
+        payload.dry_run,
+    )
+    logger.info(f"Dead-letter replay requested: {result['replayed']} replayed")
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dead-letter replay completed",
+        data=result,
+    )
+
+
+@router.delete("/dlq/{entry_id}", status_code=status.HTTP_200_OK)
+async def discard_dead_letter(entry_id: str, dlq: DeadLetterQueue = Depends(get_dead_letter_queue)):
+    """
+    Discard a dead-letter entry without replaying it.
+
+    Args:
+        entry_id (str): The stream entry ID.
+
+    Returns:
+        JSONResponse: 200 if removed, 404 if the entry does not exist.
+    """
+    entry = await run_in_threadpool(dlq.get, entry_id)
+    if not entry:
+        return error_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Dead-letter entry not found",
+            error="DLQ_ENTRY_NOT_FOUND",
+        )
+
+    await run_in_threadpool(dlq.remove, entry)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dead-letter entry discarded",
+        data={"id": entry_id, "source_id": entry["source_id"]},
+    )
+
+
+@router.get("/breakers", status_code=status.HTTP_200_OK)
+async def list_circuit_breakers(breaker: HostCircuitBreaker = Depends(get_circuit_breaker)):
+    """
+    Report the circuit breaker state of every host with recent fetch failures.
+
+    Open breakers are listed first, then half-open, then closed hosts by
+    failure ratio.
+
+    Returns:
+        JSONResponse: 200 with one entry per host.
+    """
+    items = await run_in_threadpool(breaker.statuses)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Circuit breakers retrieved successfully",
+        data={"items": items, "count": len(items)},
+    )
+
+
+@router.post("/breakers/{host}/reset", status_code=status.HTTP_200_OK)
+async def reset_circuit_breaker(
+    host: str, breaker: HostCircuitBreaker = Depends(get_circuit_breaker)
+):
+    """
+    Force a host's circuit breaker closed and clear its failure window.
+
+    Args:
+        host (str): The target host, e.g. ``portal.example.gov``.
+
+    Returns:
+        JSONResponse: 200 with the host's state after the reset.
+    """
+    host = host.lower()
+    await run_in_threadpool(breaker.reset, host)
+    logger.info(f"Circuit breaker reset for host {host}")
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Circuit breaker reset successfully",
+        data=await run_in_threadpool(breaker.status, host),
+    )
@@ -0,0 +1,109 @@
+"""
+OpenAPI documentation for extracted fact routes.
+
+Provides response schemas and examples for:
+- GET /facts/{key}/timeline - Values a fact key has taken over time
+- GET /facts/changes - Fact values opened or closed since a point in time
+"""
+
+_fact_example = {
+    "id": "4b0f6a52-9d1e-4c8f-b1a3-7e2d5c9f0a11",
+    "source_id": "123e4567-e89b-12d3-a456-426614174000",
+    "key": "registration_fee",
+    "value": "1,200 NGN",
+    "numeric_value": 1200.0,
+    "valid_from": "2026-09-02T08:15:00",
+    "valid_to": None,
+    "revision_id": "987e6543-e21c-34d5-b678-556655440000",
+}
+
+_previous_fact_example = {
+    **_fact_example,
+    "id": "0c7e2d94-3a5b-4f61-8e0d-2b9c6a4f1e37",
+    "value": "1,000 NGN",
+    "numeric_value": 1000.0,
+    "valid_from": "2026-03-11T08:15:00",
+    "valid_to": "2026-09-02T08:15:00",
+    "revision_id": "5d3c1b2a-8f7e-4d6c-9b0a-1e2f3a4b5c6d",
+}
+
+_no_organization = {
+    "description": "Forbidden - No Active Organization",
+    "content": {
+        "application/json": {
+            "examples": {
+                "no_organization": {
+                    "summary": "No Active Organization",
+                    "value": {
+                        "status": "error",
+                        "status_code": 403,
+                        "message": "User does not belong to an active organization",
+                        "errors": {},
+                    },
+                }
+            }
+        }
+    },
+}
+
+get_fact_timeline_responses = {
+    200: {
+        "description": "Fact Timeline Retrieved Successfully",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "success": {
+                        "summary": "Fact Timeline Retrieved",
+                        "value": {
+                            "status": "success",
+                            "status_code": 200,
+                            "message": "Fact timeline retrieved successfully",
+                            "data": {
+                                "key": "registration_fee",
+                                "facts": [_previous_fact_example, _fact_example],
+                            },
+                        },
+                    }
+                }
+            }
+        },
+    },
+    403: _no_organization,
+}
+
+get_fact_timeline_custom_errors = ["403", "422"]
+get_fact_timeline_custom_success = {
+    "status_code": 200,
+    "description": "Values of the fact key across the organization's sources, oldest first.",
+}
+
+get_fact_changes_responses = {
+    200: {
+        "description": "Fact Changes Retrieved Successfully",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "success": {
+                        "summary": "Fact Changes Retrieved",
+                        "value": {
+                            "status": "success",
+                            "status_code": 200,
+                            "message": "Fact changes retrieved successfully",
+                            "data": {
+                                "since": "2026-09-01T00:00:00",
+                                "facts": [_fact_example, _previous_fact_example],
+                            },
+                        },
+                    }
+                }
+            }
+        },
+    },
+    403: _no_organization,
+}
+
+get_fact_changes_custom_errors = ["403", "422"]
+get_fact_changes_custom_success = {
+    "status_code": 200,
+    "description": "Fact values opened or closed since the given time, newest first.",
+}
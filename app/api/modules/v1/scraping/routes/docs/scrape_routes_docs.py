@@ -24,10 +24,24 @@ manual_scrape_trigger_responses = {
                                 "job_id": "987e6543-e21c-34d5-b678-556655440000",
                                 "source_id": "123e4567-e89b-12d3-a456-426614174000",
                                 "status": "PENDING",
-                                "is_baseline": False,
+                                "coalesced": False,
                             },
                         },
-                    }
+                    },
+                    "coalesced": {
+                        "summary": "Coalesced With Active Run",
+                        "value": {
+                            "status": "success",
+                            "status_code": 202,
+                            "message": "Scrape job coalesced with an active or recent run",
+                            "data": {
+                                "job_id": "987e6543-e21c-34d5-b678-556655440000",
+                                "source_id": "123e4567-e89b-12d3-a456-426614174000",
+                                "status": "IN_PROGRESS",
+                                "coalesced": True,
+                            },
+                        },
+                    },
                 }
             }
         },
@@ -71,7 +85,7 @@ manual_scrape_trigger_responses = {
         },
     },
     409: {
-        "description": "Conflict - Scrape Already In Progress",
+        "description": "Conflict - Concurrent Scrape Finished While Queuing",
         "content": {
             "application/json": {
                 "examples": {
@@ -90,9 +104,28 @@ manual_scrape_trigger_responses = {
             }
         },
     },
+    503: {
+        "description": "Service Unavailable - Scrape Queue Unavailable",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "queue_unavailable": {
+                        "summary": "Scrape Could Not Be Queued",
+                        "value": {
+                            "status": "error",
+                            "status_code": 503,
+                            "message": "Scrape could not be queued. Please try again later.",
+                            "error_code": "SCRAPE_QUEUE_UNAVAILABLE",
+                            "errors": {},
+                        },
+                    }
+                }
+            }
+        },
+    },
 }
 
-manual_scrape_trigger_custom_errors = ["400", "404", "409"]
+manual_scrape_trigger_custom_errors = ["400", "404", "409", "503"]
 manual_scrape_trigger_custom_success = {
     "status_code": 202,
     "description": "Scrape job queued successfully. Use job_id to poll for status.",
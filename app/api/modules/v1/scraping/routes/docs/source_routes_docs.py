@@ -28,6 +28,8 @@ get_source_revisions_responses = {
                                         "ai_confidence_score": 0.95,
                                         "scraped_at": "2025-11-25T10:30:00Z",
                                         "was_change_detected": True,
+                                        "last_confirmed_at": "2025-11-28T10:30:00Z",
+                                        "confirmations": 72,
                                     },
                                     {
                                         "id": "876e5432-d10b-23c4-a567-445544330000",
@@ -654,3 +656,89 @@ update_source_patch_custom_success = {
     "status_code": 200,
     "description": "Source updated successfully via partial update.",
 }
+
+
+# SOURCE NOISE MODEL DOCS
+_noise_model_example = {
+    "volatile_templates": ["Last updated #:#", "Visitors: #"],
+    "pinned_patterns": ["^Session \\w+$"],
+    "kept_templates": [],
+    "tracked_lines": 42,
+    "window": 3,
+}
+
+_source_not_found = {
+    "description": "Not Found - Source Not Found",
+    "content": {
+        "application/json": {
+            "examples": {
+                "source_not_found": {
+                    "summary": "Source Not Found",
+                    "value": {
+                        "status": "error",
+                        "status_code": 404,
+                        "message": "Source not found",
+                        "error_code": "SOURCE_NOT_FOUND",
+                        "errors": {},
+                    },
+                }
+            }
+        }
+    },
+}
+
+get_noise_model_responses = {
+    200: {
+        "description": "Noise Model Retrieved Successfully",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "success": {
+                        "summary": "Noise Model Retrieved",
+                        "value": {
+                            "status": "success",
+                            "status_code": 200,
+                            "message": "Noise model retrieved successfully",
+                            "data": {"noise_model": _noise_model_example},
+                        },
+                    }
+                }
+            }
+        },
+    },
+    404: _source_not_found,
+}
+
+get_noise_model_custom_errors = ["404"]
+get_noise_model_custom_success = {
+    "status_code": 200,
+    "description": "Volatile lines learned for the source, with user overrides.",
+}
+
+update_noise_model_responses = {
+    200: {
+        "description": "Noise Model Updated Successfully",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "success": {
+                        "summary": "Noise Model Updated",
+                        "value": {
+                            "status": "success",
+                            "status_code": 200,
+                            "message": "Noise model updated successfully",
+                            "data": {"noise_model": _noise_model_example},
+                        },
+                    }
+                }
+            }
+        },
+    },
+    404: _source_not_found,
+}
+
+update_noise_model_custom_errors = ["404", "422"]
+update_noise_model_custom_success = {
+    "status_code": 200,
+    "description": "Overrides saved. They apply from the next scrape.",
+}
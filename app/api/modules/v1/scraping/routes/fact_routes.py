@@ -0,0 +1,159 @@
+"""
+API routes for the extracted fact timeline.
+
+Provides endpoints for:
+- GET /facts/{key}/timeline - Values a fact key has taken over time
+- GET /facts/changes - Fact values opened or closed since a point in time
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.api.core.dependencies.auth import TenantGuard
+from app.api.db.database import get_db
+from app.api.modules.v1.organization.models.user_organization_model import UserOrganization
+from app.api.modules.v1.scraping.routes.docs.fact_routes_docs import (
+    get_fact_changes_custom_errors,
+    get_fact_changes_custom_success,
+    get_fact_changes_responses,
+    get_fact_timeline_custom_errors,
+    get_fact_timeline_custom_success,
+    get_fact_timeline_responses,
+)
+from app.api.modules.v1.scraping.schemas.extracted_fact_schema import ExtractedFactResponse
+from app.api.modules.v1.scraping.service.fact_timeline import FactTimelineService
+from app.api.utils.response_payloads import success_response
+
+router = APIRouter(prefix="/facts", tags=["Facts"], dependencies=[Depends(TenantGuard)])
+logger = logging.getLogger("app")
+
+
+async def _organization_id(db: AsyncSession, tenant: TenantGuard) -> uuid.UUID:
+    membership = await db.scalar(
+        select(UserOrganization).where(
+            UserOrganization.user_id == tenant.user.id, UserOrganization.is_active
+        )
+    )
+    if not membership:
+        raise HTTPException(
+            status_code=403, detail="User does not belong to an active organization"
+        )
+    return membership.organization_id
+
+
+def _as_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timeline timestamps are stored as naive UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _serialize(facts):
+    return [ExtractedFactResponse.model_validate(f).model_dump(mode="json") for f in facts]
+
+
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    responses=get_fact_changes_responses,
+)
+async def get_fact_changes(
+    since: datetime = Query(..., description="Return values opened or closed at or after this"),
+    key: Optional[str] = Query(None, description="Restrict to one fact key"),
+    source_id: Optional[uuid.UUID] = Query(None, description="Restrict to one source"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    tenant: TenantGuard = Depends(),
+):
+    """
+    List extracted fact values that changed since a point in time.
+
+    A changed value is returned twice: the old value, closed when the change was
+    scraped, and the new value, opened at the same time.
+
+    Args:
+        since (datetime): Start of the window. Timezone-naive values are UTC.
+        key (Optional[str]): Restrict to one fact key.
+        source_id (Optional[uuid.UUID]): Restrict to one source.
+        limit (int): Maximum number of values.
+        db (AsyncSession): Database session.
+        tenant (TenantGuard): Authenticated tenant.
+
+    Returns:
+        JSONResponse: Standard success response with the changed fact values.
+
+    Raises:
+        HTTPException: 403 if the user has no active organization.
+    """
+    org_id = await _organization_id(db, tenant)
+    since = _as_naive_utc(since)
+
+    service = FactTimelineService(db)
+    facts = await service.changed_since(org_id, since, key=key, source_id=source_id, limit=limit)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Fact changes retrieved successfully",
+        data={"since": since.isoformat(), "facts": _serialize(facts)},
+    )
+
+
+get_fact_changes._custom_errors = get_fact_changes_custom_errors
+get_fact_changes._custom_success = get_fact_changes_custom_success
+
+
+@router.get(
+    "/{key}/timeline",
+    status_code=status.HTTP_200_OK,
+    responses=get_fact_timeline_responses,
+)
+async def get_fact_timeline(
+    key: str,
+    source_id: Optional[uuid.UUID] = Query(None, description="Restrict to one source"),
+    since: Optional[datetime] = Query(None, description="Only values valid at or after this"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    tenant: TenantGuard = Depends(),
+):
+    """
+    Get the values an extracted fact key has taken over time.
+
+    Each value carries the period it was valid; ``valid_to`` is null for the
+    current value of a source.
+
+    Args:
+        key (str): Fact key, as extracted into ``key_value_pairs``.
+        source_id (Optional[uuid.UUID]): Restrict to one source.
+        since (Optional[datetime]): Only values still valid at or after this time.
+        limit (int): Maximum number of values.
+        db (AsyncSession): Database session.
+        tenant (TenantGuard): Authenticated tenant.
+
+    Returns:
+        JSONResponse: Standard success response with the key's values, oldest first.
+
+    Raises:
+        HTTPException: 403 if the user has no active organization.
+    """
+    org_id = await _organization_id(db, tenant)
+
+    service = FactTimelineService(db)
+    facts = await service.key_timeline(
+        org_id, key, source_id=source_id, since=_as_naive_utc(since), limit=limit
+    )
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Fact timeline retrieved successfully",
+        data={"key": key, "facts": _serialize(facts)},
+    )
+
+
+get_fact_timeline._custom_errors = get_fact_timeline_custom_errors
+get_fact_timeline._custom_success = get_fact_timeline_custom_success
@@ -10,6 +10,7 @@ Provides endpoints for:
 
 import logging
 import uuid
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.exc import IntegrityError
@@ -65,8 +66,9 @@ async def manual_scrape_trigger(
     Use the job status endpoint to poll for completion.
 
     Concurrency is controlled per source - only one active job (PENDING or IN_PROGRESS)
-    is allowed per source at a time. If a job is already running, a 409 Conflict
-    response is returned.
+    is allowed per source at a time. A trigger while a job is active, or shortly after
+    one completed, is coalesced with that job and returns its ID instead of scraping
+    again.
 
     Args:
         source_id (uuid.UUID): The UUID of the source to scrape.
@@ -78,7 +80,7 @@ async def manual_scrape_trigger(
 
     Raises:
         HTTPException: 404 if source not found, 400 if source inactive,
-                      409 if scrape already in progress.
+                      409 if a concurrent job was created and finished meanwhile.
     """
     query = select(Source).where(Source.id == source_id)
     result = await db.execute(query)
@@ -98,6 +100,10 @@ async def manual_scrape_trigger(
             error="SOURCE_INACTIVE",
         )
 
+    recent_job = await ScrapeJobService.find_coalescable_job(db, source_id)
+    if recent_job:
+        return _coalesced_response(recent_job, current_user)
+
     try:
         job = ScrapeJob(
             source_id=source_id,
@@ -108,7 +114,11 @@ async def manual_scrape_trigger(
         await db.refresh(job)
 
     except IntegrityError:
+        # A concurrent trigger created the source's active job first.
         await db.rollback()
+        concurrent_job = await ScrapeJobService.find_coalescable_job(db, source_id)
+        if concurrent_job:
+            return _coalesced_response(concurrent_job, current_user)
         return error_response(
             status_code=status.HTTP_409_CONFLICT,
             message="A scrape is already in progress for this source. "
@@ -116,7 +126,20 @@ async def manual_scrape_trigger(
             error="SCRAPE_IN_PROGRESS",
         )
 
-    ScrapeJobService.queue_scrape_job(job.id, source_id)
+    try:
+        await ScrapeJobService.queue_scrape_job(job.id, source_id)
+    except Exception as e:
+        logger.error(f"Failed to queue scrape job {job.id}: {str(e)}", exc_info=True)
+        job.status = ScrapeJobStatus.FAILED
+        job.error_message = "Scrape could not be queued. Please try again later."
+        job.completed_at = datetime.now(timezone.utc)
+        db.add(job)
+        await db.commit()
+        return error_response(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message="Scrape could not be queued. Please try again later.",
+            error="SCRAPE_QUEUE_UNAVAILABLE",
+        )
 
     logger.info(f"User {current_user.id} triggered scrape job {job.id} for source {source_id}")
 
@@ -127,6 +150,25 @@ async def manual_scrape_trigger(
             "job_id": str(job.id),
             "source_id": str(source_id),
             "status": job.status.value,
+            "coalesced": False,
+        },
+    )
+
+
+def _coalesced_response(job: ScrapeJob, current_user: User):
+    """202 response pointing a manual trigger at the job it was coalesced with."""
+    logger.info(
+        f"User {current_user.id} scrape trigger for source {job.source_id} "
+        f"coalesced with job {job.id}"
+    )
+    return success_response(
+        status_code=status.HTTP_202_ACCEPTED,
+        message="Scrape job coalesced with an active or recent run",
+        data={
+            "job_id": str(job.id),
+            "source_id": str(job.source_id),
+            "status": job.status.value,
+            "coalesced": True,
         },
     )
 
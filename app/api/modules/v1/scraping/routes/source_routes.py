@@ -7,6 +7,8 @@ Provides endpoints for:
 - GET /sources/{source_id} - Get single source
 - PUT /sources/{source_id} - Update source
 - DELETE /sources/{source_id} - Delete source
+- GET /sources/{source_id}/noise-model - Inspect learned volatile lines
+- PUT /sources/{source_id}/noise-model - Override learned volatile lines
 """
 
 import logging
@@ -26,6 +28,9 @@ from app.api.modules.v1.scraping.routes.docs.source_routes_docs import (
     delete_source_custom_errors,
     delete_source_custom_success,
     delete_source_responses,
+    get_noise_model_custom_errors,
+    get_noise_model_custom_success,
+    get_noise_model_responses,
     get_source_custom_errors,
     get_source_custom_success,
     get_source_responses,
@@ -35,6 +40,9 @@ from app.api.modules.v1.scraping.routes.docs.source_routes_docs import (
     get_sources_custom_errors,
     get_sources_custom_success,
     get_sources_responses,
+    update_noise_model_custom_errors,
+    update_noise_model_custom_success,
+    update_noise_model_responses,
     update_source_custom_errors,
     update_source_custom_success,
     update_source_patch_custom_errors,
@@ -48,6 +56,7 @@ from app.api.modules.v1.scraping.schemas.data_revision_schema import (
     PaginationMetadata,
 )
 from app.api.modules.v1.scraping.schemas.source_service import (
+    NoiseModelUpdate,
     SourceBulkCreate,
     SourceCreate,
     SourceUpdate,
@@ -490,3 +499,92 @@ async def get_source_revisions(
 
 get_source_revisions._custom_errors = get_source_revisions_custom_errors
 get_source_revisions._custom_success = get_source_revisions_custom_success
+
+
+@router.get(
+    "/{source_id}/noise-model",
+    status_code=status.HTTP_200_OK,
+    responses=get_noise_model_responses,
+)
+async def get_noise_model(
+    source_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Inspect the lines left out of a source's content hash.
+
+    Lines whose text changes on every fetch without a material change (timestamps,
+    counters, session tokens) are learned as volatile templates, in which numbers
+    are shown as ``#`` and token-like strings as ``*``.
+
+    Args:
+        source_id (uuid.UUID): Source unique identifier.
+        db (AsyncSession): Database session.
+        current_user (User): Authenticated user.
+
+    Returns:
+        JSONResponse: Standard success response with the noise model summary.
+
+    Raises:
+        HTTPException: 404 if source not found.
+    """
+    logger.info(f"User {current_user.id} retrieving noise model for source {source_id}")
+
+    service = SourceService()
+    noise_model = await service.get_noise_model(db, source_id)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Noise model retrieved successfully",
+        data={"noise_model": noise_model},
+    )
+
+
+get_noise_model._custom_errors = get_noise_model_custom_errors
+get_noise_model._custom_success = get_noise_model_custom_success
+
+
+@router.put(
+    "/{source_id}/noise-model",
+    status_code=status.HTTP_200_OK,
+    responses=update_noise_model_responses,
+)
+async def update_noise_model(
+    source_id: uuid.UUID,
+    overrides: NoiseModelUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Override a source's learned volatile lines.
+
+    Args:
+        source_id (uuid.UUID): Source unique identifier.
+        overrides (NoiseModelUpdate): Override payload. Fields:
+            - pinned_patterns (Optional[List[str]]): Regexes always left out of the hash
+            - kept_templates (Optional[List[str]]): Learned templates to stop suppressing
+            - reset_learned (bool): Forget all learned templates
+        db (AsyncSession): Database session.
+        current_user (User): Authenticated user.
+
+    Returns:
+        JSONResponse: Standard success response with the updated noise model summary.
+
+    Raises:
+        HTTPException: 404 if source not found, 422 if a pattern is not a valid regex.
+    """
+    logger.info(f"User {current_user.id} updating noise model for source {source_id}")
+
+    service = SourceService()
+    noise_model = await service.update_noise_model(db, source_id, overrides)
+
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Noise model updated successfully",
+        data={"noise_model": noise_model},
+    )
+
+
+update_noise_model._custom_errors = update_noise_model_custom_errors
+update_noise_model._custom_success = update_noise_model_custom_success
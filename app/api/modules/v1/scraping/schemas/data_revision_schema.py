@@ -21,6 +21,8 @@ class DataRevisionResponse(BaseModel):
     scraped_at: datetime
     was_change_detected: bool
     is_baseline: bool
+    last_confirmed_at: Optional[datetime] = None
+    confirmations: int = 0
 
     model_config = ConfigDict(from_attributes=True)
 
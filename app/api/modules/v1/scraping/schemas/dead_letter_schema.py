@@ -0,0 +1,26 @@
+"""
+Pydantic schemas for the scrape dead-letter queue admin API.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class DeadLetterReplayRequest(BaseModel):
+    """Request schema for replaying one throttled batch of dead-lettered scrapes."""
+
+    batch_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="Maximum entries to replay. Defaults to SCRAPE_DLQ_REPLAY_BATCH_SIZE.",
+    )
+    source_id: Optional[str] = Field(default=None, description="Only replay this source")
+    host: Optional[str] = Field(default=None, description="Only replay sources on this host")
+    error_class: Optional[str] = Field(
+        default=None, description="Only replay entries that failed with this error class"
+    )
+    dry_run: bool = Field(
+        default=False, description="Report what would be replayed without dispatching"
+    )
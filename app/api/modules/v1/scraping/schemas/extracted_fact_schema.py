@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ExtractedFactResponse(BaseModel):
+    """
+    Schema for one value of an extracted fact and the period it was valid.
+    """
+
+    id: UUID
+    source_id: UUID
+    key: str
+    value: str
+    numeric_value: Optional[float] = None
+    valid_from: datetime
+    valid_to: Optional[datetime] = None
+    revision_id: UUID
+
+    model_config = ConfigDict(from_attributes=True)
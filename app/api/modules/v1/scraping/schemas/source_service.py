@@ -4,11 +4,12 @@ Pydantic schemas for Source entity.
 Defines request and response models for source CRUD operations.
 """
 
+import re
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 from app.api.modules.v1.scraping.models.source_model import SourceType
 
@@ -71,6 +72,43 @@ class SourceUpdate(BaseModel):
     scraping_rules: Optional[Dict] = None
 
 
+class NoiseModelUpdate(BaseModel):
+    """
+    Schema for overriding a source's learned volatile lines.
+
+    Attributes:
+        pinned_patterns (Optional[List[str]]): Regexes whose lines are always left
+            out of the content hash. Replaces the current list.
+        kept_templates (Optional[List[str]]): Learned templates that must never be
+            suppressed. Replaces the current list.
+        reset_learned (bool): Forget everything learned so far.
+    """
+
+    pinned_patterns: Optional[List[str]] = None
+    kept_templates: Optional[List[str]] = None
+    reset_learned: bool = False
+
+    @field_validator("pinned_patterns")
+    @classmethod
+    def validate_patterns(cls, patterns: Optional[List[str]]) -> Optional[List[str]]:
+        for pattern in patterns or []:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern {pattern!r}: {e}")
+        return patterns
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "pinned_patterns": ["^Visitors today: \\d+$"],
+                "kept_templates": ["Fee: # NGN"],
+                "reset_learned": False,
+            }
+        }
+    )
+
+
 class SourceRead(BaseModel):
     """
     Schema for source responses.
@@ -88,6 +126,11 @@ class SourceRead(BaseModel):
         is_deleted (bool): Whether source is soft-deleted.
         has_auth (bool): Whether source has authentication configured.
         created_at (datetime): Timestamp of creation.
+        last_scraped_at (Optional[datetime]): When the source was last scraped.
+        latest_revision_id (Optional[uuid.UUID]): The newest data revision.
+        latest_content_hash (Optional[str]): Content hash of the newest revision.
+        latest_scraped_at (Optional[datetime]): When the newest revision was scraped.
+        latest_change_detected (Optional[bool]): Whether the newest revision is a change.
     """
 
     id: uuid.UUID
@@ -100,6 +143,11 @@ class SourceRead(BaseModel):
     is_deleted: bool
     has_auth: bool
     created_at: datetime
+    last_scraped_at: Optional[datetime] = None
+    latest_revision_id: Optional[uuid.UUID] = None
+    latest_content_hash: Optional[str] = None
+    latest_scraped_at: Optional[datetime] = None
+    latest_change_detected: Optional[bool] = None
 
     model_config = ConfigDict(from_attributes=True)
 
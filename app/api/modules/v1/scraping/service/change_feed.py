@@ -0,0 +1,300 @@
+"""Feed- and sitemap-driven change probing for the dispatcher.
+
+Many regulators publish RSS/Atom feeds or sitemaps with ``<lastmod>``. A source
+can declare one in its scraping rules::
+
+    {
+        "change_feed": {
+            "url": "https://regulator.gov/sitemap.xml",
+            "entry": "https://regulator.gov/rules/fees",   # defaults to the source URL
+            "safety_hours": 168                            # defaults to SCRAPE_FEED_SAFETY_HOURS
+        }
+    }
+
+or simply ``"change_feed": "https://regulator.gov/feed.xml"``.
+
+When a feed-watched source falls due, the dispatcher polls its feed (once per
+tick for every source that shares the feed URL, e.g. all pages of one
+jurisdiction listed in one sitemap) and only enqueues a full scrape if the
+source's entry changed since it was last successfully scraped. A conditional request
+keeps unchanged feeds to a 304. Sources missing from the feed, feeds that
+cannot be fetched or parsed, and sources not fully scraped within their safety
+interval are always scraped.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import httpx
+import redis
+from lxml import etree
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.fetch_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+FEED_RULE = "change_feed"
+SEEN_KEY = "scraping:feed_seen:{source_id}"
+VALIDATORS_KEY = "scraping:feed_validators:{digest}"
+ENTRIES_KEY = "scraping:feed_entries:{digest}"
+FEED_STATE_TTL_SECONDS = 7 * 24 * 3600
+SEEN_TTL_SECONDS = 30 * 24 * 3600
+NOT_MODIFIED = object()
+
+_ENTRY_TAGS = {"item", "entry", "url", "sitemap"}
+_LINK_TAGS = ("loc", "link")
+_STAMP_TAGS = ("lastmod", "updated", "pubDate", "modified", "published", "date")
+
+
+@dataclass(frozen=True)
+class FeedRule:
+    """A source's change feed declaration.
+
+    Attributes:
+        url (str): Feed or sitemap URL.
+        entry (str): The URL to look up in the feed.
+        safety_hours (int): Scrape anyway once the last full scrape is this old.
+    """
+
+    url: str
+    entry: str
+    safety_hours: int
+
+    @classmethod
+    def from_source(cls, source: Any) -> Optional["FeedRule"]:
+        """Return the source's feed rule, or None if it declares none."""
+        rule = (source.scraping_rules or {}).get(FEED_RULE)
+        if isinstance(rule, str):
+            rule = {"url": rule}
+        if not isinstance(rule, dict) or not rule.get("url"):
+            return None
+        try:
+            safety_hours = int(rule.get("safety_hours") or settings.SCRAPE_FEED_SAFETY_HOURS)
+        except (TypeError, ValueError):
+            safety_hours = settings.SCRAPE_FEED_SAFETY_HOURS
+        return cls(
+            url=rule["url"], entry=rule.get("entry") or source.url, safety_hours=safety_hours
+        )
+
+
+def _digest(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _local(tag: Any) -> str:
+    return etree.QName(tag).localname if isinstance(tag, str) else ""
+
+
+def parse_feed(content: bytes) -> Dict[str, str]:
+    """Map every entry URL in an RSS, Atom or sitemap document to a change signature.
+
+    The signature is the entry's modification stamp when it has one, otherwise
+    a hash of the whole entry.
+
+    Args:
+        content (bytes): The feed document.
+
+    Returns:
+        Dict[str, str]: Normalized entry URL to signature.
+
+    Raises:
+        etree.XMLSyntaxError: If the document is not well-formed XML.
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+    root = etree.fromstring(content, parser=parser)
+    entries = {}
+    for element in root.iter():
+        if _local(element.tag) not in _ENTRY_TAGS:
+            continue
+        children = {_local(child.tag): child for child in element}
+        link = None
+        for tag in _LINK_TAGS:
+            child = children.get(tag)
+            if child is not None:
+                link = (child.text or "").strip() or child.get("href")
+                break
+        if not link:
+            continue
+        stamp = next(
+            ((children[tag].text or "").strip() for tag in _STAMP_TAGS if tag in children),
+            "",
+        )
+        signature = stamp or hashlib.sha256(etree.tostring(element)).hexdigest()[:32]
+        entries[normalize_url(link)] = signature
+    return entries
+
+
+def record_feed_signature(redis_client: redis.Redis, source_id: Any, signature: str) -> None:
+    """Remember the feed signature a source was successfully scraped for.
+
+    Called by the scrape task once the scrape succeeded, never at dispatch, so a
+    failed scrape leaves the entry looking changed and the next tick retries it.
+    """
+    try:
+        redis_client.set(SEEN_KEY.format(source_id=source_id), signature, ex=SEEN_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning(f"Could not record change feed signature for {source_id}: {e}")
+
+
+class ChangeFeedProber:
+    """Decides which feed-watched sources need a full scrape this tick.
+
+    Examples:
+        >>> prober = ChangeFeedProber(redis_client)
+        >>> skipped = await prober.probe(sources, now)
+        >>> ...dispatch the others with prober.pending_signature(source_id)...
+        >>> record_feed_signature(redis_client, source_id, signature)  # after the scrape
+    """
+
+    def __init__(self, redis_client: redis.Redis, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the prober.
+
+        Args:
+            redis_client (redis.Redis): Synchronous Redis client with ``decode_responses=True``.
+            client (Optional[httpx.AsyncClient]): HTTP client, injectable for tests.
+        """
+        self.redis = redis_client
+        self.client = client
+        self._pending: Dict[str, str] = {}
+
+    async def probe(self, sources: Iterable[Any], now: datetime) -> Set[Any]:
+        """Return the ids of sources whose feed entry is unchanged.
+
+        Args:
+            sources (Iterable[Any]): Due sources.
+            now (datetime): Current time, timezone-aware.
+
+        Returns:
+            Set[Any]: Ids of sources that can skip this scrape.
+        """
+        watched: Dict[str, List[tuple]] = {}
+        for source in sources:
+            rule = FeedRule.from_source(source)
+            if rule is None:
+                continue
+            last = source.last_scraped_at
+            safety_due = last is None or now - last >= timedelta(hours=rule.safety_hours)
+            watched.setdefault(rule.url, []).append((source, rule, safety_due))
+        if not watched:
+            return set()
+
+        if self.client is not None:
+            feeds = await self._fetch_all(self.client, list(watched))
+        else:
+            async with httpx.AsyncClient(
+                timeout=settings.SCRAPE_FEED_TIMEOUT_SECONDS, follow_redirects=True
+            ) as client:
+                feeds = await self._fetch_all(client, list(watched))
+
+        skipped = set()
+        for feed_url, members in watched.items():
+            entries = feeds.get(feed_url)
+            if entries is None:
+                continue
+            entries = self._watched_entries(feed_url, entries, [m[1] for m in members])
+            for source, rule, safety_due in members:
+                if self._unchanged(source, rule, entries) and not safety_due:
+                    skipped.add(source.id)
+        if skipped:
+            logger.info(
+                f"Change feeds: {len(skipped)} sources unchanged across {len(watched)} feeds"
+            )
+        return skipped
+
+    def pending_signature(self, source_id: Any) -> Optional[str]:
+        """Return the changed feed signature a dispatched source should record on success."""
+        return self._pending.get(str(source_id))
+
+    def _watched_entries(
+        self, feed_url: str, entries: Any, rules: List[FeedRule]
+    ) -> Dict[str, str]:
+        """Return the signatures of the watched entries of one feed.
+
+        Signatures of a freshly parsed feed are saved, so that a later 304 can be
+        answered from them.
+        """
+        key = ENTRIES_KEY.format(digest=_digest(feed_url))
+        watched = sorted({normalize_url(rule.entry) for rule in rules})
+        try:
+            if entries is NOT_MODIFIED:
+                return {u: v for u, v in zip(watched, self.redis.hmget(key, watched)) if v}
+            found = {u: entries[u] for u in watched if u in entries}
+            if found:
+                pipe = self.redis.pipeline()
+                pipe.hset(key, mapping=found)
+                pipe.expire(key, FEED_STATE_TTL_SECONDS)
+                pipe.execute()
+            return found
+        except redis.RedisError as e:
+            logger.warning(f"Could not access change feed entries for {feed_url}: {e}")
+            return {} if entries is NOT_MODIFIED else entries
+
+    def _unchanged(self, source: Any, rule: FeedRule, entries: Dict[str, str]) -> bool:
+        """Compare the source's feed entry with what it was last scraped for."""
+        signature = entries.get(normalize_url(rule.entry))
+        if signature is None:
+            return False
+        try:
+            seen = self.redis.get(SEEN_KEY.format(source_id=source.id))
+        except redis.RedisError as e:
+            logger.warning(f"Could not read change feed signature for {source.id}: {e}")
+            return False
+        if seen == signature:
+            return True
+        self._pending[str(source.id)] = signature
+        return False
+
+    async def _fetch_all(self, client: httpx.AsyncClient, urls: List[str]) -> Dict[str, Any]:
+        results = await asyncio.gather(*(self._fetch(client, url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Any:
+        """Fetch and parse one feed.
+
+        Returns ``NOT_MODIFIED`` on a 304 and None when the feed is unusable.
+        """
+        key = VALIDATORS_KEY.format(digest=_digest(url))
+        try:
+            validators = json.loads(self.redis.get(key) or "{}")
+        except (redis.RedisError, ValueError):
+            validators = {}
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                content = bytearray()
+                async for chunk in response.aiter_bytes():
+                    content += chunk
+                    if len(content) > settings.SCRAPE_FEED_MAX_BYTES:
+                        raise ValueError("feed exceeds SCRAPE_FEED_MAX_BYTES")
+                entries = parse_feed(bytes(content))
+        except (httpx.HTTPError, ValueError, etree.XMLSyntaxError) as e:
+            logger.warning(f"Change feed {url} unusable, scraping its sources: {e}")
+            return None
+
+        new_validators = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        try:
+            if any(new_validators.values()):
+                self.redis.set(key, json.dumps(new_validators), ex=FEED_STATE_TTL_SECONDS)
+            else:
+                self.redis.delete(key)
+        except redis.RedisError as e:
+            logger.warning(f"Could not store change feed validators for {url}: {e}")
+        return entries
@@ -0,0 +1,240 @@
+"""Per-host circuit breaker for the fetch tier, shared across workers via Redis.
+
+Fetch outcomes are counted per host in a sliding window of time buckets. When a
+host's failure ratio crosses ``SCRAPE_BREAKER_FAILURE_RATIO`` over at least
+``SCRAPE_BREAKER_MIN_REQUESTS`` fetches, its breaker opens and scrapes for that
+host are rescheduled instead of run. After the open period one worker is let
+through as a half-open probe: success closes the breaker, failure re-opens it
+with a longer cool-down.
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from app.api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BREAKER_STATE_KEY = "scraping:breaker:{host}"
+BREAKER_PROBE_KEY = "scraping:breaker_probe:{host}"
+BREAKER_WINDOW_KEY = "scraping:breaker_window:{host}:{bucket}"
+BREAKER_HOSTS_KEY = "scraping:breaker_hosts"
+
+WINDOW_BUCKETS = 10
+MAX_BACKOFF_EXPONENT = 3
+
+
+class BreakerState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+@dataclass
+class BreakerDecision:
+    """Whether a scrape for a host may run now.
+
+    Attributes:
+        allowed (bool): True if the scrape may run.
+        state (BreakerState): The breaker state the decision was based on.
+        retry_at (Optional[datetime]): When to reschedule a denied scrape.
+        probe (bool): True if this scrape is the half-open probe.
+    """
+
+    allowed: bool
+    state: BreakerState
+    retry_at: Optional[datetime] = None
+    probe: bool = False
+
+
+class HostCircuitBreaker:
+    """Closed/open/half-open breaker keyed by target host.
+
+    Redis failures never block scrapes: the breaker fails closed (allows).
+
+    Examples:
+        >>> breaker = HostCircuitBreaker(redis_client)
+        >>> decision = breaker.allow("portal.example.gov")
+        >>> if not decision.allowed:
+        ...     reschedule(source, decision.retry_at)
+    """
+
+    HALF_OPEN_RETRY_SECONDS = 60
+
+    def __init__(self, redis_client: Any, clock=time.time):
+        """Initialize the breaker.
+
+        Args:
+            redis_client: A synchronous Redis client with ``decode_responses=True``.
+            clock: Wall clock returning epoch seconds, injectable for tests.
+        """
+        self.redis = redis_client
+        self._clock = clock
+        self.window_seconds = settings.SCRAPE_BREAKER_WINDOW_SECONDS
+        self.bucket_seconds = max(1, self.window_seconds // WINDOW_BUCKETS)
+        self.min_requests = settings.SCRAPE_BREAKER_MIN_REQUESTS
+        self.failure_ratio = settings.SCRAPE_BREAKER_FAILURE_RATIO
+        self.open_seconds = settings.SCRAPE_BREAKER_OPEN_SECONDS
+
+    def allow(self, host: str) -> BreakerDecision:
+        """Decide whether a scrape for ``host`` may run now.
+
+        Args:
+            host (str): The target host.
+
+        Returns:
+            BreakerDecision: The decision, with a jittered ``retry_at`` when denied.
+        """
+        try:
+            data = self.redis.hgetall(BREAKER_STATE_KEY.format(host=host)) or {}
+            state = BreakerState(data.get("state", BreakerState.CLOSED))
+            now = self._clock()
+
+            if state == BreakerState.CLOSED:
+                return BreakerDecision(allowed=True, state=state)
+
+            open_until = float(data.get("open_until", 0))
+            if state == BreakerState.OPEN and now < open_until:
+                return BreakerDecision(
+                    allowed=False, state=state, retry_at=self._jittered(open_until)
+                )
+
+            probe = self.redis.set(
+                BREAKER_PROBE_KEY.format(host=host),
+                "1",
+                nx=True,
+                ex=settings.SCRAPE_TIME_BUDGET_SECONDS + 60,
+            )
+            if probe:
+                self._set_state(host, BreakerState.HALF_OPEN)
+                logger.info(f"Circuit half-open for {host}; letting one probe through")
+                return BreakerDecision(allowed=True, state=BreakerState.HALF_OPEN, probe=True)
+
+            return BreakerDecision(
+                allowed=False,
+                state=BreakerState.HALF_OPEN,
+                retry_at=self._jittered(now + self.HALF_OPEN_RETRY_SECONDS),
+            )
+        except (redis.RedisError, ValueError) as e:
+            logger.warning(f"Circuit breaker unavailable for {host}: {e}")
+            return BreakerDecision(allowed=True, state=BreakerState.CLOSED)
+
+    def record_success(self, host: str) -> None:
+        """Record a successful fetch; closes a half-open breaker."""
+        try:
+            self._count(host, "success")
+            state = self.redis.hget(BREAKER_STATE_KEY.format(host=host), "state")
+            if state in (BreakerState.HALF_OPEN, BreakerState.OPEN):
+                self.reset(host)
+                logger.info(f"Circuit closed for {host} after successful probe")
+        except redis.RedisError as e:
+            logger.warning(f"Could not record fetch success for {host}: {e}")
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed fetch; may open the breaker."""
+        try:
+            self._count(host, "failure")
+            self.redis.sadd(BREAKER_HOSTS_KEY, host)
+            data = self.redis.hgetall(BREAKER_STATE_KEY.format(host=host)) or {}
+            state = data.get("state", BreakerState.CLOSED)
+
+            if state == BreakerState.HALF_OPEN:
+                self._open(host, trips=int(data.get("trips", 0)) + 1)
+                return
+            if state == BreakerState.OPEN:
+                return
+
+            successes, failures = self._window(host)
+            total = successes + failures
+            if total >= self.min_requests and failures / total >= self.failure_ratio:
+                self._open(host, trips=int(data.get("trips", 0)) + 1)
+        except redis.RedisError as e:
+            logger.warning(f"Could not record fetch failure for {host}: {e}")
+
+    def reset(self, host: str) -> None:
+        """Force the breaker closed and clear its window."""
+        bucket = self._bucket()
+        keys = [BREAKER_STATE_KEY.format(host=host), BREAKER_PROBE_KEY.format(host=host)]
+        keys += [
+            BREAKER_WINDOW_KEY.format(host=host, bucket=b)
+            for b in range(bucket - WINDOW_BUCKETS + 1, bucket + 1)
+        ]
+        self.redis.delete(*keys)
+        self.redis.srem(BREAKER_HOSTS_KEY, host)
+
+    def status(self, host: str) -> Dict[str, Any]:
+        """Return the breaker state and window counts for a host."""
+        data = self.redis.hgetall(BREAKER_STATE_KEY.format(host=host)) or {}
+        successes, failures = self._window(host)
+        total = successes + failures
+        open_until = data.get("open_until")
+        return {
+            "host": host,
+            "state": data.get("state", BreakerState.CLOSED.value),
+            "open_until": (
+                datetime.fromtimestamp(float(open_until), timezone.utc).isoformat()
+                if open_until
+                else None
+            ),
+            "trips": int(data.get("trips", 0)),
+            "window_seconds": self.window_seconds,
+            "successes": successes,
+            "failures": failures,
+            "failure_ratio": round(failures / total, 3) if total else 0.0,
+        }
+
+    def statuses(self) -> List[Dict[str, Any]]:
+        """Return the status of every host that recently failed, open breakers first."""
+        order = {BreakerState.OPEN: 0, BreakerState.HALF_OPEN: 1, BreakerState.CLOSED: 2}
+        entries = [self.status(host) for host in self.redis.smembers(BREAKER_HOSTS_KEY)]
+        return sorted(
+            entries,
+            key=lambda e: (order[BreakerState(e["state"])], -e["failure_ratio"], e["host"]),
+        )
+
+    def _open(self, host: str, trips: int) -> None:
+        cooldown = self.open_seconds * 2 ** min(trips - 1, MAX_BACKOFF_EXPONENT)
+        open_until = self._clock() + min(cooldown, settings.SCRAPE_MAX_DELAY)
+        self._set_state(host, BreakerState.OPEN, open_until=open_until, trips=trips)
+        self.redis.delete(BREAKER_PROBE_KEY.format(host=host))
+        logger.warning(f"Circuit opened for {host} (trip {trips}) until {open_until:.0f}")
+
+    def _set_state(self, host: str, state: BreakerState, **fields: Any) -> None:
+        mapping = {"state": state.value, "changed_at": str(self._clock())}
+        mapping.update({key: str(value) for key, value in fields.items()})
+        self.redis.hset(BREAKER_STATE_KEY.format(host=host), mapping=mapping)
+
+    def _bucket(self) -> int:
+        return int(self._clock() // self.bucket_seconds)
+
+    def _count(self, host: str, outcome: str) -> None:
+        key = BREAKER_WINDOW_KEY.format(host=host, bucket=self._bucket())
+        pipe = self.redis.pipeline()
+        pipe.hincrby(key, outcome, 1)
+        pipe.expire(key, self.window_seconds + self.bucket_seconds)
+        pipe.execute()
+
+    def _window(self, host: str) -> tuple[int, int]:
+        bucket = self._bucket()
+        pipe = self.redis.pipeline()
+        for b in range(bucket - WINDOW_BUCKETS + 1, bucket + 1):
+            pipe.hgetall(BREAKER_WINDOW_KEY.format(host=host, bucket=b))
+        successes = failures = 0
+        for counts in pipe.execute():
+            successes += int((counts or {}).get("success", 0))
+            failures += int((counts or {}).get("failure", 0))
+        return successes, failures
+
+    @staticmethod
+    def _jittered(epoch_seconds: float) -> datetime:
+        spread = random.uniform(0, 30)
+        return datetime.fromtimestamp(epoch_seconds + spread, timezone.utc)
@@ -1,14 +1,69 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import cloudscraper
 
+from app.api.modules.v1.scraping.service.download import (
+    CHUNK_SIZE,
+    DownloadTooLargeError,
+    SpooledDownload,
+)
+from app.api.modules.v1.scraping.service.host_limiter import host_for
 from app.api.modules.v1.scraping.service.playwright_service import PlaywrightService
+from app.api.modules.v1.scraping.service.render_profile import RenderProfile
+from app.api.modules.v1.scraping.service.session_store import (
+    USER_AGENT,
+    DomainSessionStore,
+    cookies_from_jar,
+    load_cookies_into_jar,
+    session_context,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class SourceFetchError(Exception):
+    """Raised when both fetch tiers fail to retrieve a URL."""
+
+    pass
+
+
+@dataclass
+class FetchResult:
+    """Fetched body together with the response validators.
+
+    Attributes:
+        body (SpooledDownload): Response body; empty for a 304 Not Modified.
+        status_code (int): HTTP status, 200 for Playwright fetches.
+        content_type (str): Response content type, if known.
+        etag (Optional[str]): ``ETag`` validator, if the server sent one.
+        last_modified (Optional[str]): ``Last-Modified`` validator, if sent.
+    """
+
+    body: SpooledDownload
+    status_code: int = 200
+    content_type: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, content: bytes, **kwargs: Any) -> "FetchResult":
+        """Build a result from a body that is already in memory."""
+        return cls(body=SpooledDownload.from_bytes(content), **kwargs)
+
+    @property
+    def content(self) -> bytes:
+        """The whole body as bytes. Prefer ``body.stream()`` for large documents."""
+        return self.body.read_bytes()
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+
 class HTTPClientService:
     """Tiered fetching service for web content.
 
@@ -17,6 +72,8 @@ class HTTPClientService:
     2. Slow Path: Falls back to Playwright for JS-heavy sites or strict bot protection.
     """
 
+    FAST_PATH_TIMEOUT = 15
+
     def __init__(self):
         """Initialize the HTTPClientService.
 
@@ -39,91 +96,211 @@ class HTTPClientService:
             browser={"browser": "chrome", "platform": "windows", "desktop": True}
         )
         self.browser = PlaywrightService()
+        self.session_store: Optional[DomainSessionStore] = None
 
-    async def fetch_content(self, url: str, auth_creds: Optional[Dict[str, Any]] = None) -> bytes:
-        """Fetch web content using a tiered approach.
+    def use_session_store(self, session_store: Optional[DomainSessionStore]) -> None:
+        """Share per-domain session state with other workers through ``session_store``.
 
-        Attempts to fetch content efficiently via Cloudscraper,
-        falling back to Playwright if needed.
+        Both tiers resume saved cookies (and Playwright storage state) for the
+        target host, with the User-Agent they were earned with, and save what
+        they earn after a successful fetch.
+
+        Args:
+            session_store (Optional[DomainSessionStore]): The store, or None to stop sharing.
+        """
+        self.session_store = session_store
+        self.browser.session_store = session_store
+
+    async def fetch(
+        self,
+        url: str,
+        auth_creds: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        render_profile: Optional[RenderProfile] = None,
+        max_bytes: Optional[int] = None,
+    ) -> FetchResult:
+        """Fetch web content using a tiered approach, streaming it into a bounded body.
+
+        Attempts to fetch content efficiently via Cloudscraper, falling back to
+        Playwright if needed. Both tiers stream the body into a
+        ``SpooledDownload`` that is hashed on the way and capped at
+        ``max_bytes``. When ``etag`` or ``last_modified`` are given the fast
+        path sends a conditional request and may return a 304 result with an
+        empty body.
 
         Args:
             url (str): The URL to fetch content from.
             auth_creds (Optional[Dict[str, Any]]): Optional auth credentials
                 for Playwright fallback.
+            timeout (Optional[float]): Seconds left in the scrape budget.
+            etag (Optional[str]): Validator for ``If-None-Match``.
+            last_modified (Optional[str]): Validator for ``If-Modified-Since``.
+            render_profile (Optional[RenderProfile]): How the Playwright fallback
+                renders the page.
+            max_bytes (Optional[int]): Download size cap. Defaults to
+                ``SCRAPE_MAX_DOWNLOAD_BYTES``.
 
         Returns:
-            bytes: The fetched content as bytes.
+            FetchResult: The body and validators. The caller closes ``body``.
 
         Raises:
-            RequestException: If the request fails in the fast path.
-            ValueError: If suspicious content is detected in the fast path.
-            Exception: For other errors during fetching.
-
-        Examples:
-            >>> content = await service.fetch_content('https://example.com')
-            >>> print(len(content))
-            1234
+            DownloadTooLargeError: If the body exceeds ``max_bytes``.
+            SourceFetchError: If both the fast path and the Playwright fallback fail.
         """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        started_at = time.monotonic()
+        context = session_context(auth_creds)
+        saved_state = await self._restore_session(url, context)
+
         try:
-            return await self._fetch_fast_path(url)
+            result = await asyncio.to_thread(
+                self._sync_get, url, self._fast_timeout(timeout), headers, max_bytes
+            )
+        except DownloadTooLargeError:
+            raise
         except Exception as e:
             logger.warning(f"Fast path failed for {url}: {str(e)}. Escalating to Playwright.")
-            return await self.browser.scrape(url, creds=auth_creds)
-
-    async def _fetch_fast_path(self, url: str) -> bytes:
-        """Fetch content using Cloudscraper in a separate thread.
-
-        Executes the blocking Cloudscraper call asynchronously to avoid freezing the event loop.
-
-        Args:
-            url (str): The URL to fetch content from.
-
-        Returns:
-            bytes: The fetched content as bytes.
-
-        Raises:
-            RequestException: If the HTTP request fails.
-            ValueError: If suspicious content (e.g., JS-wall) is detected.
-
-        Examples:
-            >>> content = await service._fetch_fast_path('https://example.com')
-            >>> print(content[:10])
-            b'<!DOCTYPE'
-        """
-        return await asyncio.to_thread(self._sync_request, url)
-
-    def _sync_request(self, url: str) -> bytes:
-        """Perform synchronous HTTP request using Cloudscraper.
+            body = await self._fetch_with_browser(
+                url, auth_creds, timeout, started_at, render_profile, max_bytes
+            )
+            return FetchResult(body=body)
+
+        await self._persist_session(url, context, saved_state)
+        return result
+
+    async def _restore_session(self, url: str, context: str) -> Optional[Dict[str, Any]]:
+        """Load the saved cookies and User-Agent for the URL's host into Cloudscraper."""
+        if self.session_store is None:
+            return None
+        state = await self.session_store.load(url, context)
+        if state:
+            load_cookies_into_jar(self.scraper.cookies, state["cookies"])
+            if state.get(USER_AGENT):
+                self.scraper.headers["User-Agent"] = state[USER_AGENT]
+        return state
+
+    async def _persist_session(
+        self, url: str, context: str, saved_state: Optional[Dict[str, Any]]
+    ) -> None:
+        """Save the session's cookies and User-Agent for the URL's host if they changed."""
+        if self.session_store is None:
+            return
+        saved_state = saved_state or {}
+        cookies = cookies_from_jar(self.scraper.cookies, host_for(url))
+        user_agent = self.scraper.headers.get("User-Agent")
+        previous = saved_state.get("cookies", [])
+
+        def identity(items):
+            return {(c["name"], c["domain"].lstrip("."), c["path"], c["value"]) for c in items}
+
+        if identity(cookies) == identity(previous) and user_agent == saved_state.get(USER_AGENT):
+            return
+        origins = saved_state.get("origins", [])
+        await self.session_store.save(
+            url, {"cookies": cookies, "origins": origins, USER_AGENT: user_agent}, context
+        )
 
-        Makes a GET request with timeout and checks for suspicious content.
+    def _fast_timeout(self, timeout: Optional[float]) -> float:
+        if timeout is None:
+            return self.FAST_PATH_TIMEOUT
+        return min(self.FAST_PATH_TIMEOUT, timeout)
+
+    async def _fetch_with_browser(
+        self,
+        url: str,
+        auth_creds: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        started_at: float,
+        render_profile: Optional[RenderProfile] = None,
+        max_bytes: Optional[int] = None,
+    ) -> SpooledDownload:
+        """Run the Playwright fallback with what is left of ``timeout``."""
+        options: Dict[str, Any] = {"creds": auth_creds}
+        if timeout is not None:
+            options["timeout"] = max(0.0, timeout - (time.monotonic() - started_at))
+        if render_profile is not None:
+            options["render_profile"] = render_profile
+        if max_bytes is not None:
+            options["max_bytes"] = max_bytes
+        try:
+            return await self.browser.scrape(url, **options)
+        except Exception as browser_error:
+            raise SourceFetchError(
+                f"Fetch failed for {url}: {type(browser_error).__name__}: {browser_error}"
+            ) from browser_error
+
+    def _sync_get(
+        self,
+        url: str,
+        timeout: float = FAST_PATH_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> FetchResult:
+        """Stream a Cloudscraper GET into a bounded body.
 
         Args:
             url (str): The URL to request.
+            timeout (float): Request timeout in seconds.
+            headers (Optional[Dict[str, str]]): Extra request headers, e.g. conditional ones.
+            max_bytes (Optional[int]): Download size cap. Defaults to
+                ``SCRAPE_MAX_DOWNLOAD_BYTES``.
 
         Returns:
-            bytes: The response content as bytes.
+            FetchResult: The response body and validators.
 
         Raises:
             RequestException: If the request fails (e.g., timeout, bad status).
+            DownloadTooLargeError: If the body is larger than ``max_bytes``.
             ValueError: If the content appears to be a loading shell or JS-wall.
-
-        Examples:
-            >>> content = service._sync_request('https://example.com')
-            >>> print(len(content))
-            5678
         """
+        if headers:
+            response = self.scraper.get(url, timeout=timeout, headers=headers, stream=True)
+        else:
+            response = self.scraper.get(url, timeout=timeout, stream=True)
 
-        response = self.scraper.get(url, timeout=15)
-        response.raise_for_status()
-
-        content_type = response.headers.get("content-type", "").lower()
-        content = response.content
-
-        if "text/html" in content_type and len(content) < 800:
-            text_sample = response.text.lower()
-            suspicious_terms = ["javascript", "enable", "loading", "wait"]
-            if any(term in text_sample for term in suspicious_terms):
-                raise ValueError("Detected likely JS-wall or Loading shell")
-
-        logger.info(f"Fast fetch successful: {url} ({content_type}) - {len(content)} bytes")
-        return content
+        try:
+            validators = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+            if response.status_code == 304:
+                logger.info(f"Fast fetch not modified: {url}")
+                return FetchResult(body=SpooledDownload(), status_code=304, **validators)
+
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "").lower()
+            body = SpooledDownload(max_bytes=max_bytes)
+            try:
+                declared = str(response.headers.get("content-length", ""))
+                if declared.isdigit() and int(declared) > body.max_bytes:
+                    raise DownloadTooLargeError(body.max_bytes)
+                body.write_chunks(response.iter_content(chunk_size=CHUNK_SIZE))
+
+                if "text/html" in content_type and body.size < 800:
+                    text_sample = body.read_bytes().decode("utf-8", errors="ignore").lower()
+                    suspicious_terms = ["javascript", "enable", "loading", "wait"]
+                    if any(term in text_sample for term in suspicious_terms):
+                        raise ValueError("Detected likely JS-wall or Loading shell")
+            except Exception:
+                body.close()
+                raise
+        finally:
+            response.close()
+
+        logger.info(
+            f"Fast fetch successful: {url} ({content_type}) - {body.size} bytes, "
+            f"sha256 {body.sha256[:12]}"
+        )
+        return FetchResult(
+            body=body,
+            status_code=response.status_code,
+            content_type=content_type,
+            **validators,
+        )
@@ -0,0 +1,354 @@
+"""Dead-letter queue for scrapes that exhausted their retries.
+
+Failed scrapes are appended to a capped Redis Stream. The stream keeps at most
+one entry per source: a repeat failure replaces the previous entry and bumps its
+``failures`` counter. Entries older than the retention window are trimmed on
+every write.
+
+The same ``DeadLetterQueue`` backs the Celery task that writes entries, the
+admin API and the ``scripts/dlq.py`` CLI. Replays are released in batches sized
+by the free capacity of the target Celery queue and gated by the per-host
+limiter, so recovering thousands of sources after an outage never floods the
+fleet or a single site.
+"""
+
+import json
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.fair_queue import PriorityClass, queue_for
+from app.api.modules.v1.scraping.service.host_limiter import HostRateLimiter, host_for
+
+logger = logging.getLogger(__name__)
+
+DLQ_STREAM_KEY = "scraping:dlq"
+DLQ_INDEX_KEY = "scraping:dlq:index"
+LEGACY_DLQ_KEY = "celery:scraping_dlq"
+
+GROUP_FIELDS = {"source": "source_id", "host": "host", "error_class": "error_class"}
+
+SCAN_CHUNK = 500
+
+
+def _send_scrape_task(source_id: str, queue: str) -> None:
+    """Publish a scrape_source task for a replayed entry."""
+    from app.celery_app import celery_app
+
+    celery_app.send_task(
+        "app.api.modules.v1.scraping.service.tasks.scrape_source",
+        args=[source_id],
+        queue=queue,
+    )
+
+
+class DeadLetterQueue:
+    """Capped, de-duplicated dead-letter stream of failed scrapes.
+
+    Examples:
+        >>> dlq = DeadLetterQueue(redis_client)
+        >>> dlq.add(source_id, url, "TimeoutError", "timed out", task_id="abc")
+        >>> dlq.summary()["by_host"][:1]
+        [{'key': 'example.gov', 'count': 1}]
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        maxlen: Optional[int] = None,
+        retention_days: Optional[int] = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            redis_client: A synchronous Redis client with ``decode_responses=True``.
+            maxlen (Optional[int]): Approximate stream cap. Defaults to ``SCRAPE_DLQ_MAXLEN``.
+            retention_days (Optional[int]): Entry retention. Defaults to
+                ``SCRAPE_DLQ_RETENTION_DAYS``.
+        """
+        self.redis = redis_client
+        self.maxlen = maxlen or settings.SCRAPE_DLQ_MAXLEN
+        self.retention_days = retention_days or settings.SCRAPE_DLQ_RETENTION_DAYS
+
+    # ------------------------------------------------------------------ writes
+
+    def add(
+        self,
+        source_id: str,
+        url: Optional[str],
+        error_class: str,
+        error_message: str,
+        task_id: Optional[str] = None,
+        failed_at: Optional[datetime] = None,
+        failures: int = 1,
+    ) -> str:
+        """Record a failed scrape, replacing any earlier entry for the source.
+
+        Args:
+            source_id (str): The failed source.
+            url (Optional[str]): The source URL, used for host grouping and throttling.
+            error_class (str): Exception class name of the final failure.
+            error_message (str): Final error message.
+            task_id (Optional[str]): Celery task ID of the failed run.
+            failed_at (Optional[datetime]): Failure time. Defaults to now.
+            failures (int): Failures this entry represents.
+
+        Returns:
+            str: The new stream entry ID.
+        """
+        previous = self._indexed_entry(source_id)
+        if previous:
+            failures += int(previous.get("failures", 1))
+            self.redis.xdel(DLQ_STREAM_KEY, previous["id"])
+
+        fields = {
+            "source_id": source_id,
+            "host": host_for(url),
+            "url": url or "",
+            "error_class": error_class or "Exception",
+            "error_message": (error_message or "")[:2000],
+            "task_id": task_id or "",
+            "failed_at": (failed_at or datetime.now(timezone.utc)).isoformat(),
+            "failures": str(failures),
+        }
+        entry_id = self.redis.xadd(DLQ_STREAM_KEY, fields, maxlen=self.maxlen, approximate=True)
+        self.redis.hset(DLQ_INDEX_KEY, source_id, entry_id)
+        self._trim_expired()
+        return entry_id
+
+    def remove(self, entry: Dict[str, Any]) -> None:
+        """Delete an entry and its de-duplication index slot.
+
+        Args:
+            entry (Dict[str, Any]): A decoded entry as returned by ``entries``.
+        """
+        self.redis.xdel(DLQ_STREAM_KEY, entry["id"])
+        if self.redis.hget(DLQ_INDEX_KEY, entry["source_id"]) == entry["id"]:
+            self.redis.hdel(DLQ_INDEX_KEY, entry["source_id"])
+
+    def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Return a single entry by stream ID, or None if it is gone."""
+        rows = self.redis.xrange(DLQ_STREAM_KEY, min=entry_id, max=entry_id, count=1)
+        return self._decode(*rows[0]) if rows else None
+
+    def migrate_legacy(self, legacy_key: str = LEGACY_DLQ_KEY) -> int:
+        """Move entries from the old unbounded Redis list into the stream.
+
+        Entries are replayed oldest first so the newest failure of a source wins.
+
+        Returns:
+            int: Number of legacy entries migrated.
+        """
+        migrated = 0
+        while True:
+            raw = self.redis.rpop(legacy_key)
+            if raw is None:
+                return migrated
+            try:
+                legacy = json.loads(raw)
+            except (TypeError, ValueError):
+                logger.warning(f"Dropping unreadable legacy DLQ entry: {raw!r}")
+                continue
+            failed_at = None
+            if legacy.get("timestamp"):
+                try:
+                    failed_at = datetime.fromisoformat(legacy["timestamp"])
+                except ValueError:
+                    failed_at = None
+            self.add(
+                source_id=legacy.get("source_id", ""),
+                url=legacy.get("url"),
+                error_class=legacy.get("error_class", "Unknown"),
+                error_message=legacy.get("error_message", ""),
+                task_id=legacy.get("task_id"),
+                failed_at=failed_at,
+            )
+            migrated += 1
+
+    # ------------------------------------------------------------------- reads
+
+    def __len__(self) -> int:
+        return self.redis.xlen(DLQ_STREAM_KEY)
+
+    def iter_entries(self, newest_first: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate over every entry in chunks.
+
+        Args:
+            newest_first (bool): Iterate from the newest entry backwards.
+
+        Yields:
+            Dict[str, Any]: Decoded entries.
+        """
+        cursor = "+" if newest_first else "-"
+        while True:
+            if newest_first:
+                rows = self.redis.xrevrange(DLQ_STREAM_KEY, max=cursor, min="-", count=SCAN_CHUNK)
+            else:
+                rows = self.redis.xrange(DLQ_STREAM_KEY, min=cursor, max="+", count=SCAN_CHUNK)
+            if not rows:
+                return
+            for entry_id, fields in rows:
+                yield self._decode(entry_id, fields)
+            if len(rows) < SCAN_CHUNK:
+                return
+            cursor = f"({rows[-1][0]}"
+
+    def entries(
+        self,
+        limit: int = 100,
+        source_id: Optional[str] = None,
+        host: Optional[str] = None,
+        error_class: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List the newest entries matching the filters.
+
+        Args:
+            limit (int): Maximum entries to return.
+            source_id (Optional[str]): Only this source.
+            host (Optional[str]): Only this host.
+            error_class (Optional[str]): Only this error class.
+
+        Returns:
+            List[Dict[str, Any]]: Matching entries, newest first.
+        """
+        matches = []
+        for entry in self.iter_entries(newest_first=True):
+            if _matches(entry, source_id, host, error_class):
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def summary(self, top: int = 50) -> Dict[str, Any]:
+        """Count entries per source, host and error class.
+
+        Args:
+            top (int): Maximum groups returned per dimension.
+
+        Returns:
+            Dict[str, Any]: ``total`` plus ``by_source``, ``by_host`` and
+            ``by_error_class`` lists of ``{"key", "count"}`` sorted by count.
+        """
+        counters = {group: Counter() for group in GROUP_FIELDS}
+        total = 0
+        for entry in self.iter_entries():
+            total += 1
+            for group, field in GROUP_FIELDS.items():
+                counters[group][entry.get(field) or "unknown"] += 1
+
+        report: Dict[str, Any] = {"total": total}
+        for group, counter in counters.items():
+            report[f"by_{group}"] = [
+                {"key": key, "count": count} for key, count in counter.most_common(top)
+            ]
+        return report
+
+    # ------------------------------------------------------------------ replay
+
+    def replay(
+        self,
+        batch_size: Optional[int] = None,
+        source_id: Optional[str] = None,
+        host: Optional[str] = None,
+        error_class: Optional[str] = None,
+        dry_run: bool = False,
+        limiter: Optional[HostRateLimiter] = None,
+        send: Callable[[str, str], None] = _send_scrape_task,
+    ) -> Dict[str, Any]:
+        """Re-dispatch one throttled batch of entries, oldest first.
+
+        The batch is capped by ``batch_size`` and by the free capacity of the
+        default scrape queue (``SCRAPE_QUEUE_MAX_BACKLOG`` minus its depth).
+        Entries whose host is over its limit stay in the queue for a later batch.
+
+        Args:
+            batch_size (Optional[int]): Maximum entries to replay.
+                Defaults to ``SCRAPE_DLQ_REPLAY_BATCH_SIZE``.
+            source_id (Optional[str]): Only replay this source.
+            host (Optional[str]): Only replay this host.
+            error_class (Optional[str]): Only replay this error class.
+            dry_run (bool): Report what would be replayed without dispatching.
+            limiter (Optional[HostRateLimiter]): Per-host limiter. Defaults to one
+                built on this queue's Redis client.
+            send (Callable[[str, str], None]): Publishes ``(source_id, queue)``.
+
+        Returns:
+            Dict[str, Any]: The batch ``budget``, counts of ``replayed`` and
+            ``throttled`` entries, the replayed source IDs and the ``remaining``
+            queue length.
+        """
+        queue = queue_for(PriorityClass.DAILY)
+        budget = batch_size or settings.SCRAPE_DLQ_REPLAY_BATCH_SIZE
+        budget = min(budget, max(0, settings.SCRAPE_QUEUE_MAX_BACKLOG - self.redis.llen(queue)))
+        limiter = limiter or HostRateLimiter(self.redis)
+
+        replayed: List[str] = []
+        throttled_hosts: set[str] = set()
+        throttled = 0
+
+        if budget > 0:
+            for entry in self.iter_entries():
+                if len(replayed) >= budget:
+                    break
+                if not _matches(entry, source_id, host, error_class):
+                    continue
+                if entry["host"] in throttled_hosts:
+                    throttled += 1
+                    continue
+                if not dry_run and not limiter.try_acquire(entry["host"]):
+                    throttled_hosts.add(entry["host"])
+                    throttled += 1
+                    continue
+
+                replayed.append(entry["source_id"])
+                if not dry_run:
+                    send(entry["source_id"], queue)
+                    self.remove(entry)
+
+        if replayed and not dry_run:
+            logger.info(f"Replayed {len(replayed)} dead-lettered scrapes ({throttled} throttled)")
+
+        return {
+            "budget": budget,
+            "replayed": len(replayed),
+            "throttled": throttled,
+            "source_ids": replayed,
+            "dry_run": dry_run,
+            "remaining": len(self),
+        }
+
+    # ----------------------------------------------------------------- helpers
+
+    def _indexed_entry(self, source_id: str) -> Optional[Dict[str, Any]]:
+        entry_id = self.redis.hget(DLQ_INDEX_KEY, source_id)
+        if not entry_id:
+            return None
+        entry = self.get(entry_id)
+        if entry is None:
+            self.redis.hdel(DLQ_INDEX_KEY, source_id)
+        return entry
+
+    def _trim_expired(self) -> None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        self.redis.xtrim(DLQ_STREAM_KEY, minid=f"{int(cutoff.timestamp() * 1000)}-0")
+
+    @staticmethod
+    def _decode(entry_id: str, fields: Dict[str, str]) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"id": entry_id, **fields}
+        entry["failures"] = int(fields.get("failures", 1))
+        return entry
+
+
+def _matches(
+    entry: Dict[str, Any],
+    source_id: Optional[str],
+    host: Optional[str],
+    error_class: Optional[str],
+) -> bool:
+    return (
+        (source_id is None or entry.get("source_id") == source_id)
+        and (host is None or entry.get("host") == host.lower())
+        and (error_class is None or entry.get("error_class") == error_class)
+    )
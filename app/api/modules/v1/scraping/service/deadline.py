@@ -0,0 +1,106 @@
+"""Per-scrape time budget shared by every stage of the scraping pipeline.
+
+A scrape starts with a total budget, configurable per source through the
+``time_budget_seconds`` scraping rule. Each stage runs under whatever is left of
+that budget; when it runs out the stage is cancelled and the scrape fails with
+``ScrapeDeadlineExceeded`` naming the stage that was running.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from app.api.core.config import settings
+
+TIME_BUDGET_RULE = "time_budget_seconds"
+
+
+class ScrapeDeadlineExceeded(Exception):
+    """Raised when a scrape runs out of its time budget."""
+
+    def __init__(self, stage: str, budget_seconds: float):
+        self.stage = stage
+        self.budget_seconds = budget_seconds
+        super().__init__(
+            f"Scrape time budget of {budget_seconds:g}s exhausted during stage '{stage}'"
+        )
+
+
+def resolve_time_budget(scraping_rules: Optional[Dict[str, Any]]) -> float:
+    """Return the scrape budget for a source.
+
+    Args:
+        scraping_rules (Optional[Dict[str, Any]]): The source's scraping rules.
+
+    Returns:
+        float: ``time_budget_seconds`` from the rules if it is a positive number,
+        otherwise ``SCRAPE_TIME_BUDGET_SECONDS``.
+    """
+    value = (scraping_rules or {}).get(TIME_BUDGET_RULE)
+    try:
+        budget = float(value)
+    except (TypeError, ValueError):
+        return float(settings.SCRAPE_TIME_BUDGET_SECONDS)
+    return budget if budget > 0 else float(settings.SCRAPE_TIME_BUDGET_SECONDS)
+
+
+class ScrapeDeadline:
+    """Track the remaining budget of one scrape and enforce it per stage.
+
+    Examples:
+        >>> deadline = ScrapeDeadline(120)
+        >>> async with deadline.stage("fetch"):
+        ...     result = await client.fetch(url, timeout=deadline.remaining())
+    """
+
+    def __init__(self, budget_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """Start the budget clock.
+
+        Args:
+            budget_seconds (float): Total seconds the scrape may take.
+            clock (Callable[[], float]): Monotonic clock, injectable for tests.
+        """
+        self.budget_seconds = budget_seconds
+        self._clock = clock
+        self._started_at = clock()
+        self.current_stage: Optional[str] = None
+
+    def reset_budget(self, budget_seconds: float) -> None:
+        """Replace the total budget without restarting the clock.
+
+        Used once the source is loaded and its own budget is known.
+        """
+        self.budget_seconds = budget_seconds
+
+    def elapsed(self) -> float:
+        """Seconds spent since the scrape started."""
+        return self._clock() - self._started_at
+
+    def remaining(self) -> float:
+        """Seconds left in the budget, never negative."""
+        return max(0.0, self.budget_seconds - self.elapsed())
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        """Run a block of the pipeline under the remaining budget.
+
+        Args:
+            name (str): Stage name reported if the budget runs out.
+
+        Raises:
+            ScrapeDeadlineExceeded: If the budget is exhausted before or during the block.
+        """
+        self.current_stage = name
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise ScrapeDeadlineExceeded(name, self.budget_seconds)
+
+        timeout = asyncio.timeout(remaining)
+        try:
+            async with timeout:
+                yield
+        except TimeoutError as e:
+            if timeout.expired():
+                raise ScrapeDeadlineExceeded(name, self.budget_seconds) from e
+            raise
@@ -0,0 +1,125 @@
+"""Bounded-memory download bodies for the fetch tier.
+
+Responses are streamed chunk by chunk into a spooled temporary file: small
+pages stay in memory, large documents roll over to disk once they pass
+``SCRAPE_DOWNLOAD_SPOOL_BYTES``. The SHA-256 of the body is computed while it
+streams, and a per-source size cap aborts oversized downloads early instead of
+letting a huge gazette exhaust worker memory.
+"""
+
+import hashlib
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterable, Optional
+
+from app.api.core.config import settings
+
+MAX_DOWNLOAD_RULE = "max_download_bytes"
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadTooLargeError(Exception):
+    """Raised when a response body exceeds the source's download size cap."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"Download exceeded the {max_bytes} byte limit")
+
+
+def resolve_max_download_bytes(scraping_rules: Optional[Dict[str, Any]]) -> int:
+    """Return the download size cap for a source.
+
+    Args:
+        scraping_rules (Optional[Dict[str, Any]]): The source's scraping rules.
+
+    Returns:
+        int: ``max_download_bytes`` from the rules if it is a positive number,
+        otherwise ``SCRAPE_MAX_DOWNLOAD_BYTES``.
+    """
+    value = (scraping_rules or {}).get(MAX_DOWNLOAD_RULE)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return settings.SCRAPE_MAX_DOWNLOAD_BYTES
+    return value if value > 0 else settings.SCRAPE_MAX_DOWNLOAD_BYTES
+
+
+class SpooledDownload:
+    """A response body held in a spooled temporary file.
+
+    Use it as a context manager, or call ``close()``, to release the file.
+
+    Examples:
+        >>> with SpooledDownload(max_bytes=10_000_000) as body:
+        ...     body.write_chunks(response.iter_content(CHUNK_SIZE))
+        ...     text = pdf_service.extract_text(body.stream())
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, spool_bytes: Optional[int] = None):
+        """Initialize an empty body.
+
+        Args:
+            max_bytes (Optional[int]): Size cap. Defaults to ``SCRAPE_MAX_DOWNLOAD_BYTES``.
+            spool_bytes (Optional[int]): Size kept in memory before rolling over
+                to disk. Defaults to ``SCRAPE_DOWNLOAD_SPOOL_BYTES``.
+        """
+        self.max_bytes = max_bytes or settings.SCRAPE_MAX_DOWNLOAD_BYTES
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=spool_bytes or settings.SCRAPE_DOWNLOAD_SPOOL_BYTES
+        )
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpooledDownload":
+        """Wrap bytes that are already in memory; the size cap never rejects them."""
+        body = cls(max_bytes=max(len(data), settings.SCRAPE_MAX_DOWNLOAD_BYTES))
+        body.write(data)
+        return body
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, hashing it on the way.
+
+        Raises:
+            DownloadTooLargeError: If the body would exceed ``max_bytes``.
+        """
+        if not chunk:
+            return
+        if self.size + len(chunk) > self.max_bytes:
+            raise DownloadTooLargeError(self.max_bytes)
+        self._file.seek(0, 2)
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def write_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Append every chunk from an iterator such as ``response.iter_content``."""
+        for chunk in chunks:
+            self.write(chunk)
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of everything written so far."""
+        return self._hash.hexdigest()
+
+    def head(self, length: int = 1024) -> bytes:
+        """Return the first ``length`` bytes, e.g. for content sniffing."""
+        self._file.seek(0)
+        return self._file.read(length)
+
+    def stream(self) -> BinaryIO:
+        """Return the underlying seekable file, rewound to the start."""
+        self._file.seek(0)
+        return self._file
+
+    def read_bytes(self) -> bytes:
+        """Return the whole body. Only use this for bodies known to be small."""
+        return self.stream().read()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SpooledDownload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
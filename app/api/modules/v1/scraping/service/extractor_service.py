@@ -10,7 +10,7 @@ back to MinIO. It supports fallback mechanisms using readability-lxml if primary
 import io
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from fastapi.concurrency import run_in_threadpool
@@ -146,7 +146,8 @@ class TextExtractorService:
             revision_id (UUID, optional): ID of the revision.
 
         Returns:
-            Dict: Contains 'full_text', 'raw_key', 'clean_key', 'revision_id'.
+            Dict: Contains 'full_text', 'raw_key', 'clean_key', 'revision_id', and
+                'lines' (the clean text line by line, before whitespace normalization).
         """
         revision_id = revision_id or uuid4()
 
@@ -165,6 +166,7 @@ class TextExtractorService:
             except Exception:
                 pass
 
+        lines = [line for line in extracted_text.splitlines() if line.strip()]
         extracted_text = normalize_text(extracted_text)
 
         clean_key = self._generate_clean_key(source_id, revision_id)
@@ -182,6 +184,7 @@ class TextExtractorService:
             "clean_key": clean_key,
             "revision_id": str(revision_id),
             "char_count": len(extracted_text),
+            "lines": lines,
         }
 
     def _generate_clean_key(self, source_id: str, revision_id: UUID) -> str:
@@ -191,10 +194,14 @@ class TextExtractorService:
 
     async def extract_from_minio(self, bucket: str, object_name: str) -> str:
         """Fetch raw HTML from MinIO and return cleaned string (Legacy support)."""
+        lines = await self.extract_lines_from_minio(bucket, object_name)
+        return normalize_text("\n".join(lines))
+
+    async def extract_lines_from_minio(self, bucket: str, object_name: str) -> List[str]:
+        """Fetch raw HTML from MinIO and return its clean text line by line."""
         html_bytes = await run_in_threadpool(self._fetch_bytes_sync, bucket, object_name)
 
         if not html_bytes or len(html_bytes.strip()) < 20:
-            return ""
+            return []
 
-        extracted = cleaned_html(html_bytes)
-        return normalize_text(extracted)
+        return [line for line in cleaned_html(html_bytes).splitlines() if line.strip()]
@@ -0,0 +1,206 @@
+"""Slowly-changing timeline of extracted key-value facts.
+
+Each revision's ``key_value_pairs`` are diffed against the source's current
+facts: unchanged values stay open, changed or dropped values are closed at the
+revision's ``scraped_at`` and new values are opened from it. A key's history
+and the facts that changed since a point in time are then plain indexed range
+queries instead of scans over every revision's JSON.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
+from app.api.modules.v1.projects.models.project_model import Project
+from app.api.modules.v1.scraping.models.extracted_fact import ExtractedFact
+from app.api.modules.v1.scraping.models.source_model import Source
+
+NUMBER_PATTERN = r"-?[0-9]+(?:\.[0-9]+)?"
+_NUMBER = re.compile(NUMBER_PATTERN)
+
+
+def parse_number(value: str) -> Optional[float]:
+    """Return the first number in a fact value, ignoring thousands separators.
+
+    ``"1,200 NGN"`` is 1200.0; values without a number return None.
+    """
+    match = _NUMBER.search(value.replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def fact_value(value: Any) -> Optional[str]:
+    """Render a fact value as text the way PostgreSQL's ``->>`` does."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def facts_from_result(ai_result: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Return the ``key_value_pairs`` of an extraction result as text values."""
+    extracted = (ai_result or {}).get("extracted_data") or {}
+    pairs = extracted.get("key_value_pairs") if isinstance(extracted, dict) else None
+    if not isinstance(pairs, dict):
+        return {}
+    facts = {}
+    for key, value in pairs.items():
+        text = fact_value(value)
+        if text is not None:
+            facts[str(key)] = text
+    return facts
+
+
+@dataclass
+class TimelineUpdate:
+    """Keys whose values were opened and closed by one revision."""
+
+    opened: List[str]
+    closed: List[str]
+
+
+class FactTimelineService:
+    """Maintains and queries the ``extracted_facts`` timeline."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(
+        self,
+        source_id: UUID,
+        revision_id: UUID,
+        facts: Dict[str, str],
+        observed_at: datetime,
+    ) -> TimelineUpdate:
+        """Record the facts seen in a new revision of a source.
+
+        Only the source's open facts are read, so the cost is proportional to
+        the facts of one revision rather than to the source's history. The
+        caller owns the transaction.
+
+        Args:
+            source_id (UUID): Source the revision belongs to.
+            revision_id (UUID): The new revision.
+            facts (Dict[str, str]): Fact key to text value, see ``facts_from_result``.
+            observed_at (datetime): The revision's ``scraped_at``.
+
+        Returns:
+            TimelineUpdate: Keys opened and closed by this revision.
+        """
+        result = await self.db.execute(
+            select(ExtractedFact).where(
+                ExtractedFact.source_id == source_id,
+                ExtractedFact.valid_to.is_(None),
+            )
+        )
+        current = {fact.key: fact for fact in result.scalars().all()}
+
+        closed = []
+        for key, fact in current.items():
+            if facts.get(key) != fact.value:
+                fact.valid_to = observed_at
+                closed.append(key)
+        if closed:
+            # Close before opening so the partial unique index on open facts holds.
+            await self.db.flush()
+
+        opened = []
+        for key, value in facts.items():
+            if key in current and current[key].value == value:
+                continue
+            self.db.add(
+                ExtractedFact(
+                    source_id=source_id,
+                    key=key,
+                    value=value,
+                    numeric_value=parse_number(value),
+                    valid_from=observed_at,
+                    revision_id=revision_id,
+                )
+            )
+            opened.append(key)
+
+        return TimelineUpdate(opened=opened, closed=closed)
+
+    def _scoped(self, org_id: UUID):
+        return (
+            select(ExtractedFact)
+            .join(Source, Source.id == ExtractedFact.source_id)
+            .join(Jurisdiction, Jurisdiction.id == Source.jurisdiction_id)
+            .join(Project, Project.id == Jurisdiction.project_id)
+            .where(Project.org_id == org_id)
+        )
+
+    async def key_timeline(
+        self,
+        org_id: UUID,
+        key: str,
+        source_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[ExtractedFact]:
+        """Return the values a fact key has taken, oldest first.
+
+        Args:
+            org_id (UUID): Organization whose sources are searched.
+            key (str): Fact key.
+            source_id (Optional[UUID]): Restrict to one source.
+            since (Optional[datetime]): Only values still valid at or after this time.
+            limit (int): Maximum number of values.
+
+        Returns:
+            List[ExtractedFact]: Values ordered by ``valid_from``.
+        """
+        query = self._scoped(org_id).where(ExtractedFact.key == key)
+        if source_id:
+            query = query.where(ExtractedFact.source_id == source_id)
+        if since:
+            query = query.where(
+                or_(ExtractedFact.valid_to.is_(None), ExtractedFact.valid_to >= since)
+            )
+        query = query.order_by(ExtractedFact.valid_from, ExtractedFact.id).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def changed_since(
+        self,
+        org_id: UUID,
+        since: datetime,
+        key: Optional[str] = None,
+        source_id: Optional[UUID] = None,
+        limit: int = 100,
+    ) -> List[ExtractedFact]:
+        """Return fact values opened or closed at or after ``since``, newest first.
+
+        A changed value appears twice: the closed old value and the opened new one.
+
+        Args:
+            org_id (UUID): Organization whose sources are searched.
+            since (datetime): Start of the window.
+            key (Optional[str]): Restrict to one fact key.
+            source_id (Optional[UUID]): Restrict to one source.
+            limit (int): Maximum number of values.
+
+        Returns:
+            List[ExtractedFact]: Values ordered by ``valid_from``, newest first.
+        """
+        query = self._scoped(org_id).where(
+            or_(ExtractedFact.valid_from >= since, ExtractedFact.valid_to >= since)
+        )
+        if key:
+            query = query.where(ExtractedFact.key == key)
+        if source_id:
+            query = query.where(ExtractedFact.source_id == source_id)
+        query = query.order_by(
+            ExtractedFact.valid_from.desc(), ExtractedFact.source_id, ExtractedFact.key
+        ).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
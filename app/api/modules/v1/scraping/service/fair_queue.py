@@ -0,0 +1,230 @@
+"""Fair-share scheduling helpers for the scrape dispatcher.
+
+Due sources are grouped per organization and interleaved with deficit
+round-robin (DRR) so that a tenant bulk-importing thousands of sources cannot
+starve the hourly sources of every other tenant. Each tenant's quantum is scaled
+by the weight of its billing plan, and every priority class is routed to its own
+Celery queue.
+"""
+
+import json
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.models.source_model import ScrapeFrequency
+
+DRR_DEFICIT_KEY = "scraping:drr_deficit:{queue}"
+TENANT_LATENCY_KEY = "scraping:tenant_queue_latency"
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class PriorityClass(str, Enum):
+    """Scheduling classes, each backed by a dedicated Celery queue."""
+
+    MANUAL = "MANUAL"
+    HOURLY = "HOURLY"
+    DAILY = "DAILY"
+
+
+def priority_class_for(frequency: ScrapeFrequency) -> PriorityClass:
+    """Map a source's scrape frequency to its scheduling class.
+
+    Args:
+        frequency (ScrapeFrequency): The source frequency.
+
+    Returns:
+        PriorityClass: HOURLY for hourly sources, DAILY for everything slower.
+    """
+    if frequency == ScrapeFrequency.HOURLY:
+        return PriorityClass.HOURLY
+    return PriorityClass.DAILY
+
+
+def queue_for(priority_class: PriorityClass) -> str:
+    """Return the Celery queue name serving a priority class.
+
+    Args:
+        priority_class (PriorityClass): The scheduling class.
+
+    Returns:
+        str: The configured queue name.
+    """
+    return {
+        PriorityClass.MANUAL: settings.SCRAPE_QUEUE_MANUAL,
+        PriorityClass.HOURLY: settings.SCRAPE_QUEUE_HOURLY,
+        PriorityClass.DAILY: settings.SCRAPE_QUEUE_DEFAULT,
+    }[priority_class]
+
+
+def parse_plan_weights(raw: str) -> Dict[str, int]:
+    """Parse a ``TIER:weight`` list such as ``"ESSENTIAL:1,ENTERPRISE:4"``.
+
+    Malformed entries are ignored and weights are clamped to at least 1.
+
+    Args:
+        raw (str): Comma separated tier/weight pairs.
+
+    Returns:
+        Dict[str, int]: Mapping of upper-cased plan tier to weight.
+    """
+    weights: Dict[str, int] = {}
+    for entry in (raw or "").split(","):
+        tier, _, weight = entry.partition(":")
+        try:
+            weights[tier.strip().upper()] = max(1, int(weight))
+        except ValueError:
+            continue
+    return weights
+
+
+def tenant_weight(plan_tier: Optional[str], weights: Optional[Dict[str, int]] = None) -> int:
+    """Resolve the DRR weight for a tenant from its billing plan tier.
+
+    Args:
+        plan_tier (Optional[str]): The tenant's plan tier, or None if it has no plan.
+        weights (Optional[Dict[str, int]]): Pre-parsed weights. Defaults to settings.
+
+    Returns:
+        int: The tenant weight (>= 1).
+    """
+    if weights is None:
+        weights = parse_plan_weights(settings.SCRAPE_PLAN_WEIGHTS)
+    tier = getattr(plan_tier, "value", plan_tier)
+    default = max(1, settings.SCRAPE_DEFAULT_TENANT_WEIGHT)
+    if not tier:
+        return default
+    return weights.get(str(tier).upper(), default)
+
+
+class DeficitRoundRobinScheduler:
+    """Weighted deficit round-robin over per-tenant FIFO queues.
+
+    Every round each backlogged tenant earns ``quantum * weight`` credits and may
+    dequeue one item per credit. Unused credit carries over to the next call via
+    ``deficits`` so that fairness holds across dispatcher ticks, not only within
+    one. A tenant whose queue drains forfeits its credit, as in classic DRR.
+
+    Examples:
+        >>> scheduler = DeficitRoundRobinScheduler()
+        >>> scheduler.enqueue("org-a", "s1", weight=2)
+        >>> scheduler.enqueue("org-b", "s2")
+        >>> [tenant for tenant, _ in scheduler.select(2)]
+        ['org-a', 'org-b']
+    """
+
+    def __init__(self, quantum: int = 1, deficits: Optional[Dict[str, float]] = None):
+        """Initialize the scheduler.
+
+        Args:
+            quantum (int): Credits granted per round for a weight of 1.
+            deficits (Optional[Dict[str, float]]): Carried-over credit per tenant.
+        """
+        self.quantum = quantum
+        self.deficits: Dict[str, float] = dict(deficits or {})
+        self._queues: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+        self._weights: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def enqueue(self, tenant_id: str, item: Any, weight: int = 1) -> None:
+        """Append an item to a tenant's queue.
+
+        Tenants are visited in the order they were first enqueued, so callers
+        should enqueue oldest-due work first.
+
+        Args:
+            tenant_id (str): The tenant (organization) identifier.
+            item (Any): The work item.
+            weight (int): The tenant weight; the last value given wins.
+        """
+        self._queues.setdefault(tenant_id, deque()).append(item)
+        self._weights[tenant_id] = max(1, int(weight))
+
+    def select(self, budget: int) -> List[Tuple[str, Any]]:
+        """Dequeue up to ``budget`` items in weighted round-robin order.
+
+        Args:
+            budget (int): Maximum number of items to return.
+
+        Returns:
+            List[Tuple[str, Any]]: ``(tenant_id, item)`` pairs in dispatch order.
+        """
+        selected: List[Tuple[str, Any]] = []
+        while len(selected) < budget and self._queues:
+            for tenant_id in list(self._queues):
+                queue = self._queues[tenant_id]
+                weight = self._weights[tenant_id]
+                credit = self.deficits.get(tenant_id, 0) + self.quantum * weight
+                while queue and credit >= 1 and len(selected) < budget:
+                    selected.append((tenant_id, queue.popleft()))
+                    credit -= 1
+
+                if queue:
+                    self.deficits[tenant_id] = min(credit, self.quantum * weight)
+                else:
+                    del self._queues[tenant_id]
+                    self.deficits.pop(tenant_id, None)
+
+                if len(selected) >= budget:
+                    break
+        return selected
+
+
+def record_queue_latency(
+    redis_client: Any, organization_id: str, queue: str, lag_seconds: float
+) -> Dict[str, Any]:
+    """Fold a due-to-start latency sample into the tenant's queue latency stats.
+
+    Args:
+        redis_client: A synchronous Redis client.
+        organization_id (str): The tenant that owns the scraped source.
+        queue (str): The Celery queue the task was consumed from.
+        lag_seconds (float): Seconds between the source becoming due and the task starting.
+
+    Returns:
+        Dict[str, Any]: The updated stats entry.
+    """
+    field = f"{organization_id}:{queue}"
+    raw = redis_client.hget(TENANT_LATENCY_KEY, field)
+    previous = json.loads(raw) if raw else {}
+
+    lag_seconds = max(0.0, float(lag_seconds))
+    ewma = previous.get("ewma_seconds")
+    ewma = (
+        lag_seconds
+        if ewma is None
+        else LATENCY_EWMA_ALPHA * lag_seconds + (1 - LATENCY_EWMA_ALPHA) * ewma
+    )
+
+    stats = {
+        "organization_id": organization_id,
+        "queue": queue,
+        "last_seconds": round(lag_seconds, 3),
+        "ewma_seconds": round(ewma, 3),
+        "samples": previous.get("samples", 0) + 1,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    redis_client.hset(TENANT_LATENCY_KEY, field, json.dumps(stats))
+    return stats
+
+
+def parse_latency_report(raw: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Decode the latency hash into a list sorted by worst EWMA first.
+
+    Args:
+        raw (Dict[str, str]): The ``HGETALL`` result of ``TENANT_LATENCY_KEY``.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per tenant and queue.
+    """
+    entries = []
+    for value in (raw or {}).values():
+        try:
+            entries.append(json.loads(value))
+        except (TypeError, ValueError):
+            continue
+    return sorted(entries, key=lambda entry: entry.get("ewma_seconds", 0), reverse=True)
@@ -0,0 +1,260 @@
+"""Short-lived fetch cache shared by every source that watches the same URL.
+
+Different projects and organizations often monitor the same public page. A
+fresh cached copy lets each of their sources run its own extraction prompt over
+the same bytes without hitting the origin once per source.
+
+Bytes live in object storage; the index entry in Redis carries the response
+validators (``ETag`` / ``Last-Modified``), so once the copy goes stale it is
+revalidated with a conditional request instead of being downloaded again.
+Concurrent misses for one URL are collapsed into a single origin request: one
+worker takes the fill lock and the others wait for its result.
+
+Only anonymous fetches are shared. Sources with credentials always fetch on
+their own.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.cloudscrapper_service import FetchResult
+from app.api.modules.v1.scraping.service.download import SpooledDownload
+from app.api.modules.v1.scraping.storage.minio_storage import (
+    stream_raw_content_from_minio,
+    upload_raw_stream,
+)
+
+logger = logging.getLogger(__name__)
+
+ENTRY_KEY = "scraping:fetch_cache:{digest}"
+FILL_LOCK_KEY = "scraping:fetch_cache_lock:{digest}"
+ANONYMOUS = "anonymous"
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+Fetcher = Callable[[Optional[str], Optional[str]], Awaitable[FetchResult]]
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings share a cache entry.
+
+    Lower-cases the scheme and host, drops default ports, user info and the
+    fragment, and sorts query parameters.
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_digest(url: str, auth_context: str = ANONYMOUS, variant: str = "") -> str:
+    """Return the cache key digest for a URL fetched under ``auth_context``.
+
+    Args:
+        url (str): The URL being fetched.
+        auth_context (str): Identifies whose view of the page this is.
+        variant (str): Anything else that changes the fetched bytes.
+
+    Returns:
+        str: A hex SHA-256 digest.
+    """
+    material = "\n".join([auth_context, variant, normalize_url(url)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class SharedFetchCache:
+    """Object-storage backed fetch cache with single-flight fills.
+
+    Redis failures never block a scrape: the cache falls back to a direct fetch.
+
+    Examples:
+        >>> cache = SharedFetchCache(redis_client)
+        >>> body = await cache.fetch(url, fetcher)
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl_seconds: Optional[int] = None,
+        lock_seconds: Optional[int] = None,
+        poll_interval: float = 0.5,
+        clock=time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_client (Redis): Async Redis client with ``decode_responses=True``.
+            ttl_seconds (Optional[int]): How long a copy is served without revalidation.
+                Defaults to ``SCRAPE_FETCH_CACHE_TTL_SECONDS``.
+            lock_seconds (Optional[int]): Fill lock TTL and the longest a waiter waits.
+                Defaults to ``SCRAPE_FETCH_CACHE_LOCK_SECONDS``.
+            poll_interval (float): Seconds between polls while waiting on a fill.
+            clock: Wall clock returning epoch seconds, injectable for tests.
+        """
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds or settings.SCRAPE_FETCH_CACHE_TTL_SECONDS
+        self.lock_seconds = lock_seconds or settings.SCRAPE_FETCH_CACHE_LOCK_SECONDS
+        self.poll_interval = poll_interval
+        self.bucket = settings.SCRAPE_FETCH_CACHE_BUCKET
+        self._clock = clock
+
+    async def fetch(self, url: str, fetcher: Fetcher, variant: str = "") -> SpooledDownload:
+        """Return the body of ``url``, from the cache when a fresh copy exists.
+
+        Args:
+            url (str): The URL to fetch.
+            fetcher (Fetcher): Performs the origin request. Called with the cached
+                ``etag`` and ``last_modified`` validators (or None) and may return a
+                304 result.
+            variant (str): Anything besides the URL that changes the fetched bytes.
+
+        Returns:
+            SpooledDownload: The page body. The caller closes it.
+
+        Raises:
+            Exception: Propagates errors raised by ``fetcher``.
+        """
+        digest = cache_digest(url, ANONYMOUS, variant)
+        try:
+            entry = await self._load_entry(digest)
+            if entry and self._is_fresh(entry):
+                body = await self._read(entry)
+                if body is not None:
+                    logger.info(f"Fetch cache hit for {url}")
+                    return body
+
+            lock_key = FILL_LOCK_KEY.format(digest=digest)
+            lock_token = uuid.uuid4().hex
+            if await self.redis.set(lock_key, lock_token, nx=True, ex=self.lock_seconds):
+                try:
+                    return await self._fill(digest, url, entry, fetcher)
+                finally:
+                    await self._release(lock_key, lock_token)
+
+            body = await self._wait_for_fill(digest, lock_key)
+            if body is not None:
+                logger.info(f"Fetch cache filled by a concurrent fetch of {url}")
+                return body
+        except RedisError as e:
+            logger.warning(f"Fetch cache unavailable for {url}: {e}")
+
+        result = await fetcher(None, None)
+        return result.body
+
+    async def _fill(
+        self, digest: str, url: str, entry: Optional[Dict[str, Any]], fetcher: Fetcher
+    ) -> SpooledDownload:
+        """Fetch from the origin, revalidating a stale copy when validators exist."""
+        if entry and (entry.get("etag") or entry.get("last_modified")):
+            result = await fetcher(entry.get("etag"), entry.get("last_modified"))
+            if result.not_modified:
+                result.body.close()
+                body = await self._read(entry)
+                if body is not None:
+                    logger.info(f"Fetch cache revalidated {url} (304 Not Modified)")
+                    await self._save_entry(digest, {**entry, "fetched_at": self._clock()})
+                    return body
+                result = await fetcher(None, None)
+        else:
+            result = await fetcher(None, None)
+
+        await self._store(digest, url, result)
+        return result.body
+
+    async def _store(self, digest: str, url: str, result: FetchResult) -> None:
+        """Stream the body to object storage and write the validators to the index."""
+        body = result.body
+        try:
+            await asyncio.to_thread(
+                upload_raw_stream, body.stream(), body.size, self.bucket, digest
+            )
+        except Exception as e:
+            logger.warning(f"Could not store fetch cache object for {url}: {e}")
+            return
+
+        await self._save_entry(
+            digest,
+            {
+                "url": url,
+                "object_name": digest,
+                "sha256": body.sha256,
+                "size": body.size,
+                "content_type": result.content_type,
+                "etag": result.etag,
+                "last_modified": result.last_modified,
+                "fetched_at": self._clock(),
+            },
+        )
+
+    async def _wait_for_fill(self, digest: str, lock_key: str) -> Optional[SpooledDownload]:
+        """Wait for the worker holding the fill lock, then read what it stored."""
+        waited = 0.0
+        while waited < self.lock_seconds:
+            await asyncio.sleep(self.poll_interval)
+            waited += self.poll_interval
+            if await self.redis.exists(lock_key):
+                continue
+            entry = await self._load_entry(digest)
+            if entry and self._is_fresh(entry):
+                return await self._read(entry)
+            return None
+        return None
+
+    async def _read(self, entry: Dict[str, Any]) -> Optional[SpooledDownload]:
+        """Stream the cached object, treating a missing or mismatched one as a miss."""
+        body = SpooledDownload(max_bytes=entry.get("size") or None)
+        found = await asyncio.to_thread(
+            stream_raw_content_from_minio, entry["object_name"], body.write, self.bucket
+        )
+        if not found or body.sha256 != entry.get("sha256"):
+            body.close()
+            return None
+        return body
+
+    async def _load_entry(self, digest: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(ENTRY_KEY.format(digest=digest))
+        return json.loads(raw) if raw else None
+
+    async def _save_entry(self, digest: str, entry: Dict[str, Any]) -> None:
+        try:
+            await self.redis.set(
+                ENTRY_KEY.format(digest=digest),
+                json.dumps(entry),
+                ex=settings.SCRAPE_FETCH_CACHE_VALIDATOR_TTL_SECONDS,
+            )
+        except RedisError as e:
+            logger.warning(f"Could not index fetch cache entry {digest}: {e}")
+
+    async def _release(self, lock_key: str, lock_token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_SCRIPT, 1, lock_key, lock_token)
+        except RedisError as e:
+            logger.warning(f"Could not release fetch cache lock {lock_key}: {e}")
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return self._clock() - float(entry.get("fetched_at", 0)) < self.ttl_seconds
@@ -0,0 +1,85 @@
+"""Per-host request limiter for scrape traffic.
+
+Scrapes are counted per target host in a fixed Redis window so that bulk work
+such as dead-letter replays cannot hammer a site that just recovered from an
+outage.
+"""
+
+import logging
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import redis
+
+from app.api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+HOST_LIMIT_KEY = "scraping:host_limit:{host}"
+
+
+def host_for(url: Optional[str]) -> str:
+    """Return the lower-cased host of a URL, or ``"unknown"`` if it has none.
+
+    Args:
+        url (Optional[str]): The source URL.
+
+    Returns:
+        str: The host name without credentials or port.
+    """
+    if not url:
+        return "unknown"
+    return (urlparse(url).hostname or "unknown").lower()
+
+
+class HostRateLimiter:
+    """Fixed-window limiter keyed by target host.
+
+    Examples:
+        >>> limiter = HostRateLimiter(redis_client)
+        >>> if limiter.try_acquire("example.gov"):
+        ...     dispatch(source)
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        max_requests: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            redis_client: A synchronous Redis client.
+            max_requests (Optional[int]): Scrapes allowed per host per window.
+                Defaults to ``SCRAPE_HOST_RATE_LIMIT``.
+            window_seconds (Optional[int]): Window length. Defaults to
+                ``SCRAPE_HOST_RATE_WINDOW_SECONDS``.
+        """
+        self.redis = redis_client
+        self.max_requests = max_requests or settings.SCRAPE_HOST_RATE_LIMIT
+        self.window_seconds = window_seconds or settings.SCRAPE_HOST_RATE_WINDOW_SECONDS
+
+    def try_acquire(self, host: str) -> bool:
+        """Count one scrape against a host if it is under its limit.
+
+        Fails open when Redis is unavailable, like the API rate limiter.
+
+        Args:
+            host (str): The target host.
+
+        Returns:
+            bool: True if the scrape may proceed.
+        """
+        key = HOST_LIMIT_KEY.format(host=host)
+        try:
+            current = self.redis.incr(key)
+            if current == 1:
+                self.redis.expire(key, self.window_seconds)
+            if current > self.max_requests:
+                self.redis.decr(key)
+                return False
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Host limiter unavailable for {host}: {e}")
+            return True
@@ -0,0 +1,68 @@
+"""Latest-revision pointer for each source.
+
+``Source`` carries a denormalized pointer to its newest ``DataRevision``
+(``latest_revision_id`` plus its hash, scrape time and change flag). The
+pointer is written in the same transaction as the revision insert, so source
+listings can show each source's latest state without a per-source query, and
+the scrape pipeline can load the previous revision by primary key instead of
+sorting the source's history. The column is loaded with the source, so
+resolving it costs no extra round trip; sources scraped before the pointer
+existed fall back to the history query.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class LatestRevision:
+    """The newest revision of a source.
+
+    Attributes:
+        revision_id (str): The revision's UUID.
+        content_hash (Optional[str]): The revision's content hash.
+        scraped_at (Optional[str]): ISO timestamp of the scrape.
+        was_change_detected (bool): Whether that scrape detected a change.
+    """
+
+    revision_id: str
+    content_hash: Optional[str]
+    scraped_at: Optional[str]
+    was_change_detected: bool
+
+    @classmethod
+    def from_revision(cls, revision: Any) -> "LatestRevision":
+        """Build the pointer for a ``DataRevision``."""
+        return cls(
+            revision_id=str(revision.id),
+            content_hash=revision.content_hash,
+            scraped_at=revision.scraped_at.isoformat() if revision.scraped_at else None,
+            was_change_detected=bool(revision.was_change_detected),
+        )
+
+    @classmethod
+    def from_source(cls, source: Any) -> Optional["LatestRevision"]:
+        """Read the pointer stored on a ``Source``, or None if it has none yet."""
+        if not source.latest_revision_id:
+            return None
+        return cls(
+            revision_id=str(source.latest_revision_id),
+            content_hash=source.latest_content_hash,
+            scraped_at=source.latest_scraped_at.isoformat() if source.latest_scraped_at else None,
+            was_change_detected=bool(source.latest_change_detected),
+        )
+
+    @property
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(self.revision_id)
+
+    def apply_to(self, source: Any) -> None:
+        """Write the pointer onto a ``Source`` so it commits with the revision."""
+        source.latest_revision_id = self.uuid
+        source.latest_content_hash = self.content_hash
+        source.latest_scraped_at = (
+            datetime.fromisoformat(self.scraped_at) if self.scraped_at else None
+        )
+        source.latest_change_detected = self.was_change_detected
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import random
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 try:
     import google.generativeai as genai
@@ -17,6 +17,7 @@ from pydantic import ValidationError
 
 from app.api.core.config import settings
 from app.api.modules.v1.scraping.schemas.ai_analysis import ExtractionResult
+from app.api.modules.v1.scraping.service.pdf_service import truncate_to_pages
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,26 @@ EXTRACTION_SCHEMA = {
 }
 
 
+INCREMENTAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "markdown_summary": {"type": "string"},
+        "updated_pairs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"key": {"type": "string"}, "value": {"type": "string"}},
+                "required": ["key", "value"],
+            },
+        },
+        "removed_keys": {"type": "array", "items": {"type": "string"}},
+        "confidence_score": {"type": "number"},
+    },
+    "required": ["summary", "markdown_summary", "updated_pairs", "confidence_score"],
+}
+
+
 class AIExtractionService:
     """
     Service responsible for extracting structured data from raw text using Google's Gemini AI.
@@ -89,6 +110,14 @@ class AIExtractionService:
                 response_schema=EXTRACTION_SCHEMA,
             ),
         )
+        self.incremental_model = genai.GenerativeModel(
+            model_name=settings.MODEL_NAME,
+            generation_config=GenerationConfig(
+                temperature=0.0,
+                response_mime_type="application/json",
+                response_schema=INCREMENTAL_SCHEMA,
+            ),
+        )
 
     async def run_llm_analysis(
         self, cleaned_text: str, project_prompt: str, jurisdiction_prompt: str, max_retries: int = 2
@@ -141,41 +170,119 @@ SUMMARY RULES (UI RENDER):
     - MUST be based strictly on the 'extracted_data'.
 
 --- SOURCE TEXT ---
-{cleaned_text[:_MAX_PROMPT_TEXT_CHARS]} 
+{truncate_to_pages(cleaned_text, _MAX_PROMPT_TEXT_CHARS)} 
+"""
+
+        return await self._generate_with_retries(
+            self.model, prompt, self._parse_extraction, max_retries
+        )
+
+    async def run_incremental_analysis(
+        self,
+        previous_result: Dict[str, Any],
+        text_diff: str,
+        project_prompt: str,
+        jurisdiction_prompt: str,
+        max_retries: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Updates a previous extraction from a diff of the source text instead of the full text.
+
+        The model sees the previous key-value pairs and a unified diff of the changed
+        sections, and returns only the keys that changed or disappeared together with
+        refreshed summaries. The changes are merged into the previous pairs, so prompt and
+        output size follow the size of the edit rather than the size of the document.
+
+        Args:
+            previous_result (Dict[str, Any]): The previous revision's extraction result.
+            text_diff (str): Unified diff between the old and new clean text.
+            project_prompt (str): The main goal or monitoring instruction.
+            jurisdiction_prompt (str): Context specific to the jurisdiction.
+            max_retries (int, optional): Max retries for failed API calls. Defaults to 2.
+
+        Returns:
+            Dict[str, Any]: A full extraction result in the same shape as
+                ``run_llm_analysis`` returns.
+
+        Raises:
+            AIExtractionServiceError: If extraction fails after the specified number of retries.
+        """
+        previous_pairs = (previous_result.get("extracted_data") or {}).get("key_value_pairs") or {}
+        prompt = f"""You are an Expert Regulatory Data Analyst.
+TASK: A monitored document was edited. Update the previously extracted data using ONLY the
+changes shown in the diff below, and regenerate the summaries.
+
+PROJECT GOAL: {project_prompt}
+JURISDICTION CONTEXT: {jurisdiction_prompt}
+
+OUTPUT RULES (CRITICAL):
+1. Return ONLY valid JSON matching the schema.
+2. "updated_pairs": key-value objects for keys whose value changed or that are new.
+   Reuse the EXACT existing key names when a fact already has a key. Keys MUST be snake_case.
+3. "removed_keys": existing keys whose facts were deleted from the document.
+4. Do NOT repeat unchanged keys.
+5. "summary" and "markdown_summary" describe the document as a whole AFTER the edit,
+   following the same style as the previous summaries.
+
+PREVIOUS SUMMARY: {previous_result.get("summary", "")}
+
+PREVIOUS EXTRACTED DATA:
+{json.dumps(previous_pairs, indent=1, sort_keys=True)}
+
+--- TEXT DIFF (lines starting with - were removed, + were added) ---
+{text_diff[:_MAX_PROMPT_TEXT_CHARS]}
 """
 
+        def parse(result_json: Dict[str, Any]) -> Dict[str, Any]:
+            pairs = dict(previous_pairs)
+            for key in result_json.get("removed_keys") or []:
+                pairs.pop(key, None)
+            for item in result_json.get("updated_pairs") or []:
+                if "key" in item:
+                    pairs[item["key"]] = item.get("value")
+            return self._parse_extraction(
+                {
+                    "summary": result_json.get("summary"),
+                    "markdown_summary": result_json.get("markdown_summary", ""),
+                    "confidence_score": result_json.get("confidence_score"),
+                    "extracted_data": {"key_value_pairs": pairs},
+                }
+            )
+
+        return await self._generate_with_retries(self.incremental_model, prompt, parse, max_retries)
+
+    @staticmethod
+    def _parse_extraction(result_json: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a model response and normalize key-value pairs into a sorted dict."""
+        if "extracted_data" in result_json and "key_value_pairs" in result_json["extracted_data"]:
+            kv_list = result_json["extracted_data"]["key_value_pairs"]
+            if isinstance(kv_list, list):
+                result_json["extracted_data"]["key_value_pairs"] = {
+                    item.get("key"): item.get("value") for item in kv_list if "key" in item
+                }
+
+        validated_result = ExtractionResult.model_validate(result_json)
+
+        result_dump = validated_result.model_dump()
+        if "extracted_data" in result_dump and "key_value_pairs" in result_dump["extracted_data"]:
+            kv_pairs = result_dump["extracted_data"]["key_value_pairs"]
+            result_dump["extracted_data"]["key_value_pairs"] = dict(sorted(kv_pairs.items()))
+
+        logger.info(f"Extraction successful (Confidence: {validated_result.confidence_score})")
+        return result_dump
+
+    async def _generate_with_retries(
+        self,
+        model: Any,
+        prompt: str,
+        parse: Callable[[Dict[str, Any]], Dict[str, Any]],
+        max_retries: int,
+    ) -> Dict[str, Any]:
+        """Call the model and parse its JSON reply, retrying with jittered exponential backoff."""
         for attempt in range(max_retries + 1):
             try:
-                response = await self.model.generate_content_async(prompt)
-
-                result_json = json.loads(response.text)
-
-                if (
-                    "extracted_data" in result_json
-                    and "key_value_pairs" in result_json["extracted_data"]
-                ):
-                    kv_list = result_json["extracted_data"]["key_value_pairs"]
-                    if isinstance(kv_list, list):
-                        result_json["extracted_data"]["key_value_pairs"] = {
-                            item.get("key"): item.get("value") for item in kv_list if "key" in item
-                        }
-
-                validated_result = ExtractionResult.model_validate(result_json)
-
-                result_dump = validated_result.model_dump()
-                if (
-                    "extracted_data" in result_dump
-                    and "key_value_pairs" in result_dump["extracted_data"]
-                ):
-                    kv_pairs = result_dump["extracted_data"]["key_value_pairs"]
-                    result_dump["extracted_data"]["key_value_pairs"] = dict(
-                        sorted(kv_pairs.items())
-                    )
-
-                logger.info(
-                    f"Extraction successful (Confidence: {validated_result.confidence_score})"
-                )
-                return result_dump
+                response = await model.generate_content_async(prompt)
+                return parse(json.loads(response.text))
 
             except (json.JSONDecodeError, ValidationError) as e:
                 logger.warning(
@@ -0,0 +1,187 @@
+"""Per-source model of volatile page content.
+
+Many pages change on every fetch without saying anything new: "Last updated
+10:32" footers, visitor counters, CSRF tokens in visible text. Each such change
+breaks the ``content_hash`` shortcut and costs an LLM extraction and a diff.
+
+The model reduces every line to a template by masking numbers and token-like
+strings ("Last updated 10:32" becomes "Last updated #:#"). For each template it
+remembers a hash of the line's last value. A template whose value changed on
+``SCRAPE_NOISE_WINDOW`` consecutive fetches, each time with the semantic diff
+reporting no material change, is learned as volatile. Its lines are then left
+out of the content hash.
+
+Users can inspect the learned templates and override them: ``pinned_patterns``
+are regexes whose matching lines are always suppressed, and ``kept_templates``
+are learned templates that must never be suppressed.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.api.core.config import settings
+
+MAX_TEMPLATE_CHARS = 200
+
+_TOKEN_RE = re.compile(r"\b(?=[A-Za-z0-9_-]*\d)(?=[A-Za-z0-9_-]*[A-Za-z])[A-Za-z0-9_-]{16,}\b")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def line_template(line: str) -> str:
+    """Mask the variable parts of a line.
+
+    Long alphanumeric tokens (session ids, hashes) become ``*`` and digit runs
+    become ``#``.
+
+    Args:
+        line (str): A line of clean text.
+
+    Returns:
+        str: The line's template, truncated to ``MAX_TEMPLATE_CHARS``.
+    """
+    template = _NUMBER_RE.sub("#", _TOKEN_RE.sub("*", line.strip()))
+    return template[:MAX_TEMPLATE_CHARS]
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class NoiseModel:
+    """Learned and user-defined volatile lines of one source.
+
+    Attributes:
+        observed (Dict[str, Dict[str, Any]]): Per template key, the template, a hash
+            of its last value and the current run of unexplained changes.
+        volatile (Dict[str, str]): Learned volatile templates by key.
+        pinned_patterns (List[str]): Regexes whose lines are always suppressed.
+        kept_templates (List[str]): Templates that are never suppressed.
+        resets (int): How often the learned state was reset by a user.
+
+    Examples:
+        >>> model = NoiseModel.from_dict(source.noise_model)
+        >>> hash_text = " ".join(model.filter(lines))
+        >>> model.observe(lines, material_change=False)
+        >>> source.noise_model = model.merge_learned_into(locked_noise_model)
+    """
+
+    observed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    volatile: Dict[str, str] = field(default_factory=dict)
+    pinned_patterns: List[str] = field(default_factory=list)
+    kept_templates: List[str] = field(default_factory=list)
+    resets: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "NoiseModel":
+        """Load a model from its stored form; anything unusable yields an empty model."""
+        if not isinstance(data, dict):
+            return cls()
+        return cls(
+            observed=dict(data.get("observed") or {}),
+            volatile=dict(data.get("volatile") or {}),
+            pinned_patterns=list(data.get("pinned_patterns") or []),
+            kept_templates=list(data.get("kept_templates") or []),
+            resets=int(data.get("resets") or 0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "observed": self.observed,
+            "volatile": self.volatile,
+            "pinned_patterns": self.pinned_patterns,
+            "kept_templates": self.kept_templates,
+            "resets": self.resets,
+        }
+
+    def reset_learned(self) -> None:
+        """Forget every learned template; user overrides are kept."""
+        self.observed = {}
+        self.volatile = {}
+        self.resets += 1
+
+    def merge_learned_into(self, stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return ``stored`` with this model's learned state written into it.
+
+        A scrape loads the model long before it persists. Only ``observed`` and
+        ``volatile`` are taken from this model, so pins and keeps saved in the
+        meantime survive; if the learned state was reset in the meantime the
+        reset wins and this model's learning is dropped.
+
+        Args:
+            stored (Optional[Dict[str, Any]]): The column as re-read, under a row
+                lock, in the persisting transaction.
+
+        Returns:
+            Dict[str, Any]: The value to write back to the column.
+        """
+        current = NoiseModel.from_dict(stored)
+        if current.resets == self.resets:
+            current.observed = self.observed
+            current.volatile = self.volatile
+        return current.to_dict()
+
+    def is_volatile(self, line: str) -> bool:
+        """Return True if ``line`` should be left out of the content hash."""
+        if any(re.search(pattern, line) for pattern in self.pinned_patterns):
+            return True
+        template = line_template(line)
+        return _digest(template) in self.volatile and template not in self.kept_templates
+
+    def filter(self, lines: Iterable[str]) -> List[str]:
+        """Return the lines that are not volatile."""
+        return [line for line in lines if not self.is_volatile(line)]
+
+    def observe(self, lines: Iterable[str], material_change: bool) -> List[str]:
+        """Update the model with the lines of a new fetch.
+
+        Args:
+            lines (Iterable[str]): All lines of the fetch, before filtering.
+            material_change (bool): Whether the semantic diff found a real change.
+                Line changes seen alongside a real change are not counted as noise.
+
+        Returns:
+            List[str]: Templates newly learned as volatile.
+        """
+        values: Dict[str, List[str]] = {}
+        templates: Dict[str, str] = {}
+        for line in lines:
+            template = line_template(line)
+            if template == line.strip()[:MAX_TEMPLATE_CHARS]:
+                continue
+            key = _digest(template)
+            templates[key] = template
+            values.setdefault(key, []).append(line.strip())
+
+        window = settings.SCRAPE_NOISE_WINDOW
+        learned = []
+        observed = {}
+        for key, template in templates.items():
+            value = _digest("\n".join(sorted(values[key])))
+            previous = self.observed.get(key)
+            streak = 0
+            if previous and previous.get("value") != value and not material_change:
+                streak = int(previous.get("streak", 0)) + 1
+            observed[key] = {"template": template, "value": value, "streak": streak}
+            if streak >= window and key not in self.volatile:
+                self.volatile[key] = template
+                learned.append(template)
+
+        limit = settings.SCRAPE_NOISE_MAX_TRACKED_LINES
+        if len(observed) > limit:
+            ranked = sorted(observed.items(), key=lambda item: -item[1]["streak"])
+            observed = dict(ranked[:limit])
+        self.observed = observed
+        return learned
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the model for users, without the per-line bookkeeping."""
+        return {
+            "volatile_templates": sorted(self.volatile.values()),
+            "pinned_patterns": self.pinned_patterns,
+            "kept_templates": self.kept_templates,
+            "tracked_lines": len(self.observed),
+            "window": settings.SCRAPE_NOISE_WINDOW,
+        }
@@ -1,61 +1,450 @@
+import hashlib
+import io
 import logging
+import multiprocessing
+import os
+import re
+import shutil
 import tempfile
-from typing import Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+import redis
+
+from app.api.core.config import settings
 
 try:
     import pdfplumber
+    from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
+    from pdfminer.psparser import PSLiteral
 except ImportError:
     pdfplumber = None
+    resolve1 = None
 
 logger = logging.getLogger(__name__)
 
+PAGE_MARKER = "[Page {number}]"
+PAGE_CACHE_KEY = "scraping:pdf_page:{scope}:{fingerprint}"
+PAGE_MARKER_RE = re.compile(r"\[Page (\d+)\]")
+
+
+@dataclass
+class PdfPage:
+    """Text of one PDF page.
+
+    Attributes:
+        number (int): 1-based page number.
+        text (str): Extracted text, possibly empty.
+        fingerprint (str): Hash of the page's content streams, resources and boundaries.
+        cached (bool): True if the text came from the page cache.
+    """
+
+    number: int
+    text: str
+    fingerprint: str
+    cached: bool = False
+
+
+@dataclass
+class PdfExtraction:
+    """Per-page extraction result.
+
+    ``text`` prefixes each non-empty page with a ``[Page N]`` marker. The
+    markers survive whitespace normalization, so later stages can split the
+    cleaned text back into pages; ``boundaries`` gives the same split as
+    character offsets into ``text``.
+    """
+
+    pages: List[PdfPage]
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(
+            f"{PAGE_MARKER.format(number=page.number)}\n{page.text}"
+            for page in self.pages
+            if page.text
+        )
+
+    @property
+    def boundaries(self) -> List[Dict[str, Any]]:
+        """Character ranges of each page in ``text``."""
+        ranges = []
+        offset = 0
+        for page in self.pages:
+            if not page.text:
+                continue
+            length = len(PAGE_MARKER.format(number=page.number)) + 1 + len(page.text)
+            ranges.append(
+                {
+                    "page": page.number,
+                    "start": offset,
+                    "end": offset + length,
+                    "fingerprint": page.fingerprint,
+                }
+            )
+            offset += length + 2
+        return ranges
+
+    @property
+    def cached_pages(self) -> int:
+        return sum(1 for page in self.pages if page.cached)
+
+
+def split_pages(text: str) -> List[Tuple[int, str]]:
+    """Split text carrying ``[Page N]`` markers back into ``(page, text)`` pairs.
+
+    Text before the first marker, or text without markers at all, is returned
+    as page 0.
+
+    Args:
+        text (str): Extracted or cleaned text.
+
+    Returns:
+        List[Tuple[int, str]]: Page numbers with their stripped text.
+    """
+    parts = PAGE_MARKER_RE.split(text)
+    pages = [(0, parts[0].strip())] if parts[0].strip() else []
+    for number, body in zip(parts[1::2], parts[2::2]):
+        pages.append((int(number), body.strip()))
+    return pages
+
+
+def truncate_to_pages(text: str, max_chars: int) -> str:
+    """Cut ``text`` to at most ``max_chars``, preferring to end on a page boundary.
+
+    LLM prompts are capped in size; ending on a marker keeps the model from
+    seeing half of a page. Text without markers is cut at ``max_chars``.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = None
+    for match in PAGE_MARKER_RE.finditer(text, 0, max_chars + 1):
+        cut = match.start()
+    return text[:cut].rstrip() if cut else text[:max_chars]
+
+
+class PdfPageCache:
+    """Page text cache in Redis, keyed by scope (the source) and page fingerprint.
+
+    Entries are never shared between scopes, so one source's documents cannot
+    serve text for another's. Redis failures only cost a re-extraction:
+    lookups return nothing and writes are skipped.
+    """
+
+    def __init__(self, redis_client: Any = None, ttl_seconds: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            redis_client: A synchronous Redis client with ``decode_responses=True``.
+                Defaults to a client for ``REDIS_URL``.
+            ttl_seconds (Optional[int]): Entry lifetime. Defaults to
+                ``SCRAPE_PDF_PAGE_CACHE_TTL_SECONDS``.
+        """
+        self.redis = redis_client or redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.ttl_seconds = ttl_seconds or settings.SCRAPE_PDF_PAGE_CACHE_TTL_SECONDS
+
+    def get_many(self, scope: str, fingerprints: Sequence[str]) -> Dict[str, str]:
+        if not fingerprints:
+            return {}
+        try:
+            keys = [PAGE_CACHE_KEY.format(scope=scope, fingerprint=f) for f in fingerprints]
+            values = self.redis.mget(keys)
+        except redis.RedisError as e:
+            logger.warning(f"PDF page cache unavailable: {e}")
+            return {}
+        return {f: v for f, v in zip(fingerprints, values) if v is not None}
+
+    def set_many(self, scope: str, texts: Dict[str, str]) -> None:
+        if not texts:
+            return
+        try:
+            pipe = self.redis.pipeline()
+            for fingerprint, text in texts.items():
+                key = PAGE_CACHE_KEY.format(scope=scope, fingerprint=fingerprint)
+                pipe.set(key, text, ex=self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not write PDF page cache: {e}")
+
+
+def _object_digest(obj: Any, memo: Dict[int, bytes]) -> bytes:
+    """Hash a PDF object and everything it references.
+
+    Indirect objects are hashed once per document through ``memo``, so fonts
+    and images shared by many pages cost one pass; a reference back to an
+    object still being hashed counts as a fixed marker.
+    """
+    if isinstance(obj, PDFObjRef):
+        if obj.objid not in memo:
+            memo[obj.objid] = b"cycle"
+            memo[obj.objid] = _object_digest(obj.resolve(), memo)
+        return memo[obj.objid]
+
+    digest = hashlib.sha256()
+    if isinstance(obj, PDFStream):
+        digest.update(b"stream")
+        digest.update(_object_digest(obj.attrs, memo))
+        try:
+            digest.update(obj.get_data())
+        except Exception:
+            digest.update(obj.get_rawdata() or b"")
+    elif isinstance(obj, dict):
+        digest.update(b"dict")
+        for key in sorted(obj, key=str):
+            if key == "Parent":
+                continue
+            digest.update(str(key).encode())
+            digest.update(_object_digest(obj[key], memo))
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"array")
+        for item in obj:
+            digest.update(_object_digest(item, memo))
+    elif isinstance(obj, PSLiteral):
+        digest.update(b"/" + str(obj.name).encode())
+    else:
+        digest.update(repr(obj).encode())
+    return digest.digest()
+
+
+def _page_fingerprint(page, memo: Dict[int, bytes]) -> str:
+    """Hash a page's decoded content streams, resources and boundaries.
+
+    Resources cover what the content streams only name: Form XObjects, images,
+    fonts and their encodings and ToUnicode maps. Two pages drawing ``/X0 Do``
+    with different XObjects therefore get different fingerprints.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(tuple(page.bbox)).encode())
+    page_obj = page.page_obj
+    digest.update(repr(getattr(page_obj, "rotate", 0)).encode())
+    for stream in page_obj.contents or []:
+        stream = resolve1(stream) if resolve1 else stream
+        if hasattr(stream, "get_data"):
+            digest.update(stream.get_data())
+    digest.update(_object_digest(getattr(page_obj, "resources", None) or {}, memo))
+    return digest.hexdigest()
+
+
+def _extract_page_range(path: str, numbers: Sequence[int]) -> List[Tuple[int, str]]:
+    """Extract the given 1-based pages from a PDF file (process pool worker)."""
+    results = []
+    with pdfplumber.open(path) as document:
+        for number in numbers:
+            page = document.pages[number - 1]
+            results.append((number, page.extract_text() or ""))
+            page.flush_cache()
+    return results
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _wait_for_siblings(barrier) -> None:
+    barrier.wait()
+
+
+def start_pdf_pool(workers: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """Return this process's PDF extraction pool, starting it on first use.
+
+    The pool lives as long as the process and uses the ``spawn`` start method,
+    so workers never start as a fork of a threaded process. Celery prefork
+    children are daemonic, and ``multiprocessing`` refuses to start processes
+    from a daemonic process; the check is lifted while the workers start. All
+    of them are started up front, since the pool would otherwise spawn them on
+    demand. They exit on ``shutdown_pdf_pool``, or on their own when their
+    call queue closes because this process died.
+
+    Args:
+        workers (Optional[int]): Pool size. Defaults to ``SCRAPE_PDF_WORKERS``.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The pool, or None if it could not be started.
+    """
+    global _pool, _pool_pid
+    workers = workers or settings.SCRAPE_PDF_WORKERS
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            return _pool
+
+        context = multiprocessing.get_context("spawn")
+        process = multiprocessing.current_process()
+        daemon = process._config.pop("daemon", None)
+        try:
+            # Each worker blocks in its initializer until all of them exist, so
+            # no worker goes idle before the last one has been spawned.
+            barrier = context.Barrier(workers)
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_wait_for_siblings,
+                initargs=(barrier,),
+            )
+            for future in [pool.submit(os.getpid) for _ in range(workers)]:
+                future.result()
+        except (OSError, RuntimeError, BrokenProcessPool) as e:
+            logger.warning(f"PDF process pool unavailable, extracting sequentially: {e}")
+            return None
+        finally:
+            if daemon is not None:
+                process._config["daemon"] = daemon
+
+        _pool, _pool_pid = pool, os.getpid()
+        logger.info(f"Started PDF process pool with {workers} workers")
+        return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop this process's PDF extraction pool, if it has one."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown(cancel_futures=True)
+        _pool, _pool_pid = None, None
+
 
 class PDFService:
     """
     Service for extracting text content from PDF files.
     Handles PDF processing logic separately from scraping concerns.
+
+    Pages are fingerprinted by their content streams, resources and boundaries.
+    Pages seen before in the same cache scope are served from the page cache;
+    the rest are extracted in a process pool when there are enough of them to
+    make that worthwhile.
     """
 
-    def __init__(self):
+    def __init__(self, page_cache: Optional[PdfPageCache] = None, workers: Optional[int] = None):
+        """Initialize the service.
+
+        Args:
+            page_cache (Optional[PdfPageCache]): Cache for page text. None disables caching.
+            workers (Optional[int]): Process pool size. Defaults to ``SCRAPE_PDF_WORKERS``.
+        """
         if pdfplumber is None:
             logger.warning("pdfplumber not installed. PDF extraction will not be available.")
+        self.page_cache = page_cache
+        self.workers = workers or settings.SCRAPE_PDF_WORKERS
 
-    def extract_text(self, pdf_bytes: bytes) -> str:
+    def extract_text(self, pdf: Union[bytes, BinaryIO]) -> str:
         """
-        Extract text from PDF bytes using pdfplumber.
+        Extract text from a PDF using pdfplumber.
+
+        The PDF is parsed straight from memory or from a seekable file (such as a
+        spooled download), so no temporary copy is written to disk.
 
         Args:
-            pdf_bytes: Raw PDF content as bytes
+            pdf: Raw PDF content as bytes, or a seekable binary file object
 
         Returns:
             Extracted text from all PDF pages joined together
 
+        Raises:
+            ValueError: If pdfplumber not installed or PDF is invalid
+        """
+        extraction = self.extract_pages(pdf)
+        return "\n\n".join(page.text for page in extraction.pages if page.text)
+
+    def extract_pages(
+        self, pdf: Union[bytes, BinaryIO], cache_scope: Optional[str] = None
+    ) -> PdfExtraction:
+        """
+        Extract text page by page, reusing cached pages and parallelizing the rest.
+
+        Args:
+            pdf: Raw PDF content as bytes, or a seekable binary file object
+            cache_scope: Namespace for the page cache, normally the source ID.
+                Without one the page cache is not used.
+
+        Returns:
+            PdfExtraction with one entry per page
+
         Raises:
             ValueError: If pdfplumber not installed or PDF is invalid
         """
         if pdfplumber is None:
             raise ValueError("pdfplumber not installed. Install with: pip install pdfplumber")
 
+        stream = io.BytesIO(pdf) if isinstance(pdf, (bytes, bytearray)) else pdf
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(pdf_bytes)
-                tmp.flush()
-                tmp_path = tmp.name
-
-            extracted_text = []
-            with pdfplumber.open(tmp_path) as pdf:
-                logger.info(f"PDF has {len(pdf.pages)} pages")
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text:
-                        extracted_text.append(text)
-                    logger.debug(f"  Page {page_num}: {len(text)} chars extracted")
-
-            return "\n\n".join(extracted_text)
+            stream.seek(0)
+            with pdfplumber.open(stream) as document:
+                logger.info(f"PDF has {len(document.pages)} pages")
+                page_cache = self.page_cache if cache_scope else None
+                fingerprints = []
+                memo: Dict[int, bytes] = {}
+                for page in document.pages:
+                    fingerprints.append(_page_fingerprint(page, memo))
+                    page.flush_cache()
+
+                cached = page_cache.get_many(cache_scope, fingerprints) if page_cache else {}
+                missing = [n for n, f in enumerate(fingerprints, 1) if f not in cached]
+
+                if len(missing) >= settings.SCRAPE_PDF_PARALLEL_MIN_PAGES and self.workers > 1:
+                    texts = self._extract_parallel(stream, missing)
+                else:
+                    texts = None
+                if texts is None:
+                    texts = {}
+                    for number in missing:
+                        page = document.pages[number - 1]
+                        texts[number] = page.extract_text() or ""
+                        logger.debug(f"  Page {number}: {len(texts[number])} chars extracted")
+                        page.flush_cache()
+
+            pages = [
+                PdfPage(
+                    number=n,
+                    text=cached[f] if f in cached else texts[n],
+                    fingerprint=f,
+                    cached=f in cached,
+                )
+                for n, f in enumerate(fingerprints, 1)
+            ]
+            if page_cache:
+                page_cache.set_many(cache_scope, {fingerprints[n - 1]: texts[n] for n in missing})
+
+            logger.info(
+                f"PDF extracted: {len(missing)} pages parsed, {len(cached)} pages from cache"
+            )
+            return PdfExtraction(pages=pages)
         except Exception as e:
             logger.error(f"Failed to extract PDF: {type(e).__name__}: {e}")
             raise ValueError(f"PDF extraction failed: {e}")
 
+    def _extract_parallel(self, stream: BinaryIO, numbers: List[int]) -> Optional[Dict[int, str]]:
+        """Extract pages across the process's PDF pool (see ``start_pdf_pool``).
+
+        Workers need a path to open the PDF, so the stream is copied into a
+        temporary directory that is removed afterwards. Returns None when the
+        pool cannot be started or breaks, and the caller extracts
+        sequentially instead.
+        """
+        pool = start_pdf_pool(self.workers)
+        if pool is None:
+            return None
+        workers = min(self.workers, len(numbers))
+        size = -(-len(numbers) // workers)
+        batches = [numbers[i : i + size] for i in range(0, len(numbers), size)]
+
+        with tempfile.TemporaryDirectory(prefix="pdf-extract-") as tmp_dir:
+            path = os.path.join(tmp_dir, "document.pdf")
+            stream.seek(0)
+            with open(path, "wb") as f:
+                shutil.copyfileobj(stream, f)
+
+            try:
+                results = pool.map(_extract_page_range, [path] * len(batches), batches)
+                return {number: text for batch in results for number, text in batch}
+            except BrokenProcessPool as e:
+                logger.warning(f"PDF process pool broke, extracting sequentially: {e}")
+                shutdown_pdf_pool()
+                return None
+
     def is_pdf(self, content: bytes, content_type: Optional[str] = None) -> bool:
         """
         Determine if content is a PDF based on content-type header or magic bytes.
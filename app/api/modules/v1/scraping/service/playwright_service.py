@@ -4,6 +4,14 @@ from typing import Any, Dict, Optional
 
 from playwright.async_api import async_playwright
 
+from app.api.modules.v1.scraping.service.download import CHUNK_SIZE, SpooledDownload
+from app.api.modules.v1.scraping.service.render_profile import RenderProfile
+from app.api.modules.v1.scraping.service.session_store import (
+    USER_AGENT,
+    DomainSessionStore,
+    session_context,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,19 +32,60 @@ class PlaywrightService:
         "--disable-blink-features=AutomationControlled",
     ]
 
-    async def scrape(self, url: str, creds: Optional[Dict[str, Any]] = None) -> bytes:
+    DEFAULT_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    NAVIGATION_TIMEOUT_MS = 25000
+    SELECTOR_TIMEOUT_MS = 10000
+
+    def __init__(self, session_store: Optional[DomainSessionStore] = None):
+        """Initialize the service.
+
+        Args:
+            session_store (Optional[DomainSessionStore]): Where to resume and save
+                per-domain storage state (clearance cookies, logins). None disables it.
+        """
+        self.session_store = session_store
+
+    async def scrape(
+        self,
+        url: str,
+        creds: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        render_profile: Optional[RenderProfile] = None,
+        max_bytes: Optional[int] = None,
+    ) -> SpooledDownload:
         logger.info(f"Starting scrape for URL: {url}")
+        profile = render_profile or RenderProfile.from_rules(None)
+        navigation_timeout = self.NAVIGATION_TIMEOUT_MS
+        if timeout is not None:
+            navigation_timeout = max(1, min(navigation_timeout, int(timeout * 1000)))
+        session_key = session_context(creds)
+        saved_state = None
+        if self.session_store is not None:
+            saved_state = await self.session_store.load(url, session_key)
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=self.BROWSER_ARGS)
             logger.info("Browser launched successfully.")
 
+            context_options = {}
+            user_agent = self.DEFAULT_USER_AGENT
+            if saved_state:
+                context_options["storage_state"] = {
+                    "cookies": saved_state["cookies"],
+                    "origins": saved_state["origins"],
+                }
+                # Clearance cookies only hold for the User-Agent that earned them.
+                user_agent = saved_state.get(USER_AGENT) or user_agent
+                logger.info("Resuming saved session state.")
             context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
+                user_agent=user_agent,
                 accept_downloads=True,
                 viewport={"width": 1920, "height": 1080},
+                **context_options,
             )
 
             if creds and "cookies" in creds:
@@ -45,86 +94,147 @@ class PlaywrightService:
 
             page = await context.new_page()
             logger.info("Browser context and page created.")
+            await self._apply_render_profile(context, page, profile)
+
+            try:
+                content = await self._load_page(page, url, navigation_timeout, profile, max_bytes)
+                if self.session_store is not None:
+                    state = await context.storage_state()
+                    state[USER_AGENT] = user_agent
+                    await self.session_store.save(url, state, session_key)
+                return content
+            except Exception as e:
+                logger.error(f"Scrape failed for {url}: {str(e)}")
+                raise e
+            finally:
+                await context.close()
+                await browser.close()
+                logger.info("Browser resources cleaned up.")
 
-            download_future = asyncio.Future()
+    async def _apply_render_profile(self, context, page, profile: RenderProfile) -> None:
+        """Abort the sub-resources the profile blocks and enforce its byte cap.
 
-            def on_download(download):
-                if not download_future.done():
-                    download_future.set_result(download)
+        Transferred bytes are counted from response ``content-length`` headers.
+        Once the cap is reached every further sub-resource request is aborted;
+        the main document is never blocked.
+        """
+        if not (profile.blocked_resource_types or profile.block_analytics or profile.max_bytes):
+            return
 
-            page.on("download", on_download)
+        transferred = {"bytes": 0, "blocked": 0}
 
+        def on_response(response):
             try:
-                logger.info(f"Navigating to: {url}")
+                transferred["bytes"] += int(response.headers.get("content-length") or 0)
+            except ValueError:
+                pass
 
-                try:
-                    goto_task = asyncio.create_task(
-                        page.goto(url, wait_until="domcontentloaded", timeout=25000)
-                    )
+        async def route_request(route):
+            request = route.request
+            over_budget = profile.max_bytes and transferred["bytes"] >= profile.max_bytes
+            if request.resource_type != "document" and (
+                over_budget or profile.should_block(request.resource_type, request.url)
+            ):
+                transferred["blocked"] += 1
+                await route.abort()
+                return
+            await route.continue_()
+
+        page.on("response", on_response)
+        await context.route("**/*", route_request)
+        logger.info(f"Render profile '{profile.name}' applied.")
+
+    async def _load_page(
+        self,
+        page,
+        url: str,
+        navigation_timeout: int,
+        profile: RenderProfile,
+        max_bytes: Optional[int] = None,
+    ) -> SpooledDownload:
+        """Navigate to ``url`` and return the rendered HTML or the triggered download."""
+        download_future = asyncio.Future()
+
+        def on_download(download):
+            if not download_future.done():
+                download_future.set_result(download)
+
+        page.on("download", on_download)
 
-                    done, pending = await asyncio.wait(
-                        [goto_task, download_future], return_when=asyncio.FIRST_COMPLETED
+        logger.info(f"Navigating to: {url}")
+
+        try:
+            goto_task = asyncio.create_task(
+                page.goto(url, wait_until="domcontentloaded", timeout=navigation_timeout)
+            )
+
+            done, pending = await asyncio.wait(
+                [goto_task, download_future], return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if download_future in done:
+                logger.info("Download detected immediately.")
+                download = download_future.result()
+                return await self._handle_download_stream(download, max_bytes)
+
+            await goto_task
+            logger.info("Page navigation completed.")
+            if download_future.done():
+                return await self._handle_download_stream(download_future.result(), max_bytes)
+
+            logger.info("Waiting for page content to load.")
+            if profile.wait_for_selector:
+                try:
+                    await page.wait_for_selector(
+                        profile.wait_for_selector, timeout=self.SELECTOR_TIMEOUT_MS
                     )
+                except Exception:
+                    logger.warning(f"Timed out waiting for selector {profile.wait_for_selector!r}.")
+            else:
+                try:
+                    await page.wait_for_function("document.body.innerText.length > 0", timeout=5000)
+                except Exception:
+                    logger.warning("Page body appears empty or timed out waiting for text.")
 
-                    if download_future in done:
-                        logger.info("Download detected immediately.")
-                        download = download_future.result()
-                        return await self._handle_download_stream(download)
-
-                    await goto_task
-                    logger.info("Page navigation completed.")
-                    if download_future.done():
-                        return await self._handle_download_stream(download_future.result())
-
-                    logger.info("Waiting for page content to load.")
-                    try:
-                        await page.wait_for_function(
-                            "document.body.innerText.length > 0", timeout=5000
-                        )
-                    except Exception:
-                        logger.warning("Page body appears empty or timed out waiting for text.")
-
-                    content = await page.content()
-                    logger.info(f"Content extracted, length: {len(content)}")
-                    return content.encode("utf-8")
-
-                except Exception as e:
-                    if "Download is starting" in str(e) or download_future.done():
-                        logger.info("Navigation cancelled by download.")
-                        download = await download_future
-                        return await self._handle_download_stream(download)
-                    raise e
+            content = await page.content()
+            logger.info(f"Content extracted, length: {len(content)}")
+            return SpooledDownload.from_bytes(content.encode("utf-8"))
 
-            except Exception as e:
-                logger.error(f"Scrape failed for {url}: {str(e)}")
-                raise e
-            finally:
-                await context.close()
-                await browser.close()
-                logger.info("Browser resources cleaned up.")
+        except Exception as e:
+            if "Download is starting" in str(e) or download_future.done():
+                logger.info("Navigation cancelled by download.")
+                download = await download_future
+                return await self._handle_download_stream(download, max_bytes)
+            raise e
 
-    async def _handle_download_stream(self, download) -> bytes:
-        """Helper to stream download to memory without temp files if possible.
+    async def _handle_download_stream(
+        self, download, max_bytes: Optional[int] = None
+    ) -> SpooledDownload:
+        """Helper to stream a finished Playwright download into a bounded body.
 
-        This method waits for a Playwright download to complete, reads the
-        downloaded file into memory as bytes, and returns it. It avoids using
-        temporary files by directly reading from the download path.
+        This method waits for a Playwright download to complete and copies the
+        file Playwright saved chunk by chunk into a ``SpooledDownload``, hashing
+        it on the way. The copy stops as soon as ``max_bytes`` is exceeded, so
+        an oversized download is rejected without ever being held in memory.
 
         Args:
             download (playwright.async_api.Download): The Playwright download
                 object representing the file being downloaded.
+            max_bytes (Optional[int]): Download size cap. Defaults to
+                ``SCRAPE_MAX_DOWNLOAD_BYTES``.
 
         Returns:
-            bytes: The content of the downloaded file as a byte string.
+            SpooledDownload: The downloaded file. The caller closes it.
 
         Raises:
+            DownloadTooLargeError: If the file is larger than ``max_bytes``.
             Exception: If the download fails, is cancelled, or the file cannot
                 be read.
 
         Examples:
             >>> # Assuming a download object from Playwright
-            >>> data = await service._handle_download_stream(download)
-            >>> print(len(data))
+            >>> with await service._handle_download_stream(download) as body:
+            ...     print(body.size)
             1024
         """
         logger.info("Handling download stream.")
@@ -133,12 +243,21 @@ class PlaywrightService:
             if not path:
                 raise Exception("Download failed or was cancelled")
 
-            #
-            with open(path, "rb") as f:
-                data = f.read()
-
-            logger.info(f"Downloaded file: {download.suggested_filename} ({len(data)} bytes)")
-            return data
+            body = await asyncio.to_thread(self._spool_file, path, max_bytes)
+            logger.info(f"Downloaded file: {download.suggested_filename} ({body.size} bytes)")
+            return body
         except Exception as e:
             logger.error(f"Failed to process download: {e}")
             raise e
+
+    @staticmethod
+    def _spool_file(path: str, max_bytes: Optional[int] = None) -> SpooledDownload:
+        """Copy the file at ``path`` into a ``SpooledDownload`` capped at ``max_bytes``."""
+        body = SpooledDownload(max_bytes=max_bytes)
+        try:
+            with open(path, "rb") as f:
+                body.write_chunks(iter(lambda: f.read(CHUNK_SIZE), b""))
+        except Exception:
+            body.close()
+            raise
+        return body
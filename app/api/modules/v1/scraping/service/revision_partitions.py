@@ -0,0 +1,281 @@
+"""Monthly partitions of ``data_revisions``: creation ahead of time and retention.
+
+``data_revisions`` is range-partitioned by ``scraped_at``, one partition per
+calendar month named ``data_revisions_pYYYYMM``. The maintenance task keeps
+``SCRAPE_REVISION_PARTITIONS_AHEAD`` future months created, and archives
+months older than ``SCRAPE_REVISION_RETENTION_MONTHS``.
+
+Rows outside every monthly partition land in ``data_revisions_default`` so
+inserts never fail when the task lapses. The next run logs an error and moves
+them into monthly partitions of their own.
+
+Archiving exports the partition's rows (and the change diffs that reference
+them) as gzipped JSON lines to ``SCRAPE_REVISION_ARCHIVE_BUCKET``, then
+detaches and drops the partition. A revision that is still some source's
+latest revision (see ``latest_revision``) is never archived: stable sources
+keep pointing at old revisions, so a partition holding such rows is emptied of
+everything else instead of dropped. References from tickets and scrape jobs
+are cleared and revision notifications are deleted along with the rows.
+"""
+
+import asyncio
+import gzip
+import logging
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.storage.minio_storage import upload_raw_stream
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "data_revisions"
+DEFAULT_PARTITION = PARENT_TABLE + "_default"
+PARTITION_NAME = PARENT_TABLE + "_p{year:04d}{month:02d}"
+PARTITION_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$")
+ARCHIVE_KEY = "data_revisions/{year:04d}/{month:02d}/{table}-{stamp}.jsonl.gz"
+
+_PINNED = "SELECT latest_revision_id FROM sources WHERE latest_revision_id IS NOT NULL"
+
+
+def month_start(moment: datetime) -> date:
+    """Return the first day of ``moment``'s month."""
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift the first day of a month by ``count`` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the name of the partition holding ``month``."""
+    return PARTITION_NAME.format(year=month.year, month=month.month)
+
+
+def partition_bounds(month: date) -> str:
+    """Return the ``FROM ... TO ...`` range clause of ``month``'s partition."""
+    return f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Parse a partition name back to its month, or None for foreign tables."""
+    match = PARTITION_RE.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of archiving one partition.
+
+    Attributes:
+        partition (str): The partition name.
+        archived (int): Revisions exported and removed.
+        kept (int): Latest revisions kept in place.
+        dropped (bool): Whether the partition was detached and dropped.
+    """
+
+    partition: str
+    archived: int
+    kept: int
+    dropped: bool
+
+
+class RevisionPartitionManager:
+    """Creates and retires the monthly partitions of ``data_revisions``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def is_partitioned(self) -> bool:
+        """Return True if ``data_revisions`` is a partitioned Postgres table."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return False
+        result = await self.db.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:parent)"),
+            {"parent": PARENT_TABLE},
+        )
+        return result.first() is not None
+
+    async def _child_tables(self) -> List[str]:
+        result = await self.db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass)"
+            ),
+            {"parent": PARENT_TABLE},
+        )
+        return [name for (name,) in result.all()]
+
+    async def list_partitions(self) -> List[str]:
+        """Return the names of the monthly partitions, oldest first."""
+        names = [name for name in await self._child_tables() if partition_month(name)]
+        return sorted(names, key=partition_month)
+
+    async def ensure_partitions(self, now: datetime, months_ahead: int) -> List[str]:
+        """Create the partitions for the current month and ``months_ahead`` more.
+
+        Months with rows in the default partition also get their partition,
+        and those rows are moved into it.
+
+        Returns:
+            List[str]: Names of the partitions that were created.
+        """
+        children = await self._child_tables()
+        existing = {name for name in children if partition_month(name)}
+        stray = set()
+        if DEFAULT_PARTITION in children:
+            stray = await self._default_partition_months()
+        if stray:
+            logger.error(
+                f"Revisions for {sorted(m.isoformat() for m in stray)} landed in "
+                f"{DEFAULT_PARTITION}; partition maintenance has lapsed. Moving them."
+            )
+
+        current = month_start(now)
+        months = {add_months(current, offset) for offset in range(months_ahead + 1)} | stray
+        created = []
+        for month in sorted(months):
+            name = partition_name(month)
+            if name in existing:
+                continue
+            if month in stray:
+                await self._move_from_default(name, month)
+            else:
+                await self.db.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                        f"FOR VALUES {partition_bounds(month)}"
+                    )
+                )
+            created.append(name)
+        await self.db.commit()
+        return created
+
+    async def _default_partition_months(self) -> Set[date]:
+        """Return the months that have rows in the default partition."""
+        result = await self.db.execute(
+            text(
+                "SELECT DISTINCT CAST(date_trunc('month', scraped_at) AS date) "
+                f"FROM {DEFAULT_PARTITION}"
+            )
+        )
+        return {month for (month,) in result.all()}
+
+    async def _move_from_default(self, name: str, month: date) -> None:
+        """Create ``month``'s partition from the rows the default partition holds for it.
+
+        A partition cannot be created while the default partition holds rows
+        in its range, so the rows are copied into a standalone table, removed
+        from the default partition, and the table is then attached.
+        """
+        where = (
+            f"scraped_at >= '{month.isoformat()}' "
+            f"AND scraped_at < '{add_months(month, 1).isoformat()}'"
+        )
+        await self.db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.db.execute(
+            text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {where}")
+        )
+        await self.db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {where}"))
+        await self.db.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES {partition_bounds(month)}"
+            )
+        )
+
+    async def archive_expired(self, now: datetime, retention_months: int) -> List[ArchiveResult]:
+        """Archive every partition that ended more than ``retention_months`` ago."""
+        cutoff = add_months(month_start(now), -retention_months)
+        results = []
+        for name in await self.list_partitions():
+            if add_months(partition_month(name), 1) > cutoff:
+                break
+            result = await self.archive_partition(name, now)
+            if result is not None:
+                results.append(result)
+        return results
+
+    async def archive_partition(self, name: str, now: datetime) -> Optional[ArchiveResult]:
+        """Export a partition to object storage, then remove its archivable rows.
+
+        Returns:
+            Optional[ArchiveResult]: None if the partition only holds latest
+            revisions, which were archived on an earlier run.
+        """
+        month = partition_month(name)
+        archivable = f"SELECT id FROM {name} WHERE id NOT IN ({_PINNED})"
+        # Diffs from or to an archived revision; none may outlive either side.
+        diffs = f"d.new_revision_id IN ({archivable}) OR d.old_revision_id IN ({archivable})"
+        counts = await self.db.execute(
+            text(f"SELECT count(*), count(*) FILTER (WHERE id IN ({_PINNED})) FROM {name}")
+        )
+        total, kept = counts.one()
+        archived = total - kept
+        if archived == 0 and kept:
+            return None
+
+        if archived:
+            stamp = now.strftime("%Y%m%d%H%M%S")
+            await self._export(
+                f"SELECT row_to_json(r)::text FROM {name} r WHERE r.id IN ({archivable})",
+                ARCHIVE_KEY.format(year=month.year, month=month.month, table=name, stamp=stamp),
+            )
+            await self._export(
+                f"SELECT row_to_json(d)::text FROM change_diff d WHERE {diffs}",
+                ARCHIVE_KEY.format(
+                    year=month.year, month=month.month, table="change_diff", stamp=stamp
+                ),
+            )
+
+        await self.db.execute(text(f"DELETE FROM change_diff d WHERE {diffs}"))
+        for table, column in (("tickets", "data_revision_id"), ("scrape_jobs", "data_revision_id")):
+            await self.db.execute(
+                text(f"UPDATE {table} SET {column} = NULL WHERE {column} IN ({archivable})")
+            )
+        await self.db.execute(
+            text(f"DELETE FROM revision_notifications WHERE revision_id IN ({archivable})")
+        )
+        if kept:
+            await self.db.execute(text(f"DELETE FROM {name} WHERE id IN ({archivable})"))
+        else:
+            await self.db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            await self.db.execute(text(f"DROP TABLE {name}"))
+        await self.db.commit()
+
+        logger.info(
+            f"Archived {archived} revisions from {name} "
+            f"({kept} latest revisions kept, dropped={not kept})"
+        )
+        return ArchiveResult(partition=name, archived=archived, kept=kept, dropped=not kept)
+
+    async def _export(self, query: str, object_name: str) -> None:
+        """Stream query rows, one JSON document each, into a gzipped object."""
+        with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spool:
+            with gzip.GzipFile(fileobj=spool, mode="wb") as archive:
+                rows = await self.db.stream(text(query))
+                async for (row,) in rows:
+                    archive.write(row.encode("utf-8") + b"\n")
+            length = spool.tell()
+            spool.seek(0)
+            await asyncio.to_thread(
+                upload_raw_stream,
+                spool,
+                length,
+                settings.SCRAPE_REVISION_ARCHIVE_BUCKET,
+                object_name,
+            )
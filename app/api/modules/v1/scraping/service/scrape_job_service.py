@@ -7,16 +7,21 @@ Handles background scrape execution and job lifecycle management.
 import asyncio
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from sqlmodel import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import desc, select
 
 from app.api.core.config import settings
 from app.api.db.database import AsyncSessionLocal
 from app.api.events.builders import build_scrape_job_event
 from app.api.events.factory import get_event_publisher
 from app.api.modules.v1.scraping.models.scrape_job import ScrapeJob, ScrapeJobStatus
+from app.api.modules.v1.scraping.service.deadline import ScrapeDeadlineExceeded
+from app.api.modules.v1.scraping.service.fair_queue import PriorityClass, queue_for
 from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+from app.celery_app import celery_app
 
 logger = logging.getLogger("app")
 
@@ -79,10 +84,17 @@ class ScrapeJobService:
                         exc_info=True,
                     )
                     job.status = ScrapeJobStatus.FAILED
-                    job.error_message = (
-                        "Scrape execution failed. Please try again or contact support "
-                        "if the issue persists."
-                    )
+                    if isinstance(e, ScrapeDeadlineExceeded):
+                        job.error_message = (
+                            f"Scrape exceeded its time budget during the '{e.stage}' stage. "
+                            "Please try again or contact support if the issue persists."
+                        )
+                        job.result = {"timed_out_stage": e.stage}
+                    else:
+                        job.error_message = (
+                            "Scrape execution failed. Please try again or contact support "
+                            "if the issue persists."
+                        )
                     job.completed_at = datetime.now(timezone.utc)
 
                 await db.commit()
@@ -95,24 +107,68 @@ class ScrapeJobService:
             )
 
     @staticmethod
-    def queue_scrape_job(job_id: uuid.UUID, source_id: uuid.UUID) -> None:
+    async def queue_scrape_job(job_id: uuid.UUID, source_id: uuid.UUID) -> None:
         """
-        Queue a scrape job for background execution.
+        Queue a scrape job for execution on the worker fleet.
 
-        Uses asyncio.create_task for fire-and-forget execution.
+        The job is sent to the high-priority manual queue so that fetching,
+        rendering and LLM calls never run inside the API process. Publishing is
+        a blocking broker round trip, so it runs in a worker thread.
 
         Args:
             job_id (uuid.UUID): The scrape job ID.
             source_id (uuid.UUID): The source ID to scrape.
+
+        Raises:
+            Exception: If the task cannot be published to the broker.
+        """
+        await asyncio.to_thread(
+            celery_app.send_task,
+            "app.api.modules.v1.scraping.service.tasks.run_manual_scrape_job",
+            args=[str(job_id), str(source_id)],
+            queue=queue_for(PriorityClass.MANUAL),
+        )
+
+    @staticmethod
+    async def find_coalescable_job(db: AsyncSession, source_id: uuid.UUID) -> Optional[ScrapeJob]:
         """
-        task = asyncio.create_task(
-            ScrapeJobService.execute_scrape_job_background(job_id, source_id)
+        Find a job whose result a new manual trigger for the source can reuse.
+
+        The source's active (PENDING or IN_PROGRESS) job is always reused. Otherwise
+        a job that completed within ``SCRAPE_MANUAL_COALESCE_SECONDS`` is reused
+        instead of scraping the source again. Failed jobs are never reused.
+
+        Args:
+            db (AsyncSession): Database session.
+            source_id (uuid.UUID): The source ID being triggered.
+
+        Returns:
+            Optional[ScrapeJob]: The active or recently completed job, or None.
+        """
+        active = await db.execute(
+            select(ScrapeJob)
+            .where(ScrapeJob.source_id == source_id)
+            .where(ScrapeJob.status.in_([ScrapeJobStatus.PENDING, ScrapeJobStatus.IN_PROGRESS]))
+            .order_by(desc(ScrapeJob.created_at))
+            .limit(1)
+        )
+        active_job = active.scalars().first()
+        if active_job or settings.SCRAPE_MANUAL_COALESCE_SECONDS <= 0:
+            return active_job
+
+        window_start = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.SCRAPE_MANUAL_COALESCE_SECONDS
         )
-        task.add_done_callback(
-            lambda t: logger.error("Exception in background scrape job", exc_info=t.exception())
-            if t.exception()
-            else None
+        query = (
+            select(ScrapeJob)
+            .where(ScrapeJob.source_id == source_id)
+            .where(ScrapeJob.status == ScrapeJobStatus.COMPLETED)
+            .where(ScrapeJob.completed_at >= window_start)
+            .order_by(desc(ScrapeJob.completed_at))
+            .limit(1)
         )
+        result = await db.execute(query)
+        return result.scalars().first()
 
     @staticmethod
     async def _publish_scrape_job_update(job: ScrapeJob) -> None:
@@ -4,15 +4,21 @@ Handles the end-to-end flow of fetching content, extracting text,
 analyzing with AI, detecting changes, and persisting data revisions.
 """
 
+import asyncio
 import hashlib
+import html
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import desc, select
 
+from app.api.core.config import settings
 from app.api.core.security import decrypt_auth_details
 from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
 from app.api.modules.v1.notifications.service.revision_notification_task import (
@@ -21,15 +27,53 @@ from app.api.modules.v1.notifications.service.revision_notification_task import
 from app.api.modules.v1.scraping.models.change_diff import ChangeDiff
 from app.api.modules.v1.scraping.models.data_revision import DataRevision
 from app.api.modules.v1.scraping.models.source_model import Source
-from app.api.modules.v1.scraping.service.cloudscrapper_service import HTTPClientService
+from app.api.modules.v1.scraping.service.cloudscrapper_service import (
+    FetchResult,
+    HTTPClientService,
+)
+from app.api.modules.v1.scraping.service.deadline import ScrapeDeadline, resolve_time_budget
 from app.api.modules.v1.scraping.service.diff_service import DiffAIService
+from app.api.modules.v1.scraping.service.download import (
+    SpooledDownload,
+    resolve_max_download_bytes,
+)
 from app.api.modules.v1.scraping.service.extractor_service import TextExtractorService
-from app.api.modules.v1.scraping.service.llm_service import AIExtractionService
-from app.api.modules.v1.scraping.service.pdf_service import PDFService
+from app.api.modules.v1.scraping.service.fact_timeline import (
+    FactTimelineService,
+    facts_from_result,
+)
+from app.api.modules.v1.scraping.service.fetch_cache import SharedFetchCache
+from app.api.modules.v1.scraping.service.latest_revision import LatestRevision
+from app.api.modules.v1.scraping.service.llm_service import (
+    AIExtractionService,
+    AIExtractionServiceError,
+)
+from app.api.modules.v1.scraping.service.noise_model import NoiseModel
+from app.api.modules.v1.scraping.service.pdf_service import PdfPageCache, PDFService
+from app.api.modules.v1.scraping.service.render_profile import RenderProfile
+from app.api.modules.v1.scraping.service.section_fingerprint import (
+    SectionChanges,
+    compare_fingerprints,
+    fingerprint_text,
+    section_diff,
+)
+from app.api.modules.v1.scraping.service.session_store import DomainSessionStore
+from app.api.modules.v1.scraping.service.source_lease import (
+    SourceLeaseManager,
+    SourceLeaseTimeoutError,
+    StaleFencingTokenError,
+)
+from app.api.modules.v1.search.service.search_cache import SearchCache
 from app.api.modules.v1.tickets.service.ticket_creation_service import TicketService
+from app.api.utils.cleaned_text import normalize_text
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_MODE_KEY = "extraction_mode"
+INCREMENTAL_RUNS_KEY = "incremental_runs"
+
+LEASE_ACQUIRE_ATTEMPTS = 3
+
 
 class ScraperService:
     """Orchestrates the scraping, extraction, and analysis pipeline."""
@@ -45,37 +89,300 @@ class ScraperService:
         self.text_extractor = TextExtractorService()
         self.differ = DiffAIService()
         self.http_client = HTTPClientService()
-        self.pdf_service = PDFService()
+        self.pdf_service = PDFService(page_cache=PdfPageCache())
+        self.fetch_cache: Optional[SharedFetchCache] = None
+        self.search_cache: Optional[SearchCache] = None
+        # Called with None when the origin answers a fetch (a 304 included), or with
+        # the fetch stage's error. Copies served from the fetch cache report nothing.
+        self.fetch_observer: Optional[Callable[[Optional[Exception]], None]] = None
 
     async def execute_scrape_job(self, source_id: str) -> Dict[str, Any]:
-        """Execute the full scraping pipeline for a given source.
+        """Execute the full scraping pipeline for a given source under a per-source lease.
+
+        Only one caller runs the pipeline for a source at a time. Concurrent callers
+        (manual triggers, scheduled tasks, retries) attach to the in-flight run and
+        return its result, flagged with ``attached_to_inflight``. If Redis is
+        unavailable the pipeline runs without a lease.
+
+        Args:
+            source_id (str): The UUID of the source to scrape.
+
+        Returns:
+            Dict[str, Any]: A summary of the scrape execution including status and changes.
+
+        Raises:
+            ValueError: If the source ID cannot be found.
+            AttachedRunFailedError: If the in-flight run this call attached to failed.
+            SourceLeaseTimeoutError: If the in-flight run did not finish in time.
+            Exception: Propagates any errors occurring during the pipeline.
+        """
+        redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        lease = SourceLeaseManager(redis_client)
+        fetch_cache = self.fetch_cache = SharedFetchCache(redis_client)
+        self.search_cache = SearchCache(redis_client)
+        self.http_client.use_session_store(DomainSessionStore(redis_client))
+        try:
+            for _ in range(LEASE_ACQUIRE_ATTEMPTS):
+                try:
+                    token = await lease.acquire(source_id)
+                except RedisError as e:
+                    logger.warning(f"Scrape lease unavailable, running unfenced: {e}")
+                    return await self._run_pipeline(source_id)
+
+                if token is None:
+                    attached_result = await lease.wait_for_result(source_id)
+                    if attached_result is not None:
+                        return {**attached_result, "attached_to_inflight": True}
+                    continue
+
+                async with lease.hold(source_id, token):
+                    try:
+                        result = await self._run_pipeline(source_id, fencing_token=token)
+                    except Exception as e:
+                        await self._publish_lease_result(lease, source_id, token, error=str(e))
+                        raise
+                    await self._publish_lease_result(lease, source_id, token, result=result)
+                    return result
+
+            raise SourceLeaseTimeoutError(f"Could not acquire scrape lease for source {source_id}")
+        finally:
+            if self.fetch_cache is fetch_cache:
+                self.fetch_cache = None
+                self.search_cache = None
+                self.http_client.use_session_store(None)
+            await redis_client.aclose()
+
+    def _observe_fetch(self, error: Optional[Exception]) -> None:
+        if self.fetch_observer is not None:
+            self.fetch_observer(error)
+
+    async def _fetch_source(
+        self, source: Source, auth_creds: Dict[str, Any], deadline: ScrapeDeadline
+    ) -> SpooledDownload:
+        """Fetch a source's URL into a bounded body, through the shared fetch cache
+        when it is anonymous.
+
+        Sources with credentials, or with ``shared_fetch_cache: false`` in their
+        scraping rules, always fetch directly. Only a request that reached the
+        origin is reported to ``fetch_observer``. The caller closes the returned body.
+        """
+        use_cache = (
+            self.fetch_cache is not None
+            and settings.SCRAPE_FETCH_CACHE_ENABLED
+            and not source.auth_details_encrypted
+            and source.scraping_rules.get("shared_fetch_cache", True)
+        )
+        render_profile = RenderProfile.from_rules(source.scraping_rules)
+        max_bytes = resolve_max_download_bytes(source.scraping_rules)
+        if not use_cache:
+            result = await self.http_client.fetch(
+                source.url,
+                auth_creds,
+                timeout=deadline.remaining(),
+                render_profile=render_profile,
+                max_bytes=max_bytes,
+            )
+            self._observe_fetch(None)
+            return result.body
+
+        async def fetcher(etag: Optional[str], last_modified: Optional[str]) -> FetchResult:
+            result = await self.http_client.fetch(
+                source.url,
+                timeout=deadline.remaining(),
+                etag=etag,
+                last_modified=last_modified,
+                render_profile=render_profile,
+                max_bytes=max_bytes,
+            )
+            self._observe_fetch(None)
+            return result
+
+        return await self.fetch_cache.fetch(
+            source.url, fetcher, variant=render_profile.cache_variant
+        )
+
+    async def _extract_incrementally(
+        self,
+        source: Source,
+        last_revision: Optional[DataRevision],
+        stable_lines: List[str],
+        noise_model: NoiseModel,
+        project_prompt: str,
+        jurisdiction_prompt: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Update the previous extraction from the changed sections only.
+
+        Returns None when a full extraction should run instead: there is no usable
+        previous result, incremental mode is disabled for the source, the previous
+        snapshot cannot be read, the edit covers more than
+        ``SCRAPE_INCREMENTAL_MAX_DIFF_RATIO`` of the text, the last
+        ``SCRAPE_INCREMENTAL_FULL_EVERY`` extractions were all incremental, or the
+        incremental call fails.
+        """
+        if (
+            not settings.SCRAPE_INCREMENTAL_ENABLED
+            or not source.scraping_rules.get("incremental_extraction", True)
+            or not last_revision
+            or not (last_revision.extracted_data or {}).get("extracted_data")
+        ):
+            return None
+
+        runs = int(last_revision.extracted_data.get(INCREMENTAL_RUNS_KEY) or 0)
+        if runs + 1 >= settings.SCRAPE_INCREMENTAL_FULL_EVERY:
+            logger.info(f"{runs} incremental extractions in a row. Running a full extraction.")
+            return None
+
+        old_lines = await self.text_extractor.extract_lines_from_minio(
+            "raw-content", last_revision.minio_object_key
+        )
+        if not old_lines:
+            logger.info("Previous snapshot unavailable. Running a full extraction.")
+            return None
+
+        diff = section_diff(noise_model.filter(old_lines), stable_lines)
+        if not diff.text or diff.ratio > settings.SCRAPE_INCREMENTAL_MAX_DIFF_RATIO:
+            logger.info(
+                f"Edit covers {diff.ratio:.0%} of the text in {diff.sections} sections. "
+                "Running a full extraction."
+            )
+            return None
+
+        logger.info(
+            f"Incremental extraction over {diff.sections} changed sections "
+            f"({diff.ratio:.1%} of the text, {len(diff.text)} diff chars)"
+        )
+        try:
+            ai_result = await self.ai_extractor.run_incremental_analysis(
+                previous_result=last_revision.extracted_data,
+                text_diff=diff.text,
+                project_prompt=project_prompt,
+                jurisdiction_prompt=jurisdiction_prompt,
+            )
+        except AIExtractionServiceError as e:
+            logger.warning(f"Incremental extraction failed, running a full extraction: {e}")
+            return None
+
+        ai_result[EXTRACTION_MODE_KEY] = "incremental"
+        ai_result[INCREMENTAL_RUNS_KEY] = runs + 1
+        return ai_result
+
+    async def _publish_lease_result(
+        self,
+        lease: SourceLeaseManager,
+        source_id: str,
+        token: int,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Share a run's outcome with attached callers without failing the run itself."""
+        try:
+            await lease.publish_result(source_id, token, result=result, error=error)
+        except RedisError as e:
+            logger.warning(f"Failed to publish scrape result for source {source_id}: {e}")
+
+    async def _claim_fencing_token(self, source_id, fencing_token: int) -> None:
+        """Record the fencing token on the source, rejecting stale lease holders.
+
+        Runs inside the revision transaction, so the row lock taken here serializes
+        concurrent holders and only the newest token may persist a revision.
+
+        Raises:
+            StaleFencingTokenError: If a newer holder already persisted results.
+        """
+        stmt = (
+            update(Source)
+            .where(Source.id == source_id)
+            .where(
+                or_(
+                    Source.scrape_fence_token.is_(None),
+                    Source.scrape_fence_token <= fencing_token,
+                )
+            )
+            .values(scrape_fence_token=fencing_token)
+        )
+        result = await self.db.execute(stmt)
+        if result.rowcount == 0:
+            raise StaleFencingTokenError(
+                f"Fencing token {fencing_token} for source {source_id} is stale"
+            )
+
+    async def _load_latest_revision(self, source: Source) -> Optional[DataRevision]:
+        """Load the source's newest revision through its latest-revision pointer.
+
+        The pointer columns are loaded with ``source`` and resolve to a
+        primary-key lookup. ``latest_scraped_at`` is the partition key, so the
+        lookup only probes the one monthly partition that holds the revision.
+        Sources without a pointer (never scraped, or scraped before it existed)
+        fall back to the history query.
+
+        Args:
+            source (Source): The source being scraped.
+
+        Returns:
+            Optional[DataRevision]: The newest revision, or None on a first scrape.
+        """
+        pointer = LatestRevision.from_source(source)
+        if pointer is not None and source.latest_scraped_at is not None:
+            pointed = await self.db.execute(
+                select(DataRevision).where(
+                    DataRevision.id == pointer.uuid,
+                    DataRevision.scraped_at == source.latest_scraped_at,
+                    DataRevision.source_id == source.id,
+                )
+            )
+            revision = pointed.scalars().first()
+            if revision is not None:
+                return revision
+
+        rev_query = (
+            select(DataRevision)
+            .where(DataRevision.source_id == source.id)
+            .order_by(desc(DataRevision.scraped_at))
+            .limit(1)
+        )
+        rev_result = await self.db.execute(rev_query)
+        return rev_result.scalars().first()
+
+    async def _run_pipeline(
+        self, source_id: str, fencing_token: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run the scraping pipeline for a given source.
 
         Fetching -> Archiving -> Cleaning -> Hashing -> AI Extraction -> Diffing -> Persistence.
         If a change is detected AND it is not the first run, it triggers a notification.
 
         Args:
             source_id (str): The UUID of the source to scrape.
+            fencing_token (Optional[int]): Lease token checked before persisting.
 
         Returns:
             Dict[str, Any]: A summary of the scrape execution including status and changes.
 
+        Each stage runs under what remains of the source's time budget (see
+        ``resolve_time_budget``) and is cancelled when it runs out.
+
         Raises:
             ValueError: If the source ID cannot be found.
+            ScrapeDeadlineExceeded: If the time budget runs out; names the stage.
+            StaleFencingTokenError: If a newer lease holder already persisted results.
             Exception: Propagates any errors occurring during the pipeline.
         """
         logger.info(f"Starting pipeline for Source ID: {source_id}")
+        deadline = ScrapeDeadline(settings.SCRAPE_TIME_BUDGET_SECONDS)
 
-        query = (
-            select(Source)
-            .where(Source.id == source_id)
-            .options(selectinload(Source.jurisdiction).selectinload(Jurisdiction.project))
-        )
-        result = await self.db.execute(query)
-        source = result.scalars().first()
+        async with deadline.stage("load_source"):
+            query = (
+                select(Source)
+                .where(Source.id == source_id)
+                .options(selectinload(Source.jurisdiction).selectinload(Jurisdiction.project))
+            )
+            result = await self.db.execute(query)
+            source = result.scalars().first()
 
         if not source:
             raise ValueError(f"Source {source_id} not found")
 
+        deadline.reset_budget(resolve_time_budget(source.scraping_rules))
         jurisdiction = source.jurisdiction
         project = jurisdiction.project
 
@@ -88,67 +395,120 @@ class ScraperService:
 
         if source.url.startswith("mock://"):
             mock_html = source.scraping_rules.get("mock_html", "<html></html>")
-            raw_content_bytes = mock_html.encode("utf-8")
+            body = SpooledDownload.from_bytes(mock_html.encode("utf-8"))
             logger.info(f"Using mock HTML for {source.name}")
             content_type = "text/html"
         else:
-            raw_content_bytes = await self.http_client.fetch_content(source.url, auth_creds)
-            content_type = source.scraping_rules.get("expected_type", "text/html").lower()
-
-        is_pdf = self.pdf_service.is_pdf(raw_content_bytes, content_type)
-        if is_pdf:
-            logger.info("PDF detected. Extracting text...")
             try:
-                text_content = self.pdf_service.extract_text(raw_content_bytes)
-                raw_content_bytes = f"<html><body><pre>{text_content}</pre></body></html>".encode(
-                    "utf-8"
-                )
+                async with deadline.stage("fetch"):
+                    body = await self._fetch_source(source, auth_creds, deadline)
             except Exception as e:
-                logger.error(f"PDF extraction failed: {e}")
-                raw_content_bytes = b"<html><body>PDF extraction failed</body></html>"
-
-        timestamp_str = datetime.now(timezone.utc).replace(tzinfo=None).strftime("%Y%m%d_%H%M%S")
-        raw_minio_key = f"raw/{project.id}/{source.id}/{timestamp_str}.html"
-
-        extraction_result = await self.text_extractor.process_pipeline(
-            raw_content=raw_content_bytes,
-            raw_bucket="raw-content",
-            raw_key=raw_minio_key,
-            clean_bucket="clean-content",
-            source_id=source.id,
-        )
+                self._observe_fetch(e)
+                raise
+            content_type = source.scraping_rules.get("expected_type", "text/html").lower()
 
-        clean_text = extraction_result["full_text"]
-        content_hash = hashlib.sha256(clean_text.encode()).hexdigest()
+        with body:
+            raw_sha256 = body.sha256
+            async with deadline.stage("load_revision"):
+                last_revision = await self._load_latest_revision(source)
+            raw_unchanged = last_revision is not None and last_revision.raw_sha256 == raw_sha256
+
+            if raw_unchanged:
+                raw_content_bytes = None
+            elif self.pdf_service.is_pdf(body.head(), content_type):
+                logger.info(f"PDF detected ({body.size} bytes). Extracting text...")
+                async with deadline.stage("pdf_extract"):
+                    try:
+                        extraction = await asyncio.to_thread(
+                            self.pdf_service.extract_pages, body.stream(), str(source.id)
+                        )
+                        logger.info(
+                            f"PDF text ready: {len(extraction.pages)} pages, "
+                            f"{extraction.cached_pages} unchanged since a previous extraction"
+                        )
+                        raw_content_bytes = (
+                            f"<html><body><pre>{html.escape(extraction.text)}</pre></body></html>"
+                        ).encode("utf-8")
+                    except Exception as e:
+                        logger.error(f"PDF extraction failed: {e}")
+                        raw_content_bytes = b"<html><body>PDF extraction failed</body></html>"
+            else:
+                raw_content_bytes = body.read_bytes()
+
+        noise_model = NoiseModel.from_dict(source.noise_model)
+        if raw_unchanged:
+            # Byte-identical to what the latest revision was built from: nothing
+            # to archive, clean or fingerprint again.
+            logger.info(f"Raw body unchanged (sha256: {raw_sha256[:8]}...). Skipping archive.")
+            lines = None
+            content_hash = last_revision.content_hash
+            section_fingerprint = last_revision.section_fingerprint
+            section_changes = SectionChanges()
+        else:
+            timestamp_str = (
+                datetime.now(timezone.utc).replace(tzinfo=None).strftime("%Y%m%d_%H%M%S")
+            )
+            raw_minio_key = f"raw/{project.id}/{source.id}/{timestamp_str}.html"
+
+            async with deadline.stage("archive"):
+                extraction_result = await self.text_extractor.process_pipeline(
+                    raw_content=raw_content_bytes,
+                    raw_bucket="raw-content",
+                    raw_key=raw_minio_key,
+                    clean_bucket="clean-content",
+                    source_id=source.id,
+                )
 
-        rev_query = (
-            select(DataRevision)
-            .where(DataRevision.source_id == source.id)
-            .order_by(desc(DataRevision.scraped_at))
-            .limit(1)
-        )
-        rev_result = await self.db.execute(rev_query)
-        last_revision = rev_result.scalars().first()
+            clean_text = extraction_result["full_text"]
+            lines = extraction_result.get("lines") or clean_text.splitlines()
+            stable_lines = noise_model.filter(lines)
+            hash_text = normalize_text(" ".join(stable_lines))
+            content_hash = hashlib.sha256(hash_text.encode()).hexdigest()
+            section_fingerprint = fingerprint_text(stable_lines)
+            section_changes = compare_fingerprints(
+                last_revision.section_fingerprint if last_revision else None, section_fingerprint
+            )
 
         diff_patch = {}
         was_change_detected = False
         change_result = None
+        changed_sections = [
+            section_fingerprint["sections"][i]["heading"] for i in section_changes.changed
+        ]
 
-        if last_revision and last_revision.content_hash == content_hash:
+        is_heartbeat = bool(last_revision) and last_revision.content_hash == content_hash
+        if is_heartbeat:
             logger.info(f"Content unchanged (hash: {content_hash[:8]}...). Skipping AI.")
             ai_result = last_revision.extracted_data
             diff_patch = {"change_summary": "No material changes detected", "risk_level": "NONE"}
         else:
-            logger.info("Content changed. Running AI Extraction...")
+            logger.info(
+                f"Content changed in {len(section_changes.changed)} of "
+                f"{len(section_fingerprint['sections'])} sections "
+                f"({len(section_changes.removed)} previous sections gone or modified). "
+                "Running AI Extraction..."
+            )
 
             master_prompt = project.master_prompt
             context_prompt = jurisdiction.prompt or ""
 
-            ai_result = await self.ai_extractor.run_llm_analysis(
-                cleaned_text=clean_text,
-                project_prompt=master_prompt,
-                jurisdiction_prompt=context_prompt,
-            )
+            async with deadline.stage("ai_extraction"):
+                ai_result = await self._extract_incrementally(
+                    source,
+                    last_revision,
+                    stable_lines,
+                    noise_model,
+                    project_prompt=master_prompt,
+                    jurisdiction_prompt=context_prompt,
+                )
+                if ai_result is None:
+                    ai_result = await self.ai_extractor.run_llm_analysis(
+                        cleaned_text=clean_text,
+                        project_prompt=master_prompt,
+                        jurisdiction_prompt=context_prompt,
+                    )
+                    ai_result[EXTRACTION_MODE_KEY] = "full"
+                    ai_result[INCREMENTAL_RUNS_KEY] = 0
 
             old_data = (
                 last_revision.extracted_data.get("extracted_data", {}) if last_revision else {}
@@ -157,9 +517,10 @@ class ScraperService:
 
             monitoring_goal = f"{master_prompt}. Context: {context_prompt}"
 
-            change_result = await self.differ.detect_semantic_change(
-                old_data=old_data, new_data=new_data, monitoring_instruction=monitoring_goal
-            )
+            async with deadline.stage("diff"):
+                change_result = await self.differ.detect_semantic_change(
+                    old_data=old_data, new_data=new_data, monitoring_instruction=monitoring_goal
+                )
 
             was_change_detected = change_result.has_changed
             if was_change_detected:
@@ -167,6 +528,7 @@ class ScraperService:
                 diff_patch = {
                     "change_summary": change_result.change_summary,
                     "risk_level": change_result.risk_level,
+                    "changed_sections": changed_sections,
                 }
             else:
                 diff_patch = {
@@ -177,32 +539,67 @@ class ScraperService:
         try:
             is_baseline = not last_revision
 
-            new_revision = DataRevision(
-                source_id=source.id,
-                minio_object_key=extraction_result["raw_key"],
-                content_hash=content_hash,
-                extracted_data=ai_result,
-                ai_summary=ai_result.get("summary"),
-                ai_markdown_summary=ai_result.get("markdown_summary"),
-                ai_confidence_score=ai_result.get("confidence_score"),
-                was_change_detected=was_change_detected,
-                is_baseline=is_baseline,
-                scraped_at=datetime.now(timezone.utc).replace(tzinfo=None),
-            )
-            self.db.add(new_revision)
-            await self.db.flush()
-
-            if was_change_detected and last_revision:
-                new_diff_record = ChangeDiff(
-                    new_revision_id=new_revision.id,
-                    old_revision_id=last_revision.id,
-                    diff_patch=diff_patch,
-                    ai_confidence=ai_result.get("confidence_score", 0.0),
-                )
-                self.db.add(new_diff_record)
-
-            await self.db.commit()
-            await self.db.refresh(new_revision)
+            async with deadline.stage("persist"):
+                if fencing_token is not None:
+                    await self._claim_fencing_token(source.id, fencing_token)
+
+                if lines is not None:
+                    learned = noise_model.observe(lines, material_change=was_change_detected)
+                    if learned:
+                        logger.info(f"Learned volatile lines for source {source.id}: {learned}")
+                    # Overrides saved through the API while this scrape ran must survive.
+                    stored = await self.db.execute(
+                        select(Source.noise_model).where(Source.id == source.id).with_for_update()
+                    )
+                    source.noise_model = noise_model.merge_learned_into(stored.scalar_one_or_none())
+
+                if is_heartbeat:
+                    new_revision = last_revision
+                    new_revision.last_confirmed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+                    new_revision.confirmations = (new_revision.confirmations or 0) + 1
+                    new_revision.raw_sha256 = raw_sha256
+                else:
+                    new_revision = DataRevision(
+                        source_id=source.id,
+                        organization_id=project.org_id,
+                        project_id=project.id,
+                        jurisdiction_id=jurisdiction.id,
+                        minio_object_key=extraction_result["raw_key"],
+                        content_hash=content_hash,
+                        raw_sha256=raw_sha256,
+                        extracted_data=ai_result,
+                        ai_summary=ai_result.get("summary"),
+                        ai_markdown_summary=ai_result.get("markdown_summary"),
+                        ai_confidence_score=ai_result.get("confidence_score"),
+                        was_change_detected=was_change_detected,
+                        is_baseline=is_baseline,
+                        section_fingerprint=section_fingerprint,
+                        scraped_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                    )
+                    self.db.add(new_revision)
+                    await self.db.flush()
+                    LatestRevision.from_revision(new_revision).apply_to(source)
+                    await FactTimelineService(self.db).apply(
+                        source.id,
+                        new_revision.id,
+                        facts_from_result(ai_result),
+                        new_revision.scraped_at,
+                    )
+
+                    if was_change_detected and last_revision:
+                        new_diff_record = ChangeDiff(
+                            new_revision_id=new_revision.id,
+                            old_revision_id=last_revision.id,
+                            diff_patch=diff_patch,
+                            ai_confidence=ai_result.get("confidence_score", 0.0),
+                        )
+                        self.db.add(new_diff_record)
+
+                await self.db.commit()
+                await self.db.refresh(new_revision)
+
+            if self.search_cache is not None and not is_heartbeat:
+                await self.search_cache.bump_generation(project.org_id)
 
             if was_change_detected and last_revision:
                 logger.info(f"Triggering notifications for revision {new_revision.id}")
@@ -215,13 +612,13 @@ class ScraperService:
             # Create automatic ticket
             if was_change_detected and change_result is not None and last_revision:
                 ticket_service = TicketService(self.db)
-            await ticket_service.create_auto_ticket(
-                revision=new_revision,
-                change_result=change_result,
-                source=source,
-                project=project,
-                jurisdiction=jurisdiction,
-            )
+                await ticket_service.create_auto_ticket(
+                    revision=new_revision,
+                    change_result=change_result,
+                    source=source,
+                    project=project,
+                    jurisdiction=jurisdiction,
+                )
 
         except Exception as e:
             await self.db.rollback()
@@ -233,4 +630,6 @@ class ScraperService:
             "change_summary": diff_patch.get("change_summary"),
             "data_revision_id": str(new_revision.id),
             "is_baseline": is_baseline,
+            "is_heartbeat": is_heartbeat,
+            "changed_sections": changed_sections,
         }
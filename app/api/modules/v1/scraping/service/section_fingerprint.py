@@ -0,0 +1,244 @@
+"""Section-level Merkle fingerprints of clean text.
+
+Clean text is split into structural sections: a section starts at a
+heading-like line (or a ``[Page N]`` marker from PDF extraction) and is cut
+into blocks when it grows past ``MAX_SECTION_CHARS``. Each section is hashed
+and the hashes are combined pairwise into a Merkle tree that is stored with
+the ``DataRevision``. Page markers label sections but are left out of their
+hashes, so inserting a page does not change every page after it.
+
+Comparing two revisions then costs O(changed sections): equal roots mean no
+change at all, trees of the same shape are compared by descending only into
+differing subtrees, and trees whose shape changed (sections inserted or
+removed) are aligned on their leaf hashes without looking at the text.
+"""
+
+import difflib
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.api.modules.v1.scraping.service.pdf_service import PAGE_MARKER_RE
+
+FINGERPRINT_VERSION = 2
+MAX_SECTION_CHARS = 4000
+MAX_HEADING_CHARS = 80
+MAX_HEADING_WORDS = 12
+
+_HEADING_RE = re.compile(
+    r"^(?:(?:article|section|chapter|part|schedule|annex|appendix|title)"
+    r"\s+(?:\d|[IVXLC]+\b|[A-Z]\b)|§|"
+    r"(?:\d+(?:\.\d+)*|[IVXLC]+)[.)]?\s+[A-Z])",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class Section:
+    """A heading and the lines under it.
+
+    Attributes:
+        heading (str): The heading line, or ``""`` for text before the first heading.
+        lines (List[str]): The section's lines, heading included.
+    """
+
+    heading: str
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def hash(self) -> str:
+        """Hash of the section's text without page markers, which shift on page insertion."""
+        content = (PAGE_MARKER_RE.sub("", line).strip() for line in self.lines)
+        return _hash("\n".join(line for line in content if line))
+
+
+@dataclass
+class SectionChanges:
+    """Sections that differ between two fingerprints.
+
+    Attributes:
+        changed (List[int]): Indexes of new or modified sections in the new revision.
+        removed (List[int]): Indexes of sections in the old revision that are gone
+            or were modified.
+    """
+
+    changed: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def is_heading(line: str) -> bool:
+    """Return True for short, title-like lines that open a new section."""
+    line = line.strip()
+    if PAGE_MARKER_RE.match(line):
+        return True
+    if not line or len(line) > MAX_HEADING_CHARS or len(line.split()) > MAX_HEADING_WORDS:
+        return False
+    if _HEADING_RE.match(line):
+        return True
+    return line[-1] not in ".,;" and (line.isupper() or line.istitle())
+
+
+def split_sections(lines: Iterable[str]) -> List[Section]:
+    """Split clean text lines into sections.
+
+    Args:
+        lines (Iterable[str]): Clean text, one line per element.
+
+    Returns:
+        List[Section]: Sections in document order.
+    """
+    sections: List[Section] = []
+    current: Optional[Section] = None
+    size = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if current is None or (is_heading(line) and size) or size >= MAX_SECTION_CHARS:
+            heading = line if is_heading(line) else (current.heading if current else "")
+            current = Section(heading=heading)
+            sections.append(current)
+            size = 0
+        current.lines.append(line)
+        size += len(line) + 1
+    return sections
+
+
+def build_tree(leaves: List[str]) -> List[List[str]]:
+    """Build the Merkle tree over leaf hashes.
+
+    An unpaired node is carried up unchanged, so the children of node ``i`` on
+    one level are always nodes ``2i`` and ``2i + 1`` on the level below.
+
+    Returns:
+        List[List[str]]: Levels from the leaves up to the single root.
+    """
+    levels = [list(leaves) or [_hash("")]]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append(
+            [
+                _hash(below[i] + below[i + 1]) if i + 1 < len(below) else below[i]
+                for i in range(0, len(below), 2)
+            ]
+        )
+    return levels
+
+
+def fingerprint_sections(sections: List[Section]) -> Dict[str, Any]:
+    """Return the storable fingerprint of a revision's sections."""
+    tree = build_tree([section.hash for section in sections])
+    return {
+        "version": FINGERPRINT_VERSION,
+        "root": tree[-1][0],
+        "sections": [
+            {"heading": section.heading[:MAX_HEADING_CHARS], "chars": len(section.text)}
+            for section in sections
+        ],
+        "tree": tree,
+    }
+
+
+def fingerprint_text(lines: Iterable[str]) -> Dict[str, Any]:
+    """Split ``lines`` into sections and fingerprint them."""
+    return fingerprint_sections(split_sections(lines))
+
+
+def compare_fingerprints(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> SectionChanges:
+    """Find the sections that differ between two fingerprints.
+
+    Args:
+        old (Optional[Dict[str, Any]]): The previous revision's fingerprint, if any.
+        new (Dict[str, Any]): The current fingerprint.
+
+    Returns:
+        SectionChanges: Every section counts as changed when there is no usable
+        previous fingerprint.
+    """
+    new_leaves = new["tree"][0] if new["sections"] else []
+    if not old or old.get("version") != FINGERPRINT_VERSION:
+        return SectionChanges(changed=list(range(len(new_leaves))))
+    if old["root"] == new["root"]:
+        return SectionChanges()
+
+    old_leaves = old["tree"][0] if old["sections"] else []
+    if len(old_leaves) == len(new_leaves):
+        changed = _descend(old["tree"], new["tree"])
+        return SectionChanges(changed=changed, removed=list(changed))
+
+    changes = SectionChanges()
+    matcher = difflib.SequenceMatcher(a=old_leaves, b=new_leaves, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            changes.removed.extend(range(i1, i2))
+            changes.changed.extend(range(j1, j2))
+    return changes
+
+
+def _descend(old_tree: List[List[str]], new_tree: List[List[str]]) -> List[int]:
+    """Return the differing leaves of two same-shaped trees, visiting only differing nodes."""
+    differing = [0]
+    for level in range(len(new_tree) - 2, -1, -1):
+        differing = [
+            child
+            for node in differing
+            for child in (2 * node, 2 * node + 1)
+            if child < len(new_tree[level]) and old_tree[level][child] != new_tree[level][child]
+        ]
+    return differing
+
+
+@dataclass
+class SectionDiff:
+    """A unified diff restricted to the sections that changed.
+
+    Attributes:
+        text (str): Unified diff of the changed sections, old versus new.
+        ratio (float): Share of the new text, by characters, in changed sections.
+        sections (int): Number of changed sections in the new text.
+    """
+
+    text: str
+    ratio: float
+    sections: int
+
+
+def section_diff(old_lines: Iterable[str], new_lines: Iterable[str]) -> SectionDiff:
+    """Diff two snapshots section by section.
+
+    Only sections whose hashes differ are compared line by line, so the cost and
+    the size of the diff follow the size of the edit.
+
+    Args:
+        old_lines (Iterable[str]): The previous clean text, one line per element.
+        new_lines (Iterable[str]): The current clean text, one line per element.
+
+    Returns:
+        SectionDiff: The diff and how much of the new text it covers.
+    """
+    old_sections = split_sections(old_lines)
+    new_sections = split_sections(new_lines)
+    changes = compare_fingerprints(
+        fingerprint_sections(old_sections), fingerprint_sections(new_sections)
+    )
+
+    old_changed = [line for i in changes.removed for line in old_sections[i].lines]
+    new_changed = [line for i in changes.changed for line in new_sections[i].lines]
+    text = "\n".join(
+        difflib.unified_diff(old_changed, new_changed, "previous", "current", n=2, lineterm="")
+    )
+    total = sum(len(section.text) for section in new_sections) or 1
+    changed = sum(len(new_sections[i].text) for i in changes.changed)
+    return SectionDiff(text=text, ratio=changed / total, sections=len(changes.changed))
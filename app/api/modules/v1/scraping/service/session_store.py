@@ -0,0 +1,165 @@
+"""Per-domain browser session state shared across scrape workers.
+
+Anti-bot clearance cookies and login sessions are expensive to obtain. Both
+fetch tiers persist what they earn here, keyed by host and by the credentials
+used, so the next worker to fetch from that host resumes the session instead of
+solving the challenge or logging in again.
+
+State is stored in Redis, encrypted with the application cipher, in Playwright's
+``storage_state`` shape (``{"cookies": [...], "origins": [...]}``) so both the
+Cloudscraper session and Playwright contexts can load it. The User-Agent the
+session was earned with is saved next to it under ``"user_agent"``: clearance
+cookies such as Cloudflare's ``cf_clearance`` are bound to it, so whoever
+resumes the session must send the same one.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.core.config import settings
+from app.api.core.security import decrypt_auth_details, encrypt_auth_details
+from app.api.modules.v1.scraping.service.host_limiter import host_for
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY = "scraping:session:{host}:{context}"
+ANONYMOUS = "anonymous"
+USER_AGENT = "user_agent"
+
+
+def session_context(creds: Optional[Dict[str, Any]]) -> str:
+    """Identify the credentials a session was earned with.
+
+    Sessions obtained with different credentials are never shared, so one
+    organization's login cannot leak into another's scrapes.
+
+    Args:
+        creds (Optional[Dict[str, Any]]): Decrypted source credentials.
+
+    Returns:
+        str: ``"anonymous"`` or a digest of the credentials.
+    """
+    if not creds:
+        return ANONYMOUS
+    material = json.dumps(creds, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def cookies_from_jar(jar: Iterable[Any], host: str) -> List[Dict[str, Any]]:
+    """Convert ``requests`` cookies that apply to ``host`` into Playwright cookie dicts."""
+    cookies = []
+    for cookie in jar:
+        domain = (cookie.domain or host).lower()
+        bare = domain.lstrip(".")
+        if host != bare and not host.endswith(f".{bare}"):
+            continue
+        cookies.append(
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": domain,
+                "path": cookie.path or "/",
+                "expires": float(cookie.expires) if cookie.expires else -1,
+                "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
+                "secure": bool(cookie.secure),
+            }
+        )
+    return cookies
+
+
+def load_cookies_into_jar(jar: Any, cookies: Iterable[Dict[str, Any]]) -> None:
+    """Set Playwright cookie dicts on a ``requests`` cookie jar."""
+    for cookie in cookies:
+        expires = cookie.get("expires", -1)
+        jar.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+            secure=cookie.get("secure", False),
+            expires=int(expires) if expires and expires > 0 else None,
+            rest={"HttpOnly": None} if cookie.get("httpOnly") else {},
+        )
+
+
+class DomainSessionStore:
+    """Encrypted per-host session state in Redis.
+
+    Redis and decryption failures never block a scrape: the store behaves as if
+    no session was saved.
+
+    Examples:
+        >>> store = DomainSessionStore(redis_client)
+        >>> state = await store.load(url, session_context(creds))
+        >>> ...
+        >>> await store.save(url, new_state, session_context(creds))
+    """
+
+    def __init__(self, redis_client: Redis, ttl_seconds: Optional[int] = None, clock=time.time):
+        """Initialize the store.
+
+        Args:
+            redis_client (Redis): Async Redis client with ``decode_responses=True``.
+            ttl_seconds (Optional[int]): How long a saved session is reused.
+                Defaults to ``SCRAPE_SESSION_TTL_SECONDS``.
+            clock: Wall clock returning epoch seconds, injectable for tests.
+        """
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds or settings.SCRAPE_SESSION_TTL_SECONDS
+        self._clock = clock
+
+    async def load(self, url: str, context: str = ANONYMOUS) -> Optional[Dict[str, Any]]:
+        """Return the saved storage state for the URL's host, without expired cookies.
+
+        Args:
+            url (str): Any URL on the host.
+            context (str): The credentials context from ``session_context``.
+
+        Returns:
+            Optional[Dict[str, Any]]: A Playwright ``storage_state`` dict, plus
+            ``"user_agent"`` when one was saved, or None.
+        """
+        key = SESSION_KEY.format(host=host_for(url), context=context)
+        try:
+            token = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Could not load session state for {host_for(url)}: {e}")
+            return None
+        state = decrypt_auth_details(token) if token else {}
+        if not state:
+            return None
+
+        now = self._clock()
+        state["cookies"] = [
+            cookie
+            for cookie in state.get("cookies", [])
+            if cookie.get("expires", -1) <= 0 or cookie["expires"] > now
+        ]
+        state.setdefault("origins", [])
+        return state
+
+    async def save(self, url: str, state: Dict[str, Any], context: str = ANONYMOUS) -> None:
+        """Save storage state for the URL's host, replacing any previous state.
+
+        Encryption and Redis failures are logged; saving never fails a scrape.
+
+        Args:
+            url (str): Any URL on the host.
+            state (Dict[str, Any]): A Playwright ``storage_state`` dict, with the
+                ``"user_agent"`` the session was earned with.
+            context (str): The credentials context from ``session_context``.
+        """
+        if not state.get("cookies") and not state.get("origins"):
+            return
+        key = SESSION_KEY.format(host=host_for(url), context=context)
+        try:
+            token = encrypt_auth_details(state)
+            await self.redis.set(key, token, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Could not save session state for {host_for(url)}: {e}")
@@ -0,0 +1,246 @@
+"""Per-source distributed lease for the scraping pipeline.
+
+Manual triggers, scheduled ``scrape_source`` tasks and Celery retries can all
+target the same source at once. The lease guarantees that only one of them runs
+the pipeline; the others attach to the in-flight run and receive its result.
+
+Every acquisition draws a monotonically increasing fencing token. The pipeline
+persists that token on the ``Source`` row in the same transaction as its
+``DataRevision`` insert, so a holder whose lease silently expired can never
+overwrite the work of a newer holder.
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "scraping:lease:{source_id}"
+FENCE_KEY = "scraping:lease_fence:{source_id}"
+RESULT_KEY = "scraping:lease_result:{source_id}:{token}"
+
+# Draw a fencing token and try to take the lease in one step. On failure the
+# current holder's token is returned, so a caller can attach to exactly the run
+# that blocked it even if that run releases before the caller starts waiting.
+_ACQUIRE_SCRIPT = """
+local token = redis.call('INCR', KEYS[2])
+if redis.call('SET', KEYS[1], token, 'NX', 'PX', ARGV[1]) then
+    return {1, token}
+end
+return {0, tonumber(redis.call('GET', KEYS[1]))}
+"""
+
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SourceLeaseTimeoutError(Exception):
+    """Raised when waiting on another holder's run exceeds the wait timeout."""
+
+    pass
+
+
+class AttachedRunFailedError(Exception):
+    """Raised when the in-flight run this caller attached to failed."""
+
+    pass
+
+
+class StaleFencingTokenError(Exception):
+    """Raised when a newer lease holder has already persisted results for the source."""
+
+    pass
+
+
+class SourceLeaseManager:
+    """Acquire, renew and release per-source leases stored in Redis.
+
+    Examples:
+        >>> manager = SourceLeaseManager(redis_client)
+        >>> token = await manager.acquire(source_id)
+        >>> if token is None:
+        ...     result = await manager.wait_for_result(source_id)
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl_seconds: Optional[int] = None,
+        wait_timeout: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ):
+        """Initialize the lease manager.
+
+        Args:
+            redis_client (Redis): Async Redis client with ``decode_responses=True``.
+            ttl_seconds (Optional[int]): Lease TTL. Defaults to ``SCRAPE_LEASE_TTL_SECONDS``.
+            wait_timeout (Optional[int]): Maximum seconds to wait on another holder.
+                Defaults to ``SCRAPE_LEASE_WAIT_TIMEOUT``.
+            poll_interval (float): Seconds between result polls while attached.
+        """
+        self.redis = redis_client
+        self.ttl_ms = int((ttl_seconds or settings.SCRAPE_LEASE_TTL_SECONDS) * 1000)
+        self.wait_timeout = wait_timeout or settings.SCRAPE_LEASE_WAIT_TIMEOUT
+        self.poll_interval = poll_interval
+        self._blocked_by: Dict[str, int] = {}
+
+    async def acquire(self, source_id: str) -> Optional[int]:
+        """Try to take the lease for a source.
+
+        Args:
+            source_id (str): The source UUID.
+
+        Returns:
+            Optional[int]: The fencing token if acquired, otherwise None.
+        """
+        acquired, token = await self.redis.eval(
+            _ACQUIRE_SCRIPT,
+            2,
+            LEASE_KEY.format(source_id=source_id),
+            FENCE_KEY.format(source_id=source_id),
+            self.ttl_ms,
+        )
+        if acquired:
+            self._blocked_by.pop(source_id, None)
+            logger.info(f"Acquired scrape lease for source {source_id} (token {token})")
+            return int(token)
+        if token is not None:
+            self._blocked_by[source_id] = int(token)
+        return None
+
+    async def current_token(self, source_id: str) -> Optional[int]:
+        """Return the fencing token of the current holder, if any."""
+        value = await self.redis.get(LEASE_KEY.format(source_id=source_id))
+        return int(value) if value else None
+
+    async def renew(self, source_id: str, token: int) -> bool:
+        """Extend the lease if it is still held with ``token``."""
+        renewed = await self.redis.eval(
+            _RENEW_SCRIPT, 1, LEASE_KEY.format(source_id=source_id), str(token), self.ttl_ms
+        )
+        return bool(renewed)
+
+    async def release(self, source_id: str, token: int) -> None:
+        """Release the lease if it is still held with ``token``."""
+        await self.redis.eval(_RELEASE_SCRIPT, 1, LEASE_KEY.format(source_id=source_id), str(token))
+
+    async def publish_result(
+        self,
+        source_id: str,
+        token: int,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Store the outcome of a run for callers attached to it.
+
+        Args:
+            source_id (str): The source UUID.
+            token (int): The fencing token of the run.
+            result (Optional[Dict[str, Any]]): The pipeline result on success.
+            error (Optional[str]): The error message on failure.
+        """
+        payload = {"status": "failed", "error": error} if error else {"result": result}
+        await self.redis.set(
+            RESULT_KEY.format(source_id=source_id, token=token),
+            json.dumps(payload, default=str),
+            ex=settings.SCRAPE_LEASE_RESULT_TTL,
+        )
+
+    async def wait_for_result(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """Wait for the current holder's run to finish and return its result.
+
+        The run waited on is the one that blocked this manager's last failed
+        ``acquire``, so a result published just before the holder released is
+        still picked up. Without a failed acquire the current holder is used.
+
+        Args:
+            source_id (str): The source UUID.
+
+        Returns:
+            Optional[Dict[str, Any]]: The holder's result, or None if the holder
+            vanished without publishing one (the caller should retry acquiring).
+
+        Raises:
+            AttachedRunFailedError: If the holder's run failed.
+            SourceLeaseTimeoutError: If the run does not finish within the wait timeout.
+        """
+        token = self._blocked_by.pop(source_id, None) or await self.current_token(source_id)
+        if token is None:
+            return None
+
+        logger.info(f"Source {source_id} is already being scraped (token {token}). Attaching.")
+        result_key = RESULT_KEY.format(source_id=source_id, token=token)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+
+        while loop.time() < deadline:
+            raw = await self.redis.get(result_key)
+            if raw:
+                payload = json.loads(raw)
+                if payload.get("status") == "failed":
+                    raise AttachedRunFailedError(
+                        f"Attached scrape run for source {source_id} failed: {payload['error']}"
+                    )
+                return payload.get("result")
+
+            if await self.current_token(source_id) != token:
+                raw = await self.redis.get(result_key)
+                return json.loads(raw).get("result") if raw else None
+
+            await asyncio.sleep(self.poll_interval)
+
+        raise SourceLeaseTimeoutError(
+            f"Timed out after {self.wait_timeout}s waiting on scrape of source {source_id}"
+        )
+
+    @asynccontextmanager
+    async def hold(self, source_id: str, token: int) -> AsyncIterator[None]:
+        """Keep the lease alive while the body runs, then release it.
+
+        The lease is renewed every third of its TTL. Losing it is logged; the
+        fencing token check at persistence time decides whether the run may commit.
+
+        Args:
+            source_id (str): The source UUID.
+            token (int): The fencing token returned by ``acquire``.
+        """
+
+        async def _keepalive() -> None:
+            interval = self.ttl_ms / 3000
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    if not await self.renew(source_id, token):
+                        logger.warning(f"Lost scrape lease for source {source_id} (token {token})")
+                        return
+                except RedisError as e:
+                    logger.warning(f"Failed to renew scrape lease for source {source_id}: {e}")
+
+        keepalive = asyncio.create_task(_keepalive())
+        try:
+            yield
+        finally:
+            keepalive.cancel()
+            try:
+                await self.release(source_id, token)
+            except RedisError as e:
+                logger.warning(f"Failed to release scrape lease for source {source_id}: {e}")
@@ -22,10 +22,12 @@ from app.api.modules.v1.projects.models.project_model import Project
 from app.api.modules.v1.scraping.models.data_revision import DataRevision
 from app.api.modules.v1.scraping.models.source_model import Source
 from app.api.modules.v1.scraping.schemas.source_service import (
+    NoiseModelUpdate,
     SourceCreate,
     SourceRead,
     SourceUpdate,
 )
+from app.api.modules.v1.scraping.service.noise_model import NoiseModel
 
 logger = logging.getLogger("app")
 
@@ -476,6 +478,71 @@ class SourceService:
         logger.info(f"Retrieved {len(revisions)} revisions for source {source_id} (total: {total})")
         return revisions, total
 
+    async def get_noise_model(self, db: AsyncSession, source_id: uuid.UUID) -> Dict[str, Any]:
+        """
+        Describe the volatile lines learned for a source, with user overrides.
+
+        Args:
+            db (AsyncSession): Database session.
+            source_id (uuid.UUID): The source UUID.
+
+        Returns:
+            Dict[str, Any]: Learned templates, pinned patterns and kept templates.
+
+        Raises:
+            HTTPException: 404 if source not found.
+        """
+        source = await db.get(Source, source_id)
+        if not source:
+            logger.warning(f"Cannot fetch noise model - source not found: {source_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Source not found",
+            )
+        return NoiseModel.from_dict(source.noise_model).summary()
+
+    async def update_noise_model(
+        self,
+        db: AsyncSession,
+        source_id: uuid.UUID,
+        overrides: NoiseModelUpdate,
+    ) -> Dict[str, Any]:
+        """
+        Override the volatile lines learned for a source.
+
+        Args:
+            db (AsyncSession): Database session.
+            source_id (uuid.UUID): The source UUID.
+            overrides (NoiseModelUpdate): Patterns to pin, templates to keep, or a reset.
+
+        Returns:
+            Dict[str, Any]: The updated model summary.
+
+        Raises:
+            HTTPException: 404 if source not found.
+        """
+        source = await db.get(Source, source_id, with_for_update=True)
+        if not source:
+            logger.warning(f"Cannot update noise model - source not found: {source_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Source not found",
+            )
+
+        model = NoiseModel.from_dict(source.noise_model)
+        if overrides.reset_learned:
+            model.reset_learned()
+        if overrides.pinned_patterns is not None:
+            model.pinned_patterns = overrides.pinned_patterns
+        if overrides.kept_templates is not None:
+            model.kept_templates = overrides.kept_templates
+
+        source.noise_model = model.to_dict()
+        await db.commit()
+
+        logger.info(f"Updated noise model overrides for source: {source_id}")
+        return model.summary()
+
     def _to_read_schema(self, source: Source) -> SourceRead:
         """
         Convert a Source model to SourceRead schema.
@@ -499,6 +566,11 @@ class SourceService:
             is_deleted=source.is_deleted,
             has_auth=bool(source.auth_details_encrypted),
             created_at=source.created_at,
+            last_scraped_at=source.last_scraped_at,
+            latest_revision_id=source.latest_revision_id,
+            latest_content_hash=source.latest_content_hash,
+            latest_scraped_at=source.latest_scraped_at,
+            latest_change_detected=source.latest_change_detected,
         )
 
     async def _ensure_prompt_requirements(
@@ -6,19 +6,47 @@ with retry logic and circuit breaking.
 """
 
 import asyncio
-import json
 import random
+import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 import nest_asyncio
 import redis
 from celery import shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
+from sqlalchemy import func
 from sqlmodel import select, update
 
 from app.api.core.config import settings
 from app.api.db.database import AsyncSessionLocal
+from app.api.modules.v1.billing.models.billing_account import BillingAccount
+from app.api.modules.v1.billing.models.billing_plan import BillingPlan
+from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
+from app.api.modules.v1.projects.models.project_model import Project
 from app.api.modules.v1.scraping.models.source_model import ScrapeFrequency, Source
+from app.api.modules.v1.scraping.service.change_feed import (
+    ChangeFeedProber,
+    record_feed_signature,
+)
+from app.api.modules.v1.scraping.service.circuit_breaker import HostCircuitBreaker
+from app.api.modules.v1.scraping.service.cloudscrapper_service import SourceFetchError
+from app.api.modules.v1.scraping.service.dead_letter import DeadLetterQueue
+from app.api.modules.v1.scraping.service.deadline import ScrapeDeadlineExceeded
+from app.api.modules.v1.scraping.service.fair_queue import (
+    DRR_DEFICIT_KEY,
+    DeficitRoundRobinScheduler,
+    PriorityClass,
+    parse_plan_weights,
+    priority_class_for,
+    queue_for,
+    record_queue_latency,
+    tenant_weight,
+)
+from app.api.modules.v1.scraping.service.host_limiter import host_for
+from app.api.modules.v1.scraping.service.pdf_service import shutdown_pdf_pool, start_pdf_pool
+from app.api.modules.v1.scraping.service.revision_partitions import RevisionPartitionManager
 
 # Apply nest_asyncio to allow asyncio.run() inside Celery tasks
 nest_asyncio.apply()
@@ -28,7 +56,21 @@ logger = get_task_logger(__name__)
 redis_pool = redis.ConnectionPool.from_url(settings.REDIS_URL, decode_responses=True)
 
 DISPATCH_LOCK_KEY = "celery:dispatch_due_sources_lock"
-CELERY_DLQ_KEY = "celery:scraping_dlq"
+
+
+@worker_process_init.connect
+def start_worker_pdf_pool(**kwargs):
+    """Start the prefork child's PDF extraction pool before it takes tasks.
+
+    Workers with other pool types start it on their first large PDF.
+    """
+    start_pdf_pool()
+
+
+@worker_process_shutdown.connect
+def stop_worker_pdf_pool(**kwargs):
+    """Stop the PDF extraction pool with the prefork child."""
+    shutdown_pdf_pool()
 
 
 def get_next_scrape_time(current_time: datetime, frequency: ScrapeFrequency) -> datetime:
@@ -51,12 +93,15 @@ def get_next_scrape_time(current_time: datetime, frequency: ScrapeFrequency) ->
     return current_time + delta
 
 
-async def _handle_scrape_failure_async(source_id: str, error_msg: str):
+async def _handle_scrape_failure_async(source_id: str, error_msg: str) -> str | None:
     """Updates the source schedule on failure to prevent infinite retry loops.
 
     Args:
         source_id (str): The UUID of the source that failed.
         error_msg (str): The error message to persist.
+
+    Returns:
+        str | None: The source URL, used to group the dead-letter entry by host.
     """
     async with AsyncSessionLocal() as db:
         backoff_time = datetime.now(timezone.utc) + timedelta(hours=6)
@@ -67,16 +112,50 @@ async def _handle_scrape_failure_async(source_id: str, error_msg: str):
             update(Source)
             .where(Source.id == source_id)
             .values(next_scrape_time=backoff_time, last_error=error_msg)
+            .returning(Source.url)
         )
-        await db.exec(stmt)
+        result = await db.exec(stmt)
+        url = result.scalar_one_or_none()
         await db.commit()
+        return url
+
+
+def _is_host_failure(exc: Exception) -> bool:
+    """Return True if a scrape failed because its host could not be fetched.
+
+    Only fetch-tier failures count towards the host's circuit breaker; LLM,
+    storage and database errors say nothing about the host's health.
+    """
+    if isinstance(exc, SourceFetchError):
+        return True
+    return isinstance(exc, ScrapeDeadlineExceeded) and exc.stage == "fetch"
+
+
+def _breaker_fetch_observer(
+    breaker: HostCircuitBreaker, host: str
+) -> Callable[[Exception | None], None]:
+    """Return a ``ScraperService.fetch_observer`` that feeds the host's breaker.
+
+    Outcomes are recorded when the fetch stage ends, so a half-open probe whose
+    fetch succeeded closes the breaker even if a later stage fails.
+    """
+
+    def observe(error: Exception | None) -> None:
+        if error is None:
+            breaker.record_success(host)
+        elif _is_host_failure(error):
+            breaker.record_failure(host)
 
+    return observe
 
-async def _scrape_source_async(source_id: str) -> str:
+
+async def _scrape_source_async(source_id: str, feed_signature: str | None = None) -> str:
     """Async logic to initialize the service and execute the scrape pipeline.
 
     Args:
         source_id (str): The UUID of the target source.
+        feed_signature (str | None): Change feed signature the source was dispatched
+            for, recorded as seen only once the scrape succeeded.
 
     Returns:
         str: A status message describing the outcome.
@@ -97,8 +176,23 @@ async def _scrape_source_async(source_id: str) -> str:
             logger.warning(f"Source {source_id} not found.")
             return f"Source {source_id} not found."
 
+        host = host_for(source.url)
+        breaker = HostCircuitBreaker(redis.Redis(connection_pool=redis_pool))
+        decision = breaker.allow(host)
+        if not decision.allowed:
+            source.next_scrape_time = decision.retry_at
+            db.add(source)
+            await db.commit()
+            msg = (
+                f"Deferred: circuit {decision.state.value} for host {host}. "
+                f"Source {source.id} rescheduled to {decision.retry_at}"
+            )
+            logger.info(msg)
+            return msg
+
         try:
             scraper_service = ScraperService(db)
+            scraper_service.fetch_observer = _breaker_fetch_observer(breaker, host)
             scrape_result = await scraper_service.execute_scrape_job(str(source.id))
 
             new_next_scrape_time = get_next_scrape_time(
@@ -111,6 +205,10 @@ async def _scrape_source_async(source_id: str) -> str:
             db.add(source)
             await db.commit()
             await db.refresh(source)
+            if feed_signature:
+                record_feed_signature(
+                    redis.Redis(connection_pool=redis_pool), source.id, feed_signature
+                )
 
             change_status = "with changes" if scrape_result.get("change_detected") else "no changes"
             msg = (
@@ -130,8 +228,37 @@ async def _scrape_source_async(source_id: str) -> str:
             raise
 
 
+def _record_dispatch_latency(
+    redis_client: redis.Redis, organization_id: str, queue: str, due_at: str
+) -> None:
+    """Record how long a source waited between becoming due and starting.
+
+    Metrics are best effort: Redis failures are logged and never fail the scrape.
+
+    Args:
+        redis_client (redis.Redis): Synchronous Redis client.
+        organization_id (str): The tenant owning the source.
+        queue (str): The queue the task was routed to.
+        due_at (str): ISO timestamp at which the source became due.
+    """
+    try:
+        due_time = datetime.fromisoformat(due_at)
+        if due_time.tzinfo is None:
+            due_time = due_time.replace(tzinfo=timezone.utc)
+        lag_seconds = (datetime.now(timezone.utc) - due_time).total_seconds()
+        record_queue_latency(redis_client, organization_id, queue, lag_seconds)
+    except (ValueError, redis.RedisError) as e:
+        logger.warning(f"Could not record queue latency for org {organization_id}: {e}")
+
+
 @shared_task(bind=True, max_retries=settings.SCRAPE_MAX_RETRIES)
-def scrape_source(self, source_id: str):
+def scrape_source(
+    self,
+    source_id: str,
+    organization_id: str | None = None,
+    due_at: str | None = None,
+    feed_signature: str | None = None,
+):
     """Celery worker task to scrape a single source.
 
     Executes the async scraping logic synchronously. Handles exponential backoff
@@ -139,12 +266,22 @@ def scrape_source(self, source_id: str):
 
     Args:
         source_id (str): The UUID of the source.
+        organization_id (str | None): Owning tenant, used for queue latency reporting.
+        due_at (str | None): ISO timestamp at which the source became due.
+        feed_signature (str | None): Changed change-feed signature that triggered
+            this scrape; recorded once the scrape succeeds.
 
     Returns:
         str: Success or Failure message.
     """
+    if organization_id and due_at and self.request.retries == 0:
+        queue = (self.request.delivery_info or {}).get("routing_key") or "unknown"
+        _record_dispatch_latency(
+            redis.Redis(connection_pool=redis_pool), organization_id, queue, due_at
+        )
+
     try:
-        return asyncio.run(_scrape_source_async(source_id))
+        return asyncio.run(_scrape_source_async(source_id, feed_signature))
     except Exception as exc:
         redis_client = redis.Redis(connection_pool=redis_pool)
 
@@ -158,29 +295,90 @@ def scrape_source(self, source_id: str):
             raise self.retry(exc=exc, countdown=countdown)
         else:
             error_msg = str(exc)
-            dlq_entry = {
-                "task_id": self.request.id,
-                "source_id": source_id,
-                "error_message": error_msg,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "args": self.request.args,
-                "kwargs": self.request.kwargs,
-            }
-            redis_client.lpush(CELERY_DLQ_KEY, json.dumps(dlq_entry))
-
+            url = None
             try:
-                asyncio.run(_handle_scrape_failure_async(source_id, error_msg))
+                url = asyncio.run(_handle_scrape_failure_async(source_id, error_msg))
             except Exception as db_exc:
                 logger.error(f"CRITICAL: Failed to update schedule after failure: {db_exc}")
 
+            DeadLetterQueue(redis_client).add(
+                source_id=source_id,
+                url=url,
+                error_class=type(exc).__name__,
+                error_message=error_msg,
+                task_id=self.request.id,
+            )
+
             return f"Failed: Source {source_id} moved to DLQ."
 
 
-async def _dispatch_due_sources_async(app) -> int:
-    """Async logic to query due sources and dispatch tasks.
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def run_manual_scrape_job(self, job_id: str, source_id: str):
+    """Celery worker task to run a manually triggered scrape job.
+
+    Routed to the manual queue by ``ScrapeJobService.queue_scrape_job`` so that
+    the pipeline runs on the worker fleet instead of the API process. Late acks
+    return the job to the queue if a worker dies mid-run.
+
+    Args:
+        job_id (str): The UUID of the ScrapeJob to update.
+        source_id (str): The UUID of the source to scrape.
+
+    Returns:
+        str: Summary of the run.
+    """
+    from app.api.modules.v1.scraping.service.scrape_job_service import ScrapeJobService
+
+    asyncio.run(
+        ScrapeJobService.execute_scrape_job_background(uuid.UUID(job_id), uuid.UUID(source_id))
+    )
+    return f"Manual scrape job {job_id} finished."
+
+
+def _queue_depth(redis_client: redis.Redis, queue: str) -> int:
+    """Return the number of messages waiting in a Redis-backed Celery queue."""
+    try:
+        return int(redis_client.llen(queue) or 0)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read depth of queue {queue}: {e}")
+        return 0
+
+
+def _load_deficits(redis_client: redis.Redis, queue: str) -> dict[str, float]:
+    """Load carried-over DRR credit for a queue."""
+    raw = redis_client.hgetall(DRR_DEFICIT_KEY.format(queue=queue)) or {}
+    deficits = {}
+    for tenant_id, value in raw.items():
+        try:
+            deficits[tenant_id] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return deficits
+
+
+def _save_deficits(redis_client: redis.Redis, queue: str, deficits: dict[str, float]) -> None:
+    """Persist DRR credit for a queue, replacing the previous snapshot."""
+    key = DRR_DEFICIT_KEY.format(queue=queue)
+    pipe = redis_client.pipeline()
+    pipe.delete(key)
+    if deficits:
+        pipe.hset(key, mapping={tenant_id: value for tenant_id, value in deficits.items()})
+    pipe.execute()
+
+
+async def _dispatch_due_sources_async(app, redis_client: redis.Redis) -> int:
+    """Async logic to query due sources and dispatch them fairly across tenants.
+
+    Each priority class (HOURLY, DAILY) has its own Celery queue. A queue only
+    accepts new work up to ``SCRAPE_QUEUE_MAX_BACKLOG`` messages, and the free
+    slots are shared between organizations with weighted deficit round-robin.
+    Sources that do not fit stay due and are reconsidered on the next tick.
+    Sources watching a change feed are only dispatched when their feed entry
+    changed or their safety scrape is due; the others move to their next slot.
 
     Args:
         app: The Celery application instance.
+        redis_client (redis.Redis): Redis client used for queue depth and DRR state.
 
     Returns:
         int: Total number of sources dispatched.
@@ -188,36 +386,113 @@ async def _dispatch_due_sources_async(app) -> int:
     async with AsyncSessionLocal() as db:
         now = datetime.now(timezone.utc)
         total_dispatched = 0
-        batch_size = settings.SCRAPE_BATCH_SIZE
-
-        while True:
-            query = (
-                select(Source)
-                .where((Source.next_scrape_time <= now) | (Source.next_scrape_time.is_(None)))
-                .order_by(Source.next_scrape_time, Source.id)
-                .limit(batch_size)
+
+        budgets = {
+            priority_class: max(
+                0,
+                settings.SCRAPE_QUEUE_MAX_BACKLOG
+                - _queue_depth(redis_client, queue_for(priority_class)),
             )
-            result = await db.execute(query)
-            due_sources = result.scalars().all()
+            for priority_class in (PriorityClass.HOURLY, PriorityClass.DAILY)
+        }
+        per_tenant_cap = min(max(budgets.values()), settings.SCRAPE_BATCH_SIZE)
+        if per_tenant_cap == 0:
+            logger.info("All scrape queues are at their backlog limit. Skipping dispatch.")
+            return 0
+
+        ranked = (
+            select(
+                Source.id.label("source_id"),
+                Project.org_id.label("organization_id"),
+                func.row_number()
+                .over(
+                    partition_by=(Project.org_id, Source.scrape_frequency),
+                    order_by=(Source.next_scrape_time, Source.id),
+                )
+                .label("tenant_rank"),
+            )
+            .join(Jurisdiction, Source.jurisdiction_id == Jurisdiction.id)
+            .join(Project, Jurisdiction.project_id == Project.id)
+            .where((Source.next_scrape_time <= now) | (Source.next_scrape_time.is_(None)))
+            .subquery()
+        )
+        query = (
+            select(Source, ranked.c.organization_id)
+            .join(ranked, ranked.c.source_id == Source.id)
+            .where(ranked.c.tenant_rank <= per_tenant_cap)
+            .order_by(Source.next_scrape_time, Source.id)
+        )
+        result = await db.execute(query)
+        candidates = result.all()
+
+        feed_prober = ChangeFeedProber(redis_client)
+        unchanged = await feed_prober.probe([src for src, _ in candidates], now)
+        if unchanged:
+            for src, _ in candidates:
+                if src.id in unchanged:
+                    src.next_scrape_time = get_next_scrape_time(now, src.scrape_frequency)
+                    db.add(src)
+            await db.commit()
+            candidates = [(src, org_id) for src, org_id in candidates if src.id not in unchanged]
 
-            if not due_sources:
-                break
+        if not candidates:
+            return 0
 
-            for src in due_sources:
-                in_progress_time = get_next_scrape_time(now, src.scrape_frequency)
-                src.next_scrape_time = in_progress_time
+        org_ids = {organization_id for _, organization_id in candidates}
+        plan_query = (
+            select(BillingAccount.organization_id, BillingPlan.tier)
+            .join(BillingPlan, BillingPlan.stripe_price_id == BillingAccount.current_price_id)
+            .where(BillingAccount.organization_id.in_(org_ids))
+        )
+        plan_result = await db.execute(plan_query)
+        plan_tiers = {str(org_id): tier for org_id, tier in plan_result.all()}
+        weights = parse_plan_weights(settings.SCRAPE_PLAN_WEIGHTS)
 
-                db.add(src)
-            await db.commit()
-            for src in due_sources:
-                app.send_task(
-                    "app.api.modules.v1.scraping.service.tasks.scrape_source",
-                    args=[str(src.id)],
-                )
+        schedulers = {
+            priority_class: DeficitRoundRobinScheduler(
+                deficits=_load_deficits(redis_client, queue_for(priority_class))
+            )
+            for priority_class in budgets
+        }
+        for src, organization_id in candidates:
+            tenant_id = str(organization_id)
+            schedulers[priority_class_for(src.scrape_frequency)].enqueue(
+                tenant_id, src, weight=tenant_weight(plan_tiers.get(tenant_id), weights)
+            )
 
-                total_dispatched += 1
+        dispatch_plan = []
+        for priority_class, scheduler in schedulers.items():
+            selected = scheduler.select(budgets[priority_class])
+            _save_deficits(redis_client, queue_for(priority_class), scheduler.deficits)
+            dispatch_plan.extend((priority_class, tenant_id, src) for tenant_id, src in selected)
+
+        due_times = {}
+        for _, _, src in dispatch_plan:
+            due_times[src.id] = src.next_scrape_time or now
+            src.next_scrape_time = get_next_scrape_time(now, src.scrape_frequency)
+            db.add(src)
+        await db.commit()
 
-            logger.info(f"Dispatched batch of {len(due_sources)} sources.")
+        per_tenant: dict[str, int] = {}
+        for priority_class, tenant_id, src in dispatch_plan:
+            app.send_task(
+                "app.api.modules.v1.scraping.service.tasks.scrape_source",
+                args=[str(src.id)],
+                kwargs={
+                    "organization_id": tenant_id,
+                    "due_at": due_times[src.id].isoformat(),
+                    "feed_signature": feed_prober.pending_signature(src.id),
+                },
+                queue=queue_for(priority_class),
+            )
+            per_tenant[tenant_id] = per_tenant.get(tenant_id, 0) + 1
+            total_dispatched += 1
+
+        deferred = len(candidates) - total_dispatched
+        logger.info(
+            f"Dispatched {total_dispatched} sources across {len(per_tenant)} organizations "
+            f"({deferred} deferred to the next tick). Per-tenant: {per_tenant}"
+        )
 
         return total_dispatched
 
@@ -241,9 +516,46 @@ def dispatch_due_sources(self):
         if not lock_acquired:
             return "Skipped: Dispatch task locked."
 
-        total_dispatched = asyncio.run(_dispatch_due_sources_async(self.app))
+        total_dispatched = asyncio.run(_dispatch_due_sources_async(self.app, redis_client))
         return f"Dispatched {total_dispatched} sources."
 
     except redis.RedisError as e:
         logger.error(f"Redis error: {e}", exc_info=True)
         return "Aborted: Redis failure."
+
+
+async def _maintain_revision_partitions_async() -> str:
+    """Create upcoming revision partitions and archive expired ones.
+
+    Returns:
+        str: Summary of the maintenance run.
+    """
+    now = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        manager = RevisionPartitionManager(db)
+        if not await manager.is_partitioned():
+            return "Skipped: data_revisions is not partitioned."
+
+        created = await manager.ensure_partitions(now, settings.SCRAPE_REVISION_PARTITIONS_AHEAD)
+        archived = await manager.archive_expired(now, settings.SCRAPE_REVISION_RETENTION_MONTHS)
+
+    if created:
+        logger.info(f"Created revision partitions: {created}")
+    return (
+        f"Created {len(created)} partitions, archived {sum(r.archived for r in archived)} "
+        f"revisions from {len(archived)} partitions."
+    )
+
+
+@shared_task(bind=True, max_retries=3)
+def maintain_revision_partitions(self):
+    """Celery Beat task keeping the data_revisions partitions current.
+
+    Returns:
+        str: Summary of the maintenance run.
+    """
+    try:
+        return asyncio.run(_maintain_revision_partitions_async())
+    except Exception as exc:
+        logger.error(f"Revision partition maintenance failed: {exc}", exc_info=True)
+        raise self.retry(exc=exc, countdown=600)
@@ -1,6 +1,6 @@
 import io
 import logging
-from typing import Optional
+from typing import BinaryIO, Callable, Optional
 
 try:
     from minio import Minio
@@ -16,6 +16,9 @@ from app.api.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+MULTIPART_PART_SIZE = 10 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 minio_client = None
 if _HAS_MINIO:
     try:
@@ -47,6 +50,26 @@ def upload_raw_content(file_data: bytes, bucket_name: str, object_name: str) ->
     Returns:
         str: The object_name (key) if successful.
 
+    Raises:
+        Exception: If upload fails, triggering the Retry/DLQ logic in the caller.
+    """
+    return upload_raw_stream(io.BytesIO(file_data), len(file_data), bucket_name, object_name)
+
+
+def upload_raw_stream(data: BinaryIO, length: int, bucket_name: str, object_name: str) -> str:
+    """
+    Uploads a seekable binary stream to the specified MinIO bucket without loading it
+    into memory. Large streams are sent as a multipart upload by the MinIO SDK.
+
+    Args:
+        data (BinaryIO): The stream to upload, positioned at its start.
+        length (int): Number of bytes to upload from the stream.
+        bucket_name (str): The target bucket (e.g., 'raw-content').
+        object_name (str): The unique key.
+
+    Returns:
+        str: The object_name (key) if successful.
+
     Raises:
         Exception: If upload fails, triggering the Retry/DLQ logic in the caller.
     """
@@ -73,14 +96,13 @@ def upload_raw_content(file_data: bytes, bucket_name: str, object_name: str) ->
                 ) and "BucketAlreadyOwnedByYou" not in str(create_err):
                     raise create_err
 
-        data_stream = io.BytesIO(file_data)
-
         minio_client.put_object(
             bucket_name=bucket_name,
             object_name=object_name,
-            data=data_stream,
-            length=len(file_data),
+            data=data,
+            length=length,
             content_type="application/octet-stream",
+            part_size=MULTIPART_PART_SIZE,
         )
 
         logger.info(f"Successfully uploaded to MinIO: {bucket_name}/{object_name}")
@@ -114,6 +136,34 @@ def fetch_raw_content_from_minio(
         return None
 
 
+def stream_raw_content_from_minio(
+    object_name: str, write: Callable[[bytes], None], bucket_name: str = "raw-content"
+) -> bool:
+    """
+    Streams an object from MinIO chunk by chunk into ``write`` instead of reading it
+    into memory at once.
+
+    Returns:
+        bool: True if the object was streamed, False if it is missing or MinIO failed.
+    """
+    if not minio_client:
+        return False
+
+    response = None
+    try:
+        response = minio_client.get_object(bucket_name=bucket_name, object_name=object_name)
+        for chunk in response.stream(STREAM_CHUNK_SIZE):
+            write(chunk)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to stream object {object_name} from MinIO: {e}")
+        return False
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
 def upload_profile_picture(
     file_data: bytes, bucket_name: str, object_name: str, content_type: str = "image/jpeg"
 ) -> str:
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from sqlmodel import select
 
 from app.api.core.dependencies.auth import TenantGuard
+from app.api.core.dependencies.redis_service import get_redis_client
 from app.api.db.database import get_db
 from app.api.modules.v1.organization.models.user_organization_model import (
     UserOrganization,
@@ -11,6 +12,7 @@ from app.api.modules.v1.search.schemas.search_schema import (
     SearchRequest,
     SearchResponse,
 )
+from app.api.modules.v1.search.service.search_cache import SearchCache
 from app.api.modules.v1.search.service.search_service import SearchService
 
 router = APIRouter(prefix="/data-revisions", tags=["Data Revision Search"])
@@ -50,5 +52,5 @@ async def search_data_revisions(
         )
     org_id = membership.organization_id
 
-    service = SearchService(db)
+    service = SearchService(db, cache=SearchCache(await get_redis_client()))
     return await service.search(request, org_id=org_id)
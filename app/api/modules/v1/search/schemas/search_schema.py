@@ -1,9 +1,30 @@
+import base64
+import binascii
+import json
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+RANGE_FILTER_OPERATORS = ("gt", "gte", "lt", "lte")
+
+
+def encode_search_cursor(rank: float, revision_id: UUID) -> str:
+    """Encode the (rank, id) of the last result of a page as an opaque cursor."""
+    payload = json.dumps({"rank": rank, "id": str(revision_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+    """Decode a cursor from ``encode_search_cursor``; raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(payload["rank"]), UUID(payload["id"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as exc:
+        raise ValueError("Invalid search cursor") from exc
 
 
 # Enum for different types of entities that can be searched; will be updated when needed
@@ -19,6 +40,24 @@ class SearchOperator(str, Enum):
     NOT = "NOT"
 
 
+class SearchFacet(str, Enum):
+    """Fields that search results can be counted by."""
+
+    SOURCE = "source"
+    JURISDICTION = "jurisdiction"
+    PROJECT = "project"
+    WAS_CHANGE_DETECTED = "was_change_detected"
+    SCRAPED_AT = "scraped_at"
+
+
+class DateHistogramInterval(str, Enum):
+    """Bucket width of the ``scraped_at`` facet."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class SearchRequest(BaseModel):
     """Request schema for full-text search on data revisions."""
 
@@ -26,18 +65,65 @@ class SearchRequest(BaseModel):
     operator: SearchOperator = Field(
         SearchOperator.AND, description="Boolean operator for multiple terms"
     )
-    page: int = Field(1, ge=1, description="Page number (1-indexed)")
+    page: int = Field(1, ge=1, description="Page number (1-indexed); ignored with a cursor")
+    cursor: Optional[str] = Field(
+        None,
+        description=(
+            "Opaque cursor from a previous response's next_cursor. Returns the results "
+            "after it; preferred over page for deep pagination."
+        ),
+    )
     limit: int = Field(10, ge=1, le=100, description="Number of results per page")
     min_rank: float = Field(0.0, ge=0.0, le=1.0, description="Minimum relevance score")
     extracted_data_filters: Optional[dict] = Field(
         default_factory=dict,
         description=(
-            "Optional filters for extracted_data JSONB field. "
-            "Example: {'category': 'legal', 'year': '2025'}"
+            "Optional filters on extracted facts (extracted_data key_value_pairs). "
+            "A plain value must equal the fact; an object of gt/gte/lt/lte bounds "
+            "compares the number in the fact's value. "
+            "Example: {'category': 'legal', 'registration_fee': {'gte': 500, 'lt': 1000}}"
         ),
         examples=[{}],
     )
 
+    facets: List[SearchFacet] = Field(
+        default_factory=list,
+        description=("Fields to count the matching revisions by; scraped_at is a date histogram"),
+        examples=[["source", "scraped_at"]],
+    )
+    date_interval: DateHistogramInterval = Field(
+        DateHistogramInterval.MONTH, description="Bucket width of the scraped_at facet"
+    )
+
+    @field_validator("facets")
+    @classmethod
+    def dedupe_facets(cls, facets: List[SearchFacet]) -> List[SearchFacet]:
+        """Count each facet once, keeping the requested order."""
+        return list(dict.fromkeys(facets))
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, cursor: Optional[str]) -> Optional[str]:
+        """Reject cursors that were not produced by a previous search."""
+        if cursor:
+            decode_search_cursor(cursor)
+        return cursor or None
+
+    @field_validator("extracted_data_filters")
+    @classmethod
+    def validate_range_filters(cls, filters: Optional[dict]) -> Optional[dict]:
+        """Reject range predicates with unknown operators or non-numeric bounds."""
+        for key, value in (filters or {}).items():
+            if not isinstance(value, dict) or not set(value) & set(RANGE_FILTER_OPERATORS):
+                continue
+            unknown = set(value) - set(RANGE_FILTER_OPERATORS)
+            if unknown:
+                raise ValueError(f"Unknown range operators for '{key}': {sorted(unknown)}")
+            for bound in value.values():
+                if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+                    raise ValueError(f"Range bounds for '{key}' must be numbers")
+        return filters
+
     model_config = ConfigDict(
         use_enum_values=True,
         json_schema_extra={
@@ -48,6 +134,7 @@ class SearchRequest(BaseModel):
                 "limit": 10,
                 "min_rank": 0.0,
                 "extracted_data_filters": {},
+                "facets": ["source", "scraped_at"],
             }
         },
     )
@@ -63,17 +150,46 @@ class DataRevisionSearchResult(BaseModel):
     key_fields: Optional[dict]
     revision_date: Optional[datetime]
     relevance_score: float = Field(..., ge=0.0, le=1.0)
+    snippet: Optional[str] = Field(
+        None,
+        description="Best matching fragments as HTML-escaped text, with matched terms "
+        "wrapped in <mark>",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class FacetBucket(BaseModel):
+    """Number of matching revisions with one value of a facet."""
+
+    value: Optional[str] = Field(
+        ..., description="Id, true/false, or bucket start date (YYYY-MM-DD)"
+    )
+    label: Optional[str] = Field(None, description="Source, jurisdiction or project name")
+    count: int
+
+
 class SearchResponse(BaseModel):
     """Response schema for search results with pagination metadata."""
 
     results: List[DataRevisionSearchResult]
     total: int = Field(..., description="Total number of matching results")
+    total_is_estimate: bool = Field(
+        False,
+        description=(
+            "True when the query matched more revisions than are ranked; total then "
+            "counts only the ranked candidates and is a lower bound"
+        ),
+    )
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Number of results per page")
     total_pages: int = Field(..., description="Total number of pages")
     query: str = Field(..., description="Search query used")
     operator: str = Field(..., description="Search operator used")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+    facets: Dict[str, List[FacetBucket]] = Field(
+        default_factory=dict,
+        description=("Counts for each requested facet over the same ranked candidates as total"),
+    )
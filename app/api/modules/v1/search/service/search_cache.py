@@ -0,0 +1,93 @@
+"""Redis cache of rendered search result pages.
+
+Pages are keyed on the tenant, the tenant's current generation and a digest
+of the normalized request (query, operator, filters, pagination). The scrape
+pipeline bumps the tenant's generation whenever it inserts a revision, so a
+new revision moves every later lookup to fresh keys and the stale pages simply
+expire. Redis errors never fail a search: lookups miss and writes are skipped.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.core.config import settings
+from app.api.modules.v1.search.schemas.search_schema import SearchRequest, SearchResponse
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "search:generation:{org_id}"
+PAGE_KEY = "search:page:{org_id}:{generation}:{digest}"
+
+
+def request_digest(search_request: SearchRequest) -> str:
+    """Hash a search request so equivalent requests share a cache entry.
+
+    Query terms are case- and whitespace-insensitive in the tsquery, so they
+    are normalized before hashing; filters are hashed with sorted keys.
+    """
+    normalized = search_request.model_dump(mode="json")
+    normalized["query"] = " ".join(search_request.query.lower().split())
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SearchCache:
+    """Per-tenant cache of search result pages."""
+
+    def __init__(self, redis_client: Redis):
+        """Initialize the cache.
+
+        Args:
+            redis_client (Redis): Async Redis client with ``decode_responses=True``.
+        """
+        self.redis = redis_client
+
+    async def page_key(self, org_id: Any, search_request: SearchRequest) -> Optional[str]:
+        """Return the cache key for a request under the tenant's current generation.
+
+        Returns None when Redis is unavailable, in which case the caller should
+        neither read nor write the cache.
+        """
+        try:
+            generation = await self.redis.get(GENERATION_KEY.format(org_id=org_id))
+        except RedisError as e:
+            logger.warning(f"Search cache unavailable for {org_id}: {e}")
+            return None
+        return PAGE_KEY.format(
+            org_id=org_id, generation=generation or 0, digest=request_digest(search_request)
+        )
+
+    async def get(self, key: str) -> Optional[SearchResponse]:
+        """Return a cached page, or None on a miss or an unreadable entry."""
+        try:
+            raw = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Could not read cached search page {key}: {e}")
+            return None
+        if not raw:
+            return None
+        try:
+            return SearchResponse.model_validate_json(raw)
+        except ValueError:
+            return None
+
+    async def set(self, key: str, response: SearchResponse) -> None:
+        """Cache a rendered page for ``SEARCH_CACHE_TTL_SECONDS``."""
+        try:
+            await self.redis.set(
+                key, response.model_dump_json(), ex=settings.SEARCH_CACHE_TTL_SECONDS
+            )
+        except RedisError as e:
+            logger.warning(f"Could not cache search page {key}: {e}")
+
+    async def bump_generation(self, org_id: Any) -> None:
+        """Invalidate every cached page of a tenant."""
+        try:
+            await self.redis.incr(GENERATION_KEY.format(org_id=org_id))
+        except RedisError as e:
+            logger.warning(f"Could not invalidate search cache for {org_id}: {e}")
@@ -0,0 +1,92 @@
+"""Batched rebuild of the data_revisions full-text search vectors.
+
+The weighted vector is built in the database by
+``data_revisions_search_vector()``, the same function the insert/update
+trigger calls. Rows are walked in ``id`` order, one short transaction per
+batch, so the rebuild never holds locks on more than one batch of revisions
+and can resume from the last id it reached.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+REBUILD_BATCH = text(
+    """
+    UPDATE data_revisions AS d
+    SET search_vector = data_revisions_search_vector(
+        d.minio_object_key, d.ai_summary, d.ai_markdown_summary, d.extracted_data
+    )
+    FROM (
+        SELECT id, scraped_at FROM data_revisions
+        WHERE CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid)
+        ORDER BY id
+        LIMIT :batch_size
+    ) AS batch
+    WHERE d.id = batch.id AND d.scraped_at = batch.scraped_at
+    RETURNING d.id
+    """
+)
+
+
+@dataclass
+class BackfillProgress:
+    """Rows rebuilt by a backfill run and where the next run resumes."""
+
+    updated: int
+    last_id: Optional[UUID]
+    done: bool
+
+
+class SearchVectorBackfill:
+    """Rebuilds ``search_vector`` for existing revisions in batches."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run_batch(self, after: Optional[UUID], batch_size: int) -> BackfillProgress:
+        """Rebuild the vectors of the next ``batch_size`` revisions after ``after``.
+
+        Args:
+            after (Optional[UUID]): Last id of the previous batch, None to start.
+            batch_size (int): Number of revisions to rebuild.
+
+        Returns:
+            BackfillProgress: Rows rebuilt, the last id, and whether the table is done.
+        """
+        result = await self.db.execute(
+            REBUILD_BATCH,
+            {"after": str(after) if after else None, "batch_size": batch_size},
+        )
+        ids = [row[0] for row in result.all()]
+        await self.db.commit()
+        return BackfillProgress(
+            updated=len(ids),
+            last_id=max(ids) if ids else after,
+            done=len(ids) < batch_size,
+        )
+
+    async def run(
+        self, after: Optional[UUID], batch_size: int, max_batches: int
+    ) -> BackfillProgress:
+        """Rebuild up to ``max_batches`` batches, stopping early when done.
+
+        Args:
+            after (Optional[UUID]): Id to resume after, None to start.
+            batch_size (int): Revisions per batch.
+            max_batches (int): Batches to run before returning.
+
+        Returns:
+            BackfillProgress: Totals for the run and the id to resume after.
+        """
+        updated = 0
+        progress = BackfillProgress(updated=0, last_id=after, done=False)
+        for _ in range(max_batches):
+            progress = await self.run_batch(progress.last_id, batch_size)
+            updated += progress.updated
+            if progress.done:
+                break
+        return BackfillProgress(updated=updated, last_id=progress.last_id, done=progress.done)
@@ -1,35 +1,153 @@
-import json
+import html
+import operator
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import to_tsquery
+from sqlalchemy import (
+    JSON,
+    REAL,
+    Date,
+    Numeric,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import JSONB, to_tsquery
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.api.core.config import settings
+from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
+from app.api.modules.v1.projects.models.project_model import Project
 from app.api.modules.v1.scraping.models.data_revision import DataRevision
+from app.api.modules.v1.scraping.models.source_model import Source
+from app.api.modules.v1.scraping.service.fact_timeline import NUMBER_PATTERN
 from app.api.modules.v1.search.schemas.search_schema import (
     DataRevisionSearchResult,
+    DateHistogramInterval,
+    FacetBucket,
+    SearchFacet,
     SearchOperator,
     SearchRequest,
     SearchResponse,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+from app.api.modules.v1.search.service.search_cache import SearchCache
+
+# ts_rank_cd normalization: divide by 1 + log(document length) so long markdown
+# summaries do not outrank short, focused ones (1), then scale to rank / (rank + 1)
+# so scores fall in [0, 1) and ``min_rank`` is a stable threshold (32).
+RANK_NORMALIZATION = 1 | 32
+
+# ts_headline does not escape the document, and summaries are LLM output derived
+# from scraped third-party pages. Matches are wrapped in control characters that
+# cannot occur in HTML; render_snippet escapes the text and only then turns them
+# into <mark> tags.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", '
+    'MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter=" … "'
 )
 
+RANGE_OPERATORS = {"gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le}
+
+
+def render_snippet(headline: Optional[str]) -> Optional[str]:
+    """Return a ``ts_headline`` result as safe HTML with matches in ``<mark>``."""
+    if headline is None:
+        return None
+    return (
+        html.escape(headline).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+def facts_column(extracted_data):
+    """Return the ``key_value_pairs`` facts of an ``extracted_data`` column.
+
+    The path is rendered with literal keys so it matches the expression of the
+    ``idx_data_revisions_facts`` GIN index.
+    """
+    return extracted_data.op("->", return_type=JSONB)(literal_column("'extracted_data'")).op(
+        "->", return_type=JSONB
+    )(literal_column("'key_value_pairs'"))
+
+
+def is_range_filter(value: Any) -> bool:
+    """Return True if a filter value is a range predicate such as ``{"gte": 500}``."""
+    return isinstance(value, dict) and bool(value) and set(value) <= set(RANGE_OPERATORS)
+
+
+def fact_filter_clauses(extracted_data, filters: Dict[str, Any]) -> List[Any]:
+    """Build WHERE clauses for filters on extracted facts.
+
+    Equality filters are combined into a single containment (``@>``) test that
+    the GIN index answers. Range filters compare the first number found in the
+    fact's value, ignoring thousands separators, so ``"1,200 NGN"`` is 1200;
+    facts without a number never match them.
+
+    Args:
+        extracted_data: The ``extracted_data`` JSONB column.
+        filters (Dict[str, Any]): Fact key to expected value or range predicate.
+
+    Returns:
+        List[Any]: Clauses to AND together.
+    """
+    facts = facts_column(extracted_data)
+    expected = {}
+    clauses = []
+    for key, value in filters.items():
+        if is_range_filter(value):
+            number = cast(
+                func.substring(func.replace(facts.op("->>")(key), ",", ""), NUMBER_PATTERN),
+                Numeric,
+            )
+            clauses.extend(RANGE_OPERATORS[op](number, bound) for op, bound in value.items())
+        elif isinstance(value, (dict, list)):
+            expected[key] = value
+        else:
+            expected[key] = str(value)
+    if expected:
+        clauses.insert(0, facts.contains(expected))
+    return clauses
+
 
 class SearchService:
     """Service for performing full-text search on DataRevision entities."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: Optional[SearchCache] = None):
         """
         Initialize the search service.
 
         Args:
             db: Async database session
+            cache: Optional cache of rendered result pages
         """
         self.db = db
+        self.cache = cache
 
     async def search(self, search_request: SearchRequest, org_id: str = None) -> SearchResponse:
         """
         Perform full-text search on data revisions.
 
+        The page and the total come from one statement. Matches are narrowed to
+        the ``SEARCH_CANDIDATE_LIMIT`` most recent candidates, and only those are
+        ranked; the total counts the candidates that reach ``min_rank``. Pages
+        continue after the cursor's (rank, id) instead of skipping an offset, so
+        a deep page costs about the same as the first. Snippets are highlighted
+        only for the rows of the returned page, and requested facets are counted
+        over the same ranked candidates as the total.
+
+        With a cache, rendered pages are served from Redis until the tenant's
+        next revision is inserted.
+
         Args:
             search_request: Search parameters including query, filters, and pagination
             org_id: Optional organization ID to enforce multi-tenant isolation
@@ -37,43 +155,104 @@ class SearchService:
         Returns:
             SearchResponse: Paginated search results with relevance scores
         """
-        tsquery = self._build_tsquery(search_request.query, search_request.operator)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = await self.cache.page_key(org_id, search_request)
+            cached = await self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return cached.model_copy(update={"query": search_request.query})
 
-        relevance_score_col = func.ts_rank(
-            DataRevision.search_vector, to_tsquery("english", tsquery)
-        ).label("relevance_score")
+        tsquery = to_tsquery(
+            "english", self._build_tsquery(search_request.query, search_request.operator)
+        )
+        limit = search_request.limit
+        candidate_limit = settings.SEARCH_CANDIDATE_LIMIT
 
-        base_filters = [
-            DataRevision.search_vector.op("@@")(to_tsquery("english", tsquery)),
-        ]
+        candidates = select(
+            DataRevision.id,
+            DataRevision.scraped_at,
+            DataRevision.source_id,
+            DataRevision.jurisdiction_id,
+            DataRevision.project_id,
+            DataRevision.was_change_detected,
+            func.ts_rank_cd(DataRevision.search_vector, tsquery, RANK_NORMALIZATION).label("rank"),
+        ).filter(DataRevision.search_vector.op("@@")(tsquery))
 
         if org_id:
-            base_filters.append(DataRevision.organization_id == org_id)
-
-        statement = select(DataRevision, relevance_score_col).filter(*base_filters)
+            candidates = candidates.filter(DataRevision.organization_id == org_id)
 
-        statement = self._apply_filters(statement, search_request)
-
-        count_statement = select(func.count()).select_from(DataRevision).filter(*base_filters)
-
-        count_statement = self._apply_filters(count_statement, search_request)
+        candidates = self._apply_filters(candidates, search_request)
+        candidates = (
+            candidates.order_by(DataRevision.scraped_at.desc(), DataRevision.id.desc())
+            .limit(candidate_limit)
+            .cte("candidates")
+        )
+        ranked = candidates.c.rank >= search_request.min_rank
 
-        count_result = await self.db.execute(count_statement)
-        total_count_value = count_result.scalar()
-        total_count = total_count_value if total_count_value is not None else 0
+        totals = select(
+            func.count().filter(ranked).label("total"),
+            func.count().label("candidates"),
+        )
+        if search_request.facets:
+            totals = totals.add_columns(
+                self._facet_counts(
+                    candidates, ranked, search_request.facets, search_request.date_interval
+                ).label("facets")
+            )
+        totals = totals.select_from(candidates).cte("totals")
 
-        offset = (search_request.page - 1) * search_request.limit
-        total_pages = (total_count + search_request.limit - 1) // search_request.limit
+        page = select(candidates.c.id, candidates.c.scraped_at, candidates.c.rank).where(ranked)
+        if search_request.cursor:
+            after_rank, after_id = decode_search_cursor(search_request.cursor)
+            page = page.where(
+                tuple_(candidates.c.rank, candidates.c.id)
+                < tuple_(literal(after_rank, REAL), literal(after_id, candidates.c.id.type))
+            )
+        else:
+            page = page.offset((search_request.page - 1) * limit)
+        # One extra row tells whether there is a next page.
+        page = (
+            page.order_by(candidates.c.rank.desc(), candidates.c.id.desc())
+            .limit(limit + 1)
+            .cte("page")
+        )
 
         statement = (
-            statement.order_by(relevance_score_col.desc())
-            .filter(relevance_score_col >= search_request.min_rank)
-            .offset(offset)
-            .limit(search_request.limit)
+            select(
+                totals.c.total,
+                totals.c.candidates,
+                DataRevision,
+                page.c.rank.label("relevance_score"),
+                func.ts_headline(
+                    "english",
+                    func.coalesce(DataRevision.ai_markdown_summary, DataRevision.ai_summary, ""),
+                    tsquery,
+                    HEADLINE_OPTIONS,
+                ).label("snippet"),
+            )
+            .select_from(totals)
+            .outerjoin(page, true())
+            .outerjoin(
+                DataRevision,
+                and_(DataRevision.id == page.c.id, DataRevision.scraped_at == page.c.scraped_at),
+            )
+            .order_by(page.c.rank.desc(), page.c.id.desc())
         )
 
+        if search_request.facets:
+            statement = statement.add_columns(totals.c.facets)
+
         results_result = await self.db.execute(statement)
-        results = results_result.all()
+        rows = results_result.all()
+
+        # The totals row is always present; page columns are NULL past the last result.
+        total_count = rows[0].total
+        results = [row for row in rows if row.DataRevision is not None]
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = encode_search_cursor(last.relevance_score, last.DataRevision.id)
 
         search_results = [
             DataRevisionSearchResult(
@@ -84,20 +263,118 @@ class SearchService:
                 key_fields=result.DataRevision.extracted_data or {},
                 revision_date=result.DataRevision.scraped_at,
                 relevance_score=result.relevance_score,
+                snippet=render_snippet(result.snippet),
             )
             for result in results
         ]
 
-        return SearchResponse(
+        response = SearchResponse(
             results=search_results,
             total=total_count,
+            total_is_estimate=rows[0].candidates >= candidate_limit,
             page=search_request.page,
-            limit=search_request.limit,
-            total_pages=total_pages,
+            limit=limit,
+            total_pages=(total_count + limit - 1) // limit,
             query=search_request.query,
             operator=search_request.operator,
+            next_cursor=next_cursor,
+            facets=(
+                self._facet_buckets(search_request.facets, rows[0].facets)
+                if search_request.facets
+                else {}
+            ),
+        )
+        if cache_key:
+            await self.cache.set(cache_key, response)
+        return response
+
+    def _facet_counts(self, candidates, ranked, facets: List[str], date_interval: str):
+        """Build a scalar subquery counting the ranked candidates by each facet.
+
+        All facets are counted in one pass with ``GROUPING SETS``, one set per
+        facet, and returned as a JSON array of ``{facet, value, label, count}``.
+
+        Args:
+            candidates: The candidates CTE.
+            ranked: Condition selecting the candidates that reach ``min_rank``.
+            facets (List[str]): Requested ``SearchFacet`` values.
+            date_interval (str): ``date_trunc`` unit of the ``scraped_at`` facet.
+
+        Returns:
+            Scalar subquery returning the JSON array, NULL when nothing matched.
+        """
+        # Rendered inline so the select list and GROUP BY hold the same expression.
+        unit = literal_column(f"'{DateHistogramInterval(date_interval).value}'")
+        bucket = cast(func.date_trunc(unit, candidates.c.scraped_at), Date)
+        columns = {
+            SearchFacet.SOURCE: candidates.c.source_id,
+            SearchFacet.JURISDICTION: candidates.c.jurisdiction_id,
+            SearchFacet.PROJECT: candidates.c.project_id,
+            SearchFacet.WAS_CHANGE_DETECTED: candidates.c.was_change_detected,
+            SearchFacet.SCRAPED_AT: bucket,
+        }
+        facets = [SearchFacet(facet) for facet in facets]
+        grouped = [columns[facet] for facet in facets]
+
+        counts = (
+            select(
+                *[col.label(f"facet_{f.value}") for f, col in zip(facets, grouped)],
+                *[
+                    func.grouping(col).label(f"grouping_{f.value}")
+                    for f, col in zip(facets, grouped)
+                ],
+                func.count().label("count"),
+            )
+            .where(ranked)
+            .group_by(func.grouping_sets(*grouped))
+            .cte("facet_counts")
         )
 
+        labels = {
+            SearchFacet.SOURCE: (Source, Source.name),
+            SearchFacet.JURISDICTION: (Jurisdiction, Jurisdiction.name),
+            SearchFacet.PROJECT: (Project, Project.title),
+        }
+        facet_names, values, label_columns = [], [], []
+        joined = counts
+        for facet in facets:
+            grouping = counts.c[f"grouping_{facet.value}"] == 0
+            value = counts.c[f"facet_{facet.value}"]
+            facet_names.append((grouping, facet.value))
+            values.append((grouping, cast(value, String)))
+            if facet in labels:
+                model, label = labels[facet]
+                joined = joined.outerjoin(model, and_(grouping, model.id == value))
+                label_columns.append((grouping, label))
+
+        bucket_json = func.json_build_object(
+            "facet",
+            case(*facet_names),
+            "value",
+            case(*values),
+            "label",
+            case(*label_columns) if label_columns else null(),
+            "count",
+            counts.c.count,
+        )
+        return select(func.json_agg(bucket_json, type_=JSON)).select_from(joined).scalar_subquery()
+
+    def _facet_buckets(
+        self, facets: List[str], raw: Optional[list]
+    ) -> Dict[str, List[FacetBucket]]:
+        """Group the facet rows by facet: most frequent first, dates in order."""
+        buckets = {SearchFacet(facet).value: [] for facet in facets}
+        for row in raw or []:
+            buckets[row["facet"]].append(
+                FacetBucket(value=row["value"], label=row["label"], count=row["count"])
+            )
+        for facet, facet_buckets in buckets.items():
+            if facet == SearchFacet.SCRAPED_AT.value:
+                facet_buckets.sort(key=lambda b: b.value or "")
+            else:
+                facet_buckets.sort(key=lambda b: (-b.count, b.value or ""))
+        return buckets
+
     def _build_tsquery(self, query: str, operator: SearchOperator) -> str:
         """
         Build a PostgreSQL tsquery string from the search query.
@@ -141,11 +418,8 @@ class SearchService:
         Returns:
             Modified select statement with applied filters
         """
-        for key, value in search_request.extracted_data_filters.items():
-            if isinstance(value, (dict, list)):
-                value_str = json.dumps(value, separators=(",", ":"))
-            else:
-                value_str = str(value)
-            query = query.filter(DataRevision.extracted_data.op("->>")(key) == value_str)
+        filters = search_request.extracted_data_filters or {}
+        if filters:
+            query = query.filter(*fact_filter_clauses(DataRevision.extracted_data, filters))
 
         return query
@@ -0,0 +1,56 @@
+"""Celery tasks for the search module."""
+
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+import nest_asyncio
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from app.api.core.config import settings
+from app.api.db.database import AsyncSessionLocal
+from app.api.modules.v1.search.service.search_index import SearchVectorBackfill
+
+# Apply nest_asyncio to allow asyncio.run() inside Celery tasks
+nest_asyncio.apply()
+
+logger = get_task_logger(__name__)
+
+
+async def _backfill_search_vectors_async(after: Optional[str]):
+    async with AsyncSessionLocal() as db:
+        return await SearchVectorBackfill(db).run(
+            UUID(after) if after else None,
+            settings.SEARCH_BACKFILL_BATCH_SIZE,
+            settings.SEARCH_BACKFILL_BATCHES_PER_RUN,
+        )
+
+
+@shared_task(bind=True, max_retries=3)
+def backfill_search_vectors(self, after: Optional[str] = None):
+    """Rebuild the weighted search vectors of existing revisions.
+
+    Runs ``SEARCH_BACKFILL_BATCHES_PER_RUN`` batches, then re-queues itself from
+    the last id it reached until every revision has been rebuilt, so other
+    tasks get worker time between runs. Start it once after migrating:
+    ``backfill_search_vectors.delay()``.
+
+    Args:
+        after (Optional[str]): Revision id to resume after.
+
+    Returns:
+        str: Summary of the run.
+    """
+    try:
+        progress = asyncio.run(_backfill_search_vectors_async(after))
+    except Exception as exc:
+        logger.error(f"Search vector backfill failed after {after}: {exc}", exc_info=True)
+        raise self.retry(exc=exc, countdown=60)
+
+    if not progress.done:
+        backfill_search_vectors.delay(str(progress.last_id))
+        return f"Rebuilt {progress.updated} search vectors, continuing after {progress.last_id}."
+
+    logger.info("Search vector backfill complete")
+    return f"Rebuilt {progress.updated} search vectors; backfill complete."
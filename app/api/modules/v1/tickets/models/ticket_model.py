@@ -165,7 +165,6 @@ class Ticket(SQLModel, table=True):
 
     data_revision_id: Optional[uuid.UUID] = Field(
         default=None,
-        foreign_key="data_revisions.id",
         index=True,
         nullable=True,
         description="Optional reference to the data revision that triggered this ticket",
@@ -249,7 +248,12 @@ class Ticket(SQLModel, table=True):
     organization: "Organization" = Relationship(back_populates="tickets")
     project: "Project" = Relationship(back_populates="tickets")
     change_diff: Optional["ChangeDiff"] = Relationship()
-    data_revision: Optional["DataRevision"] = Relationship(back_populates="tickets")
+    data_revision: Optional["DataRevision"] = Relationship(
+        back_populates="tickets",
+        sa_relationship_kwargs={
+            "primaryjoin": "foreign(Ticket.data_revision_id) == DataRevision.id"
+        },
+    )
     source: Optional["Source"] = Relationship(back_populates="tickets")
     external_participants: list["ExternalParticipant"] = Relationship(
         back_populates="ticket",
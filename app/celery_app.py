@@ -1,5 +1,6 @@
 from celery import Celery
 from celery.schedules import crontab
+from kombu import Queue
 
 from app.api.core.config import settings
 
@@ -11,6 +12,7 @@ celery_app = Celery(
         "app.api.modules.v1.scraping.service.tasks",
         "app.api.modules.v1.notifications.service.revision_notification_task",
         "app.api.modules.v1.api_access.service.rotation_tasks",
+        "app.api.modules.v1.search.service.tasks",
     ],
 )
 
@@ -22,6 +24,15 @@ celery_app.conf.update(
     enable_utc=True,
     worker_max_tasks_per_child=100,
     broker_connection_retry_on_startup=True,
+    task_default_queue="celery",
+    # Workers started without -Q consume every queue below. Dedicated scraping
+    # workers can be pinned to one priority class, e.g. -Q scraping.manual.
+    task_queues=(
+        Queue("celery"),
+        Queue(settings.SCRAPE_QUEUE_MANUAL),
+        Queue(settings.SCRAPE_QUEUE_HOURLY),
+        Queue(settings.SCRAPE_QUEUE_DEFAULT),
+    ),
 )
 
 
@@ -30,6 +41,10 @@ celery_app.conf.beat_schedule = {
         "task": "app.api.modules.v1.scraping.service.tasks.dispatch_due_sources",
         "schedule": crontab(minute="*"),
     },
+    "maintain-revision-partitions-daily": {
+        "task": "app.api.modules.v1.scraping.service.tasks.maintain_revision_partitions",
+        "schedule": crontab(minute=30, hour=3),
+    },
     "rotate-due-api-keys-every-hour": {
         "task": "app.api.modules.v1.api_access.service.rotation_tasks.rotate_due_keys",
         "schedule": crontab(minute=0, hour="*/1"),
@@ -0,0 +1,153 @@
+"""Benchmark extracted-fact filters: JSON ``->>`` scans versus JSONB containment.
+
+Builds two synthetic, unlogged copies of the extracted_data column (``json``
+and ``jsonb`` with the same ``jsonb_path_ops`` GIN index as data_revisions),
+then times the legacy text-equality filter against the filters built by
+``SearchService`` and reports whether the plan used the GIN index.
+
+Run against a disposable database, from the repository root:
+    python -m scripts.benchmark_fact_filters --rows 1000000
+    python -m scripts.benchmark_fact_filters --rows 1000000 --repeat 10 --keep
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import column, func, select, table, text
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.api.db.database import engine
+from app.api.modules.v1.search.service.search_service import fact_filter_clauses
+
+JSON_TABLE = "bench_facts_json"
+JSONB_TABLE = "bench_facts_jsonb"
+INDEX = "bench_facts_jsonb_facts"
+
+SYNTHETIC_FACTS = """
+    SELECT i, json_build_object('extracted_data', json_build_object('key_value_pairs',
+        json_build_object(
+            'doc_id', 'doc-' || i,
+            'category', 'category-' || (i % 50),
+            'jurisdiction', 'jurisdiction-' || (i % 200),
+            'registration_fee', to_char(i % 5000, 'FM9,999') || ' NGN'
+        )))
+    FROM generate_series(1, :rows) AS i
+"""
+
+CASES = {
+    "single fact (rare)": {"doc_id": "doc-424242"},
+    "two facts (1 in 200)": {"category": "category-7", "jurisdiction": "jurisdiction-7"},
+    "fact + fee range": {"category": "category-7", "registration_fee": {"gte": 1000, "lt": 1100}},
+}
+
+
+def legacy_clauses(facts_table, filters):
+    """The previous filter shape: one ``->>`` text comparison per key."""
+    facts = facts_table.c.extracted_data["extracted_data"]["key_value_pairs"]
+    return [facts.op("->>")(key) == str(value) for key, value in filters.items()]
+
+
+async def setup(conn, rows: int) -> None:
+    for name, type_ in ((JSON_TABLE, "json"), (JSONB_TABLE, "jsonb")):
+        await conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        await conn.execute(
+            text(f"CREATE UNLOGGED TABLE {name} (id bigint PRIMARY KEY, extracted_data {type_})")
+        )
+        started = time.perf_counter()
+        await conn.execute(text(f"INSERT INTO {name} {SYNTHETIC_FACTS}"), {"rows": rows})
+        print(f"Loaded {rows} rows into {name} in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    await conn.execute(
+        text(
+            f"CREATE INDEX {INDEX} ON {JSONB_TABLE} USING gin "
+            "((extracted_data -> 'extracted_data' -> 'key_value_pairs') jsonb_path_ops)"
+        )
+    )
+    print(f"Built {INDEX} in {time.perf_counter() - started:.1f}s")
+    await conn.execute(text(f"ANALYZE {JSON_TABLE}"))
+    await conn.execute(text(f"ANALYZE {JSONB_TABLE}"))
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def uses_index(conn, statement) -> bool:
+    plan = (await conn.execute(Explain(statement))).scalar()
+    return INDEX in str(plan)
+
+
+async def time_query(conn, statement, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = (await conn.execute(statement)).scalar()
+        timings.append((time.perf_counter() - started) * 1000)
+    return count, statistics.median(timings)
+
+
+async def run(rows: int, repeat: int, keep: bool) -> None:
+    json_table = table(JSON_TABLE, column("extracted_data", JSON))
+    jsonb_table = table(JSONB_TABLE, column("extracted_data", JSONB))
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await setup(conn, rows)
+
+        print(f"\n{'case':<24}{'json ->> (ms)':>16}{'jsonb @> (ms)':>16}{'rows':>8}  gin")
+        for name, filters in CASES.items():
+            equality = {k: v for k, v in filters.items() if not isinstance(v, dict)}
+            ranges = {k: v for k, v in filters.items() if isinstance(v, dict)}
+            # The legacy filter had no range support; ranges get the same numeric
+            # comparison on both sides so only the equality lookup differs.
+            legacy = (
+                select(func.count())
+                .select_from(json_table)
+                .where(*legacy_clauses(json_table, equality))
+                .where(*fact_filter_clauses(json_table.c.extracted_data, ranges))
+            )
+            current = (
+                select(func.count())
+                .select_from(jsonb_table)
+                .where(*fact_filter_clauses(jsonb_table.c.extracted_data, filters))
+            )
+
+            _, legacy_ms = await time_query(conn, legacy, repeat)
+            count, current_ms = await time_query(conn, current, repeat)
+            used_index = await uses_index(conn, current)
+            print(
+                f"{name:<24}{legacy_ms:>16.1f}{current_ms:>16.1f}{count:>8}  "
+                f"{'yes' if used_index else 'no'}"
+            )
+
+        if not keep:
+            await conn.execute(text(f"DROP TABLE {JSON_TABLE}"))
+            await conn.execute(text(f"DROP TABLE {JSONB_TABLE}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark extracted-fact filters")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic tables")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat, args.keep))
+
+
+if __name__ == "__main__":
+    main()
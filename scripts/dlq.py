@@ -0,0 +1,92 @@
+"""
+Inspect and replay the scrape dead-letter queue.
+
+Usage (from the repository root):
+    python -m scripts.dlq summary
+    python -m scripts.dlq list --host example.gov --limit 20
+    python -m scripts.dlq replay --batch-size 100 --interval 30 --all
+    python -m scripts.dlq replay --error-class ScrapeDeadlineExceeded --dry-run
+    python -m scripts.dlq migrate
+    python -m scripts.dlq discard <entry_id>
+"""
+
+import argparse
+import json
+import time
+
+import redis
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.dead_letter import DeadLetterQueue
+
+
+def _print(data) -> None:
+    print(json.dumps(data, indent=2, default=str))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape dead-letter queue tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("summary", help="Count entries by source, host and error class")
+
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--source-id")
+    filters.add_argument("--host")
+    filters.add_argument("--error-class")
+
+    list_cmd = sub.add_parser("list", parents=[filters], help="List the newest entries")
+    list_cmd.add_argument("--limit", type=int, default=50)
+
+    replay_cmd = sub.add_parser("replay", parents=[filters], help="Replay throttled batches")
+    replay_cmd.add_argument("--batch-size", type=int, default=settings.SCRAPE_DLQ_REPLAY_BATCH_SIZE)
+    replay_cmd.add_argument(
+        "--all", action="store_true", help="Keep replaying batches until nothing matches"
+    )
+    replay_cmd.add_argument(
+        "--interval", type=float, default=30.0, help="Seconds to wait between batches"
+    )
+    replay_cmd.add_argument("--dry-run", action="store_true")
+
+    sub.add_parser("migrate", help="Move entries from the legacy Redis list into the stream")
+
+    discard_cmd = sub.add_parser("discard", help="Discard an entry without replaying it")
+    discard_cmd.add_argument("entry_id")
+
+    args = parser.parse_args()
+    dlq = DeadLetterQueue(redis.Redis.from_url(settings.REDIS_URL, decode_responses=True))
+
+    if args.command == "summary":
+        _print(dlq.summary())
+
+    elif args.command == "list":
+        _print(dlq.entries(args.limit, args.source_id, args.host, args.error_class))
+
+    elif args.command == "replay":
+        while True:
+            result = dlq.replay(
+                args.batch_size, args.source_id, args.host, args.error_class, args.dry_run
+            )
+            print(
+                f"replayed={result['replayed']} throttled={result['throttled']} "
+                f"remaining={result['remaining']}"
+            )
+            if not args.all or args.dry_run:
+                break
+            if result["budget"] > 0 and result["replayed"] == 0 and result["throttled"] == 0:
+                break
+            time.sleep(args.interval)
+
+    elif args.command == "migrate":
+        print(f"Migrated {dlq.migrate_legacy()} legacy entries")
+
+    elif args.command == "discard":
+        entry = dlq.get(args.entry_id)
+        if not entry:
+            raise SystemExit(f"Entry {args.entry_id} not found")
+        dlq.remove(entry)
+        print(f"Discarded {args.entry_id} (source {entry['source_id']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,9 +70,15 @@ async def setup_test_data():
 
             # Create data revisions with searchable content
             # Using only the columns that exist in the actual database schema
+            tenant = {
+                "organization_id": org.id,
+                "project_id": project.id,
+                "jurisdiction_id": jurisdiction.id,
+            }
             revisions = [
                 DataRevision(
                     source_id=UUID("00000000-0000-0000-0000-000000000001"),
+                    **tenant,
                     minio_object_key="federal_tax_regulations_2025.pdf",
                     ai_summary="This document discusses federal tax "
                     "regulations, corporate compliance"
@@ -84,6 +90,7 @@ async def setup_test_data():
                 ),
                 DataRevision(
                     source_id=UUID("00000000-0000-0000-0000-000000000001"),
+                    **tenant,
                     minio_object_key="environmental_protection_laws.pdf",
                     ai_summary="Environmental protection laws and climate change policies"
                     "for corporations. Includes carbon emission standards,"
@@ -95,6 +102,7 @@ async def setup_test_data():
                 ),
                 DataRevision(
                     source_id=UUID("00000000-0000-0000-0000-000000000001"),
+                    **tenant,
                     minio_object_key="labor_law_updates.pdf",
                     ai_summary="Labor laws regarding employee rights,"
                     "workplace safety regulations, minimum wage updates,"
@@ -105,6 +113,7 @@ async def setup_test_data():
                 ),
                 DataRevision(
                     source_id=UUID("00000000-0000-0000-0000-000000000001"),
+                    **tenant,
                     minio_object_key="data_privacy_regulations.pdf",
                     ai_summary="Data privacy regulations covering consumer"
                     "information protection, GDPR compliance,"
@@ -116,6 +125,7 @@ async def setup_test_data():
                 ),
                 DataRevision(
                     source_id=UUID("00000000-0000-0000-0000-000000000001"),
+                    **tenant,
                     minio_object_key="healthcare_compliance.pdf",
                     ai_summary="Healthcare industry compliance"
                     "regulations including HIPAA requirements,"
@@ -80,7 +80,14 @@ async def sample_resource_setup(pg_async_session):
     await pg_async_session.commit()
     await pg_async_session.refresh(source)
 
-    rev = DataRevision(source_id=source.id, minio_object_key="k1", extracted_data={"foo": "bar"})
+    rev = DataRevision(
+        source_id=source.id,
+        organization_id=org.id,
+        project_id=project.id,
+        jurisdiction_id=jurisdiction.id,
+        minio_object_key="k1",
+        extracted_data={"foo": "bar"},
+    )
     pg_async_session.add(rev)
     await pg_async_session.commit()
     await pg_async_session.refresh(rev)
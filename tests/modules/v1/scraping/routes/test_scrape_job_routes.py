@@ -8,7 +8,9 @@ import pytest
 import pytest_asyncio
 from fastapi import status
 from httpx import ASGITransport, AsyncClient
+from sqlmodel import select
 
+from app.api.core.config import settings
 from app.api.core.dependencies.auth import get_current_user
 from app.api.db.database import get_db
 from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdiction
@@ -198,10 +200,10 @@ class TestManualScrapeTrigger:
         assert data["error"] == "SOURCE_INACTIVE"
 
     @pytest.mark.asyncio
-    async def test_manual_scrape_trigger_concurrent_job_conflict(
+    async def test_manual_scrape_trigger_coalesces_in_progress_job(
         self, client, pg_async_session, auth_headers, sample_source, sample_user
     ):
-        """Test 409 when a scrape is already in progress for the source."""
+        """Test 202 coalesced with a scrape already in progress for the source."""
         existing_job = ScrapeJob(
             id=uuid.uuid4(),
             source_id=sample_source.id,
@@ -225,16 +227,17 @@ class TestManualScrapeTrigger:
             headers=auth_headers,
         )
 
-        assert response.status_code == status.HTTP_409_CONFLICT
-        data = response.json()
-        assert "already in progress" in data["message"].lower()
-        assert data["error"] == "SCRAPE_IN_PROGRESS"
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()["data"]
+        assert data["job_id"] == str(existing_job.id)
+        assert data["status"] == ScrapeJobStatus.IN_PROGRESS.value
+        assert data["coalesced"] is True
 
     @pytest.mark.asyncio
-    async def test_manual_scrape_trigger_pending_job_conflict(
+    async def test_manual_scrape_trigger_coalesces_pending_job(
         self, client, pg_async_session, auth_headers, sample_source, sample_user
     ):
-        """Test 409 when a pending scrape exists for the source."""
+        """Test 202 coalesced with a pending scrape for the source."""
         existing_job = ScrapeJob(
             id=uuid.uuid4(),
             source_id=sample_source.id,
@@ -258,13 +261,17 @@ class TestManualScrapeTrigger:
             headers=auth_headers,
         )
 
-        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()["data"]
+        assert data["job_id"] == str(existing_job.id)
+        assert data["status"] == ScrapeJobStatus.PENDING.value
+        assert data["coalesced"] is True
 
     @pytest.mark.asyncio
     async def test_manual_scrape_trigger_after_completed_job(
         self, client, pg_async_session, auth_headers, sample_source, sample_user
     ):
-        """Test 202 when a previous job is completed (no conflict)."""
+        """Test 202 coalesced with a job that completed within the window."""
         completed_job = ScrapeJob(
             id=uuid.uuid4(),
             source_id=sample_source.id,
@@ -294,6 +301,80 @@ class TestManualScrapeTrigger:
             )
 
         assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()["data"]
+        assert data["coalesced"] is True
+        assert data["job_id"] == str(completed_job.id)
+
+    @pytest.mark.asyncio
+    async def test_manual_scrape_trigger_after_coalesce_window(
+        self, client, pg_async_session, auth_headers, sample_source, sample_user
+    ):
+        """Test a new job is queued when the last completed job is outside the window."""
+        finished_at = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.SCRAPE_MANUAL_COALESCE_SECONDS + 60
+        )
+        completed_job = ScrapeJob(
+            id=uuid.uuid4(),
+            source_id=sample_source.id,
+            status=ScrapeJobStatus.COMPLETED,
+            created_at=finished_at,
+            completed_at=finished_at,
+        )
+        pg_async_session.add(completed_job)
+        await pg_async_session.commit()
+
+        async def override_get_db():
+            yield pg_async_session
+
+        async def override_get_current_user():
+            return sample_user
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = override_get_current_user
+
+        with patch(
+            "app.api.modules.v1.scraping.service.scrape_job_service.ScrapeJobService.queue_scrape_job"
+        ) as mock_queue:
+            response = await client.post(
+                f"/api/v1/sources/{sample_source.id}/scrapes",
+                headers=auth_headers,
+            )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()["data"]
+        assert data["coalesced"] is False
+        assert data["job_id"] != str(completed_job.id)
+        mock_queue.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_manual_scrape_trigger_queue_unavailable(
+        self, client, pg_async_session, auth_headers, sample_source, sample_user
+    ):
+        """Test 503 and a FAILED job when the task cannot reach the broker."""
+
+        async def override_get_db():
+            yield pg_async_session
+
+        async def override_get_current_user():
+            return sample_user
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = override_get_current_user
+
+        with patch(
+            "app.api.modules.v1.scraping.service.scrape_job_service.ScrapeJobService.queue_scrape_job",
+            side_effect=ConnectionError("broker down"),
+        ):
+            response = await client.post(
+                f"/api/v1/sources/{sample_source.id}/scrapes",
+                headers=auth_headers,
+            )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        result = await pg_async_session.execute(
+            select(ScrapeJob).where(ScrapeJob.source_id == sample_source.id)
+        )
+        assert result.scalars().one().status == ScrapeJobStatus.FAILED
 
     @pytest.mark.asyncio
     async def test_manual_scrape_trigger_after_failed_job(
@@ -745,6 +826,22 @@ class TestBackgroundScrapeTask:
                 non_existent_job_id, non_existent_source_id
             )
 
+    @pytest.mark.asyncio
+    async def test_queue_scrape_job_routes_to_manual_queue(self):
+        """Test manual jobs are sent to the worker fleet, not run in-process."""
+        job_id, source_id = uuid.uuid4(), uuid.uuid4()
+
+        with patch(
+            "app.api.modules.v1.scraping.service.scrape_job_service.celery_app"
+        ) as mock_celery:
+            await ScrapeJobService.queue_scrape_job(job_id, source_id)
+
+        mock_celery.send_task.assert_called_once_with(
+            "app.api.modules.v1.scraping.service.tasks.run_manual_scrape_job",
+            args=[str(job_id), str(source_id)],
+            queue=settings.SCRAPE_QUEUE_MANUAL,
+        )
+
 
 class TestGetActiveScrapeJob:
     """Tests for GET /sources/{source_id}/scrapes/active endpoint."""
@@ -0,0 +1,183 @@
+"""Tests for feed- and sitemap-driven change probing."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.api.modules.v1.scraping.service.change_feed import (
+    ChangeFeedProber,
+    parse_feed,
+    record_feed_signature,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://regulator.gov/rules/fees</loc><lastmod>{fees}</lastmod></url>
+  <url><loc>https://regulator.gov/rules/forms</loc><lastmod>2026-09-01</lastmod></url>
+</urlset>
+"""
+
+ATOM = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry><link href="https://Regulator.gov/news/1"/><updated>2026-10-01T00:00:00Z</updated></entry>
+</feed>"""
+
+RSS = b"""<rss><channel>
+  <item><link>https://regulator.gov/notice?b=2&amp;a=1</link><title>Notice</title></item>
+</channel></rss>"""
+
+
+class FakeRedis:
+    """In-memory subset of sync Redis used by the prober."""
+
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(f) for f in fields]
+
+    def expire(self, key, seconds):
+        pass
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+class Feed:
+    """Serves a sitemap and answers conditional requests with 304."""
+
+    def __init__(self):
+        self.fees = "2026-10-01"
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        etag = f'"{self.fees}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=SITEMAP.replace(b"{fees}", self.fees.encode()), headers={"ETag": etag}
+        )
+
+
+def source(url, hours_since_scrape=1, feed="https://regulator.gov/sitemap.xml"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        url=url,
+        scraping_rules={"change_feed": feed},
+        last_scraped_at=NOW - timedelta(hours=hours_since_scrape),
+    )
+
+
+@pytest.fixture
+def feed():
+    return Feed()
+
+
+@pytest.fixture
+def make_prober(feed):
+    redis_client = FakeRedis()
+
+    def make():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(feed.handler))
+        return ChangeFeedProber(redis_client, client=client)
+
+    return make
+
+
+async def tick(make_prober, sources, failed=()):
+    """Probe, then record signatures the way successful scrape tasks do."""
+    prober = make_prober()
+    unchanged = await prober.probe(sources, NOW)
+    for s in sources:
+        signature = prober.pending_signature(s.id)
+        if s.id not in unchanged and s.id not in failed and signature:
+            record_feed_signature(prober.redis, s.id, signature)
+    return unchanged
+
+
+def test_parse_feed_handles_sitemaps_atom_and_rss():
+    assert parse_feed(SITEMAP.replace(b"{fees}", b"2026-10-01")) == {
+        "https://regulator.gov/rules/fees": "2026-10-01",
+        "https://regulator.gov/rules/forms": "2026-09-01",
+    }
+    assert parse_feed(ATOM) == {"https://regulator.gov/news/1": "2026-10-01T00:00:00Z"}
+    [(url, signature)] = parse_feed(RSS).items()
+    assert url == "https://regulator.gov/notice?a=1&b=2" and len(signature) == 32
+
+
+@pytest.mark.asyncio
+async def test_one_poll_serves_every_source_of_the_feed(feed, make_prober):
+    fees = source("https://regulator.gov/rules/fees")
+    forms = source("https://regulator.gov/rules/forms")
+
+    assert await tick(make_prober, [fees, forms]) == set()
+    assert await tick(make_prober, [fees, forms]) == {fees.id, forms.id}
+    assert len(feed.requests) == 2
+    assert feed.requests[1].headers["if-none-match"] == '"2026-10-01"'
+
+    feed.fees = "2026-10-17"
+    assert await tick(make_prober, [fees, forms]) == {forms.id}
+    assert await tick(make_prober, [fees, forms]) == {fees.id, forms.id}
+
+
+@pytest.mark.asyncio
+async def test_failed_scrape_is_dispatched_again_next_tick(make_prober):
+    fees = source("https://regulator.gov/rules/fees")
+
+    assert await tick(make_prober, [fees], failed={fees.id}) == set()
+    assert await tick(make_prober, [fees]) == set()
+    assert await tick(make_prober, [fees]) == {fees.id}
+
+
+@pytest.mark.asyncio
+async def test_not_modified_feed_still_scrapes_sources_not_yet_dispatched(make_prober):
+    fees = source("https://regulator.gov/rules/fees")
+    forms = source("https://regulator.gov/rules/forms")
+    await tick(make_prober, [fees])
+
+    prober = make_prober()
+    assert await prober.probe([fees, forms], NOW) == {fees.id}
+
+
+@pytest.mark.asyncio
+async def test_safety_scrape_and_unlisted_or_broken_feeds_are_dispatched(feed, make_prober):
+    fees = source("https://regulator.gov/rules/fees")
+    await tick(make_prober, [fees])
+
+    stale = source("https://regulator.gov/rules/fees", hours_since_scrape=500)
+    stale.id = fees.id
+    unlisted = source("https://regulator.gov/rules/other")
+    broken = source("https://regulator.gov/rules/fees", feed="https://regulator.gov/broken.xml")
+    feed.handler = lambda request: httpx.Response(200, content=b"<not xml")
+
+    assert await tick(make_prober, [stale, unlisted, broken]) == set()
+
+
+@pytest.mark.asyncio
+async def test_sources_without_a_feed_are_not_probed(feed, make_prober):
+    plain = source("https://regulator.gov/rules/fees")
+    plain.scraping_rules = {}
+
+    assert await tick(make_prober, [plain]) == set()
+    assert feed.requests == []
@@ -0,0 +1,231 @@
+"""Tests for the per-host circuit breaker."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.circuit_breaker import (
+    BreakerState,
+    HostCircuitBreaker,
+)
+from app.api.modules.v1.scraping.service.cloudscrapper_service import (
+    FetchResult,
+    SourceFetchError,
+)
+from app.api.modules.v1.scraping.service.deadline import ScrapeDeadlineExceeded
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+from app.api.modules.v1.scraping.service.tasks import _breaker_fetch_observer, _is_host_failure
+
+
+class FakeRedis:
+    """In-memory subset of synchronous Redis used by the breaker."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.strings = {}
+        self.sets = {}
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def expire(self, key, seconds):
+        return True
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.strings.pop(key, None)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPE_BREAKER_MIN_REQUESTS", 4)
+    monkeypatch.setattr(settings, "SCRAPE_BREAKER_FAILURE_RATIO", 0.5)
+    monkeypatch.setattr(settings, "SCRAPE_BREAKER_OPEN_SECONDS", 300)
+    return HostCircuitBreaker(FakeRedis(), clock=clock)
+
+
+def test_stays_closed_below_minimum_requests(breaker):
+    for _ in range(3):
+        breaker.record_failure("a.gov")
+
+    assert breaker.allow("a.gov").allowed
+    assert breaker.status("a.gov")["state"] == BreakerState.CLOSED
+
+
+def test_opens_on_failure_ratio_and_denies_with_retry_time(breaker, clock):
+    breaker.record_success("a.gov")
+    for _ in range(3):
+        breaker.record_failure("a.gov")
+
+    decision = breaker.allow("a.gov")
+    assert not decision.allowed
+    assert decision.state == BreakerState.OPEN
+    assert decision.retry_at.timestamp() >= clock.now + 300
+    assert breaker.allow("b.gov").allowed
+
+
+def test_half_open_lets_single_probe_then_closes_on_success(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure("a.gov")
+    clock.now += 301
+
+    probe = breaker.allow("a.gov")
+    other = breaker.allow("a.gov")
+
+    assert probe.allowed and probe.probe
+    assert not other.allowed and other.state == BreakerState.HALF_OPEN
+
+    breaker.record_success("a.gov")
+    assert breaker.allow("a.gov").allowed
+    assert breaker.status("a.gov")["failures"] == 0
+
+
+def test_failed_probe_reopens_with_longer_cooldown(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure("a.gov")
+    clock.now += 301
+    assert breaker.allow("a.gov").probe
+
+    breaker.record_failure("a.gov")
+
+    status = breaker.status("a.gov")
+    assert status["state"] == BreakerState.OPEN
+    assert status["trips"] == 2
+    clock.now += 301
+    assert not breaker.allow("a.gov").allowed
+
+
+def test_old_failures_leave_the_window(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure("a.gov")
+    clock.now += settings.SCRAPE_BREAKER_WINDOW_SECONDS + 60
+    breaker.record_failure("a.gov")
+
+    assert breaker.allow("a.gov").allowed
+
+
+def test_statuses_lists_open_hosts_first_and_reset_closes(breaker):
+    breaker.record_failure("slow.gov")
+    for _ in range(4):
+        breaker.record_failure("down.gov")
+
+    assert [entry["host"] for entry in breaker.statuses()] == ["down.gov", "slow.gov"]
+
+    breaker.reset("down.gov")
+    assert breaker.allow("down.gov").allowed
+    assert [entry["host"] for entry in breaker.statuses()] == ["slow.gov"]
+
+
+def test_only_fetch_failures_count_against_host():
+    assert _is_host_failure(SourceFetchError("down"))
+    assert _is_host_failure(ScrapeDeadlineExceeded("fetch", 60))
+    assert not _is_host_failure(ScrapeDeadlineExceeded("ai_extraction", 60))
+    assert not _is_host_failure(ValueError("LLM returned junk"))
+
+
+def open_breaker(breaker, clock, host="a.gov"):
+    for _ in range(4):
+        breaker.record_failure(host)
+    clock.now += 301
+    assert breaker.allow(host).probe
+
+
+def test_observer_records_only_host_failures(breaker, clock):
+    open_breaker(breaker, clock)
+    observe = _breaker_fetch_observer(breaker, "a.gov")
+
+    observe(ValueError("LLM returned junk"))
+    assert breaker.status("a.gov")["state"] == BreakerState.HALF_OPEN
+
+    observe(SourceFetchError("down"))
+    assert breaker.status("a.gov")["state"] == BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_probe_closes_on_fetch_success_even_if_a_later_stage_fails(breaker, clock):
+    open_breaker(breaker, clock)
+    project = SimpleNamespace(id=uuid.uuid4(), org_id=uuid.uuid4(), master_prompt="")
+    source = SimpleNamespace(
+        id=uuid.uuid4(),
+        name="Fees",
+        url="https://a.gov/fees",
+        scraping_rules={},
+        auth_details_encrypted=None,
+        noise_model=None,
+        jurisdiction=SimpleNamespace(id=uuid.uuid4(), project=project, prompt=""),
+        latest_revision_id=None,
+    )
+    db = AsyncMock()
+    loaded = MagicMock()
+    loaded.scalars.return_value.first.side_effect = [source, None]
+    db.execute = AsyncMock(return_value=loaded)
+    service = ScraperService(db)
+    service.http_client.fetch = AsyncMock(return_value=FetchResult.from_bytes(b"<p>Fees</p>"))
+    service.text_extractor = MagicMock()
+    service.text_extractor.process_pipeline = AsyncMock(side_effect=RuntimeError("minio down"))
+    service.fetch_observer = _breaker_fetch_observer(breaker, "a.gov")
+
+    with pytest.raises(RuntimeError):
+        await service._run_pipeline(str(source.id))
+
+    assert breaker.status("a.gov")["state"] == BreakerState.CLOSED
@@ -0,0 +1,221 @@
+"""Tests for the scrape dead-letter stream, its replay throttling and the host limiter."""
+
+import itertools
+import json
+
+import pytest
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.dead_letter import (
+    DLQ_STREAM_KEY,
+    LEGACY_DLQ_KEY,
+    DeadLetterQueue,
+)
+from app.api.modules.v1.scraping.service.host_limiter import HostRateLimiter, host_for
+
+
+class FakeStreamRedis:
+    """In-memory subset of the synchronous Redis commands used by the DLQ."""
+
+    def __init__(self):
+        self.streams = {}
+        self.hashes = {}
+        self.counters = {}
+        self.lists = {}
+        self._seq = itertools.count(1)
+
+    # streams
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        entry_id = f"{next(self._seq)}-0"
+        stream = self.streams.setdefault(key, [])
+        stream.append((entry_id, dict(fields)))
+        if maxlen is not None:
+            del stream[: max(0, len(stream) - maxlen)]
+        return entry_id
+
+    def xdel(self, key, *ids):
+        stream = self.streams.get(key, [])
+        self.streams[key] = [row for row in stream if row[0] not in ids]
+
+    def xlen(self, key):
+        return len(self.streams.get(key, []))
+
+    @staticmethod
+    def _ms(entry_id):
+        return int(entry_id.split("-")[0])
+
+    def _in_range(self, entry_id, low, high):
+        ms = self._ms(entry_id)
+        if low.startswith("("):
+            lower_ok = ms > self._ms(low[1:])
+        else:
+            lower_ok = low == "-" or ms >= self._ms(low)
+        if high.startswith("("):
+            upper_ok = ms < self._ms(high[1:])
+        else:
+            upper_ok = high == "+" or ms <= self._ms(high)
+        return lower_ok and upper_ok
+
+    def xrange(self, key, min="-", max="+", count=None):
+        rows = [row for row in self.streams.get(key, []) if self._in_range(row[0], min, max)]
+        return rows[:count] if count else rows
+
+    def xrevrange(self, key, max="+", min="-", count=None):
+        rows = list(reversed(self.xrange(key, min=min, max=max)))
+        return rows[:count] if count else rows
+
+    def xtrim(self, key, minid):
+        floor = self._ms(minid)
+        self.streams[key] = [row for row in self.streams.get(key, []) if self._ms(row[0]) >= floor]
+
+    # hashes
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+    # counters and lists
+    def incr(self, key):
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+    def decr(self, key):
+        self.counters[key] -= 1
+        return self.counters[key]
+
+    def expire(self, key, seconds):
+        return True
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    def rpop(self, key):
+        items = self.lists.get(key, [])
+        return items.pop() if items else None
+
+
+@pytest.fixture
+def redis_client():
+    return FakeStreamRedis()
+
+
+@pytest.fixture
+def dlq(redis_client, monkeypatch):
+    # Stream IDs in the fake are small integers, so disable time-based trimming.
+    monkeypatch.setattr(DeadLetterQueue, "_trim_expired", lambda self: None)
+    return DeadLetterQueue(redis_client, maxlen=1000)
+
+
+def test_host_for_normalizes_urls():
+    assert host_for("https://User@Example.GOV:8443/path") == "example.gov"
+    assert host_for(None) == "unknown"
+    assert host_for("not a url") == "unknown"
+
+
+def test_add_deduplicates_by_source_and_counts_failures(dlq, redis_client):
+    dlq.add("src-1", "https://a.gov/x", "TimeoutError", "slow")
+    dlq.add("src-2", "https://b.gov/y", "HTTPError", "503")
+    dlq.add("src-1", "https://a.gov/x", "HTTPError", "502")
+
+    assert len(dlq) == 2
+    entry = dlq.entries(source_id="src-1")[0]
+    assert entry["failures"] == 2
+    assert entry["error_class"] == "HTTPError"
+
+
+def test_summary_groups_by_source_host_and_error_class(dlq):
+    for i in range(3):
+        dlq.add(f"a-{i}", "https://a.gov", "TimeoutError", "slow")
+    dlq.add("b-0", "https://b.gov", "HTTPError", "404")
+
+    summary = dlq.summary()
+
+    assert summary["total"] == 4
+    assert summary["by_host"][0] == {"key": "a.gov", "count": 3}
+    assert {"key": "HTTPError", "count": 1} in summary["by_error_class"]
+    assert len(summary["by_source"]) == 4
+
+
+def test_entries_filters_and_paginates_across_chunks(dlq, monkeypatch):
+    monkeypatch.setattr("app.api.modules.v1.scraping.service.dead_letter.SCAN_CHUNK", 2)
+    for i in range(5):
+        dlq.add(f"src-{i}", "https://a.gov", "TimeoutError", "slow")
+
+    newest = dlq.entries(limit=3)
+    assert [entry["source_id"] for entry in newest] == ["src-4", "src-3", "src-2"]
+    assert len(list(dlq.iter_entries())) == 5
+
+
+def test_replay_respects_host_limit_and_keeps_throttled_entries(dlq, redis_client):
+    for i in range(5):
+        dlq.add(f"a-{i}", "https://a.gov", "TimeoutError", "slow")
+    dlq.add("b-0", "https://b.gov", "TimeoutError", "slow")
+    sent = []
+
+    result = dlq.replay(
+        batch_size=10,
+        limiter=HostRateLimiter(redis_client, max_requests=2, window_seconds=60),
+        send=lambda source_id, queue: sent.append((source_id, queue)),
+    )
+
+    assert [source_id for source_id, _ in sent] == ["a-0", "a-1", "b-0"]
+    assert all(queue == settings.SCRAPE_QUEUE_DEFAULT for _, queue in sent)
+    assert result["throttled"] == 3
+    assert result["remaining"] == 3
+    assert dlq.entries(source_id="a-0") == []
+
+
+def test_replay_batch_is_capped_by_queue_backlog(dlq, redis_client, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPE_QUEUE_MAX_BACKLOG", 4)
+    redis_client.lists[settings.SCRAPE_QUEUE_DEFAULT] = ["queued"] * 3
+    for i in range(5):
+        dlq.add(f"src-{i}", f"https://host-{i}.gov", "TimeoutError", "slow")
+    sent = []
+
+    result = dlq.replay(batch_size=50, send=lambda source_id, queue: sent.append(source_id))
+
+    assert result["budget"] == 1
+    assert sent == ["src-0"]
+
+
+def test_replay_dry_run_does_not_dispatch(dlq):
+    dlq.add("src-1", "https://a.gov", "TimeoutError", "slow")
+
+    result = dlq.replay(dry_run=True, send=lambda *args: pytest.fail("dispatched"))
+
+    assert result["source_ids"] == ["src-1"]
+    assert len(dlq) == 1
+
+
+def test_migrate_legacy_list_keeps_newest_failure(dlq, redis_client):
+    for message in ("first", "second"):
+        redis_client.lpush(
+            LEGACY_DLQ_KEY,
+            json.dumps({"source_id": "src-1", "error_message": message, "task_id": "t"}),
+        )
+    redis_client.lpush(LEGACY_DLQ_KEY, "not json")
+
+    assert dlq.migrate_legacy() == 2
+    assert redis_client.llen(LEGACY_DLQ_KEY) == 0
+    [entry] = dlq.entries()
+    assert entry["error_message"] == "second"
+    assert entry["failures"] == 2
+
+
+def test_stream_is_capped(redis_client, monkeypatch):
+    monkeypatch.setattr(DeadLetterQueue, "_trim_expired", lambda self: None)
+    dlq = DeadLetterQueue(redis_client, maxlen=3)
+    for i in range(5):
+        dlq.add(f"src-{i}", "https://a.gov", "TimeoutError", "slow")
+
+    assert redis_client.xlen(DLQ_STREAM_KEY) == 3
+    # Index slots of trimmed entries are treated as gone.
+    dlq.add("src-0", "https://a.gov", "TimeoutError", "slow")
+    assert dlq.entries(source_id="src-0")[0]["failures"] == 1
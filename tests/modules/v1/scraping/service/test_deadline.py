@@ -0,0 +1,88 @@
+"""Tests for the per-scrape deadline budget."""
+
+import asyncio
+
+import pytest
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.deadline import (
+    ScrapeDeadline,
+    ScrapeDeadlineExceeded,
+    resolve_time_budget,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_resolve_time_budget_prefers_valid_source_rule():
+    default = settings.SCRAPE_TIME_BUDGET_SECONDS
+    assert resolve_time_budget({"time_budget_seconds": 45}) == 45
+    assert resolve_time_budget({"time_budget_seconds": "bad"}) == default
+    assert resolve_time_budget({"time_budget_seconds": 0}) == default
+    assert resolve_time_budget(None) == default
+
+
+def test_remaining_shrinks_across_stages_and_keeps_clock_on_reset():
+    clock = FakeClock()
+    deadline = ScrapeDeadline(60, clock=clock)
+
+    clock.now = 20
+    assert deadline.remaining() == 40
+
+    deadline.reset_budget(30)
+    assert deadline.remaining() == 10
+
+    clock.now = 100
+    assert deadline.remaining() == 0
+
+
+@pytest.mark.asyncio
+async def test_stage_cancels_work_and_reports_stage():
+    deadline = ScrapeDeadline(0.05)
+    cancelled = asyncio.Event()
+
+    async def slow_fetch():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(ScrapeDeadlineExceeded) as exc_info:
+        async with deadline.stage("fetch"):
+            await slow_fetch()
+
+    assert exc_info.value.stage == "fetch"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stage_fails_fast_when_budget_already_spent():
+    clock = FakeClock()
+    deadline = ScrapeDeadline(10, clock=clock)
+    clock.now = 10
+    ran = False
+
+    with pytest.raises(ScrapeDeadlineExceeded) as exc_info:
+        async with deadline.stage("ai_extraction"):
+            ran = True
+
+    assert exc_info.value.stage == "ai_extraction"
+    assert ran is False
+
+
+@pytest.mark.asyncio
+async def test_stage_does_not_mask_unrelated_timeouts():
+    deadline = ScrapeDeadline(60)
+
+    with pytest.raises(TimeoutError) as exc_info:
+        async with deadline.stage("archive"):
+            raise TimeoutError("socket timed out")
+
+    assert not isinstance(exc_info.value, ScrapeDeadlineExceeded)
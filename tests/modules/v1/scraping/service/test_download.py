@@ -0,0 +1,89 @@
+"""Tests for bounded-memory download bodies."""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.api.core.config import settings
+from app.api.modules.v1.scraping.service.cloudscrapper_service import HTTPClientService
+from app.api.modules.v1.scraping.service.download import (
+    DownloadTooLargeError,
+    SpooledDownload,
+    resolve_max_download_bytes,
+)
+from app.api.modules.v1.scraping.service.playwright_service import PlaywrightService
+
+
+def test_body_hashes_while_streaming_and_rolls_to_disk():
+    chunks = [b"a" * 600, b"b" * 600]
+    with SpooledDownload(max_bytes=10_000, spool_bytes=1000) as body:
+        body.write_chunks(chunks)
+        assert body.head(3) == b"aaa"
+        body.write(b"c")
+
+        assert body.size == 1201
+        assert body.sha256 == hashlib.sha256(b"".join(chunks) + b"c").hexdigest()
+        assert body._file._rolled
+        assert body.read_bytes().endswith(b"bc")
+
+
+def test_body_rejects_data_over_the_cap():
+    with SpooledDownload(max_bytes=10) as body:
+        body.write(b"12345")
+        with pytest.raises(DownloadTooLargeError):
+            body.write(b"678901")
+        assert body.size == 5
+
+
+def test_resolve_max_download_bytes():
+    assert resolve_max_download_bytes({"max_download_bytes": 1024}) == 1024
+    assert resolve_max_download_bytes({"max_download_bytes": "junk"}) == (
+        settings.SCRAPE_MAX_DOWNLOAD_BYTES
+    )
+    assert resolve_max_download_bytes(None) == settings.SCRAPE_MAX_DOWNLOAD_BYTES
+
+
+def test_sync_get_rejects_oversized_declared_length_without_reading():
+    service = HTTPClientService()
+    response = MagicMock(status_code=200)
+    response.headers = {"content-type": "application/pdf", "content-length": "5000"}
+
+    with patch.object(service.scraper, "get", return_value=response):
+        with pytest.raises(DownloadTooLargeError):
+            service._sync_get("https://example.gov/gazette.pdf", max_bytes=1000)
+
+    response.iter_content.assert_not_called()
+    response.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_oversized_download_does_not_escalate_to_playwright():
+    service = HTTPClientService()
+    response = MagicMock(status_code=200)
+    response.headers = {"content-type": "application/pdf"}
+    response.iter_content.return_value = [b"x" * 600, b"x" * 600]
+
+    with (
+        patch.object(service.scraper, "get", return_value=response),
+        patch.object(service.browser, "scrape") as mock_scrape,
+    ):
+        with pytest.raises(DownloadTooLargeError):
+            await service.fetch("https://example.gov/gazette.pdf", max_bytes=1000)
+
+    mock_scrape.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_browser_download_is_capped(tmp_path):
+    path = tmp_path / "gazette.pdf"
+    path.write_bytes(b"%PDF" + b"x" * 100)
+    download = MagicMock(suggested_filename="gazette.pdf")
+
+    async def download_path():
+        return str(path)
+
+    download.path = download_path
+
+    with pytest.raises(DownloadTooLargeError):
+        await PlaywrightService()._handle_download_stream(download, max_bytes=50)
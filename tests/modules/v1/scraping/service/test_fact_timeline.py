@@ -0,0 +1,123 @@
+"""Tests for the extracted fact timeline."""
+
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.v1.scraping.models.extracted_fact import ExtractedFact
+from app.api.modules.v1.scraping.service.fact_timeline import (
+    FactTimelineService,
+    facts_from_result,
+    parse_number,
+)
+
+SOURCE_ID = uuid.uuid4()
+MARCH = datetime(2026, 3, 11, 8, 15)
+SEPTEMBER = datetime(2026, 9, 2, 8, 15)
+
+
+class FakeSession:
+    """Holds one source's facts; answers the open-facts query and records adds."""
+
+    def __init__(self, facts=()):
+        self.facts = list(facts)
+        self.flushes = 0
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            fact for fact in self.facts if fact.valid_to is None
+        ]
+        return result
+
+    def add(self, fact):
+        self.facts.append(fact)
+
+    async def flush(self):
+        self.flushes += 1
+
+
+def open_fact(key, value):
+    return ExtractedFact(
+        source_id=SOURCE_ID, key=key, value=value, valid_from=MARCH, revision_id=uuid.uuid4()
+    )
+
+
+def test_facts_are_read_as_text_like_postgres():
+    result = {
+        "extracted_data": {
+            "key_value_pairs": {"fee": "1,200 NGN", "year": 2025, "open": True, "note": None}
+        }
+    }
+
+    assert facts_from_result(result) == {"fee": "1,200 NGN", "year": "2025", "open": "true"}
+    assert facts_from_result({"extracted_data": {"key_value_pairs": ["fee"]}}) == {}
+    assert facts_from_result(None) == {}
+
+
+def test_numbers_ignore_thousands_separators():
+    assert parse_number("1,200 NGN") == 1200.0
+    assert parse_number("-3.5%") == -3.5
+    assert parse_number("pending") is None
+
+
+@pytest.mark.asyncio
+async def test_first_revision_opens_every_fact():
+    db = FakeSession()
+    revision_id = uuid.uuid4()
+
+    update = await FactTimelineService(db).apply(
+        SOURCE_ID, revision_id, {"fee": "1,000 NGN", "deadline": "31 May"}, MARCH
+    )
+
+    assert update.opened == ["fee", "deadline"] and update.closed == []
+    fee = db.facts[0]
+    assert (fee.numeric_value, fee.valid_from, fee.valid_to) == (1000.0, MARCH, None)
+    assert fee.revision_id == revision_id
+
+
+@pytest.mark.asyncio
+async def test_changed_and_dropped_facts_close_and_unchanged_stay_open():
+    fee, deadline, form = (
+        open_fact("fee", "1,000 NGN"),
+        open_fact("deadline", "31 May"),
+        open_fact("form", "CAC-1"),
+    )
+    db = FakeSession([fee, deadline, form])
+
+    update = await FactTimelineService(db).apply(
+        SOURCE_ID,
+        uuid.uuid4(),
+        {"fee": "1,200 NGN", "form": "CAC-1", "portal": "online"},
+        SEPTEMBER,
+    )
+
+    assert sorted(update.closed) == ["deadline", "fee"]
+    assert sorted(update.opened) == ["fee", "portal"]
+    assert fee.valid_to == SEPTEMBER and deadline.valid_to == SEPTEMBER
+    assert form.valid_to is None
+    assert db.flushes == 1
+    new_fee = next(f for f in db.facts if f.key == "fee" and f.valid_to is None)
+    assert (new_fee.value, new_fee.valid_from) == ("1,200 NGN", SEPTEMBER)
+
+
+@pytest.mark.asyncio
+async def test_queries_are_scoped_to_the_organization():
+    db = FakeSession()
+    org_id = uuid.uuid4()
+    service = FactTimelineService(db)
+
+    await service.key_timeline(org_id, "fee", since=MARCH)
+    await service.changed_since(org_id, SEPTEMBER, key="fee")
+
+    timeline, changes = (str(s.compile(dialect=postgresql.dialect())) for s in db.statements)
+    for sql in (timeline, changes):
+        assert "JOIN projects ON projects.id = jurisdictions.project_id" in sql
+        assert "projects.org_id = " in sql
+    assert "ORDER BY extracted_facts.valid_from, extracted_facts.id" in timeline
+    assert "extracted_facts.valid_from >= " in changes and "extracted_facts.valid_to >= " in changes
@@ -0,0 +1,183 @@
+"""Tests for the fair-share scrape scheduler, including a skewed-load simulation."""
+
+import math
+from collections import deque
+from itertools import islice
+
+import pytest
+
+from app.api.modules.v1.billing.models.billing_plan import PlanTier
+from app.api.modules.v1.scraping.models.source_model import ScrapeFrequency
+from app.api.modules.v1.scraping.service.fair_queue import (
+    TENANT_LATENCY_KEY,
+    DeficitRoundRobinScheduler,
+    PriorityClass,
+    parse_latency_report,
+    parse_plan_weights,
+    priority_class_for,
+    record_queue_latency,
+    tenant_weight,
+)
+
+
+class FakeRedis:
+    """Minimal synchronous hash store."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def simulate(backlogs, weights, budget_per_tick, fair=True, max_ticks=1000):
+    """Simulate dispatcher ticks against per-tenant backlogs.
+
+    Each backlog is a list of due ticks (oldest first). On every tick the
+    dispatcher may start ``budget_per_tick`` scrapes, mirroring the free slots of
+    a Celery queue that workers fully drain between ticks. Like the dispatcher,
+    at most ``budget_per_tick`` candidates are loaded per tenant.
+
+    Returns:
+        dict: Worst due-to-start wait in ticks per tenant.
+    """
+    pending = {tenant: deque(items) for tenant, items in backlogs.items()}
+    worst_wait = {tenant: 0 for tenant in backlogs}
+    deficits = {}
+
+    for tick in range(max_ticks):
+        if not any(pending.values()):
+            break
+        due = {
+            tenant: [d for d in islice(items, budget_per_tick) if d <= tick]
+            for tenant, items in pending.items()
+        }
+
+        if fair:
+            scheduler = DeficitRoundRobinScheduler(deficits=deficits)
+            for tenant in sorted((t for t in due if due[t]), key=lambda t: due[t][0]):
+                for due_tick in due[tenant]:
+                    scheduler.enqueue(tenant, due_tick, weight=weights.get(tenant, 1))
+            selected = scheduler.select(budget_per_tick)
+            deficits = scheduler.deficits
+        else:
+            flat = sorted((d, t) for t, items in due.items() for d in items)
+            selected = [(t, d) for d, t in flat[:budget_per_tick]]
+
+        for tenant, due_tick in selected:
+            pending[tenant].popleft()
+            worst_wait[tenant] = max(worst_wait[tenant], tick - due_tick)
+
+    assert not any(pending.values()), "simulation did not drain"
+    return worst_wait
+
+
+def test_priority_class_for_frequency():
+    assert priority_class_for(ScrapeFrequency.HOURLY) == PriorityClass.HOURLY
+    assert priority_class_for(ScrapeFrequency.DAILY) == PriorityClass.DAILY
+    assert priority_class_for(ScrapeFrequency.MONTHLY) == PriorityClass.DAILY
+
+
+def test_parse_plan_weights_ignores_malformed_entries():
+    weights = parse_plan_weights("essential:1, ENTERPRISE:4,broken,PROFESSIONAL:x,ZERO:0")
+    assert weights == {"ESSENTIAL": 1, "ENTERPRISE": 4, "ZERO": 1}
+    assert tenant_weight(PlanTier.ENTERPRISE, weights) == 4
+    assert tenant_weight(None, weights) >= 1
+
+
+def test_drr_respects_weights():
+    scheduler = DeficitRoundRobinScheduler()
+    for i in range(100):
+        scheduler.enqueue("enterprise", i, weight=4)
+        scheduler.enqueue("essential", i, weight=1)
+
+    selected = scheduler.select(50)
+    counts = {"enterprise": 0, "essential": 0}
+    for tenant, _ in selected:
+        counts[tenant] += 1
+
+    assert counts == {"enterprise": 40, "essential": 10}
+    assert len(scheduler) == 150
+
+
+def test_drr_carries_deficit_across_calls():
+    scheduler = DeficitRoundRobinScheduler()
+    for i in range(10):
+        scheduler.enqueue("a", i, weight=3)
+        scheduler.enqueue("b", i, weight=1)
+
+    first = scheduler.select(2)
+    assert [tenant for tenant, _ in first] == ["a", "a"]
+    assert scheduler.deficits["a"] == 1
+
+    resumed = DeficitRoundRobinScheduler(deficits=scheduler.deficits)
+    for i in range(2, 10):
+        resumed.enqueue("a", i, weight=3)
+    for i in range(10):
+        resumed.enqueue("b", i, weight=1)
+    assert [tenant for tenant, _ in resumed.select(5)] == ["a", "a", "a", "a", "b"]
+
+
+def test_drr_forfeits_credit_when_queue_drains():
+    scheduler = DeficitRoundRobinScheduler()
+    scheduler.enqueue("a", 1, weight=5)
+    scheduler.select(10)
+    assert "a" not in scheduler.deficits
+
+
+@pytest.mark.parametrize("budget", [50, 200])
+def test_simulation_bounded_latency_under_skewed_load(budget):
+    """A 20k bulk import must not delay small tenants beyond their fair share."""
+    small_tenants = [f"org-{i}" for i in range(4)]
+    backlogs = {"bulk-importer": [0] * 20_000}
+    for tenant in small_tenants:
+        backlogs[tenant] = [1] * 30 + [60] * 30
+
+    fair_wait = simulate(backlogs, {}, budget)
+    fifo_wait = simulate(backlogs, {}, budget, fair=False)
+
+    fair_share = budget / len(backlogs)
+    bound = math.ceil(30 / fair_share)
+    for tenant in small_tenants:
+        assert fair_wait[tenant] <= bound
+        assert fifo_wait[tenant] > 10 * max(bound, 1)
+
+
+def test_simulation_plan_weights_shorten_latency():
+    backlogs = {"bulk": [0] * 5_000, "enterprise": [0] * 400, "essential": [0] * 400}
+    weights = {"enterprise": 4, "essential": 1, "bulk": 1}
+
+    wait = simulate(backlogs, weights, budget_per_tick=60)
+
+    assert wait["enterprise"] < wait["essential"]
+    assert wait["enterprise"] <= math.ceil(400 / (60 * 4 / 6))
+
+
+def test_simulation_many_tenants_small_budget_no_starvation():
+    """With more tenants than slots per tick, every tenant still progresses."""
+    backlogs = {f"org-{i:02d}": [0] * 5 for i in range(40)}
+
+    wait = simulate(backlogs, {}, budget_per_tick=8)
+
+    assert max(wait.values()) <= math.ceil(200 / 8)
+
+
+def test_record_queue_latency_tracks_ewma():
+    redis_client = FakeRedis()
+
+    record_queue_latency(redis_client, "org-1", "scraping.hourly", 10)
+    stats = record_queue_latency(redis_client, "org-1", "scraping.hourly", 20)
+    record_queue_latency(redis_client, "org-2", "scraping.default", 1)
+
+    assert stats["samples"] == 2
+    assert stats["last_seconds"] == 20
+    assert stats["ewma_seconds"] == pytest.approx(12.0)
+
+    report = parse_latency_report(redis_client.hgetall(TENANT_LATENCY_KEY))
+    assert [entry["organization_id"] for entry in report] == ["org-1", "org-2"]
@@ -0,0 +1,232 @@
+"""Tests for the shared fetch cache."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.modules.v1.scraping.service import fetch_cache as fetch_cache_module
+from app.api.modules.v1.scraping.service.cloudscrapper_service import (
+    FetchResult,
+    HTTPClientService,
+)
+from app.api.modules.v1.scraping.service.fetch_cache import (
+    SharedFetchCache,
+    cache_digest,
+    normalize_url,
+)
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+
+
+class FakeRedis:
+    """In-memory subset of async Redis used by the fetch cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def objects(monkeypatch):
+    store = {}
+
+    def upload(stream, length, bucket, name):
+        store[(bucket, name)] = stream.read(length)
+        return name
+
+    def download(name, write, bucket):
+        if (bucket, name) not in store:
+            return False
+        write(store[(bucket, name)])
+        return True
+
+    monkeypatch.setattr(fetch_cache_module, "upload_raw_stream", upload)
+    monkeypatch.setattr(fetch_cache_module, "stream_raw_content_from_minio", download)
+    return store
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(objects, clock):
+    return SharedFetchCache(
+        FakeRedis(), ttl_seconds=300, lock_seconds=5, poll_interval=0.01, clock=clock
+    )
+
+
+async def fetch_bytes(cache, url, fetcher):
+    with await cache.fetch(url, fetcher) as body:
+        return body.read_bytes()
+
+
+def make_fetcher(results, calls):
+    async def fetcher(etag, last_modified):
+        calls.append((etag, last_modified))
+        await asyncio.sleep(0.02)
+        return results.pop(0)
+
+    return fetcher
+
+
+def test_normalize_url_collapses_equivalent_spellings():
+    assert normalize_url("HTTPS://User@Example.GOV:443/a?b=2&a=1#top") == (
+        "https://example.gov/a?a=1&b=2"
+    )
+    assert normalize_url("http://example.gov:8080") == "http://example.gov:8080/"
+    assert cache_digest("https://example.gov/?b=2&a=1") == cache_digest(
+        "https://EXAMPLE.gov/?a=1&b=2"
+    )
+    assert cache_digest("https://example.gov/") != cache_digest(
+        "https://example.gov/", auth_context="org-1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fresh_copy_is_shared_across_sources(cache):
+    calls = []
+    fetcher = make_fetcher([FetchResult.from_bytes(b"page", etag='"v1"')], calls)
+
+    first = await fetch_bytes(cache, "https://example.gov/law", fetcher)
+    second = await fetch_bytes(cache, "https://EXAMPLE.gov/law#section", fetcher)
+
+    assert first == second == b"page"
+    assert calls == [(None, None)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_collapse_into_one_request(cache):
+    calls = []
+    fetcher = make_fetcher([FetchResult.from_bytes(b"page")], calls)
+
+    results = await asyncio.gather(
+        *(fetch_bytes(cache, "https://example.gov/law", fetcher) for _ in range(4))
+    )
+
+    assert results == [b"page"] * 4
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_copy_is_revalidated_with_validators(cache, clock):
+    calls = []
+    fetcher = make_fetcher(
+        [
+            FetchResult.from_bytes(
+                b"page", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+            ),
+            FetchResult.from_bytes(b"", status_code=304),
+        ],
+        calls,
+    )
+    await fetch_bytes(cache, "https://example.gov/law", fetcher)
+    clock.now += 301
+
+    content = await fetch_bytes(cache, "https://example.gov/law", fetcher)
+
+    assert content == b"page"
+    assert calls[1] == ('"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+    # The 304 refreshed the copy, so the next call is a plain hit.
+    assert await fetch_bytes(cache, "https://example.gov/law", fetcher) == b"page"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_only_origin_requests_are_reported_to_the_fetch_observer(cache, clock):
+    service = ScraperService(AsyncMock())
+    service.fetch_cache = cache
+    service.http_client.fetch = AsyncMock(
+        side_effect=[
+            FetchResult.from_bytes(b"page", etag='"v1"'),
+            FetchResult.from_bytes(b"", status_code=304),
+        ]
+    )
+    observed = []
+    service.fetch_observer = observed.append
+    source = SimpleNamespace(
+        url="https://example.gov/law", scraping_rules={}, auth_details_encrypted=None
+    )
+    deadline = MagicMock(remaining=MagicMock(return_value=30))
+
+    async def fetch_source():
+        with await service._fetch_source(source, {}, deadline) as body:
+            return body.read_bytes()
+
+    assert await fetch_source() == b"page"
+    assert observed == [None]
+
+    # A fresh cached copy never reached the host, so it says nothing about it.
+    assert await fetch_source() == b"page"
+    assert observed == [None]
+
+    clock.now += 301
+    assert await fetch_source() == b"page"
+    assert observed == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_missing_object_is_treated_as_a_miss(cache, objects):
+    calls = []
+    fetcher = make_fetcher([FetchResult.from_bytes(b"one"), FetchResult.from_bytes(b"two")], calls)
+    await fetch_bytes(cache, "https://example.gov/law", fetcher)
+    objects.clear()
+
+    assert await fetch_bytes(cache, "https://example.gov/law", fetcher) == b"two"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_bypasses_cache_when_redis_is_down(objects):
+    redis_client = MagicMock()
+    redis_client.get.side_effect = fetch_cache_module.RedisError("down")
+    cache = SharedFetchCache(redis_client)
+    calls = []
+
+    content = await fetch_bytes(
+        cache, "https://example.gov", make_fetcher([FetchResult.from_bytes(b"x")], calls)
+    )
+
+    assert content == b"x"
+    assert objects == {}
+
+
+def test_sync_get_sends_conditional_headers_and_handles_304():
+    service = HTTPClientService()
+    response = MagicMock(status_code=304, headers={"etag": '"v1"'})
+    with patch.object(service.scraper, "get", return_value=response) as mock_get:
+        result = service._sync_get("https://example.gov", 5, {"If-None-Match": '"v1"'})
+
+    mock_get.assert_called_once_with(
+        "https://example.gov", timeout=5, headers={"If-None-Match": '"v1"'}, stream=True
+    )
+    assert result.not_modified
+    assert result.etag == '"v1"'
+    response.raise_for_status.assert_not_called()
@@ -0,0 +1,136 @@
+"""Tests for incremental re-extraction from changed sections."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from app.api.modules.v1.scraping.service.llm_service import (
+    AIExtractionService,
+    AIExtractionServiceError,
+)
+from app.api.modules.v1.scraping.service.noise_model import NoiseModel
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+
+PREVIOUS = {
+    "summary": "Fees for company registration.",
+    "markdown_summary": "## Fees",
+    "confidence_score": 0.9,
+    "extracted_data": {"key_value_pairs": {"old_fee": "10", "registration_fee": "600 NGN"}},
+    "incremental_runs": 2,
+}
+
+
+def document(fee="600 NGN", pages=20):
+    lines = ["Companies Regulations", "Issued by the Registrar."]
+    for n in range(1, pages + 1):
+        lines += [f"Article {n} Provisions", f"Paragraph {n} text that stays the same."]
+    lines += ["Article 99 Fees", f"Registration costs {fee}."]
+    return lines
+
+
+@pytest.fixture
+def service():
+    service = ScraperService(AsyncMock())
+    service.ai_extractor = MagicMock()
+    service.ai_extractor.run_incremental_analysis = AsyncMock(
+        return_value={"summary": "Updated", "extracted_data": {"key_value_pairs": {}}}
+    )
+    service.text_extractor = MagicMock()
+    service.text_extractor.extract_lines_from_minio = AsyncMock(return_value=document())
+    return service
+
+
+def revision(extracted_data=PREVIOUS):
+    return MagicMock(extracted_data=extracted_data, minio_object_key="raw/old.html")
+
+
+def source(rules=None):
+    return MagicMock(scraping_rules=rules or {})
+
+
+async def extract(service, last_revision, new_lines):
+    return await service._extract_incrementally(
+        source(), last_revision, new_lines, NoiseModel(), "Track fees", "Nigeria"
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_edit_sends_only_the_changed_section(service):
+    result = await extract(service, revision(), document(fee="650 NGN"))
+
+    kwargs = service.ai_extractor.run_incremental_analysis.call_args.kwargs
+    assert "+Registration costs 650 NGN." in kwargs["text_diff"]
+    assert "Paragraph 1 text" not in kwargs["text_diff"]
+    assert kwargs["previous_result"] is PREVIOUS
+    assert result["extraction_mode"] == "incremental"
+    assert result["incremental_runs"] == 3
+    service.text_extractor.extract_lines_from_minio.assert_awaited_once_with(
+        "raw-content", "raw/old.html"
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_edit_falls_back_to_full_extraction(service):
+    assert await extract(service, revision(), document(pages=2)[:3] + ["All new text."]) is None
+    service.ai_extractor.run_incremental_analysis.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_full_extraction_runs_periodically(service):
+    with patch(
+        "app.api.modules.v1.scraping.service.scraper_service.settings.SCRAPE_INCREMENTAL_FULL_EVERY",
+        3,
+    ):
+        assert await extract(service, revision(), document(fee="650 NGN")) is None
+
+
+@pytest.mark.asyncio
+async def test_missing_snapshot_or_failed_call_falls_back(service):
+    assert await extract(service, revision(extracted_data={}), document()) is None
+    assert await extract(service, None, document()) is None
+
+    service.ai_extractor.run_incremental_analysis.side_effect = AIExtractionServiceError("bad")
+    assert await extract(service, revision(), document(fee="650 NGN")) is None
+
+    service.text_extractor.extract_lines_from_minio.return_value = []
+    assert await extract(service, revision(), document(fee="650 NGN")) is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_analysis_merges_changes_into_previous_pairs():
+    service = AIExtractionService()
+    service.incremental_model = Mock()
+    service.incremental_model.generate_content_async = AsyncMock(
+        return_value=Mock(
+            text=json.dumps(
+                {
+                    "summary": "Fee raised to 650 NGN.",
+                    "markdown_summary": "## Fees\n- **650 NGN**",
+                    "updated_pairs": [
+                        {"key": "registration_fee", "value": "650 NGN"},
+                        {"key": "late_fee", "value": "50 NGN"},
+                    ],
+                    "removed_keys": ["old_fee"],
+                    "confidence_score": 0.92,
+                }
+            )
+        )
+    )
+
+    result = await service.run_incremental_analysis(
+        previous_result=PREVIOUS,
+        text_diff="-Registration costs 600 NGN.\n+Registration costs 650 NGN.",
+        project_prompt="Track fees",
+        jurisdiction_prompt="Nigeria",
+        max_retries=0,
+    )
+
+    assert result["extracted_data"]["key_value_pairs"] == {
+        "late_fee": "50 NGN",
+        "registration_fee": "650 NGN",
+    }
+    assert result["summary"] == "Fee raised to 650 NGN."
+    prompt = service.incremental_model.generate_content_async.call_args.args[0]
+    assert "Registration costs 650 NGN" in prompt
+    assert PREVIOUS["extracted_data"]["key_value_pairs"]["old_fee"] == "10"
@@ -0,0 +1,90 @@
+"""Tests for the latest-revision pointer."""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.modules.v1.scraping.service.latest_revision import LatestRevision
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+
+SOURCE_ID = uuid.uuid4()
+
+
+def revision(hash_="abc", source_id=SOURCE_ID):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        source_id=source_id,
+        content_hash=hash_,
+        scraped_at=datetime(2026, 10, 18, 12, 0),
+        was_change_detected=True,
+    )
+
+
+def source():
+    return SimpleNamespace(
+        id=SOURCE_ID,
+        latest_revision_id=None,
+        latest_content_hash=None,
+        latest_scraped_at=None,
+        latest_change_detected=None,
+    )
+
+
+def make_service(*rows):
+    """Service whose queries return ``rows`` in order, then the history query's row."""
+    db = AsyncMock()
+    results = []
+    for row in (*rows, "from-history"):
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = row
+        results.append(result)
+    db.execute = AsyncMock(side_effect=results)
+    return ScraperService(db)
+
+
+def test_pointer_round_trips_through_the_source():
+    rev = revision()
+    src = source()
+
+    LatestRevision.from_revision(rev).apply_to(src)
+
+    assert src.latest_revision_id == rev.id
+    assert src.latest_scraped_at == rev.scraped_at
+    assert LatestRevision.from_source(src) == LatestRevision.from_revision(rev)
+    assert LatestRevision.from_source(source()) is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_loads_the_pointed_revision_from_its_partition():
+    rev = revision()
+    src = source()
+    LatestRevision.from_revision(rev).apply_to(src)
+    service = make_service(rev)
+
+    assert await service._load_latest_revision(src) is rev
+    [call] = service.db.execute.await_args_list
+    query = call.args[0].compile()
+    assert "data_revisions.scraped_at =" in str(query)
+    assert rev.scraped_at in query.params.values()
+    assert SOURCE_ID in query.params.values()
+
+
+@pytest.mark.asyncio
+async def test_missing_pointed_revision_falls_back_to_history():
+    rev = revision(source_id=uuid.uuid4())
+    src = source()
+    LatestRevision.from_revision(rev).apply_to(src)
+    service = make_service(None)
+
+    assert await service._load_latest_revision(src) == "from-history"
+
+
+@pytest.mark.asyncio
+async def test_sources_without_a_pointer_fall_back_to_history():
+    service = make_service()
+
+    assert await service._load_latest_revision(source()) == "from-history"
+    assert service.db.execute.await_count == 1
@@ -0,0 +1,93 @@
+"""Tests for the per-source volatile line model."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.modules.v1.scraping.schemas.source_service import NoiseModelUpdate
+from app.api.modules.v1.scraping.service.noise_model import NoiseModel, line_template
+
+
+def page(minute, visitors=100, fee="600 NGN"):
+    return [
+        "Registration fees",
+        f"Company registration: {fee}",
+        f"Last updated 10:{minute:02d}",
+        f"Visitors today: {visitors}",
+    ]
+
+
+def test_line_template_masks_numbers_and_tokens():
+    assert line_template("Last updated 10:32") == "Last updated #:#"
+    assert line_template("csrf a1b2c3d4e5f6a7b8c9d0") == "csrf *"
+    assert line_template("Registration fees") == "Registration fees"
+
+
+def test_lines_changing_every_fetch_without_material_change_are_learned():
+    model = NoiseModel()
+    model.observe(page(0, 100), material_change=False)
+    for fetch in range(1, 3):
+        assert model.observe(page(fetch, 100 + fetch), material_change=False) == []
+
+    learned = model.observe(page(3, 103), material_change=False)
+
+    assert sorted(learned) == ["Last updated #:#", "Visitors today: #"]
+    assert model.filter(page(59, 999)) == page(0)[:2]
+
+
+def test_changes_alongside_a_material_change_are_not_noise():
+    model = NoiseModel()
+    model.observe(page(0, fee="600 NGN"), material_change=False)
+    for fetch in range(1, 5):
+        model.observe(page(fetch, fee=f"{600 + fetch} NGN"), material_change=True)
+
+    assert model.volatile == {}
+
+
+def test_a_stable_fetch_resets_the_streak():
+    model = NoiseModel()
+    for minute in (0, 1, 2, 2, 3):
+        model.observe([f"Last updated 10:{minute:02d}"], material_change=False)
+
+    assert model.volatile == {}
+
+
+def test_overrides_pin_and_keep_lines():
+    model = NoiseModel(pinned_patterns=[r"^Visitors today"])
+    for minute in range(5):
+        model.observe([f"Last updated 10:{minute:02d}"], material_change=False)
+    model.kept_templates = ["Last updated #:#"]
+
+    assert model.filter(page(7)) == page(7)[:3]
+    assert NoiseModel.from_dict(model.to_dict()) == model
+    assert NoiseModel.from_dict(None) == NoiseModel()
+
+
+def test_invalid_pinned_pattern_is_rejected():
+    with pytest.raises(ValidationError):
+        NoiseModelUpdate(pinned_patterns=["(unclosed"])
+
+
+def test_merging_learned_state_keeps_overrides_saved_during_a_scrape():
+    scrape = NoiseModel.from_dict({"pinned_patterns": ["^Old"]})
+    for minute in range(5):
+        scrape.observe([f"Last updated 10:{minute:02d}"], material_change=False)
+    stored = {"pinned_patterns": ["^Visitors"], "kept_templates": ["Fee #"]}
+
+    merged = NoiseModel.from_dict(scrape.merge_learned_into(stored))
+
+    assert merged.pinned_patterns == ["^Visitors"]
+    assert merged.kept_templates == ["Fee #"]
+    assert merged.volatile == scrape.volatile != {}
+
+
+def test_a_reset_during_a_scrape_wins_over_its_learning():
+    scrape = NoiseModel()
+    for minute in range(5):
+        scrape.observe([f"Last updated 10:{minute:02d}"], material_change=False)
+    stored = NoiseModel(pinned_patterns=["^Visitors"])
+    stored.reset_learned()
+
+    merged = NoiseModel.from_dict(scrape.merge_learned_into(stored.to_dict()))
+
+    assert merged.volatile == {} and merged.observed == {}
+    assert merged.pinned_patterns == ["^Visitors"]
@@ -4,11 +4,21 @@ Unit tests for PDFService.
 Tests PDF text extraction and detection logic.
 """
 
+import multiprocessing
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.api.modules.v1.scraping.service.pdf_service import PDFService
+from app.api.modules.v1.scraping.service.download import SpooledDownload
+from app.api.modules.v1.scraping.service.pdf_service import (
+    PdfPageCache,
+    PDFService,
+    shutdown_pdf_pool,
+    split_pages,
+    start_pdf_pool,
+    truncate_to_pages,
+)
 
 
 @pytest.fixture
@@ -34,11 +44,26 @@ def test_extract_text_success(service):
         ),
         patch("tempfile.NamedTemporaryFile") as mock_temp,
     ):
-        mock_temp.return_value.__enter__.return_value.write = MagicMock()
-        mock_temp.return_value.__enter__.return_value.flush = MagicMock()
-        mock_temp.return_value.__enter__.return_value.name = "/tmp/test.pdf"
         result = service.extract_text(b"%PDF test")
         assert result == "Page 1 text\n\nPage 2 text"
+        mock_temp.assert_not_called()
+
+
+def test_extract_text_reads_from_spooled_download(service):
+    """PDFs are parsed straight from the spooled body, without a temp file copy."""
+    mock_pdf = MagicMock()
+    mock_page = MagicMock()
+    mock_page.extract_text.return_value = "Gazette text"
+    mock_pdf.pages = [mock_page]
+    mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
+    mock_pdf.__exit__ = MagicMock(return_value=None)
+
+    with SpooledDownload.from_bytes(b"%PDF-1.4 body") as body:
+        with patch(
+            "app.api.modules.v1.scraping.service.pdf_service.pdfplumber.open", return_value=mock_pdf
+        ) as mock_open:
+            assert service.extract_text(body.stream()) == "Gazette text"
+        mock_open.assert_called_once_with(body.stream())
 
 
 def test_extract_text_pdfplumber_not_installed(service):
@@ -66,3 +91,185 @@ def test_is_pdf_by_magic_bytes(service):
     assert service.is_pdf(b"%PDF-1.4") is True
     assert service.is_pdf(b"Not PDF") is False
     assert service.is_pdf(b"") is False
+
+
+class FakeRedis:
+    """In-memory subset of sync Redis used by the page cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def execute(self):
+        return []
+
+
+def build_pdf(objects):
+    """Serialize numbered object bodies (object 1 is the catalog) into a PDF."""
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+def make_xobject_pdf(text):
+    """Build a one-page PDF whose content stream only draws Form XObject /X0."""
+    content = b"q /X0 Do Q"
+    form = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    return build_pdf(
+        [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+            b"/Resources << /XObject << /X0 5 0 R >> >> >>",
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+            b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 6 0 R >> >> /Length %d >>\nstream\n%s\nendstream"
+            % (len(form), form),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        ]
+    )
+
+
+def make_pdf(page_texts):
+    """Build a minimal valid PDF with one line of Helvetica text per page."""
+    count = len(page_texts)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>".encode(),
+    ]
+    font = 3 + 2 * count
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    return build_pdf(objects)
+
+
+def test_extract_pages_marks_boundaries():
+    extraction = PDFService().extract_pages(make_pdf(["First page", "Second page"]))
+
+    assert [page.text for page in extraction.pages] == ["First page", "Second page"]
+    assert extraction.text == "[Page 1]\nFirst page\n\n[Page 2]\nSecond page"
+    for boundary in extraction.boundaries:
+        chunk = extraction.text[boundary["start"] : boundary["end"]]
+        assert chunk.startswith(f"[Page {boundary['page']}]")
+    assert split_pages(extraction.text) == [(1, "First page"), (2, "Second page")]
+
+
+def test_unchanged_pages_are_served_from_cache():
+    service = PDFService(page_cache=PdfPageCache(FakeRedis()))
+    first = service.extract_pages(make_pdf(["Article 1", "Article 2", "Article 3"]), "src-1")
+
+    with patch.object(service, "_extract_parallel") as parallel:
+        second = service.extract_pages(
+            make_pdf(["Article 1", "Article 2 amended", "Article 3"]), "src-1"
+        )
+        parallel.assert_not_called()
+
+    assert first.cached_pages == 0
+    assert [page.cached for page in second.pages] == [True, False, True]
+    assert second.pages[1].text == "Article 2 amended"
+    assert second.pages[0].fingerprint == first.pages[0].fingerprint
+    assert second.pages[1].fingerprint != first.pages[1].fingerprint
+
+
+def test_pages_sharing_a_content_stream_differ_by_their_resources():
+    service = PDFService(page_cache=PdfPageCache(FakeRedis()))
+    hello = service.extract_pages(make_xobject_pdf("Hello"), "src-1")
+    goodbye = service.extract_pages(make_xobject_pdf("Goodbye"), "src-1")
+
+    assert hello.pages[0].text == "Hello"
+    assert hello.pages[0].fingerprint != goodbye.pages[0].fingerprint
+    assert goodbye.pages[0].cached is False
+    assert goodbye.pages[0].text == "Goodbye"
+
+
+def test_page_cache_is_not_shared_between_sources():
+    service = PDFService(page_cache=PdfPageCache(FakeRedis()))
+    service.extract_pages(make_pdf(["Article 1"]), "src-1")
+
+    assert service.extract_pages(make_pdf(["Article 1"]), "src-2").cached_pages == 0
+    assert service.extract_pages(make_pdf(["Article 1"]), "src-1").cached_pages == 1
+
+
+@pytest.fixture
+def pdf_pool():
+    yield
+    shutdown_pdf_pool()
+
+
+@pytest.fixture
+def daemonic_process():
+    """Mark the test process daemonic, as Celery prefork children are."""
+    process = multiprocessing.current_process()
+    process._config["daemon"] = True
+    yield
+    process._config.pop("daemon", None)
+
+
+def test_large_documents_are_extracted_in_a_process_pool(pdf_pool, daemonic_process):
+    texts = [f"Section {n}" for n in range(1, 7)]
+    service = PDFService(workers=2)
+    pool = start_pdf_pool(2)
+
+    with (
+        patch(
+            "app.api.modules.v1.scraping.service.pdf_service.settings.SCRAPE_PDF_PARALLEL_MIN_PAGES",
+            4,
+        ),
+        patch.object(pool, "map", wraps=pool.map) as pool_map,
+    ):
+        extraction = service.extract_pages(make_pdf(texts))
+
+    assert [page.text for page in extraction.pages] == texts
+    pool_map.assert_called_once()
+    assert pool.submit(os.getpid).result() != os.getpid()
+    assert multiprocessing.current_process().daemon
+    assert start_pdf_pool(2) is pool
+
+
+def test_pool_failure_falls_back_to_sequential_extraction(pdf_pool):
+    with (
+        patch(
+            "app.api.modules.v1.scraping.service.pdf_service.settings.SCRAPE_PDF_PARALLEL_MIN_PAGES",
+            1,
+        ),
+        patch(
+            "app.api.modules.v1.scraping.service.pdf_service.ProcessPoolExecutor",
+            side_effect=OSError("Too many open files"),
+        ),
+    ):
+        extraction = PDFService(workers=2).extract_pages(make_pdf(["One", "Two"]))
+
+    assert [page.text for page in extraction.pages] == ["One", "Two"]
+
+
+def test_truncate_to_pages_ends_on_a_page_boundary():
+    text = "[Page 1] alpha [Page 2] beta gamma [Page 3] delta"
+
+    assert truncate_to_pages(text, 30) == "[Page 1] alpha"
+    assert truncate_to_pages(text, 1000) == text
+    assert truncate_to_pages("no markers here", 5) == "no ma"
@@ -4,11 +4,13 @@ Unit tests for PlaywrightService.
 Tests web scraping with Playwright, including downloads and auth.
 """
 
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.api.modules.v1.scraping.service.playwright_service import PlaywrightService
+from app.api.modules.v1.scraping.service.render_profile import RenderProfile
 
 
 @pytest.fixture
@@ -27,6 +29,7 @@ async def test_scrape_successful_content(service):
     mock_context = MagicMock()
     mock_context.new_page = AsyncMock(return_value=mock_page)
     mock_context.close = AsyncMock()
+    mock_context.route = AsyncMock()
     mock_browser = MagicMock()
     mock_browser.new_context = AsyncMock(return_value=mock_context)
     mock_browser.close = AsyncMock()
@@ -38,7 +41,7 @@ async def test_scrape_successful_content(service):
         mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
         mock_pw.return_value.__aenter__.return_value = mock_p
         result = await service.scrape("https://example.com")
-        assert result == b"<html>Content</html>"
+        assert result.read_bytes() == b"<html>Content</html>"
 
 
 @pytest.mark.asyncio
@@ -55,6 +58,7 @@ async def test_scrape_with_download(service):
     mock_context.new_page = AsyncMock(return_value=mock_page)
     mock_context.add_cookies = AsyncMock()
     mock_context.close = AsyncMock()
+    mock_context.route = AsyncMock()
     mock_browser = MagicMock()
     mock_browser.new_context = AsyncMock(return_value=mock_context)
     mock_browser.close = AsyncMock()
@@ -87,6 +91,7 @@ async def test_scrape_with_auth_cookies(service):
     mock_context.new_page = AsyncMock(return_value=mock_page)
     mock_context.add_cookies = AsyncMock()
     mock_context.close = AsyncMock()
+    mock_context.route = AsyncMock()
     mock_browser = MagicMock()
     mock_browser.new_context = AsyncMock(return_value=mock_context)
     mock_browser.close = AsyncMock()
@@ -104,22 +109,21 @@ async def test_scrape_with_auth_cookies(service):
         mock_context.add_cookies.assert_called_once_with(
             [{"name": "session", "value": "abc", "url": "https://example.com"}]
         )
-        assert result == b"<html>Auth content</html>"
+        assert result.read_bytes() == b"<html>Auth content</html>"
 
 
 @pytest.mark.asyncio
-async def test_handle_download_stream_success(service):
-    """Test successful download handling."""
+async def test_handle_download_stream_success(service, tmp_path):
+    """Test the downloaded file is streamed into a hashed body."""
+    path = tmp_path / "test.pdf"
+    path.write_bytes(b"File content")
     mock_download = MagicMock()
-    mock_download.path = AsyncMock(return_value="/tmp/test.pdf")
+    mock_download.path = AsyncMock(return_value=str(path))
     mock_download.suggested_filename = "test.pdf"
 
-    with patch("builtins.open", MagicMock()) as mock_open:
-        mock_file = MagicMock()
-        mock_file.read.return_value = b"File content"
-        mock_open.return_value.__enter__.return_value = mock_file
-        result = await service._handle_download_stream(mock_download)
-        assert result == b"File content"
+    with await service._handle_download_stream(mock_download) as body:
+        assert body.read_bytes() == b"File content"
+        assert body.sha256 == hashlib.sha256(b"File content").hexdigest()
 
 
 @pytest.mark.asyncio
@@ -130,3 +134,70 @@ async def test_handle_download_stream_failure(service):
 
     with pytest.raises(Exception, match="Download failed"):
         await service._handle_download_stream(mock_download)
+
+
+def test_render_profile_from_rules():
+    lean = RenderProfile.from_rules({"wait_for_selector": "#main", "render_max_bytes": 1000})
+    full = RenderProfile.from_rules({"render_profile": "full"})
+
+    assert lean.should_block("image", "https://example.gov/logo.png")
+    assert lean.should_block("script", "https://www.google-analytics.com/analytics.js")
+    assert not lean.should_block("script", "https://example.gov/app.js")
+    assert lean.wait_for_selector == "#main" and lean.max_bytes == 1000
+    assert not full.should_block("image", "https://example.gov/logo.png")
+    assert lean.cache_variant != full.cache_variant
+
+
+def make_route(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+@pytest.mark.asyncio
+async def test_render_profile_blocks_heavy_resources_and_caps_bytes(service):
+    context = MagicMock()
+    context.route = AsyncMock()
+    page = MagicMock()
+    profile = RenderProfile(max_bytes=100)
+
+    await service._apply_render_profile(context, page, profile)
+    handler = context.route.call_args.args[1]
+    on_response = page.on.call_args.args[1]
+
+    image = make_route("image", "https://example.gov/a.png")
+    await handler(image)
+    image.abort.assert_awaited_once()
+
+    script = make_route("script", "https://example.gov/app.js")
+    await handler(script)
+    script.continue_.assert_awaited_once()
+
+    on_response(MagicMock(headers={"content-length": "150"}))
+    late_script = make_route("script", "https://example.gov/late.js")
+    await handler(late_script)
+    late_script.abort.assert_awaited_once()
+
+    document = make_route("document", "https://example.gov/")
+    await handler(document)
+    document.continue_.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scrape_waits_on_profile_selector(service):
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    page.wait_for_function = AsyncMock()
+    page.content = AsyncMock(return_value="<html>Ready</html>")
+
+    result = await service._load_page(
+        page, "https://example.gov", 1000, RenderProfile(wait_for_selector="#content")
+    )
+
+    assert result.read_bytes() == b"<html>Ready</html>"
+    page.wait_for_selector.assert_awaited_once_with("#content", timeout=service.SELECTOR_TIMEOUT_MS)
+    page.wait_for_function.assert_not_called()
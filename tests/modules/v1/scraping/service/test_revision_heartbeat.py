@@ -0,0 +1,136 @@
+"""Tests for recording unchanged scrapes as heartbeats on the current revision."""
+
+import hashlib
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.modules.v1.scraping.models.data_revision import DataRevision
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+from app.api.utils.cleaned_text import normalize_text
+
+LINES = ["Registration fees", "Company registration: 600 NGN"]
+
+
+def make_source(revision):
+    project = SimpleNamespace(id=uuid.uuid4(), org_id=uuid.uuid4(), master_prompt="Track fees")
+    return SimpleNamespace(
+        id=revision.source_id,
+        name="Fees",
+        url="mock://fees",
+        scraping_rules={},
+        auth_details_encrypted=None,
+        noise_model=None,
+        jurisdiction=SimpleNamespace(id=uuid.uuid4(), project=project, prompt=""),
+        latest_revision_id=revision.id,
+        latest_content_hash=revision.content_hash,
+        latest_scraped_at=revision.scraped_at,
+        latest_change_detected=False,
+    )
+
+
+@pytest.fixture
+def revision():
+    content_hash = hashlib.sha256(normalize_text(" ".join(LINES)).encode()).hexdigest()
+    return DataRevision(
+        source_id=uuid.uuid4(),
+        minio_object_key="raw/first.html",
+        content_hash=content_hash,
+        extracted_data={"summary": "Fees"},
+        scraped_at=datetime(2026, 10, 1, 9, 0),
+        confirmations=2,
+    )
+
+
+@pytest.fixture
+def source(revision):
+    return make_source(revision)
+
+
+@pytest.fixture
+def service(revision, source):
+    db = AsyncMock()
+    db.add = MagicMock()
+    loaded = MagicMock()
+    loaded.scalars.return_value.first.side_effect = [source, revision]
+    db.execute = AsyncMock(return_value=loaded)
+    service = ScraperService(db)
+    service.text_extractor = MagicMock()
+    service.text_extractor.process_pipeline = AsyncMock(
+        return_value={"full_text": " ".join(LINES), "lines": LINES, "raw_key": "raw/next.html"}
+    )
+    service.ai_extractor = MagicMock()
+    service.ai_extractor.run_llm_analysis = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_unchanged_scrape_extends_the_current_revision(service, revision):
+    result = await service._run_pipeline(str(revision.source_id))
+
+    service.db.add.assert_not_called()
+    service.ai_extractor.run_llm_analysis.assert_not_called()
+    assert revision.confirmations == 3
+    assert revision.last_confirmed_at > revision.scraped_at
+    assert revision.minio_object_key == "raw/first.html"
+    assert result["is_heartbeat"] is True
+    assert result["data_revision_id"] == str(revision.id)
+    service.db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_noise_model_overrides_saved_during_the_scrape_are_kept(service, revision, source):
+    service.db.execute.return_value.scalar_one_or_none.return_value = {
+        "pinned_patterns": ["^Visitors"]
+    }
+
+    await service._run_pipeline(str(revision.source_id))
+
+    assert source.noise_model["pinned_patterns"] == ["^Visitors"]
+    assert source.noise_model["observed"]
+
+
+@pytest.mark.asyncio
+async def test_identical_raw_body_skips_archive_and_cleaning(service, revision):
+    revision.raw_sha256 = hashlib.sha256(b"<html></html>").hexdigest()
+
+    result = await service._run_pipeline(str(revision.source_id))
+
+    service.text_extractor.process_pipeline.assert_not_called()
+    assert result["is_heartbeat"] is True
+    assert revision.confirmations == 3
+
+
+@pytest.mark.asyncio
+async def test_changed_scrape_inserts_a_revision_with_its_tenant(service, revision, source):
+    service.text_extractor.process_pipeline.return_value = {
+        "full_text": "Company registration: 700 NGN",
+        "lines": ["Company registration: 700 NGN"],
+        "raw_key": "raw/next.html",
+    }
+    service.ai_extractor.run_llm_analysis.return_value = {"summary": "Fees rose"}
+    service.differ = MagicMock()
+    service.differ.detect_semantic_change = AsyncMock(
+        return_value=SimpleNamespace(has_changed=False)
+    )
+    service.search_cache = MagicMock()
+    service.search_cache.bump_generation = AsyncMock()
+
+    result = await service._run_pipeline(str(revision.source_id))
+
+    [new_revision] = [
+        call.args[0]
+        for call in service.db.add.call_args_list
+        if isinstance(call.args[0], DataRevision)
+    ]
+    assert result["is_heartbeat"] is False
+    assert new_revision.raw_sha256 == hashlib.sha256(b"<html></html>").hexdigest()
+    assert new_revision.organization_id == source.jurisdiction.project.org_id
+    assert new_revision.project_id == source.jurisdiction.project.id
+    assert new_revision.jurisdiction_id == source.jurisdiction.id
+    service.search_cache.bump_generation.assert_awaited_once_with(
+        source.jurisdiction.project.org_id
+    )
@@ -0,0 +1,156 @@
+"""Tests for monthly data_revisions partition maintenance."""
+
+import gzip
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.api.modules.v1.scraping.service.revision_partitions import (
+    RevisionPartitionManager,
+    add_months,
+    partition_month,
+    partition_name,
+)
+
+NOW = datetime(2026, 10, 18, 3, 30, tzinfo=timezone.utc)
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def one(self):
+        return self.rows[0]
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class Stream:
+    def __init__(self, rows):
+        self.rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class FakeSession:
+    """Answers the catalog and count queries and records every statement."""
+
+    def __init__(self, partitions, counts=(0, 0), rows=(), default_months=()):
+        self.partitions = list(partitions)
+        self.counts = counts
+        self.rows = rows
+        self.default_months = default_months
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_inherits" in sql:
+            return Result([(name,) for name in self.partitions])
+        if sql.startswith("SELECT count(*)"):
+            return Result([self.counts])
+        if sql.startswith("SELECT DISTINCT") and "FROM data_revisions_default" in sql:
+            return Result([(month,) for month in self.default_months])
+        return Result([])
+
+    async def stream(self, statement):
+        sql = str(statement)
+        return Stream([(row,) for row in self.rows] if "FROM data_revisions_p" in sql else [])
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_month_arithmetic_and_names():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 2, 1)) == "data_revisions_p202602"
+    assert partition_month("data_revisions_p202602") == date(2026, 2, 1)
+    assert partition_month("data_revisions_legacy") is None
+
+
+@pytest.mark.asyncio
+async def test_missing_future_partitions_are_created():
+    db = FakeSession(["data_revisions_p202610", "data_revisions_p202611"])
+
+    created = await RevisionPartitionManager(db).ensure_partitions(NOW, months_ahead=3)
+
+    assert created == ["data_revisions_p202612", "data_revisions_p202701"]
+    assert "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')" in db.statements[1]
+
+
+@pytest.mark.asyncio
+async def test_revisions_in_the_default_partition_move_to_their_month(caplog):
+    db = FakeSession(
+        ["data_revisions_default", *(partition_name(date(2026, m, 1)) for m in (10, 11, 12))],
+        default_months=[date(2026, 7, 1)],
+    )
+
+    created = await RevisionPartitionManager(db).ensure_partitions(NOW, months_ahead=3)
+
+    assert created == ["data_revisions_p202607", "data_revisions_p202701"]
+    start = next(i for i, sql in enumerate(db.statements) if "(LIKE" in sql)
+    moved = db.statements[start : start + 4]
+    assert moved[0].startswith("CREATE TABLE data_revisions_p202607 (LIKE data_revisions")
+    assert moved[1].startswith("INSERT INTO data_revisions_p202607 SELECT * FROM")
+    assert moved[2].startswith("DELETE FROM data_revisions_default WHERE scraped_at >=")
+    assert moved[3] == (
+        "ALTER TABLE data_revisions ATTACH PARTITION data_revisions_p202607 "
+        "FOR VALUES FROM ('2026-07-01') TO ('2026-08-01')"
+    )
+    assert "partition maintenance has lapsed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_expired_partitions_are_exported_then_dropped():
+    db = FakeSession(
+        ["data_revisions_p202408", "data_revisions_p202409", "data_revisions_p202410"],
+        counts=(2, 0),
+        rows=['{"id": "a"}', '{"id": "b"}'],
+    )
+    uploads = {}
+
+    def upload(data, length, bucket, name):
+        uploads[name] = gzip.decompress(data.read(length))
+
+    with patch("app.api.modules.v1.scraping.service.revision_partitions.upload_raw_stream", upload):
+        results = await RevisionPartitionManager(db).archive_expired(NOW, retention_months=24)
+
+    assert [r.partition for r in results] == ["data_revisions_p202408", "data_revisions_p202409"]
+    assert uploads["data_revisions/2024/08/data_revisions_p202408-20261018033000.jsonl.gz"] == (
+        b'{"id": "a"}\n{"id": "b"}\n'
+    )
+    assert any("DETACH PARTITION data_revisions_p202409" in sql for sql in db.statements)
+    [diff_delete] = [
+        sql
+        for sql in db.statements
+        if sql.startswith("DELETE FROM change_diff") and "p202408" in sql
+    ]
+    assert "d.old_revision_id IN" in diff_delete and "d.new_revision_id IN" in diff_delete
+
+
+@pytest.mark.asyncio
+async def test_latest_revisions_keep_their_partition():
+    db = FakeSession(["data_revisions_p202401"], counts=(5, 1))
+
+    with patch("app.api.modules.v1.scraping.service.revision_partitions.upload_raw_stream"):
+        [result] = await RevisionPartitionManager(db).archive_expired(NOW, retention_months=24)
+
+    assert (result.archived, result.kept, result.dropped) == (4, 1, False)
+    assert not any("DETACH" in sql for sql in db.statements)
+
+    db.counts = (1, 1)
+    assert await RevisionPartitionManager(db).archive_expired(NOW, retention_months=24) == []
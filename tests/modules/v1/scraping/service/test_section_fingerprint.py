@@ -0,0 +1,116 @@
+"""Tests for section-level Merkle fingerprints."""
+
+from unittest.mock import patch
+
+from app.api.modules.v1.scraping.service.section_fingerprint import (
+    build_tree,
+    compare_fingerprints,
+    fingerprint_text,
+    section_diff,
+    split_sections,
+)
+
+
+def document(fees="600 NGN", extra=None):
+    lines = [
+        "Companies Regulations",
+        "Issued by the Registrar.",
+        "Article 1 Scope",
+        "These rules apply to all companies.",
+        "Article 2 Fees",
+        f"Registration costs {fees}.",
+        "Article 3 Penalties",
+        "Late filing is fined daily.",
+    ]
+    if extra:
+        lines[4:4] = extra
+    return lines
+
+
+def test_split_sections_on_headings_and_page_markers():
+    sections = split_sections(document() + ["[Page 2]", "Annex text."])
+
+    assert [s.heading for s in sections] == [
+        "Companies Regulations",
+        "Article 1 Scope",
+        "Article 2 Fees",
+        "Article 3 Penalties",
+        "[Page 2]",
+    ]
+    assert sections[2].lines == ["Article 2 Fees", "Registration costs 600 NGN."]
+
+
+def test_long_sections_are_cut_into_blocks():
+    with patch("app.api.modules.v1.scraping.service.section_fingerprint.MAX_SECTION_CHARS", 30):
+        sections = split_sections(["Article 1", "a" * 25 + ".", "b" * 25 + ".", "c."])
+
+    assert [len(s.lines) for s in sections] == [2, 2]
+    assert sections[1].heading == "Article 1"
+
+
+def test_merkle_root_changes_with_any_leaf():
+    tree = build_tree(["a", "b", "c"])
+
+    assert [len(level) for level in tree] == [3, 2, 1]
+    assert tree[1][1] == "c"
+    assert build_tree(["a", "b", "x"])[-1] != tree[-1]
+
+
+def test_identical_text_has_no_changes():
+    assert not compare_fingerprints(fingerprint_text(document()), fingerprint_text(document()))
+
+
+def test_edit_localized_to_one_section():
+    old = fingerprint_text(document())
+    new = fingerprint_text(document(fees="650 NGN"))
+
+    changes = compare_fingerprints(old, new)
+
+    assert changes.changed == [2] and changes.removed == [2]
+    assert new["sections"][2]["heading"] == "Article 2 Fees"
+
+
+def test_inserted_section_is_aligned_without_shifting_the_rest():
+    old = fingerprint_text(document())
+    new = fingerprint_text(document(extra=["Article 1A Definitions", "Words mean things."]))
+
+    changes = compare_fingerprints(old, new)
+
+    assert changes.changed == [2]
+    assert changes.removed == []
+
+
+def test_inserted_pdf_page_does_not_shift_later_pages():
+    pages = [
+        [f"[Page {n}]", f"Notice {n}: licence fees for zone {n} are unchanged."]
+        for n in range(1, 51)
+    ]
+    cover = ["Official Gazette, cover page."]
+    old_lines = [line for page in pages for line in page]
+    new_lines = ["[Page 1]", *cover] + [
+        line.replace(f"[Page {n}]", f"[Page {n + 1}]")
+        for n, page in enumerate(pages, 1)
+        for line in page
+    ]
+
+    changes = compare_fingerprints(fingerprint_text(old_lines), fingerprint_text(new_lines))
+
+    assert changes.changed == [0]
+    assert changes.removed == []
+    assert section_diff(old_lines, new_lines).ratio < 0.05
+
+
+def test_missing_previous_fingerprint_marks_everything_changed():
+    new = fingerprint_text(document())
+
+    assert compare_fingerprints(None, new).changed == [0, 1, 2, 3]
+
+
+def test_section_diff_covers_only_changed_sections():
+    diff = section_diff(document(), document(fees="650 NGN"))
+
+    assert diff.sections == 1
+    assert "-Registration costs 600 NGN." in diff.text
+    assert "+Registration costs 650 NGN." in diff.text
+    assert "Late filing" not in diff.text
+    assert 0 < diff.ratio < 0.5
@@ -0,0 +1,229 @@
+"""Tests for per-domain session state reuse."""
+
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from requests.cookies import RequestsCookieJar
+
+from app.api.modules.v1.scraping.service import session_store as session_store_module
+from app.api.modules.v1.scraping.service.cloudscrapper_service import (
+    FetchResult,
+    HTTPClientService,
+)
+from app.api.modules.v1.scraping.service.playwright_service import PlaywrightService
+from app.api.modules.v1.scraping.service.session_store import (
+    ANONYMOUS,
+    DomainSessionStore,
+    cookies_from_jar,
+    load_cookies_into_jar,
+    session_context,
+)
+
+
+class FakeRedis:
+    """In-memory subset of async Redis used by the session store."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def reversible_cipher(monkeypatch):
+    """Fernet is mocked out suite-wide, so swap in a reversible stand-in."""
+
+    def decrypt(token):
+        try:
+            return json.loads(base64.b64decode(token[len("enc:") :]))
+        except ValueError:
+            return {}
+
+    monkeypatch.setattr(
+        session_store_module,
+        "encrypt_auth_details",
+        lambda data: "enc:" + base64.b64encode(json.dumps(data).encode()).decode(),
+    )
+    monkeypatch.setattr(session_store_module, "decrypt_auth_details", decrypt)
+
+
+@pytest.fixture
+def store(clock):
+    return DomainSessionStore(FakeRedis(), clock=clock)
+
+
+def cookie(name, value, expires=-1, domain=".example.gov"):
+    return {
+        "name": name,
+        "value": value,
+        "domain": domain,
+        "path": "/",
+        "expires": expires,
+        "httpOnly": True,
+        "secure": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_state_is_encrypted_and_expired_cookies_are_dropped(store, clock):
+    state = {
+        "cookies": [cookie("cf_clearance", "abc", clock.now + 3600), cookie("old", "x", 10)],
+        "origins": [],
+    }
+    await store.save("https://portal.example.gov/a", state)
+
+    [raw] = store.redis.store.values()
+    assert raw.startswith("enc:") and "cf_clearance" not in raw
+
+    loaded = await store.load("https://PORTAL.example.gov/other")
+    assert [c["name"] for c in loaded["cookies"]] == ["cf_clearance"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_partitioned_by_credentials(store):
+    await store.save("https://example.gov", {"cookies": [cookie("sid", "org-a")]}, "ctx-a")
+
+    assert await store.load("https://example.gov", "ctx-b") is None
+    assert await store.load("https://example.gov", ANONYMOUS) is None
+    assert session_context(None) == ANONYMOUS
+    assert session_context({"user": "a"}) != session_context({"user": "b"})
+
+
+@pytest.mark.asyncio
+async def test_undecryptable_state_is_ignored(store):
+    store.redis.store["scraping:session:example.gov:anonymous"] = "garbage"
+
+    assert await store.load("https://example.gov") is None
+
+
+@pytest.mark.asyncio
+async def test_unencryptable_state_is_not_saved_and_does_not_raise(store, monkeypatch):
+    def fail(data):
+        raise TypeError("Object of type bytes is not JSON serializable")
+
+    monkeypatch.setattr(session_store_module, "encrypt_auth_details", fail)
+
+    await store.save("https://example.gov", {"cookies": [cookie("sid", "abc")]})
+    assert store.redis.store == {}
+
+
+def test_cookie_jar_round_trip_keeps_only_matching_domains():
+    jar = RequestsCookieJar()
+    load_cookies_into_jar(
+        jar, [cookie("cf_clearance", "abc", 2_000_000_000), cookie("other", "y", domain="b.gov")]
+    )
+
+    cookies = cookies_from_jar(jar, "www.example.gov")
+
+    assert [c["name"] for c in cookies] == ["cf_clearance"]
+    assert cookies[0]["expires"] == 2_000_000_000
+    assert cookies[0]["httpOnly"] is True
+
+
+@pytest.mark.asyncio
+async def test_fast_path_resumes_and_saves_session(store):
+    await store.save("https://example.gov", {"cookies": [cookie("cf_clearance", "old")]})
+    service = HTTPClientService()
+    service.use_session_store(store)
+
+    def fast_path(url, timeout, headers, max_bytes):
+        assert service.scraper.cookies.get("cf_clearance") == "old"
+        service.scraper.cookies.set("cf_clearance", "new", domain=".example.gov", path="/")
+        return FetchResult.from_bytes(b"page")
+
+    with patch.object(service, "_sync_get", side_effect=fast_path):
+        result = await service.fetch("https://example.gov/law")
+        assert result.content == b"page"
+
+    saved = await store.load("https://example.gov")
+    assert [c["value"] for c in saved["cookies"]] == ["new"]
+    assert service.browser.session_store is store
+
+
+@pytest.mark.asyncio
+async def test_unchanged_cookies_are_not_rewritten(store):
+    await store.save(
+        "https://example.gov",
+        {"cookies": [cookie("cf_clearance", "same")], "user_agent": "Agent/1.0"},
+    )
+    service = HTTPClientService()
+    service.use_session_store(store)
+    store.save = AsyncMock()
+
+    with patch.object(service, "_sync_get", return_value=FetchResult.from_bytes(b"page")):
+        await service.fetch("https://example.gov/law")
+
+    store.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fast_path_sends_and_saves_the_sessions_user_agent(store):
+    await store.save(
+        "https://example.gov",
+        {"cookies": [cookie("cf_clearance", "old")], "user_agent": "Agent/1.0"},
+    )
+    service = HTTPClientService()
+    service.use_session_store(store)
+
+    def fast_path(url, timeout, headers, max_bytes):
+        assert service.scraper.headers["User-Agent"] == "Agent/1.0"
+        service.scraper.cookies.set("cf_clearance", "new", domain=".example.gov", path="/")
+        return FetchResult.from_bytes(b"page")
+
+    with patch.object(service, "_sync_get", side_effect=fast_path):
+        await service.fetch("https://example.gov/law")
+
+    saved = await store.load("https://example.gov")
+    assert saved["user_agent"] == "Agent/1.0"
+
+
+@pytest.mark.asyncio
+async def test_browser_resumes_with_the_sessions_user_agent(store):
+    await store.save(
+        "https://example.gov",
+        {"cookies": [cookie("cf_clearance", "abc")], "user_agent": "Agent/1.0"},
+    )
+    service = PlaywrightService(session_store=store)
+    context = MagicMock()
+    context.new_page = AsyncMock()
+    context.route = AsyncMock()
+    context.close = AsyncMock()
+    context.storage_state = AsyncMock(return_value={"cookies": [cookie("cf_clearance", "abc")]})
+    browser = MagicMock()
+    browser.new_context = AsyncMock(return_value=context)
+    browser.close = AsyncMock()
+
+    with (
+        patch("app.api.modules.v1.scraping.service.playwright_service.async_playwright") as mock_pw,
+        patch.object(service, "_load_page", AsyncMock(return_value=b"page")),
+    ):
+        mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(
+            return_value=browser
+        )
+        await service.scrape("https://example.gov/law")
+
+    options = browser.new_context.call_args.kwargs
+    assert options["user_agent"] == "Agent/1.0"
+    assert "user_agent" not in options["storage_state"]
+    saved = await store.load("https://example.gov")
+    assert saved["user_agent"] == "Agent/1.0"
@@ -0,0 +1,164 @@
+"""Tests for the per-source scrape lease and its use by ScraperService."""
+
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.api.modules.v1.scraping.service import source_lease
+from app.api.modules.v1.scraping.service.scraper_service import ScraperService
+from app.api.modules.v1.scraping.service.source_lease import (
+    AttachedRunFailedError,
+    SourceLeaseManager,
+    SourceLeaseTimeoutError,
+)
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for the async Redis commands used by the lease."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if script == source_lease._ACQUIRE_SCRIPT:
+            fence = await self.incr(token)
+            if key in self.store:
+                return [0, int(self.store[key])]
+            self.store[key] = str(fence)
+            return [1, fence]
+        if self.store.get(key) != token:
+            return 0
+        if script == source_lease._RELEASE_SCRIPT:
+            del self.store[key]
+        return 1
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def redis_client():
+    return FakeAsyncRedis()
+
+
+@pytest.mark.asyncio
+async def test_acquire_is_exclusive_and_tokens_increase(redis_client):
+    manager = SourceLeaseManager(redis_client, ttl_seconds=30)
+
+    first = await manager.acquire("src-1")
+    assert first == 1
+    assert await manager.acquire("src-1") is None
+
+    await manager.release("src-1", first)
+    second = await manager.acquire("src-1")
+    assert second > first
+    assert await manager.current_token("src-1") == second
+
+
+@pytest.mark.asyncio
+async def test_release_with_stale_token_keeps_newer_lease(redis_client):
+    manager = SourceLeaseManager(redis_client, ttl_seconds=30)
+    token = await manager.acquire("src-1")
+
+    await manager.release("src-1", token - 1)
+    assert await manager.renew("src-1", token - 1) is False
+    assert await manager.current_token("src-1") == token
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_attaches_to_inflight_run(redis_client):
+    holder = SourceLeaseManager(redis_client, ttl_seconds=30)
+    waiter = SourceLeaseManager(redis_client, ttl_seconds=30, poll_interval=0.01)
+    token = await holder.acquire("src-1")
+
+    async def finish():
+        await asyncio.sleep(0.03)
+        await holder.publish_result("src-1", token, result={"status": "success"})
+        await holder.release("src-1", token)
+
+    result, _ = await asyncio.gather(waiter.wait_for_result("src-1"), finish())
+    assert result == {"status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_propagates_failure(redis_client):
+    manager = SourceLeaseManager(redis_client, ttl_seconds=30, poll_interval=0.01)
+    token = await manager.acquire("src-1")
+    await manager.publish_result("src-1", token, error="boom")
+
+    with pytest.raises(AttachedRunFailedError):
+        await manager.wait_for_result("src-1")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_times_out(redis_client):
+    manager = SourceLeaseManager(redis_client, ttl_seconds=30, wait_timeout=0.05)
+    manager.poll_interval = 0.01
+    await manager.acquire("src-1")
+
+    with pytest.raises(SourceLeaseTimeoutError):
+        await manager.wait_for_result("src-1")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_reads_result_of_holder_that_already_released(redis_client):
+    holder = SourceLeaseManager(redis_client, ttl_seconds=30)
+    waiter = SourceLeaseManager(redis_client, ttl_seconds=30, poll_interval=0.01)
+    token = await holder.acquire("src-1")
+    assert await waiter.acquire("src-1") is None
+
+    await holder.publish_result("src-1", token, result={"status": "success"})
+    await holder.release("src-1", token)
+
+    assert await waiter.wait_for_result("src-1") == {"status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_returns_none_when_holder_vanishes(redis_client):
+    manager = SourceLeaseManager(redis_client, ttl_seconds=30)
+    assert await manager.wait_for_result("src-1") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_execute_scrape_job_runs_pipeline_once(redis_client):
+    """Duplicate triggers for one source share a single pipeline run."""
+    calls = []
+
+    async def fake_pipeline(source_id, fencing_token=None):
+        calls.append(fencing_token)
+        await asyncio.sleep(0.05)
+        return {"status": "success", "data_revision_id": "rev-1"}
+
+    service = ScraperService(AsyncMock())
+    service._run_pipeline = fake_pipeline
+
+    with (
+        patch(
+            "app.api.modules.v1.scraping.service.scraper_service.Redis.from_url",
+            return_value=redis_client,
+        ),
+        patch(
+            "app.api.modules.v1.scraping.service.scraper_service.SourceLeaseManager",
+            partial(SourceLeaseManager, ttl_seconds=30, wait_timeout=5, poll_interval=0.01),
+        ),
+    ):
+        results = await asyncio.gather(*(service.execute_scrape_job("src-1") for _ in range(3)))
+
+    assert calls == [1]
+    assert sum(1 for r in results if r.get("attached_to_inflight")) == 2
+    assert all(r["data_revision_id"] == "rev-1" for r in results)
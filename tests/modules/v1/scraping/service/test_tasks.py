@@ -1,4 +1,3 @@
-import json
 import uuid
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,10 +10,11 @@ from app.api.modules.v1.jurisdictions.models.jurisdiction_model import Jurisdict
 from app.api.modules.v1.organization.models.organization_model import Organization
 from app.api.modules.v1.projects.models.project_model import Project
 from app.api.modules.v1.scraping.models.source_model import Source
+from app.api.modules.v1.scraping.service.dead_letter import DLQ_STREAM_KEY
 from app.api.modules.v1.scraping.service.tasks import (
-    CELERY_DLQ_KEY,
     dispatch_due_sources,
     get_next_scrape_time,
+    run_manual_scrape_job,
     scrape_source,
 )
 
@@ -233,6 +233,7 @@ def test_scrape_source_dlq_on_max_retries(sync_session: Session):
         mock_scraper_cls.return_value = mock_scraper_instance
 
         mock_redis_client = MagicMock()
+        mock_redis_client.hget.return_value = None
         mock_redis_cls.return_value = mock_redis_client
 
         for i in range(settings.SCRAPE_MAX_RETRIES):
@@ -249,12 +250,16 @@ def test_scrape_source_dlq_on_max_retries(sync_session: Session):
         scrape_source.pop_request()
 
         assert "moved to DLQ" in result
-        mock_redis_client.lpush.assert_called_once()
+        mock_redis_client.xadd.assert_called_once()
 
-        called_args, _ = mock_redis_client.lpush.call_args
-        assert called_args[0] == CELERY_DLQ_KEY
-        dlq_entry = json.loads(called_args[1])
+        called_args, called_kwargs = mock_redis_client.xadd.call_args
+        assert called_args[0] == DLQ_STREAM_KEY
+        dlq_entry = called_args[1]
         assert dlq_entry["task_id"] == "test_task_id"
+        assert dlq_entry["source_id"] == str(source.id)
+        assert dlq_entry["error_class"] == "Exception"
+        assert called_kwargs["maxlen"] == settings.SCRAPE_DLQ_MAXLEN
+        mock_redis_client.hset.assert_called_once()
 
 
 def test_dispatch_due_sources_acquires_lock_and_dispatches(
@@ -326,6 +331,8 @@ def test_dispatch_due_sources_acquires_lock_and_dispatches(
     ):
         mock_redis_instance = MagicMock()
         mock_redis_instance.set.return_value = True
+        mock_redis_instance.llen.return_value = 0
+        mock_redis_instance.hgetall.return_value = {}
         mock_redis_cls.return_value = mock_redis_instance
 
         mock_db = MagicMock()
@@ -338,9 +345,7 @@ def test_dispatch_due_sources_acquires_lock_and_dispatches(
 
         async def mock_execute(stmt):
             result = MagicMock()
-            result.scalars.return_value.all.return_value = (
-                sync_session.execute(stmt).scalars().all()
-            )
+            result.all.return_value = sync_session.execute(stmt).all()
             return result
 
         mock_db.execute.side_effect = mock_execute
@@ -353,6 +358,36 @@ def test_dispatch_due_sources_acquires_lock_and_dispatches(
     assert mock_redis_instance.set.call_count == 1
     assert mock_app.send_task.call_count == 2
 
+    dispatched_orgs = set()
+    for call in mock_app.send_task.call_args_list:
+        assert call.kwargs["queue"] == settings.SCRAPE_QUEUE_DEFAULT
+        assert call.kwargs["kwargs"]["due_at"]
+        dispatched_orgs.add(call.kwargs["kwargs"]["organization_id"])
+    assert dispatched_orgs == {str(organization1.id), str(organization2.id)}
+
+
+def test_dispatch_due_sources_respects_queue_backlog():
+    """Tests that nothing is dispatched while the scrape queues are full."""
+    with (
+        patch("app.api.modules.v1.scraping.service.tasks.redis.Redis") as mock_redis_cls,
+        patch("app.api.modules.v1.scraping.service.tasks.AsyncSessionLocal") as mock_session_cls,
+        patch.object(dispatch_due_sources, "app") as mock_app,
+    ):
+        mock_redis_instance = MagicMock()
+        mock_redis_instance.set.return_value = True
+        mock_redis_instance.llen.return_value = settings.SCRAPE_QUEUE_MAX_BACKLOG
+        mock_redis_cls.return_value = mock_redis_instance
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_session_cls.return_value.__aenter__.return_value = mock_db
+
+        result = dispatch_due_sources.run()
+
+    assert result == "Dispatched 0 sources."
+    mock_db.execute.assert_not_called()
+    mock_app.send_task.assert_not_called()
+
 
 def test_dispatch_due_sources_lock_already_held():
     """Tests that the dispatcher skips if the lock is already held."""
@@ -412,6 +447,8 @@ def test_dispatch_due_sources_no_due_sources(sync_session: Session):
     ):
         mock_redis_instance = MagicMock()
         mock_redis_instance.set.return_value = True
+        mock_redis_instance.llen.return_value = 0
+        mock_redis_instance.hgetall.return_value = {}
         mock_redis_cls.return_value = mock_redis_instance
 
         mock_db = MagicMock()
@@ -421,9 +458,7 @@ def test_dispatch_due_sources_no_due_sources(sync_session: Session):
 
         async def mock_execute(stmt):
             result = MagicMock()
-            result.scalars.return_value.all.return_value = (
-                sync_session.execute(stmt).scalars().all()
-            )
+            result.all.return_value = sync_session.execute(stmt).all()
             return result
 
         mock_db.execute.side_effect = mock_execute
@@ -433,3 +468,18 @@ def test_dispatch_due_sources_no_due_sources(sync_session: Session):
         result = dispatch_due_sources.run()
 
     assert result == "Dispatched 0 sources."
+
+
+def test_run_manual_scrape_job_executes_background_job():
+    """The manual queue task drives the ScrapeJob lifecycle on the worker."""
+    job_id, source_id = uuid.uuid4(), uuid.uuid4()
+
+    with patch(
+        "app.api.modules.v1.scraping.service.scrape_job_service.ScrapeJobService."
+        "execute_scrape_job_background",
+        new_callable=AsyncMock,
+    ) as mock_execute:
+        result = run_manual_scrape_job.run(str(job_id), str(source_id))
+
+    mock_execute.assert_awaited_once_with(job_id, source_id)
+    assert str(job_id) in result
@@ -0,0 +1,50 @@
+"""Tests for extracted-fact filters in data revision search."""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.v1.scraping.models.data_revision import DataRevision
+from app.api.modules.v1.search.schemas.search_schema import SearchRequest
+from app.api.modules.v1.search.service.search_service import fact_filter_clauses
+
+FACTS = "((data_revisions.extracted_data -> 'extracted_data') -> 'key_value_pairs')"
+
+
+def compile_clauses(filters):
+    clauses = fact_filter_clauses(DataRevision.extracted_data, filters)
+    return [clause.compile(dialect=postgresql.dialect()) for clause in clauses]
+
+
+def test_equality_filters_become_one_indexed_containment():
+    [clause] = compile_clauses({"category": "legal", "year": 2025, "tags": ["tax"]})
+
+    assert str(clause) == f"{FACTS} @> %(param_1)s::JSONB"
+    assert clause.params["param_1"] == {"category": "legal", "year": "2025", "tags": ["tax"]}
+
+
+def test_range_filters_compare_the_number_in_the_value():
+    containment, lower, upper = compile_clauses(
+        {"registration_fee": {"gte": 500, "lt": 1000}, "category": "fees"}
+    )
+
+    assert "@>" in str(containment)
+    assert str(lower).startswith(f"CAST(SUBSTRING(replace({FACTS} ->> ")
+    assert str(lower).endswith(">= %(param_2)s::INTEGER")
+    assert str(upper).endswith("< %(param_2)s::INTEGER")
+    assert lower.params["param_1"] == "registration_fee"
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"fee": {"gte": "500"}}, {"fee": {"gte": 5, "between": 9}}, {"fee": {"lt": True}}],
+)
+def test_invalid_range_filters_are_rejected(filters):
+    with pytest.raises(ValidationError):
+        SearchRequest(query="fees", extracted_data_filters=filters)
+
+
+def test_plain_object_filters_are_not_ranges():
+    request = SearchRequest(query="fees", extracted_data_filters={"meta": {"source": "gazette"}})
+
+    assert request.extracted_data_filters == {"meta": {"source": "gazette"}}
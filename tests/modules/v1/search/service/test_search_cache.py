@@ -0,0 +1,118 @@
+"""Tests for search snippets and the per-tenant search page cache."""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.v1.search.schemas.search_schema import SearchRequest
+from app.api.modules.v1.search.service.search_cache import SearchCache, request_digest
+from app.api.modules.v1.search.service.search_service import SearchService
+
+ORG_ID = uuid.uuid4()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+
+
+def session(snippet="Company \x02registration\x03 costs 700 NGN"):
+    revision = SimpleNamespace(
+        id=uuid.uuid4(),
+        minio_object_key="fees.html",
+        ai_summary="Registration fees",
+        extracted_data={},
+        scraped_at=datetime(2026, 10, 1),
+    )
+    row = SimpleNamespace(
+        total=1,
+        candidates=1,
+        DataRevision=revision,
+        relevance_score=0.5,
+        snippet=snippet,
+    )
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=lambda: [row]))
+    return db
+
+
+def test_equivalent_requests_share_a_digest():
+    a = SearchRequest(query="Registration  Fee", extracted_data_filters={"a": 1, "b": 2})
+    b = SearchRequest(query="registration fee", extracted_data_filters={"b": 2, "a": 1})
+
+    assert request_digest(a) == request_digest(b)
+    assert request_digest(a) != request_digest(SearchRequest(query="registration fee", page=2))
+
+
+@pytest.mark.asyncio
+async def test_snippets_are_highlighted_on_the_page_rows():
+    db = session()
+
+    response = await SearchService(db).search(SearchRequest(query="registration"), org_id=ORG_ID)
+
+    assert response.results[0].snippet == "Company <mark>registration</mark> costs 700 NGN"
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ts_headline(" in sql
+    assert "coalesce(data_revisions.ai_markdown_summary, data_revisions.ai_summary" in sql
+
+
+@pytest.mark.asyncio
+async def test_markup_in_summaries_is_escaped_in_snippets():
+    db = session('Fee \x02notice\x03 <img src=x onerror="alert(1)"><script>steal()</script>')
+
+    response = await SearchService(db).search(SearchRequest(query="notice"), org_id=ORG_ID)
+
+    assert response.results[0].snippet == (
+        "Fee <mark>notice</mark> &lt;img src=x onerror=&quot;alert(1)&quot;&gt;"
+        "&lt;script&gt;steal()&lt;/script&gt;"
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_are_cached_until_the_tenant_generation_moves():
+    cache = SearchCache(FakeRedis())
+    db = session()
+    service = SearchService(db, cache=cache)
+
+    first = await service.search(SearchRequest(query="Registration"), org_id=ORG_ID)
+    again = await service.search(SearchRequest(query="registration"), org_id=ORG_ID)
+
+    assert db.execute.await_count == 1
+    assert again.results == first.results
+    assert again.query == "registration"
+
+    await cache.bump_generation(ORG_ID)
+    await service.search(SearchRequest(query="registration"), org_id=ORG_ID)
+    assert db.execute.await_count == 2
+
+    await service.search(SearchRequest(query="registration"), org_id=uuid.uuid4())
+    assert db.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_runs_uncached_when_redis_is_down():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=RedisError("down"))
+    redis.set = AsyncMock()
+    db = session()
+
+    response = await SearchService(db, cache=SearchCache(redis)).search(
+        SearchRequest(query="registration"), org_id=ORG_ID
+    )
+
+    assert response.total == 1
+    redis.set.assert_not_called()
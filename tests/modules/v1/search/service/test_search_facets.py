@@ -0,0 +1,71 @@
+"""Tests for faceted search counts."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.v1.search.schemas.search_schema import SearchRequest
+from app.api.modules.v1.search.service.search_service import SearchService
+
+SOURCE_A, SOURCE_B = str(uuid.uuid4()), str(uuid.uuid4())
+
+
+def session(facets):
+    totals = SimpleNamespace(total=6, candidates=6, DataRevision=None, facets=facets)
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=lambda: [totals]))
+    return db
+
+
+@pytest.mark.asyncio
+async def test_facets_are_counted_with_grouping_sets_in_the_search_statement():
+    db = session(None)
+    request = SearchRequest(
+        query="fee", facets=["source", "scraped_at", "source"], date_interval="week"
+    )
+
+    response = await SearchService(db).search(request)
+
+    assert db.execute.await_count == 1
+    assert response.facets == {"source": [], "scraped_at": []}
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert (
+        "GROUP BY GROUPING SETS(candidates.source_id, "
+        "CAST(date_trunc('week', candidates.scraped_at) AS DATE))"
+    ) in sql
+    assert "LEFT OUTER JOIN sources ON facet_counts.grouping_source = " in sql
+    assert "jurisdictions" not in sql
+
+
+@pytest.mark.asyncio
+async def test_facet_rows_are_grouped_and_ordered():
+    rows = [
+        {"facet": "source", "value": SOURCE_A, "label": "Gazette", "count": 2},
+        {"facet": "source", "value": SOURCE_B, "label": "Registry", "count": 4},
+        {"facet": "was_change_detected", "value": "true", "label": None, "count": 1},
+        {"facet": "scraped_at", "value": "2026-10-01", "label": None, "count": 5},
+        {"facet": "scraped_at", "value": "2026-09-01", "label": None, "count": 1},
+    ]
+    request = SearchRequest(query="fee", facets=["source", "was_change_detected", "scraped_at"])
+
+    response = await SearchService(session(rows)).search(request)
+
+    assert [(b.label, b.count) for b in response.facets["source"]] == [
+        ("Registry", 4),
+        ("Gazette", 2),
+    ]
+    assert [b.value for b in response.facets["scraped_at"]] == ["2026-09-01", "2026-10-01"]
+    assert response.facets["was_change_detected"][0].value == "true"
+
+
+@pytest.mark.asyncio
+async def test_no_facets_requested_adds_no_aggregation():
+    db = session(None)
+
+    response = await SearchService(db).search(SearchRequest(query="fee"))
+
+    assert response.facets == {}
+    assert "GROUPING SETS" not in str(db.execute.await_args.args[0].compile())
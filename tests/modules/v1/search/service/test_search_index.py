@@ -0,0 +1,68 @@
+"""Tests for the batched search vector backfill and weighted ranking."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.modules.v1.search.schemas.search_schema import SearchRequest
+from app.api.modules.v1.search.service.search_index import SearchVectorBackfill
+from app.api.modules.v1.search.service.search_service import SearchService
+
+IDS = sorted(uuid.uuid4() for _ in range(5))
+
+
+class FakeSession:
+    """Returns the next ``batch_size`` ids after the cursor, like the UPDATE ... RETURNING."""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+        self.commits = 0
+
+    async def execute(self, statement, params):
+        self.calls.append(params)
+        after = uuid.UUID(params["after"]) if params["after"] else None
+        batch = [i for i in self.ids if after is None or i > after][: params["batch_size"]]
+        result = MagicMock()
+        result.all.return_value = [(i,) for i in batch]
+        return result
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_walks_ids_in_committed_batches():
+    db = FakeSession(IDS)
+
+    progress = await SearchVectorBackfill(db).run(None, batch_size=2, max_batches=10)
+
+    assert (progress.updated, progress.last_id, progress.done) == (5, IDS[-1], True)
+    assert [c["after"] for c in db.calls] == [None, str(IDS[1]), str(IDS[3])]
+    assert db.commits == 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_stops_after_max_batches_and_resumes():
+    db = FakeSession(IDS)
+    backfill = SearchVectorBackfill(db)
+
+    first = await backfill.run(None, batch_size=2, max_batches=1)
+    assert (first.updated, first.last_id, first.done) == (2, IDS[1], False)
+
+    rest = await backfill.run(first.last_id, batch_size=2, max_batches=5)
+    assert (rest.updated, rest.last_id, rest.done) == (3, IDS[-1], True)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_with_normalized_cover_density():
+    db = MagicMock()
+    totals = MagicMock(total=0, candidates=0, DataRevision=None)
+    db.execute = AsyncMock(return_value=MagicMock(all=lambda: [totals]))
+
+    await SearchService(db).search(SearchRequest(query="registration fee"))
+
+    page_query = str(db.execute.await_args_list[-1].args[0].compile())
+    assert "ts_rank_cd(data_revisions.search_vector" in page_query
+    assert "ts_rank(" not in page_query
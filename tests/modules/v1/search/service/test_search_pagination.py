@@ -0,0 +1,96 @@
+"""Tests for single-statement search with keyset pagination."""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.v1.search.schemas.search_schema import (
+    SearchRequest,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+from app.api.modules.v1.search.service.search_service import SearchService
+
+IDS = [uuid.UUID(int=i) for i in range(1, 5)]
+
+
+def row(revision_id, rank, total=4, candidates=4):
+    revision = SimpleNamespace(
+        id=revision_id,
+        minio_object_key=f"{revision_id}.html",
+        ai_summary="Registration fee",
+        extracted_data={},
+        scraped_at=datetime(2026, 10, 1),
+    )
+    return SimpleNamespace(
+        total=total,
+        candidates=candidates,
+        DataRevision=revision,
+        relevance_score=rank,
+        snippet="\x02Registration\x03 fee",
+    )
+
+
+def session(rows):
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=lambda: rows))
+    return db
+
+
+def compiled(db):
+    return str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    cursor = encode_search_cursor(0.4375, IDS[0])
+
+    assert decode_search_cursor(cursor) == (0.4375, IDS[0])
+    with pytest.raises(ValidationError):
+        SearchRequest(query="fee", cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_total_and_page_come_from_one_statement():
+    db = session([row(IDS[0], 0.5), row(IDS[1], 0.4), row(IDS[2], 0.3)])
+
+    response = await SearchService(db).search(SearchRequest(query="fee", limit=2))
+
+    assert db.execute.await_count == 1
+    assert [r.id for r in response.results] == IDS[:2]
+    assert (response.total, response.total_pages, response.total_is_estimate) == (4, 2, False)
+    assert decode_search_cursor(response.next_cursor) == (0.4, IDS[1])
+    sql = compiled(db)
+    assert "count(*) FILTER (WHERE candidates.rank >= " in sql
+    assert "OFFSET" in sql
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_seek_instead_of_offset():
+    db = session([row(IDS[2], 0.3), row(IDS[3], 0.2)])
+    request = SearchRequest(query="fee", limit=2, cursor=encode_search_cursor(0.4, IDS[1]))
+
+    response = await SearchService(db).search(request)
+
+    assert [r.id for r in response.results] == IDS[2:]
+    assert response.next_cursor is None
+    sql = compiled(db)
+    assert "(candidates.rank, candidates.id) < (" in sql
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.asyncio
+async def test_past_the_end_keeps_the_total_and_flags_capped_candidates():
+    totals_only = SimpleNamespace(total=5, candidates=5, DataRevision=None, relevance_score=None)
+    db = session([totals_only])
+
+    with patch("app.api.modules.v1.search.service.search_service.settings") as settings:
+        settings.SEARCH_CANDIDATE_LIMIT = 5
+        response = await SearchService(db).search(SearchRequest(query="fee", page=9))
+
+    assert response.results == []
+    assert (response.total, response.total_is_estimate) == (5, True)